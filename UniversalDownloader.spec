@@ -36,6 +36,22 @@ a = Analysis(
         'spotify_downloader',
         'video_downloader',
         'audible_integration',
+        'download_scheduler',
+        'download_service',
+        'download_daemon',
+        'metrics',
+        'log_writer',
+        'log_pump',
+        'ui_event_bus',
+        'virtual_list',
+        'lazy_import',
+        'instance_ipc',
+        'history_store',
+        'query_cache',
+        'match_ranking',
+        'token_broker',
+        'identity_store',
+        'discography',
     ],
     hookspath=[],
     hooksconfig={},
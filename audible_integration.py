@@ -19,6 +19,8 @@ import urllib.parse
 import threading
 import time
 
+import metrics
+
 # Versuche audible-Bibliothek zu importieren (bessere API)
 try:
     import audible
@@ -48,6 +50,26 @@ except ImportError:
     SELENIUM_AVAILABLE = False
     webdriver = None
 
+# Versuche lxml zu importieren (deutlich schnellerer HTML-Parser für BeautifulSoup)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Container-Tags und Klassen-Schlüsselwörter für Einträge der Bibliothek-Seite
+_LIBRARY_CONTAINER_TAGS = frozenset(['div', 'li', 'tr', 'article', 'section', 'table'])
+_LIBRARY_ITEM_KEYWORDS = ('library-item', 'productlistitem', 'bc-list-item', 'adbl-library', 'library-row', 'bc-list', 'product-row')
+_PD_ASIN_PATTERN = re.compile(r'/pd/([^/]+)')
+
+
+def _container_parent(tag):
+    """Nächster Vorfahre mit Container-Tag (wie find_parent, ohne Filter-Overhead)"""
+    node = tag.parent
+    while node is not None and node.name not in _LIBRARY_CONTAINER_TAGS:
+        node = node.parent
+    return node
+
 
 class AudibleAuth:
     """Klasse für Audible-Authentifizierung"""
@@ -1919,6 +1941,7 @@ class AudibleLibrary:
         if AUDIBLE_AVAILABLE and auth.audible_auth:
             self.audible_client = auth.audible_auth
     
+    @metrics.instrument('audible_api', 'audible')
     def fetch_library(self) -> List[Dict]:
         """
         Lädt die Bibliothek des Benutzers
@@ -2139,7 +2162,7 @@ class AudibleLibrary:
         # Versuche BeautifulSoup zu verwenden (wenn verfügbar)
         try:
             from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'lxml' if 'lxml' in str(BeautifulSoup) else 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER)
             
             # Debug: Zeige HTML-Struktur
             print("  Analysiere HTML-Struktur...")
@@ -2161,6 +2184,14 @@ class AudibleLibrary:
                     asin_groups[asin].append(asin_elem)
             
             book_elements = []
+            # Bereits übernommene Container (Identität statt Tag.__eq__, das ganze Teilbäume vergleicht)
+            book_element_ids = set()
+            
+            def add_book_element(tag):
+                if id(tag) not in book_element_ids:
+                    book_element_ids.add(id(tag))
+                    book_elements.append(tag)
+            
             # Für jedes ASIN: Finde gemeinsamen Parent aller Elemente
             for asin, elements in asin_groups.items():
                 # Sammle alle Parent-Elemente
@@ -2169,21 +2200,19 @@ class AudibleLibrary:
                     # Gehe mehrere Ebenen nach oben, um den Hauptcontainer zu finden
                     current = elem
                     for _ in range(5):  # Maximal 5 Ebenen nach oben
-                        parent = current.find_parent(['div', 'li', 'tr', 'article', 'section', 'table'])
-                        if not parent:
+                        parent = _container_parent(current)
+                        if parent is None:
                             break
                         # Prüfe ob es ein Library-Item-Container ist
-                        classes = parent.get('class', [])
-                        class_str = ' '.join(str(c) for c in classes).lower()
-                        if any(keyword in class_str for keyword in ['library-item', 'productlistitem', 'bc-list-item', 'adbl-library', 'library-row', 'bc-list', 'product-row']):
-                            if parent not in book_elements:
-                                book_elements.append(parent)
+                        class_str = ' '.join(str(c) for c in parent.get('class', [])).lower()
+                        if any(keyword in class_str for keyword in _LIBRARY_ITEM_KEYWORDS):
+                            add_book_element(parent)
                             break
                         current = parent
                         all_parents.append(parent)
                 
                 # Wenn kein Library-Item-Container gefunden, verwende den höchsten gemeinsamen Parent
-                if not any(elem in book_elements for elem in all_parents):
+                if not any(id(elem) in book_element_ids for elem in all_parents):
                     if all_parents:
                         # Nimm den höchsten Parent (letztes Element)
                         highest_parent = all_parents[-1]
@@ -2191,11 +2220,11 @@ class AudibleLibrary:
                         classes = highest_parent.get('class', [])
                         class_str = ' '.join(str(c) for c in classes).lower()
                         if any(keyword in class_str for keyword in ['wrapper', 'checkbox', 'button-row']):
-                            higher_parent = highest_parent.find_parent(['div', 'li', 'tr', 'article', 'section', 'table'])
-                            if higher_parent and higher_parent not in book_elements:
-                                book_elements.append(higher_parent)
-                        elif highest_parent not in book_elements:
-                            book_elements.append(highest_parent)
+                            higher_parent = _container_parent(highest_parent)
+                            if higher_parent is not None:
+                                add_book_element(higher_parent)
+                        else:
+                            add_book_element(highest_parent)
             
             print(f"    Gefunden via data-asin: {len(asin_elements)} Elemente → {len(asin_groups)} ASINs → {len(book_elements)} Container-Elemente")
             
@@ -2214,9 +2243,11 @@ class AudibleLibrary:
             if not book_elements:
                 pd_links = soup.find_all('a', href=lambda x: x and '/pd/' in str(x) if x else False)
                 # Finde Parent-Elemente
+                seen_parents = set()
                 for link in pd_links:
                     parent = link.find_parent(['div', 'li', 'tr'])
-                    if parent and parent not in book_elements:
+                    if parent is not None and id(parent) not in seen_parents:
+                        seen_parents.add(id(parent))
                         book_elements.append(parent)
                 print(f"    Gefunden via /pd/ Links: {len(book_elements)}")
             
@@ -2243,7 +2274,7 @@ class AudibleLibrary:
                     link = element.find('a', href=lambda x: x and '/pd/' in str(x) if x else False)
                     if link:
                         href = link.get('href', '')
-                        asin_match = re.search(r'/pd/([^/]+)', href)
+                        asin_match = _PD_ASIN_PATTERN.search(href)
                         if asin_match:
                             asin = asin_match.group(1)
                 
@@ -2743,6 +2774,7 @@ class AudibleLibrary:
         
         return available
     
+    @metrics.instrument('book', 'audible', success=bool)
     def download_book(self, asin: str, title: str, output_dir: Path, 
                      as_chapters: bool = False, quality: str = "MP3_320") -> bool:
         """
@@ -3014,6 +3046,7 @@ class AudibleLibrary:
                 'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
             }
             
+            download_started = time.perf_counter()
             response = self.session.get(download_url, stream=True, timeout=300, headers=headers, allow_redirects=True)
             
             if response.status_code == 200:
@@ -3031,12 +3064,15 @@ class AudibleLibrary:
                                 if downloaded % (1024 * 1024) == 0:  # Jede MB
                                     print(f"  {percent:.1f}% ({downloaded // (1024*1024)} MB)")
                 
+                metrics.observe('download', 'audible', time.perf_counter() - download_started)
+                metrics.add_bytes('download', 'audible', downloaded)
                 print(f"  ✓ AAX-Datei heruntergeladen: {aax_path}")
                 
                 # Konvertiere AAX zu Zielformat
                 print(f"\nKonvertiere zu {audio_format.upper()}...")
                 return self._convert_aax_to_format(aax_path, output_dir, title, audio_format, quality_value, as_chapters)
             else:
+                metrics.count_error('download', 'audible')
                 print(f"  ✗ Download fehlgeschlagen: Status {response.status_code}")
                 return False
                 
@@ -3046,6 +3082,7 @@ class AudibleLibrary:
             traceback.print_exc()
             return False
     
+    @metrics.instrument('transcode', 'audible', success=bool)
     def _convert_aax_to_format(self, aax_path: Path, output_dir: Path, title: str,
                                audio_format: str, quality_value: str, as_chapters: bool) -> bool:
         """
@@ -3,54 +3,210 @@
 """
 Multi-Anbieter-Suche für Hörbücher
 Prüft Verfügbarkeit auf verschiedenen Plattformen: YouTube, Audible, Storytel, Nextory, BookBeat, Spotify
+Alle Anbieter werden gleichzeitig abgefragt; Ergebnisse kommen in der
+Reihenfolge ihres Eintreffens (iter_provider_results).
 """
 
+import importlib
 import subprocess
 import sys
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 import requests
 import time
 
-# Importiere vorhandene Downloader
-try:
-    from deezer_downloader import DeezerDownloader
-except ImportError:
-    DeezerDownloader = None
+import query_cache
+from lazy_import import module_available
 
-try:
-    from spotify_downloader import SpotifyDownloader
-except ImportError:
-    SpotifyDownloader = None
+DEFAULT_PROVIDER_TIMEOUT = 10
 
-try:
-    from audible_integration import AudibleLibrary
-except ImportError:
-    AudibleLibrary = None
+# Entry-Point-Gruppe, über die andere Pakete Anbieter (ProviderSpec) anmelden
+PROVIDER_ENTRY_POINT_GROUP = 'universal_downloader.audiobook_providers'
 
-try:
-    from audiobook_providers import StorytelProvider, NextoryProvider, BookBeatProvider
-except ImportError:
-    StorytelProvider = None
-    NextoryProvider = None
-    BookBeatProvider = None
+# Gesamtbudget einer Suche - danach werden ausstehende Anbieter abgebrochen
+SEARCH_BUDGET_SECONDS = 35
+
+# Ergebnis eines Anbieters ohne Treffer (Ausgangswerte für search_all_providers)
+EMPTY_RESULTS = {
+    'youtube': {'available': False, 'url': None, 'info': {}, 'downloadable': True, 'method': 'yt-dlp', 'drm': False},
+    'librivox': {'available': False, 'url': None, 'info': {}, 'downloadable': True, 'method': 'direct', 'drm': False},
+    'internet_archive': {'available': False, 'url': None, 'info': {}, 'downloadable': True, 'method': 'direct', 'drm': False},
+    'audible': {'available': False, 'asin': None, 'info': {}, 'downloadable': True, 'method': 'aax-decrypt', 'drm': True},
+    'spotify': {'available': False, 'url': None, 'info': {}, 'downloadable': True, 'method': 'audio-recording', 'drm': True},
+    'storytel': {'available': False, 'book_id': None, 'info': {}, 'downloadable': True, 'method': 'audio-recording', 'drm': True},
+    'nextory': {'available': False, 'book_id': None, 'info': {}, 'downloadable': True, 'method': 'audio-recording', 'drm': True},
+    'bookbeat': {'available': False, 'book_id': None, 'info': {}, 'downloadable': True, 'method': 'audio-recording', 'drm': True},
+}
+
+
+class ProviderSpec:
+    """
+    Deklaration eines Hörbuch-Anbieters für AudiobookSearch
+    
+    Beim Anmelden wird nichts importiert oder erzeugt. Die Anbieter-Instanz
+    (factory) entsteht erst, wenn der Anbieter zum ersten Mal abgefragt wird.
+    Ohne Zugangsdaten (is_configured() liefert False) wird er übersprungen,
+    bevor irgendeine Anfrage läuft.
+    
+    Beispiel für ein anderes Paket (pyproject.toml):
+        [project.entry-points."universal_downloader.audiobook_providers"]
+        mein_anbieter = "mein_paket.hoerbuch:SPEC"
+    mit SPEC = ProviderSpec('mein_anbieter', factory='mein_paket.hoerbuch:MeinAnbieter'),
+    wobei MeinAnbieter().search(query, timeout) ein Ergebnis-Dict liefert.
+    """
+    
+    def __init__(self, name: str, search: Optional[Callable] = None,
+                 factory: Optional[Union[str, Callable]] = None, requires: Tuple[str, ...] = (),
+                 is_configured: Optional[Callable[[], bool]] = None, timeout: float = DEFAULT_PROVIDER_TIMEOUT,
+                 label: Optional[Tuple[str, str, str]] = None, empty_result: Optional[Dict] = None):
+        """
+        Args:
+            name: Schlüssel im Suchergebnis (z.B. 'storytel')
+            search: search(searcher, query, timeout) → Ergebnis-Dict; None = Instanz.search(query, timeout)
+            factory: 'modul:Attribut' oder Callable, das die Anbieter-Instanz erzeugt
+            requires: Module, die importierbar sein müssen (wird ohne Import geprüft)
+            is_configured: Schnelle Prüfung auf Zugangsdaten (ohne Netzwerk)
+            timeout: Zeitlimit einer Suche in Sekunden
+            label: (Symbol, Name, Zusatz bei Treffer) für die Konsolenausgabe
+            empty_result: Ergebnis ohne Treffer
+        """
+        self.name = name
+        self.search = search
+        self.factory = factory
+        self.requires = tuple(requires)
+        self.is_configured = is_configured
+        self.timeout = timeout
+        self.label = label or ('🔍', name, '')
+        self.empty_result = empty_result or EMPTY_RESULTS.get(
+            name, {'available': False, 'url': None, 'info': {}, 'downloadable': True, 'method': None, 'drm': False}
+        )
+    
+    def is_available(self) -> bool:
+        """Module vorhanden und Zugangsdaten eingerichtet (ohne Import, ohne Netzwerk)"""
+        modules = list(self.requires)
+        if isinstance(self.factory, str):
+            modules.append(self.factory.partition(':')[0])
+        if not all(module_available(module) for module in modules):
+            return False
+        if self.is_configured is None:
+            return True
+        try:
+            return bool(self.is_configured())
+        except Exception:
+            return False
+    
+    def create(self):
+        """Erzeugt die Anbieter-Instanz (importiert dabei das Modul)"""
+        if callable(self.factory):
+            return self.factory()
+        module_name, _, attribute = self.factory.partition(':')
+        module = importlib.import_module(module_name)
+        return (getattr(module, attribute) if attribute else module)()
+
+
+_providers: Dict[str, ProviderSpec] = {}
+_entry_points_loaded = False
+_registry_lock = threading.Lock()
+
+
+def register_provider(spec: ProviderSpec, replace: bool = False):
+    """
+    Meldet einen Anbieter an (Reihenfolge der Anmeldung = Reihenfolge der Ausgabe)
+    
+    Args:
+        spec: Deklaration des Anbieters
+        replace: Vorhandenen Anbieter gleichen Namens ersetzen
+    """
+    with _registry_lock:
+        if replace or spec.name not in _providers:
+            _providers[spec.name] = spec
+
+
+def registered_providers() -> List[ProviderSpec]:
+    """Alle angemeldeten Anbieter, inklusive der über Entry Points installierten"""
+    _load_entry_points()
+    with _registry_lock:
+        return list(_providers.values())
+
+
+def _load_entry_points():
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    try:
+        from importlib.metadata import entry_points
+        found = entry_points()
+        # Python 3.10+: select(); davor ein Dict Gruppe → Liste
+        group = found.select(group=PROVIDER_ENTRY_POINT_GROUP) if hasattr(found, 'select') \
+            else found.get(PROVIDER_ENTRY_POINT_GROUP, [])
+    except Exception:
+        return
+    for entry_point in group:
+        try:
+            spec = entry_point.load()
+            if not isinstance(spec, ProviderSpec) and callable(spec):
+                spec = spec()
+            if isinstance(spec, ProviderSpec):
+                register_provider(spec)
+            else:
+                print(f"[WARNING] Hörbuch-Anbieter {entry_point.name}: keine ProviderSpec")
+        except Exception as e:
+            print(f"[WARNING] Hörbuch-Anbieter {entry_point.name} konnte nicht geladen werden: {e}")
 
 
 class AudiobookSearch:
     """Klasse für Multi-Anbieter-Suche von Hörbüchern"""
     
     def __init__(self):
-        self.deezer_downloader = DeezerDownloader() if DeezerDownloader else None
-        self.spotify_downloader = SpotifyDownloader() if SpotifyDownloader else None
-        self.audible_library = AudibleLibrary() if AudibleLibrary else None
+        # Anbieter-Instanzen entstehen erst bei der ersten Abfrage (siehe provider())
+        self._instances: Dict[str, object] = {}
+        self._instances_lock = threading.Lock()
         
-        # Initialisiere Provider (falls verfügbar)
-        self.storytel = StorytelProvider() if StorytelProvider else None
-        self.nextory = NextoryProvider() if NextoryProvider else None
-        self.bookbeat = BookBeatProvider() if BookBeatProvider else None
+        # Antworten der Anbieter (auch "nicht gefunden") werden zwischengespeichert
+        self.cache = query_cache.get_cache()
+    
+    def provider(self, name: str):
+        """
+        Instanz eines Anbieters, beim ersten Zugriff erzeugt
+        
+        Returns:
+            Instanz oder None (nicht angemeldet, nicht eingerichtet oder Fehler beim Erzeugen)
+        """
+        with self._instances_lock:
+            if name not in self._instances:
+                spec = next((spec for spec in registered_providers() if spec.name == name), None)
+                if spec is None or spec.factory is None or not spec.is_available():
+                    # Nicht merken - Zugangsdaten können später noch eingerichtet werden
+                    return None
+                try:
+                    self._instances[name] = spec.create()
+                except Exception as e:
+                    print(f"[WARNING] Anbieter {name} konnte nicht initialisiert werden: {e}")
+                    self._instances[name] = None
+            return self._instances[name]
+    
+    @property
+    def audible_library(self):
+        return self.provider('audible')
+    
+    @property
+    def storytel(self):
+        return self.provider('storytel')
+    
+    @property
+    def nextory(self):
+        return self.provider('nextory')
+    
+    @property
+    def bookbeat(self):
+        return self.provider('bookbeat')
     
-    def search_all_providers(self, title: str, artist: Optional[str] = None) -> Dict[str, Dict]:
+    def search_all_providers(self, title: str, artist: Optional[str] = None,
+                             budget: float = SEARCH_BUDGET_SECONDS) -> Dict[str, Dict]:
         """
         Sucht ein Hörbuch auf allen verfügbaren Plattformen
         Fokussiert auf Anbieter, von denen tatsächlich heruntergeladen werden kann
@@ -58,6 +214,7 @@ class AudiobookSearch:
         Args:
             title: Titel des Hörbuchs
             artist: Optional: Künstler/Autor
+            budget: Maximale Gesamtdauer in Sekunden
             
         Returns:
             Dictionary mit Verfügbarkeits-Informationen pro Anbieter
@@ -72,81 +229,21 @@ class AudiobookSearch:
                 'bookbeat': {'available': bool, 'book_id': str, 'info': dict, 'downloadable': bool, 'method': str, 'drm': bool},
             }
         """
-        results = {
-            'youtube': {'available': False, 'url': None, 'info': {}, 'downloadable': True, 'method': 'yt-dlp', 'drm': False},
-            'librivox': {'available': False, 'url': None, 'info': {}, 'downloadable': True, 'method': 'direct', 'drm': False},
-            'internet_archive': {'available': False, 'url': None, 'info': {}, 'downloadable': True, 'method': 'direct', 'drm': False},
-            'audible': {'available': False, 'asin': None, 'info': {}, 'downloadable': True, 'method': 'aax-decrypt', 'drm': True},
-            'spotify': {'available': False, 'url': None, 'info': {}, 'downloadable': True, 'method': 'audio-recording', 'drm': True},
-            'storytel': {'available': False, 'book_id': None, 'info': {}, 'downloadable': True, 'method': 'audio-recording', 'drm': True},
-            'nextory': {'available': False, 'book_id': None, 'info': {}, 'downloadable': True, 'method': 'audio-recording', 'drm': True},
-            'bookbeat': {'available': False, 'book_id': None, 'info': {}, 'downloadable': True, 'method': 'audio-recording', 'drm': True},
-        }
-        
-        # Erstelle Suchanfrage
-        search_query = f"{artist} {title}" if artist else title
+        results = {provider: dict(result) for provider, result in EMPTY_RESULTS.items()}
+        labels = {spec.name: spec.label for spec in registered_providers()}
         
-        print(f"🔍 Suche nach: {search_query}")
+        print(f"🔍 Suche nach: {f'{artist} {title}' if artist else title}")
         print("=" * 70)
         
-        # 1. Prüfe YouTube
-        print("📺 Prüfe YouTube...")
-        youtube_result = self._search_youtube(search_query)
-        results['youtube'] = youtube_result
-        if youtube_result['available']:
-            print(f"  ✅ Verfügbar auf YouTube")
-        else:
-            print(f"  ❌ Nicht verfügbar auf YouTube")
-        
-        # 4. Prüfe Spotify (DRM, aber Audio-Aufnahme möglich)
-        if self.spotify_downloader:
-            print("🎵 Prüfe Spotify...")
-            spotify_result = self._search_spotify(search_query)
-            results['spotify'] = spotify_result
-            if spotify_result['available']:
-                print(f"  ✅ Verfügbar auf Spotify (DRM, Audio-Aufnahme möglich)")
+        for provider, result in self.iter_provider_results(title, artist, budget):
+            results[provider] = result
+            symbol, name, note = labels.get(provider, ('🔍', provider, ''))
+            if result.get('available'):
+                print(f"{symbol} ✅ Verfügbar auf {name}{note}")
+            elif result.get('info', {}).get('error'):
+                print(f"{symbol} ⚠️ {name}: {result['info']['error']}")
             else:
-                print(f"  ❌ Nicht verfügbar auf Spotify")
-        
-        # 5. Prüfe Audible (DRM, aber AAX-Entschlüsselung möglich)
-        if self.audible_library:
-            print("📚 Prüfe Audible...")
-            audible_result = self._search_audible(search_query)
-            results['audible'] = audible_result
-            if audible_result['available']:
-                print(f"  ✅ Verfügbar auf Audible (DRM, AAX-Entschlüsselung möglich)")
-            else:
-                print(f"  ❌ Nicht verfügbar auf Audible")
-        
-        # 6. Prüfe Storytel (DRM, aber Audio-Aufnahme möglich)
-        if self.storytel:
-            print("📖 Prüfe Storytel...")
-            storytel_result = self._search_storytel(search_query)
-            results['storytel'] = storytel_result
-            if storytel_result['available']:
-                print(f"  ✅ Verfügbar auf Storytel (DRM, Audio-Aufnahme möglich)")
-            else:
-                print(f"  ❌ Nicht verfügbar auf Storytel")
-        
-        # 7. Prüfe Nextory (DRM, aber Audio-Aufnahme möglich)
-        if self.nextory:
-            print("📕 Prüfe Nextory...")
-            nextory_result = self._search_nextory(search_query)
-            results['nextory'] = nextory_result
-            if nextory_result['available']:
-                print(f"  ✅ Verfügbar auf Nextory (DRM, Audio-Aufnahme möglich)")
-            else:
-                print(f"  ❌ Nicht verfügbar auf Nextory")
-        
-        # 8. Prüfe BookBeat (DRM, aber Audio-Aufnahme möglich)
-        if self.bookbeat:
-            print("📗 Prüfe BookBeat...")
-            bookbeat_result = self._search_bookbeat(search_query)
-            results['bookbeat'] = bookbeat_result
-            if bookbeat_result['available']:
-                print(f"  ✅ Verfügbar auf BookBeat (DRM, Audio-Aufnahme möglich)")
-            else:
-                print(f"  ❌ Nicht verfügbar auf BookBeat")
+                print(f"{symbol} ❌ Nicht verfügbar auf {name}")
         
         print("=" * 70)
         
@@ -159,7 +256,91 @@ class AudiobookSearch:
         
         return results
     
-    def _search_youtube(self, query: str) -> Dict:
+    def _provider_searches(self) -> List[Tuple[str, Callable[[str, float], Dict], float]]:
+        """Anbieter, die abgefragt werden: (Name, Suchfunktion(query, timeout), Zeitlimit)"""
+        searches = []
+        for spec in registered_providers():
+            # Fehlende Module/Zugangsdaten: überspringen, bevor irgendetwas importiert oder angefragt wird
+            if spec.is_available():
+                searches.append((spec.name, lambda query, timeout, spec=spec: self._run_search(spec, query, timeout),
+                                 spec.timeout))
+        return searches
+    
+    def _run_search(self, spec: ProviderSpec, query: str, timeout: float) -> Dict:
+        if spec.search is not None:
+            return spec.search(self, query, timeout)
+        instance = self.provider(spec.name)
+        if instance is None:
+            return self._failed_result(spec.name, "Anbieter nicht verfügbar")
+        return instance.search(query, timeout)
+
+    def iter_provider_results(self, title: str, artist: Optional[str] = None,
+                              budget: float = SEARCH_BUDGET_SECONDS) -> Iterator[Tuple[str, Dict]]:
+        """
+        Fragt alle Anbieter gleichzeitig ab und liefert Ergebnisse, sobald sie eintreffen
+        
+        Jeder Anbieter hat sein eigenes Zeitlimit (ProviderSpec.timeout), höchstens
+        aber das Gesamtbudget. Ist das Budget aufgebraucht, werden noch
+        ausstehende Anbieter mit einem Fehler-Ergebnis gemeldet und nicht mehr
+        abgewartet. Bricht der Aufrufer die Iteration ab, gilt dasselbe.
+        Zwischengespeicherte Antworten kommen sofort, ohne Anfrage.
+        
+        Args:
+            title: Titel des Hörbuchs
+            artist: Optional: Künstler/Autor
+            budget: Maximale Gesamtdauer in Sekunden
+            
+        Yields:
+            (Anbieter, Ergebnis im Format von search_all_providers)
+        """
+        query = f"{artist} {title}" if artist else title
+        cache_key = (artist or '', title)
+        searches = []
+        for provider, search, timeout in self._provider_searches():
+            cached = self.cache.get(f"audiobook.{provider}", cache_key)
+            if cached is query_cache.MISS:
+                searches.append((provider, search, timeout))
+            else:
+                yield provider, cached
+        if not searches:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=len(searches), thread_name_prefix='audiobook-search')
+        pending = {
+            executor.submit(search, query, min(timeout, budget)): provider
+            for provider, search, timeout in searches
+        }
+        try:
+            try:
+                for future in as_completed(list(pending), timeout=budget):
+                    provider = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = self._failed_result(provider, str(e))
+                    # Fehler (Timeout, Netzwerk) nicht merken - nur echte Antworten
+                    if not result.get('info', {}).get('error'):
+                        self.cache.put(f"audiobook.{provider}", cache_key, result)
+                    yield provider, result
+            except FuturesTimeoutError:
+                for future, provider in list(pending.items()):
+                    future.cancel()
+                    del pending[future]
+                    yield provider, self._failed_result(provider, f"Zeitüberschreitung nach {budget:.0f}s")
+        finally:
+            # Nicht auf Nachzügler warten - deren eigene Timeouts beenden sie
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    @staticmethod
+    def _failed_result(provider: str, error: str) -> Dict:
+        spec = _providers.get(provider)
+        result = dict(spec.empty_result if spec else EMPTY_RESULTS.get(provider, {'available': False, 'info': {}}))
+        result['info'] = {'error': error}
+        return result
+    
+    def _search_youtube(self, query: str, timeout: float = 30) -> Dict:
         """Sucht auf YouTube"""
         try:
             import tempfile
@@ -182,9 +363,13 @@ class AudiobookSearch:
                     search_url
                 ]
                 
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+                
+                if result.returncode != 0:
+                    tmp_path.unlink(missing_ok=True)
+                    return self._failed_result('youtube', (result.stderr or '').strip()[-200:] or 'yt-dlp fehlgeschlagen')
                 
-                if result.returncode == 0 and result.stdout:
+                if result.stdout:
                     import json
                     video_info = json.loads(result.stdout)
                     
@@ -212,19 +397,23 @@ class AudiobookSearch:
                 tmp_path.unlink(missing_ok=True)
                 return {'available': False, 'url': None, 'info': {}, 'downloadable': False, 'method': None, 'drm': False}
                 
-            except Exception:
+            except Exception as e:
                 tmp_path.unlink(missing_ok=True)
-                return {'available': False, 'url': None, 'info': {}}
+                return {'available': False, 'url': None, 'info': {'error': str(e)}}
                 
         except Exception as e:
             return {'available': False, 'url': None, 'info': {'error': str(e)}}
     
-    def _search_librivox(self, query: str) -> Dict:
+    def _search_librivox(self, query: str, timeout: float = DEFAULT_PROVIDER_TIMEOUT) -> Dict:
         """Sucht auf Librivox (kostenlose Hörbücher, kein DRM)"""
         try:
             # Librivox API oder Web-Suche
             search_url = f"https://librivox.org/api/feed/audiobooks/?search={query}&format=json"
-            response = requests.get(search_url, timeout=10)
+            response = requests.get(search_url, timeout=timeout)
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                # Vorübergehende Störung - nicht als "nicht gefunden" werten
+                return self._failed_result('librivox', f"HTTP {response.status_code}")
             
             if response.status_code == 200:
                 data = response.json()
@@ -251,7 +440,7 @@ class AudiobookSearch:
         except Exception as e:
             return {'available': False, 'url': None, 'info': {'error': str(e)}, 'downloadable': False, 'method': None, 'drm': False}
     
-    def _search_internet_archive(self, query: str) -> Dict:
+    def _search_internet_archive(self, query: str, timeout: float = DEFAULT_PROVIDER_TIMEOUT) -> Dict:
         """Sucht auf Internet Archive (kostenlose Hörbücher, kein DRM)"""
         try:
             # Internet Archive API
@@ -262,7 +451,11 @@ class AudiobookSearch:
                 'output': 'json',
                 'rows': 1
             }
-            response = requests.get(search_url, params=params, timeout=10)
+            response = requests.get(search_url, params=params, timeout=timeout)
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                # Vorübergehende Störung - nicht als "nicht gefunden" werten
+                return self._failed_result('internet_archive', f"HTTP {response.status_code}")
             
             if response.status_code == 200:
                 data = response.json()
@@ -289,12 +482,9 @@ class AudiobookSearch:
         except Exception as e:
             return {'available': False, 'url': None, 'info': {'error': str(e)}, 'downloadable': False, 'method': None, 'drm': False}
     
-    def _search_spotify(self, query: str) -> Dict:
+    def _search_spotify(self, query: str, timeout: float = DEFAULT_PROVIDER_TIMEOUT) -> Dict:
         """Sucht auf Spotify"""
         try:
-            if not self.spotify_downloader:
-                return {'available': False, 'url': None, 'info': {}}
-            
             # Verwende Spotify Web API für Suche
             search_url = "https://api.spotify.com/v1/search"
             params = {
@@ -304,7 +494,11 @@ class AudiobookSearch:
             }
             
             # Versuche ohne Token (öffentliche API)
-            response = requests.get(search_url, params=params, timeout=10)
+            response = requests.get(search_url, params=params, timeout=timeout)
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                # Vorübergehende Störung - nicht als "nicht gefunden" werten
+                return self._failed_result('spotify', f"HTTP {response.status_code}")
             
             if response.status_code == 200:
                 data = response.json()
@@ -330,7 +524,7 @@ class AudiobookSearch:
         except Exception as e:
             return {'available': False, 'url': None, 'info': {'error': str(e)}}
     
-    def _search_audible(self, query: str) -> Dict:
+    def _search_audible(self, query: str, timeout: float = DEFAULT_PROVIDER_TIMEOUT) -> Dict:
         """Sucht auf Audible"""
         try:
             if not self.audible_library:
@@ -361,7 +555,7 @@ class AudiobookSearch:
         except Exception as e:
             return {'available': False, 'asin': None, 'info': {'error': str(e)}}
     
-    def _search_storytel(self, query: str) -> Dict:
+    def _search_storytel(self, query: str, timeout: float = DEFAULT_PROVIDER_TIMEOUT) -> Dict:
         """Sucht auf Storytel"""
         try:
             if not self.storytel:
@@ -370,7 +564,11 @@ class AudiobookSearch:
             # Storytel hat keine öffentliche API
             # Versuche über Web-Suche
             search_url = f"https://www.storytel.com/de/de/search?q={query}"
-            response = requests.get(search_url, timeout=10)
+            response = requests.get(search_url, timeout=timeout)
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                # Vorübergehende Störung - nicht als "nicht gefunden" werten
+                return self._failed_result('storytel', f"HTTP {response.status_code}")
             
             if response.status_code == 200:
                 # Prüfe ob Ergebnisse gefunden wurden (einfache Heuristik)
@@ -391,7 +589,7 @@ class AudiobookSearch:
         except Exception as e:
             return {'available': False, 'book_id': None, 'info': {'error': str(e)}}
     
-    def _search_nextory(self, query: str) -> Dict:
+    def _search_nextory(self, query: str, timeout: float = DEFAULT_PROVIDER_TIMEOUT) -> Dict:
         """Sucht auf Nextory"""
         try:
             if not self.nextory:
@@ -399,7 +597,11 @@ class AudiobookSearch:
             
             # Nextory hat keine öffentliche API
             search_url = f"https://www.nextory.de/suche/?q={query}"
-            response = requests.get(search_url, timeout=10)
+            response = requests.get(search_url, timeout=timeout)
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                # Vorübergehende Störung - nicht als "nicht gefunden" werten
+                return self._failed_result('nextory', f"HTTP {response.status_code}")
             
             if response.status_code == 200:
                 if 'book' in response.text.lower() or 'hörbuch' in response.text.lower():
@@ -419,7 +621,7 @@ class AudiobookSearch:
         except Exception as e:
             return {'available': False, 'book_id': None, 'info': {'error': str(e)}}
     
-    def _search_bookbeat(self, query: str) -> Dict:
+    def _search_bookbeat(self, query: str, timeout: float = DEFAULT_PROVIDER_TIMEOUT) -> Dict:
         """Sucht auf BookBeat"""
         try:
             if not self.bookbeat:
@@ -427,7 +629,11 @@ class AudiobookSearch:
             
             # BookBeat hat keine öffentliche API
             search_url = f"https://www.bookbeat.de/suche?q={query}"
-            response = requests.get(search_url, timeout=10)
+            response = requests.get(search_url, timeout=timeout)
+            
+            if response.status_code == 429 or response.status_code >= 500:
+                # Vorübergehende Störung - nicht als "nicht gefunden" werten
+                return self._failed_result('bookbeat', f"HTTP {response.status_code}")
             
             if response.status_code == 200:
                 if 'book' in response.text.lower() or 'hörbuch' in response.text.lower():
@@ -562,6 +768,36 @@ class AudiobookSearch:
             return False
 
 
+def _config_exists(filename: str) -> Callable[[], bool]:
+    """Zugangsdaten gelten als eingerichtet, wenn die Konfigurationsdatei des Anbieters existiert"""
+    return lambda: Path(filename).exists()
+
+
+def _create_audible_library():
+    from audible_integration import AudibleAuth, AudibleLibrary
+    return AudibleLibrary(AudibleAuth())
+
+
+_DRM_RECORDING_NOTE = ' (DRM, Audio-Aufnahme möglich)'
+
+for _spec in (
+    ProviderSpec('youtube', search=AudiobookSearch._search_youtube, timeout=30,
+                 label=('📺', 'YouTube', '')),
+    ProviderSpec('spotify', search=AudiobookSearch._search_spotify, requires=('spotify_downloader',),
+                 label=('🎵', 'Spotify', _DRM_RECORDING_NOTE)),
+    ProviderSpec('audible', search=AudiobookSearch._search_audible, factory=_create_audible_library,
+                 requires=('audible_integration',), is_configured=_config_exists('.audible_config.json'),
+                 label=('📚', 'Audible', ' (DRM, AAX-Entschlüsselung möglich)')),
+    ProviderSpec('storytel', search=AudiobookSearch._search_storytel, factory='audiobook_providers:StorytelProvider',
+                 is_configured=_config_exists('.storytel_config.json'), label=('📖', 'Storytel', _DRM_RECORDING_NOTE)),
+    ProviderSpec('nextory', search=AudiobookSearch._search_nextory, factory='audiobook_providers:NextoryProvider',
+                 is_configured=_config_exists('.nextory_config.json'), label=('📕', 'Nextory', _DRM_RECORDING_NOTE)),
+    ProviderSpec('bookbeat', search=AudiobookSearch._search_bookbeat, factory='audiobook_providers:BookBeatProvider',
+                 is_configured=_config_exists('.bookbeat_config.json'), label=('📗', 'BookBeat', _DRM_RECORDING_NOTE)),
+):
+    register_provider(_spec)
+
+
 if __name__ == "__main__":
     # Test
     searcher = AudiobookSearch()
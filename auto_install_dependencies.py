@@ -11,8 +11,16 @@ import os
 import shutil
 import zipfile
 import urllib.request
+import json
+import hashlib
+import site
+import sysconfig
+from datetime import datetime
 from pathlib import Path
 
+# Ergebnis der letzten vollständigen Prüfung (gültig solange sich der Fingerabdruck nicht ändert)
+DEPENDENCY_CACHE_FILE = ".dependency_check.json"
+
 
 def is_frozen():
     """Prüft ob die Anwendung als .exe gebaut wurde (PyInstaller)"""
@@ -29,6 +37,99 @@ def get_app_dir():
         return Path(__file__).parent
 
 
+def _local_ffmpeg_bin() -> Path:
+    return get_app_dir() / "ffmpeg" / "bin"
+
+
+def _prepend_local_ffmpeg_to_path():
+    """Nimmt das mitgelieferte ffmpeg in den PATH auf, falls keines im PATH liegt (ohne Prozessstart)"""
+    ffmpeg_bin = _local_ffmpeg_bin()
+    if shutil.which('ffmpeg') is None and ffmpeg_bin.exists():
+        os.environ['PATH'] = str(ffmpeg_bin) + os.pathsep + os.environ.get('PATH', '')
+
+
+def _mtime(path) -> float:
+    try:
+        return os.stat(path).st_mtime
+    except (OSError, TypeError):
+        return 0.0
+
+
+def dependency_fingerprint() -> str:
+    """
+    Fingerabdruck der Umgebung, von der das Ergebnis der Abhängigkeitsprüfung abhängt
+    
+    Interpreter, virtuelle Umgebung, Änderungszeiten der site-packages-Ordner
+    (ändern sich bei pip install/uninstall), requirements.txt und der
+    ffmpeg-Datei, die im PATH gefunden wird. Kommt ohne Prozessstart und ohne
+    Paket-Imports aus.
+    """
+    site_dirs = set()
+    for key in ('purelib', 'platlib'):
+        try:
+            site_dirs.add(sysconfig.get_paths()[key])
+        except KeyError:
+            pass
+    try:
+        site_dirs.update(site.getsitepackages())
+    except AttributeError:
+        pass  # ältere virtualenv-Versionen
+    if site.ENABLE_USER_SITE and site.USER_SITE:
+        site_dirs.add(site.USER_SITE)
+    
+    ffmpeg_path = shutil.which('ffmpeg')
+    parts = {
+        'executable': sys.executable,
+        'version': sys.version,
+        'prefix': sys.prefix,
+        'base_prefix': getattr(sys, 'base_prefix', sys.prefix),
+        'frozen': is_frozen(),
+        'site_packages': sorted((d, _mtime(d)) for d in site_dirs),
+        'requirements': _mtime(get_app_dir() / "requirements.txt"),
+        'ffmpeg': [ffmpeg_path, _mtime(ffmpeg_path)],
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _dependency_cache_path() -> Path:
+    return get_app_dir() / DEPENDENCY_CACHE_FILE
+
+
+def load_cached_dependency_status():
+    """
+    Liefert das gespeicherte Prüfergebnis, wenn sich die Umgebung seitdem nicht geändert hat
+    
+    Returns:
+        dict mit 'ytdlp_version' und 'ffmpeg_version' oder None (neu prüfen)
+    """
+    _prepend_local_ffmpeg_to_path()
+    cache_file = _dependency_cache_path()
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get('fingerprint') != dependency_fingerprint():
+        return None
+    return data
+
+
+def save_dependency_status(ytdlp_version, ffmpeg_version):
+    """Speichert ein vollständig erfolgreiches Prüfergebnis zusammen mit dem aktuellen Fingerabdruck"""
+    try:
+        with open(_dependency_cache_path(), 'w', encoding='utf-8') as f:
+            json.dump({
+                'fingerprint': dependency_fingerprint(),
+                'checked_at': datetime.now().isoformat(),
+                'ytdlp_version': ytdlp_version,
+                'ffmpeg_version': ffmpeg_version
+            }, f)
+    except OSError:
+        pass  # z.B. Programmordner nicht beschreibbar - dann wird beim nächsten Start neu geprüft
+
+
 def check_ytdlp():
     """Prüft ob yt-dlp verfügbar ist (als Python-Modul)"""
     try:
@@ -631,6 +732,12 @@ def ensure_dependencies():
     # Progress-Callback für alle Funktionen
     progress_callback = getattr(ensure_dependencies, '_progress_callback', None)
     
+    # Nichts geändert seit der letzten erfolgreichen Prüfung → keine Imports, keine Prozessstarts
+    cached = load_cached_dependency_status()
+    if cached:
+        messages.append(f"[OK] Abhängigkeiten unverändert seit {cached.get('checked_at', '?')} (yt-dlp {cached.get('ytdlp_version')}, ffmpeg)")
+        return True, True, messages, False
+    
     # Prüfe und installiere requirements.txt
     requirements_ok, missing_packages = check_requirements_txt(progress_callback)
     if not requirements_ok:
@@ -639,6 +746,7 @@ def ensure_dependencies():
         if success:
             messages.append(f"[OK] requirements.txt Installation: {status}")
             has_updates = True
+            requirements_ok = True
         else:
             messages.append(f"[ERROR] requirements.txt Installation fehlgeschlagen: {status}")
     else:
@@ -689,6 +797,10 @@ def ensure_dependencies():
             elif system == 'Darwin':
                 messages.append("  brew install ffmpeg")
     
+    # Nur vollständig erfolgreiche Prüfungen merken - fehlt etwas, wird beim nächsten Start erneut geprüft
+    if requirements_ok and ytdlp_ok and ffmpeg_available:
+        save_dependency_status(ytdlp_version, ffmpeg_version)
+    
     return ytdlp_ok, ffmpeg_ok, messages, has_updates
 
 
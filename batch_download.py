@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch-Downloads über die Kommandozeile
+Liest URLs oder IDs (z.B. "deezer:album:302127", "spotify:playlist:...")
+aus Dateien oder stdin, verteilt sie auf den passenden Downloader und gibt
+pro Eintrag eine JSON-Zeile auf stdout aus. Für Cronjobs geeignet.
+
+Exit-Codes:
+    0  alle Einträge erfolgreich
+    1  mindestens ein Eintrag fehlgeschlagen
+    2  ungültiger Aufruf / keine Einträge
+    130  abgebrochen (Strg+C)
+
+Beispiele:
+    python batch_download.py urls.txt --jobs 4
+    cat urls.txt | python batch_download.py - --format mp3 > results.jsonl
+    python batch_download.py urls.txt --metrics run-metrics.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from datetime import datetime
+from typing import Dict, Iterable, List, TextIO
+
+import metrics
+from download_service import execute_download, normalize_target, detect_kind
+
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+# Sekunden, die nach einem Abbruch auf laufende Downloads gewartet wird
+SHUTDOWN_TIMEOUT = 5.0
+
+
+def read_targets(sources: List[str], stdin: TextIO = None) -> List[str]:
+    """
+    Liest URLs/IDs aus Dateien oder stdin
+
+    Leere Zeilen und Kommentare (#) werden ignoriert, Duplikate entfernt.
+
+    Args:
+        sources: Dateipfade, "-" für stdin
+        stdin: Alternativer Eingabe-Stream für "-"
+
+    Returns:
+        Liste der Einträge in Eingabereihenfolge
+    """
+    stdin = stdin or sys.stdin
+    targets = []
+    seen = set()
+
+    def add_lines(lines: Iterable[str]):
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            target = normalize_target(line)
+            if target not in seen:
+                seen.add(target)
+                targets.append(target)
+
+    for source in sources:
+        if source == '-':
+            add_lines(stdin)
+        else:
+            with open(source, 'r', encoding='utf-8') as f:
+                add_lines(f)
+    return targets
+
+
+def run_one(index: int, target: str, options: Dict, retries: int) -> Dict:
+    """Lädt einen Eintrag herunter und baut die Ergebniszeile"""
+    started = time.monotonic()
+    attempts = 0
+    result = None
+    while attempts <= retries:
+        attempts += 1
+        try:
+            result = execute_download(target, options)
+        except Exception as e:
+            result = {'success': False, 'kind': detect_kind(target), 'url': target,
+                      'count': 0, 'file_path': None, 'error': str(e)}
+        if result.get('success'):
+            break
+    return {
+        'index': index,
+        'input': target,
+        'kind': result.get('kind'),
+        'success': bool(result.get('success')),
+        'count': result.get('count', 0),
+        'file_path': result.get('file_path'),
+        'error': result.get('error'),
+        'attempts': attempts,
+        'duration': round(time.monotonic() - started, 3),
+        'finished_at': datetime.now().isoformat(),
+    }
+
+
+def main(argv=None) -> int:
+    """Einstiegspunkt der Batch-CLI"""
+    parser = argparse.ArgumentParser(
+        description="Universal Downloader - Batch-Downloads aus Dateien oder stdin (Ausgabe: JSON-Lines)"
+    )
+    parser.add_argument('sources', nargs='*', default=['-'],
+                        help="Dateien mit einer URL/ID pro Zeile, '-' für stdin (Standard)")
+    parser.add_argument('-j', '--jobs', type=int, default=2, help="Gleichzeitige Downloads (Standard: 2)")
+    parser.add_argument('-o', '--download-path', help="Basis-Ordner für Downloads")
+    parser.add_argument('-q', '--quality', help="Qualität (Video: best/1080p/...; Deezer: MP3_320/FLAC)")
+    parser.add_argument('-f', '--format', help="Ausgabeformat für Videos (mp4, mp3, ...)")
+    parser.add_argument('--discography', action='store_true',
+                        help="Deezer-Artists: komplette Diskografie statt Top-Tracks (jede Aufnahme einmal)")
+    parser.add_argument('--retries', type=int, default=0, help="Wiederholungen pro fehlgeschlagenem Eintrag")
+    parser.add_argument('--ordered', action='store_true',
+                        help="Ergebnisse in Eingabereihenfolge statt nach Fertigstellung ausgeben")
+    parser.add_argument('--verbose', action='store_true', help="Log-Ausgaben der Downloader auf stderr zeigen")
+    parser.add_argument('--metrics', metavar='DATEI',
+                        help="Dauer/Fehler/Bytes je Stufe am Ende als JSON-Snapshot speichern")
+    args = parser.parse_args(argv)
+
+    try:
+        targets = read_targets(args.sources)
+    except OSError as e:
+        print(f"Fehler beim Lesen der Eingabe: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    if not targets:
+        print("Keine URLs/IDs in der Eingabe gefunden", file=sys.stderr)
+        return EXIT_USAGE
+
+    options = {key: value for key, value in {
+        'download_path': args.download_path,
+        'quality': args.quality,
+        'format': args.format,
+        'discography': args.discography,
+    }.items() if value}
+
+    out = sys.stdout
+    out_lock = threading.Lock()
+    pending = {}
+    next_index = [0]
+
+    def emit(line: Dict):
+        with out_lock:
+            if not args.ordered:
+                out.write(json.dumps(line, ensure_ascii=False) + "\n")
+                out.flush()
+                return
+            # Gibt Ergebnisse erst aus, wenn alle vorherigen Einträge fertig sind
+            pending[line['index']] = line
+            while next_index[0] in pending:
+                out.write(json.dumps(pending.pop(next_index[0]), ensure_ascii=False) + "\n")
+                next_index[0] += 1
+            out.flush()
+
+    # Die Downloader schreiben ihre Logs per print() - halte stdout frei für JSON-Lines
+    log_target = sys.stderr if args.verbose else open(os.devnull, 'w')
+    failed = 0
+    futures = []
+    executor = ThreadPoolExecutor(max_workers=max(1, args.jobs))
+    sys.stdout = log_target
+    try:
+        futures = [executor.submit(run_one, i, target, options, max(0, args.retries))
+                   for i, target in enumerate(targets)]
+        for future in as_completed(futures):
+            line = future.result()
+            if not line['success']:
+                failed += 1
+            emit(line)
+    except KeyboardInterrupt:
+        executor.shutdown(wait=False, cancel_futures=True)
+        print("Abgebrochen", file=sys.stderr)
+        return EXIT_INTERRUPTED
+    finally:
+        executor.shutdown(wait=False)
+        # Laufende Downloads loggen weiter per print() - Umleitung erst aufheben
+        # (und das Log-Ziel schließen), wenn kein Worker mehr schreibt
+        _, running = wait(futures, timeout=SHUTDOWN_TIMEOUT)
+        if running:
+            print(f"{len(running)} Download(s) laufen noch - Logs bleiben umgeleitet", file=sys.stderr)
+        else:
+            sys.stdout = out
+            if log_target is not sys.stderr:
+                log_target.close()
+        if args.metrics:
+            try:
+                metrics.write_snapshot(args.metrics)
+            except OSError as e:
+                print(f"Metriken konnten nicht gespeichert werden: {e}", file=sys.stderr)
+
+    print(f"{len(targets) - failed}/{len(targets)} erfolgreich", file=sys.stderr)
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
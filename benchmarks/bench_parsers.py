@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mikro-Benchmarks für die Parser im Hot-Path
+Misst die reine Parse-Zeit (ohne Netzwerk, ohne yt-dlp) auf aufgezeichneten
+Fixtures in benchmarks/fixtures/:
+
+    qualities_*     VideoDownloader._extract_available_qualities
+    series_*        VideoDownloader._parse_series_listing (Flat-Playlist JSON-Zeilen)
+    description     VideoDownloader._parse_description_html (ARD-Mediathek Seite)
+    audible_library AudibleLibrary._parse_library_html (benötigt requests + bs4)
+
+Verwendung:
+    python benchmarks/bench_parsers.py
+    python benchmarks/bench_parsers.py --only series_ard description --repeat 9
+    python benchmarks/bench_parsers.py --output parsers.json
+    python benchmarks/bench_parsers.py --baseline parsers.json --threshold 15
+    python benchmarks/bench_parsers.py --snapshot before.json   # Parser-Ergebnisse sichern
+    python benchmarks/bench_parsers.py --verify before.json     # ... und später vergleichen
+
+Exit-Code 1 bei einer Regression gegenüber --baseline oder abweichenden
+Ergebnissen bei --verify.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+FIXTURE_DIR = BENCH_DIR / "fixtures"
+
+# Füge Projekt-Pfad hinzu
+sys.path.insert(0, str(REPO_ROOT))
+
+
+class CaseSkipped(Exception):
+    """Fall kann in dieser Umgebung nicht laufen (z.B. fehlende Abhängigkeit)"""
+
+
+def _read_fixture(name: str) -> str:
+    return (FIXTURE_DIR / name).read_text(encoding='utf-8')
+
+
+def _video_downloader():
+    """VideoDownloader ohne __init__ (kein yt-dlp-Check, keine Log-Datei)"""
+    from video_downloader import VideoDownloader
+    downloader = VideoDownloader.__new__(VideoDownloader)
+    downloader.download_log = []
+    downloader.log_file = None
+    downloader.gui_instance = None
+    downloader.log = lambda message, level="INFO": None
+    return downloader
+
+
+def _audible_library():
+    try:
+        import bs4  # noqa: F401
+        from audible_integration import AudibleLibrary
+    except ImportError as e:
+        raise CaseSkipped(f"Abhängigkeit fehlt: {e.name}")
+    return AudibleLibrary.__new__(AudibleLibrary)
+
+
+def case_qualities(fixture_key: str) -> Callable[[], Callable]:
+    def setup():
+        downloader = _video_downloader()
+        info = json.loads(_read_fixture("video_formats.json"))[fixture_key]
+        return lambda: downloader._extract_available_qualities(info)
+    return setup
+
+
+def case_series(fixture: str, series_url: str, is_youtube: bool) -> Callable[[], Callable]:
+    def setup():
+        downloader = _video_downloader()
+        output = _read_fixture(fixture)
+        return lambda: downloader._parse_series_listing(output, series_url, is_youtube)
+    return setup
+
+
+def case_description() -> Callable:
+    downloader = _video_downloader()
+    html = _read_fixture("ard_video_page.html")
+    return lambda: downloader._parse_description_html(html)
+
+
+def case_audible_library() -> Callable:
+    library = _audible_library()
+    html = _read_fixture("audible_library.html")
+    return lambda: library._parse_library_html(html)
+
+
+CASES: Dict[str, Callable[[], Callable]] = {
+    'qualities_youtube': case_qualities('youtube_4k'),
+    'qualities_ard': case_qualities('ard_hls'),
+    'series_ard': case_series("series_ard_flat_playlist.jsonl",
+                              "https://www.ardmediathek.de/serie/almania/staffel-3/Y3JpZDovL2FsbWFuaWE/3", False),
+    'series_youtube': case_series("series_youtube_flat_playlist.jsonl",
+                                  "https://www.youtube.com/playlist?list=PLbench", True),
+    'description': case_description,
+    'audible_library': case_audible_library,
+}
+
+
+def measure(func: Callable, repeat: int, min_time: float) -> Tuple[Dict, object]:
+    """
+    Misst einen Aufruf wie timeit: Anzahl Durchläufe so wählen, dass eine
+    Messung mindestens min_time Sekunden dauert, dann repeat Messungen.
+
+    Returns:
+        Tuple (Statistik, Ergebnis des letzten Aufrufs)
+    """
+    result = func()  # Aufwärmen (Imports, Caches)
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    per_call = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            result = func()
+        per_call.append((time.perf_counter() - started) / number)
+
+    return {
+        'status': 'ok',
+        'number': number,
+        'repeat': repeat,
+        'best_us': round(min(per_call) * 1e6, 2),
+        'median_us': round(statistics.median(per_call) * 1e6, 2),
+    }, result
+
+
+def _normalize(value):
+    """Macht Parser-Ergebnisse JSON-vergleichbar (int-Keys → str)"""
+    return json.loads(json.dumps(value, ensure_ascii=False, sort_keys=True, default=str))
+
+
+def compare_with_baseline(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Vergleicht Median-Zeiten mit einer früheren Messung"""
+    regressions = []
+    for name, current in results['cases'].items():
+        previous = baseline.get('cases', {}).get(name)
+        if current.get('status') != 'ok' or not previous or previous.get('status') != 'ok':
+            continue
+        change = (current['median_us'] - previous['median_us']) / previous['median_us'] * 100
+        current['change_vs_baseline_percent'] = round(change, 1)
+        if change > threshold:
+            regressions.append(f"{name}: {previous['median_us']:.1f}µs → {current['median_us']:.1f}µs (+{change:.1f}%)")
+    return regressions
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def print_report(results: Dict):
+    print(f"\n{'Fall':<18} {'Status':<8} {'Median':>12} {'Best':>12} {'Läufe':>8}")
+    print("-" * 62)
+    for name, data in results['cases'].items():
+        if data['status'] != 'ok':
+            print(f"{name:<18} {data['status']:<8} {data.get('reason', '')}")
+            continue
+        change = data.get('change_vs_baseline_percent')
+        suffix = f"  ({change:+.1f}%)" if change is not None else ""
+        print(f"{name:<18} {'ok':<8} {data['median_us']:>10.1f}µs {data['best_us']:>10.1f}µs "
+              f"{data['number']:>8}{suffix}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Mikro-Benchmarks für Parser (Fixtures, offline)")
+    parser.add_argument('--only', nargs='+', choices=sorted(CASES), help="Nur diese Fälle ausführen")
+    parser.add_argument('--repeat', type=int, default=5, help="Messungen pro Fall (Standard: 5)")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="Mindestdauer einer Messung in Sekunden (Standard: 0.2)")
+    parser.add_argument('--output', help="Ergebnisse als JSON speichern")
+    parser.add_argument('--baseline', help="Frühere JSON-Ergebnisse zum Vergleich")
+    parser.add_argument('--threshold', type=float, default=20.0,
+                        help="Erlaubte Verlangsamung gegenüber --baseline in Prozent (Standard: 20)")
+    parser.add_argument('--snapshot', help="Parser-Ergebnisse als JSON speichern")
+    parser.add_argument('--verify', help="Parser-Ergebnisse mit einem früheren --snapshot vergleichen")
+    args = parser.parse_args(argv)
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+        },
+        'cases': {},
+    }
+    outputs = {}
+
+    for name in args.only or list(CASES):
+        print(f"▶ {name} ...", file=sys.stderr)
+        try:
+            func = CASES[name]()
+            # Parser schreiben Debug-Ausgaben per print - nicht mitmessen lassen
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                results['cases'][name], outputs[name] = measure(func, args.repeat, args.min_time)
+        except CaseSkipped as e:
+            results['cases'][name] = {'status': 'skipped', 'reason': str(e)}
+        except Exception as e:
+            results['cases'][name] = {'status': 'error', 'reason': f"{type(e).__name__}: {str(e)[:200]}"}
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_with_baseline(results, json.load(f), args.threshold)
+
+    mismatches = []
+    if args.verify:
+        with open(args.verify, 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+        for name, value in outputs.items():
+            if name in expected and _normalize(value) != expected[name]:
+                mismatches.append(name)
+
+    print_report(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\nErgebnisse gespeichert: {args.output}")
+    if args.snapshot:
+        with open(args.snapshot, 'w', encoding='utf-8') as f:
+            json.dump({name: _normalize(value) for name, value in outputs.items()}, f, indent=1, ensure_ascii=False)
+        print(f"Parser-Ergebnisse gespeichert: {args.snapshot}")
+
+    if mismatches:
+        print("\n✗ Abweichende Parser-Ergebnisse gegenüber Snapshot:")
+        for name in mismatches:
+            print(f"  • {name}")
+    if regressions:
+        print("\n✗ Regressionen gegenüber Baseline:")
+        for line in regressions:
+            print(f"  • {line}")
+    return 1 if regressions or mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lokaler Ersatz-Server für Benchmarks (kein Netzwerk nötig)
+Liefert deterministische Deezer-API-Antworten, Cover, YouTube-Such- und
+Video-Infos für den yt-dlp Stub sowie HLS-Playlists mit Segmenten.
+
+Routen:
+    /deezer/track/<id>                 Track (wie api.deezer.com)
+    /deezer/album/<id>                 Album inkl. Tracks (paginiert)
+    /deezer/album/<id>/tracks          Album-Tracks (paginiert)
+    /deezer/playlist/<id>[/tracks]     Playlist (paginiert)
+    /deezer/artist/<id>[/top|/albums]  Künstler
+    /cover/<id>.jpg                    Cover-Bild
+    /yt/search?q=...&n=5               Suchergebnisse (Info-Dicts)
+    /yt/info?url=...                   Video-Info oder Serien-Playlist
+    /hls/<id>.m3u8                     HLS-Playlist
+    /hls/<id>/<n>.ts                   HLS-Segment
+    /stats                             Anfragen pro Route
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+
+# Deezer liefert 25 Einträge pro Seite
+PAGE_SIZE = 25
+
+# Ein MPEG-1 Layer III Frame (128 kbit/s, 44,1 kHz, 417 Bytes) - genügt mutagen zum Taggen
+_MP3_FRAME = b'\xff\xfb\x90\x64' + b'\x00' * 413
+
+
+def _stable_id(text: str, length: int = 11) -> str:
+    """Erzeugt eine stabile ID aus einem Text"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:length]
+
+
+class MockCatalog:
+    """Deterministischer Katalog für Deezer- und Video-Antworten"""
+
+    def __init__(self, base_url: str, album_tracks: int = 12, playlist_tracks: int = 50,
+                 series_episodes: int = 6, segments: int = 4, segment_kb: int = 64):
+        self.base_url = base_url
+        self.album_tracks = album_tracks
+        self.playlist_tracks = playlist_tracks
+        self.series_episodes = series_episodes
+        self.segments = segments
+        self.segment_kb = segment_kb
+        frames = max(1, (segment_kb * 1024) // len(_MP3_FRAME))
+        self.segment_bytes = _MP3_FRAME * frames
+
+    # ------------------------------------------------------------------
+    # Deezer
+    # ------------------------------------------------------------------
+
+    def artist(self, artist_id: int) -> Dict:
+        return {'id': artist_id, 'name': f"Bench Artist {artist_id}", 'type': 'artist'}
+
+    def album_stub(self, album_id: int) -> Dict:
+        return {
+            'id': album_id,
+            'title': f"Benchmark Album {album_id}",
+            'cover_medium': f"{self.base_url}/cover/{album_id}.jpg",
+            'release_date': '2024-01-01',
+            'record_type': 'album',
+            'type': 'album',
+        }
+
+    def track(self, track_id: int) -> Dict:
+        album_id, position = divmod(track_id, 1000)
+        return {
+            'id': track_id,
+            'title': f"Track {position:02d}",
+            'duration': 180 + position,
+            'isrc': f"BENCH{track_id:07d}",
+            'track_position': position,
+            'disk_number': 1,
+            'artist': self.artist(album_id % 7 + 1),
+            'album': self.album_stub(album_id),
+            'type': 'track',
+        }
+
+    def album(self, album_id: int) -> Dict:
+        tracks = [self.track(album_id * 1000 + i) for i in range(1, self.album_tracks + 1)]
+        data = self.album_stub(album_id)
+        data.update({
+            'artist': self.artist(album_id % 7 + 1),
+            'nb_tracks': len(tracks),
+            'tracks': self.page(tracks, 0, f"/deezer/album/{album_id}/tracks"),
+        })
+        return data
+
+    def album_tracks(self, album_id: int, index: int) -> Dict:
+        tracks = [self.track(album_id * 1000 + i) for i in range(1, self.album_tracks + 1)]
+        return self.page(tracks, index, f"/deezer/album/{album_id}/tracks")
+
+    def playlist_tracks_list(self, playlist_id: int) -> List[Dict]:
+        return [
+            self.track((playlist_id * 10 + i // self.album_tracks) * 1000 + i % self.album_tracks + 1)
+            for i in range(self.playlist_tracks)
+        ]
+
+    def playlist(self, playlist_id: int) -> Dict:
+        tracks = self.playlist_tracks_list(playlist_id)
+        return {
+            'id': playlist_id,
+            'title': f"Benchmark Playlist {playlist_id}",
+            'nb_tracks': len(tracks),
+            'tracks': self.page(tracks, 0, f"/deezer/playlist/{playlist_id}/tracks"),
+        }
+
+    def artist_albums(self, artist_id: int, limit: int, index: int) -> Dict:
+        albums = [self.album_stub(artist_id * 100 + i) for i in range(1, 9)]
+        return self.page(albums, index, f"/deezer/artist/{artist_id}/albums", limit)
+
+    def artist_top(self, artist_id: int, limit: int) -> Dict:
+        tracks = [self.track((artist_id * 100 + 1) * 1000 + i) for i in range(1, min(limit, 10) + 1)]
+        return {'data': tracks, 'total': len(tracks)}
+
+    def page(self, items: List[Dict], index: int, path: str, limit: int = PAGE_SIZE) -> Dict:
+        chunk = items[index:index + limit]
+        data = {'data': chunk, 'total': len(items)}
+        if index + limit < len(items):
+            data['next'] = f"{self.base_url}{path}?index={index + limit}&limit={limit}"
+        return data
+
+    # ------------------------------------------------------------------
+    # YouTube / Mediatheken (für den yt-dlp Stub)
+    # ------------------------------------------------------------------
+
+    def video(self, video_id: str, title: str, duration: int = 200, **extra) -> Dict:
+        info = {
+            'id': video_id,
+            'title': title,
+            'duration': duration,
+            'channel': extra.pop('channel', 'Bench Channel'),
+            'webpage_url': extra.pop('webpage_url', f"https://www.youtube.com/watch?v={video_id}"),
+            'ext': 'mp4',
+            'hls_url': f"{self.base_url}/hls/{video_id}.m3u8",
+            'formats': [
+                {'format_id': f"hls-{h}", 'height': h, 'width': h * 16 // 9, 'ext': 'mp4',
+                 'vcodec': 'avc1', 'acodec': 'mp4a', 'tbr': h * 3.2}
+                for h in (360, 540, 720, 1080)
+            ] + [{'format_id': 'audio', 'ext': 'm4a', 'vcodec': 'none', 'acodec': 'mp4a', 'abr': 128}],
+        }
+        info['url'] = info['webpage_url']
+        info.update(extra)
+        return info
+
+    def search(self, query: str, count: int) -> List[Dict]:
+        results = []
+        for i in range(count):
+            video_id = _stable_id(f"{query}#{i}")
+            title = query if i == 0 else f"{query} (Live {i})"
+            results.append(self.video(video_id, title, duration=200 + i * 13,
+                                      channel='Bench Artist - Topic' if i == 0 else f"Uploader {i}"))
+        return results
+
+    def info(self, url: str) -> Dict:
+        parsed = urlparse(url)
+        if '/series/' in parsed.path:
+            series = parsed.path.rstrip('/').split('/')[-1]
+            entries = []
+            for n in range(self.series_episodes):
+                season, episode = n // 3 + 1, n % 3 + 1
+                video_id = _stable_id(f"{series}-{season}-{episode}")
+                entries.append(self.video(
+                    video_id,
+                    f"Folge {episode}: {series.title()} (S{season:02d}/E{episode:02d})",
+                    duration=1500,
+                    webpage_url=f"https://bench.local/video/{series}/{video_id}",
+                    series=series.title(),
+                    season_number=season,
+                    episode_number=episode,
+                ))
+            return {'_type': 'playlist', 'id': series, 'title': series.title(), 'entries': entries}
+        return self.video(_stable_id(url), f"Bench Video {_stable_id(url, 6)}", duration=600)
+
+    def hls_playlist(self, video_id: str) -> str:
+        lines = ['#EXTM3U', '#EXT-X-VERSION:3', '#EXT-X-TARGETDURATION:4']
+        for n in range(self.segments):
+            lines.append('#EXTINF:4.0,')
+            lines.append(f"{video_id}/{n}.ts")
+        lines.append('#EXT-X-ENDLIST')
+        return "\n".join(lines) + "\n"
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """HTTP-Handler des Ersatz-Servers"""
+
+    protocol_version = "HTTP/1.1"
+    catalog: MockCatalog = None
+    latency: float = 0.0
+    stats: Counter = None
+    stats_lock: threading.Lock = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, payload, status: int = 200):
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        parts = [p for p in parsed.path.split('/') if p]
+        query = parse_qs(parsed.query)
+        if parts and parts[0] == 'deezer' and len(parts) > 2:
+            route = "/".join(['deezer', parts[1]] + parts[3:4])
+        else:
+            route = "/".join(parts[:1] if parts[:1] in (['hls'], ['cover']) else parts[:2])
+        with self.stats_lock:
+            self.stats[route] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        try:
+            payload = self._route(parts, query)
+        except (ValueError, IndexError):
+            payload = None
+        if payload is None:
+            self._json({'error': {'type': 'DataException', 'message': 'no data', 'code': 800}}, 404)
+        elif isinstance(payload, bytes):
+            content_type = 'image/jpeg' if parts[0] == 'cover' else 'video/mp2t'
+            self._send(200, payload, content_type)
+        elif isinstance(payload, str):
+            self._send(200, payload.encode('utf-8'), 'application/vnd.apple.mpegurl')
+        else:
+            self._json(payload)
+
+    def _route(self, parts: List[str], query: Dict):
+        catalog = self.catalog
+        index = int(query.get('index', ['0'])[0])
+        limit = int(query.get('limit', [str(PAGE_SIZE)])[0])
+        if not parts:
+            return None
+        if parts[0] == 'stats':
+            with self.stats_lock:
+                return dict(self.stats)
+        if parts[0] == 'deezer':
+            kind, item_id = parts[1], int(parts[2])
+            sub = parts[3] if len(parts) > 3 else None
+            if kind == 'track':
+                return catalog.track(item_id)
+            if kind == 'album':
+                return catalog.album_tracks(item_id, index) if sub == 'tracks' else catalog.album(item_id)
+            if kind == 'playlist':
+                if sub == 'tracks':
+                    return catalog.page(catalog.playlist_tracks_list(item_id), index,
+                                        f"/deezer/playlist/{item_id}/tracks")
+                return catalog.playlist(item_id)
+            if kind == 'artist':
+                if sub == 'top':
+                    return catalog.artist_top(item_id, limit)
+                if sub == 'albums':
+                    return catalog.artist_albums(item_id, limit, index)
+                return catalog.artist(item_id)
+            return None
+        if parts[0] == 'cover':
+            return b'\xff\xd8\xff\xe0' + b'\x00' * 2048 + b'\xff\xd9'
+        if parts[0] == 'yt':
+            if parts[1] == 'search':
+                return catalog.search(query.get('q', [''])[0], int(query.get('n', ['1'])[0]))
+            if parts[1] == 'info':
+                return catalog.info(query.get('url', [''])[0])
+            return None
+        if parts[0] == 'hls':
+            if len(parts) == 2 and parts[1].endswith('.m3u8'):
+                return catalog.hls_playlist(parts[1][:-5])
+            if len(parts) == 3:
+                return catalog.segment_bytes
+        return None
+
+
+class MockServer:
+    """Startet den Ersatz-Server in einem Hintergrund-Thread"""
+
+    def __init__(self, latency_ms: float = 0.0, **catalog_options):
+        """
+        Args:
+            latency_ms: Künstliche Latenz pro Anfrage (simuliert Netzwerk)
+            **catalog_options: Optionen für MockCatalog (album_tracks, segments, ...)
+        """
+        self.latency_ms = latency_ms
+        self.catalog_options = catalog_options
+        self.server: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+        self.stats = Counter()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockServer':
+        handler = type('BoundMockRequestHandler', (MockRequestHandler,), {
+            'latency': self.latency_ms / 1000.0,
+            'stats': self.stats,
+            'stats_lock': threading.Lock(),
+        })
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.server.daemon_threads = True
+        handler.catalog = MockCatalog(self.base_url, **self.catalog_options)
+        self.thread = threading.Thread(target=self.server.serve_forever, name="MockServer", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Lokaler Ersatz-Server für Benchmarks")
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    args = parser.parse_args()
+    with MockServer(latency_ms=args.latency_ms) as mock:
+        print(f"Mock-Server läuft auf {mock.base_url} (Strg+C zum Beenden)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline-Benchmarks für Universal Downloader
+Misst End-to-End-Zeiten für Album-, Playlist- und Serien-Jobs, den Durchsatz
+der Download-Queue und die Latenz einzelner Stufen (API, Suche, Download,
+Cover, Tagging). Alle Anfragen gehen an einen lokalen Ersatz-Server
+(mock_server.py), yt-dlp und ffmpeg werden durch Stubs ersetzt - es wird
+kein Netzwerk benötigt (Linux/macOS).
+
+Verwendung:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --only album series --repeat 5
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --baseline bench.json --threshold 15
+
+Exit-Code 1, wenn ein Szenario fehlschlägt (auch: nichts heruntergeladen)
+oder gegenüber --baseline um mehr als --threshold Prozent langsamer
+geworden ist.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+STUB_DIR = BENCH_DIR / "stubs"
+
+# Füge Projekt-Pfad hinzu
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+from mock_server import MockServer  # noqa: E402
+
+
+class ScenarioSkipped(Exception):
+    """Szenario kann in dieser Umgebung nicht laufen (z.B. fehlende Abhängigkeit)"""
+
+
+class StageTimer:
+    """Sammelt Laufzeiten pro Stufe"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def wrap(self, obj, method_name: str, stage: str):
+        """Ersetzt eine Methode der Instanz durch eine zeitmessende Variante"""
+        original = getattr(obj, method_name)
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.samples[stage].append(time.perf_counter() - started)
+
+        setattr(obj, method_name, timed)
+
+    def summary(self) -> Dict[str, Dict]:
+        result = {}
+        for stage, values in sorted(self.samples.items()):
+            ordered = sorted(values)
+            result[stage] = {
+                'count': len(values),
+                'mean_ms': round(statistics.fmean(values) * 1000, 2),
+                'p50_ms': round(ordered[len(ordered) // 2] * 1000, 2),
+                'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+                'total_ms': round(sum(values) * 1000, 2),
+            }
+        return result
+
+
+def prepare_environment(server_url: str, work_dir: Path):
+    """
+    Legt Stubs für yt-dlp und ffmpeg an und richtet die Umgebung ein
+
+    HOME und der Anwendungsordner (UD_APP_DIR) zeigen in work_dir - Identitäts-
+    Speicher, Tokens usw. des Benutzers bleiben unberührt.
+    """
+    bin_dir = work_dir / "bin"
+    bin_dir.mkdir(parents=True, exist_ok=True)
+
+    ytdlp = bin_dir / "yt-dlp"
+    ytdlp.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"sys.path.insert(0, {str(STUB_DIR)!r})\n"
+        "from yt_dlp import main\n"
+        "sys.exit(main())\n",
+        encoding='utf-8'
+    )
+    ffmpeg = bin_dir / "ffmpeg"
+    ffmpeg.write_text(f"#!{sys.executable}\nprint('ffmpeg version 0.0-bench')\n", encoding='utf-8')
+    for stub in (ytdlp, ffmpeg):
+        stub.chmod(0o755)
+
+    os.environ['PATH'] = f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
+    os.environ['PYTHONPATH'] = os.pathsep.join(filter(None, [str(STUB_DIR), os.environ.get('PYTHONPATH')]))
+    os.environ['UD_BENCH_SERVER'] = server_url
+    (work_dir / "home").mkdir(exist_ok=True)
+    os.environ['HOME'] = str(work_dir / "home")
+    isolate_run(work_dir)
+
+
+def isolate_run(work_dir: Path):
+    """Eigener Anwendungsordner pro Lauf: keine Treffer aus früheren Läufen (Such-Cache, Quelle "Bibliothek")"""
+    import identity_store
+    import query_cache
+
+    os.environ['UD_APP_DIR'] = str(work_dir / "app")
+    identity_store.reset_store()
+    query_cache.reset_cache()
+
+
+def _deezer_downloader(ctx: Dict, timer: StageTimer, subdir: str):
+    try:
+        from deezer_downloader import DeezerDownloader
+    except ImportError as e:
+        raise ScenarioSkipped(f"Abhängigkeit fehlt: {e}")
+    downloader = DeezerDownloader(download_path=str(ctx['work_dir'] / subdir))
+    downloader.api_base = f"{ctx['server_url']}/deezer"
+    timer.wrap(downloader, 'get_album_info', 'deezer_api')
+    timer.wrap(downloader, 'get_playlist_tracks', 'deezer_api')
+    timer.wrap(downloader, 'get_track_info', 'deezer_api')
+    timer.wrap(downloader, 'download_track_youtube', 'youtube_search_download')
+    timer.wrap(downloader, 'download_cover_art', 'cover_art')
+    timer.wrap(downloader, 'add_metadata_to_mp3', 'tagging')
+    timer.wrap(downloader, 'download_track', 'track_total')
+    return downloader
+
+
+def _successful_tracks(downloader) -> int:
+    # Nicht der Rückgabewert von download_album/-playlist: die Vollständigkeitsprüfung
+    # sucht im Album-Ordner, YouTube-Downloads landen aber in Unterordnern
+    return sum(1 for result in downloader.download_results if result.success)
+
+
+def scenario_album(ctx: Dict, timer: StageTimer) -> int:
+    """Komplettes Album über Deezer-API + YouTube-Fallback"""
+    downloader = _deezer_downloader(ctx, timer, "album")
+    downloader.download_album("4242")
+    return _successful_tracks(downloader)
+
+
+def scenario_playlist(ctx: Dict, timer: StageTimer) -> int:
+    """Playlist mit mehreren Seiten über Deezer-API + YouTube-Fallback"""
+    downloader = _deezer_downloader(ctx, timer, "playlist")
+    downloader.download_playlist("77")
+    return _successful_tracks(downloader)
+
+
+def scenario_series(ctx: Dict, timer: StageTimer) -> int:
+    """Serie: Folgenliste abrufen und alle Folgen (HLS) herunterladen"""
+    from video_downloader import VideoDownloader
+    downloader = VideoDownloader(download_path=str(ctx['work_dir'] / "series"))
+    timer.wrap(downloader, 'get_series_episodes', 'series_listing')
+    timer.wrap(downloader, 'get_video_info', 'video_info')
+    timer.wrap(downloader, 'download_video', 'video_download')
+
+    series = downloader.get_series_episodes("https://bench.local/series/bench-serie")
+    if not series:
+        raise RuntimeError("Keine Folgen gefunden")
+    done = 0
+    for season_number, episodes in series['seasons'].items():
+        for episode in episodes:
+            success, _, error = downloader.download_video(
+                episode['url'],
+                is_series=True,
+                series_name=series['series_name'],
+                season_number=season_number
+            )
+            if not success:
+                raise RuntimeError(f"Folge fehlgeschlagen: {error}")
+            done += 1
+    return done
+
+
+def scenario_queue(ctx: Dict, timer: StageTimer) -> int:
+    """Durchsatz der Download-Queue (DownloadService) mit mehreren Workern"""
+    from download_service import DownloadService, FINAL_STATUSES, STATUS_COMPLETED
+    service = DownloadService(max_workers=ctx['workers'], download_path=str(ctx['work_dir'] / "queue"))
+    jobs = [service.submit(f"https://bench.local/video/queue-{i}") for i in range(ctx['queue_jobs'])]
+    started = {job.id: time.perf_counter() for job in jobs}
+    seq = 0
+    try:
+        while any(job.status not in FINAL_STATUSES for job in jobs):
+            for event in service.wait_events(since=seq, timeout=1.0):
+                seq = event['seq']
+                if event['type'] == 'status' and event['data'].get('status') in FINAL_STATUSES:
+                    timer.samples['queue_job_latency'].append(time.perf_counter() - started[event['job_id']])
+    finally:
+        service.shutdown(cancel_running=False)
+    completed = sum(1 for job in jobs if job.status == STATUS_COMPLETED)
+    if completed != len(jobs):
+        failed = [job.error for job in jobs if job.status != STATUS_COMPLETED]
+        raise RuntimeError(f"{len(failed)} Queue-Jobs fehlgeschlagen: {failed[:1]}")
+    return completed
+
+
+SCENARIOS: Dict[str, Callable[[Dict, StageTimer], int]] = {
+    'album': scenario_album,
+    'playlist': scenario_playlist,
+    'series': scenario_series,
+    'queue': scenario_queue,
+}
+
+
+def run_scenario(name: str, args, server: MockServer, base_dir: Path) -> Dict:
+    """Führt ein Szenario mehrfach aus und sammelt die Messwerte"""
+    timer = StageTimer()
+    walls = []
+    items = 0
+    requests_before = sum(server.stats.values())
+    log_target = sys.stderr if args.verbose else open(os.devnull, 'w')
+    try:
+        for run in range(args.repeat):
+            ctx = {
+                'server_url': server.base_url,
+                'work_dir': Path(tempfile.mkdtemp(prefix=f"{name}-{run}-", dir=base_dir)),
+                'workers': args.workers,
+                'queue_jobs': args.queue_jobs,
+            }
+            isolate_run(ctx['work_dir'])
+            with contextlib.redirect_stdout(log_target):
+                started = time.perf_counter()
+                items = SCENARIOS[name](ctx, timer)
+                walls.append(time.perf_counter() - started)
+            if items <= 0:
+                # Ein Lauf ohne Ergebnis misst nichts - nicht als "ok" werten
+                raise RuntimeError(f"Lauf {run + 1}: keine Einträge heruntergeladen")
+    finally:
+        if log_target is not sys.stderr:
+            log_target.close()
+
+    median = statistics.median(walls)
+    return {
+        'status': 'ok',
+        'runs': len(walls),
+        'items': items,
+        'wall_median_s': round(median, 4),
+        'wall_min_s': round(min(walls), 4),
+        'wall_max_s': round(max(walls), 4),
+        'items_per_s': round(items / median, 3) if median > 0 else None,
+        'http_requests_per_run': (sum(server.stats.values()) - requests_before) // max(1, len(walls)),
+        'stages': timer.summary(),
+    }
+
+
+def compare_with_baseline(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Vergleicht Median-Zeiten mit einer früheren Messung"""
+    regressions = []
+    for name, current in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if current.get('status') != 'ok' or not previous or previous.get('status') != 'ok':
+            continue
+        change = (current['wall_median_s'] - previous['wall_median_s']) / previous['wall_median_s'] * 100
+        current['change_vs_baseline_percent'] = round(change, 1)
+        if change > threshold:
+            regressions.append(f"{name}: {previous['wall_median_s']:.3f}s → {current['wall_median_s']:.3f}s (+{change:.1f}%)")
+    return regressions
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def print_report(results: Dict):
+    print(f"\n{'Szenario':<10} {'Status':<8} {'Items':>6} {'Median':>9} {'Items/s':>9} {'Requests':>9}")
+    print("-" * 56)
+    for name, data in results['scenarios'].items():
+        if data['status'] != 'ok':
+            print(f"{name:<10} {data['status']:<8} {data.get('reason', '')}")
+            continue
+        change = data.get('change_vs_baseline_percent')
+        suffix = f"  ({change:+.1f}%)" if change is not None else ""
+        print(f"{name:<10} {'ok':<8} {data['items']:>6} {data['wall_median_s']:>8.3f}s "
+              f"{data['items_per_s'] or 0:>9.2f} {data['http_requests_per_run']:>9}{suffix}")
+        for stage, stats in data['stages'].items():
+            print(f"    {stage:<26} n={stats['count']:<4} p50={stats['p50_ms']:>8.1f}ms "
+                  f"p95={stats['p95_ms']:>8.1f}ms")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline-Benchmarks (lokaler Ersatz-Server, yt-dlp Stub)")
+    parser.add_argument('--only', nargs='+', choices=sorted(SCENARIOS), help="Nur diese Szenarien ausführen")
+    parser.add_argument('--repeat', type=int, default=3, help="Wiederholungen pro Szenario (Standard: 3)")
+    parser.add_argument('--latency-ms', type=float, default=5.0,
+                        help="Künstliche Latenz pro HTTP-Anfrage in ms (Standard: 5)")
+    parser.add_argument('--workers', type=int, default=4, help="Worker für das Queue-Szenario (Standard: 4)")
+    parser.add_argument('--queue-jobs', type=int, default=16, help="Jobs im Queue-Szenario (Standard: 16)")
+    parser.add_argument('--output', help="Ergebnisse als JSON speichern")
+    parser.add_argument('--baseline', help="Frühere JSON-Ergebnisse zum Vergleich")
+    parser.add_argument('--threshold', type=float, default=20.0,
+                        help="Erlaubte Verlangsamung gegenüber --baseline in Prozent (Standard: 20)")
+    parser.add_argument('--verbose', action='store_true', help="Log-Ausgaben der Downloader anzeigen")
+    args = parser.parse_args(argv)
+
+    if sys.platform == "win32":
+        print("Die Benchmarks benötigen Linux oder macOS (Shebang-Stubs für yt-dlp/ffmpeg).", file=sys.stderr)
+        return 2
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'git_revision': _git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'latency_ms': args.latency_ms,
+            'workers': args.workers,
+        },
+        'scenarios': {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="ud-bench-") as tmp, MockServer(latency_ms=args.latency_ms) as server:
+        base_dir = Path(tmp)
+        prepare_environment(server.base_url, base_dir)
+        for name in args.only or list(SCENARIOS):
+            print(f"▶ {name} ...", file=sys.stderr)
+            try:
+                results['scenarios'][name] = run_scenario(name, args, server, base_dir)
+            except ScenarioSkipped as e:
+                results['scenarios'][name] = {'status': 'skipped', 'reason': str(e)}
+            except Exception as e:
+                results['scenarios'][name] = {'status': 'error', 'reason': str(e)[:200]}
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare_with_baseline(results, json.load(f), args.threshold)
+
+    print_report(results)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\nErgebnisse gespeichert: {args.output}")
+
+    failed = [name for name, data in results['scenarios'].items() if data['status'] == 'error']
+    if failed:
+        print(f"\n✗ Fehlgeschlagene Szenarien: {', '.join(failed)}")
+    if regressions:
+        print("\n✗ Regressionen gegenüber Baseline:")
+        for line in regressions:
+            print(f"  • {line}")
+    return 1 if failed or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
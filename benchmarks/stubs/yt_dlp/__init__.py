@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+yt-dlp Stub für Benchmarks
+Versteht die Aufrufe, die die Downloader verwenden (--dump-json, --flat-playlist,
+ytsearchN:, -x/--audio-format, -o, --load-info-json, --version) und bedient sie
+aus dem lokalen Ersatz-Server (Umgebungsvariable UD_BENCH_SERVER).
+Downloads laden die HLS-Segmente des Servers und fügen sie zusammen.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+from urllib.request import urlopen
+
+__version__ = "2099.01.01-bench"
+
+# Optionen, die einen Wert erwarten
+_VALUE_OPTIONS = {
+    '-o', '--output', '-f', '--format', '--audio-format', '--audio-quality', '--playlist-end',
+    '--playlist-start', '--extractor', '--cookies', '--sub-langs', '--convert-subs', '--limit-rate',
+    '--user-agent', '--add-header', '--extractor-args', '--recode-video', '--ffmpeg-location',
+    '--convert-thumbnails', '--load-info-json', '--print', '-P', '--paths', '--merge-output-format',
+    '--socket-timeout', '--retries', '--match-filter', '--default-search',
+}
+_SEARCH_PATTERN = re.compile(r'^ytsearch(\d*):(.*)$', re.DOTALL)
+
+
+def _server() -> str:
+    server = os.environ.get('UD_BENCH_SERVER')
+    if not server:
+        print("ERROR: UD_BENCH_SERVER ist nicht gesetzt", file=sys.stderr)
+        sys.exit(2)
+    return server.rstrip('/')
+
+
+def _get_json(path: str):
+    with urlopen(f"{_server()}{path}", timeout=30) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+
+def _parse_args(argv: List[str]):
+    options: Dict[str, str] = {}
+    flags = set()
+    targets = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _VALUE_OPTIONS and i + 1 < len(argv):
+            options[arg] = argv[i + 1]
+            i += 2
+            continue
+        if arg.startswith('-'):
+            flags.add(arg)
+        else:
+            targets.append(arg)
+        i += 1
+    return options, flags, targets
+
+
+def _resolve(target: str, flags: set, options: Dict[str, str]) -> List[Dict]:
+    """Liefert die Info-Dicts für eine URL oder Suchanfrage"""
+    search = _SEARCH_PATTERN.match(target)
+    if search:
+        count = int(search.group(1) or 1)
+        return _get_json(f"/yt/search?q={quote(search.group(2))}&n={count}")
+    if 'deezer.com' in target:
+        print("ERROR: [Deezer] This video is DRM protected", file=sys.stderr)
+        sys.exit(1)
+    info = _get_json(f"/yt/info?url={quote(target, safe='')}")
+    if info.get('_type') == 'playlist':
+        entries = info.get('entries', [])
+        if '--no-playlist' in flags:
+            return entries[:1]
+        end = options.get('--playlist-end')
+        if end:
+            entries = entries[:int(end)]
+        for index, entry in enumerate(entries, 1):
+            entry.setdefault('playlist', info.get('title'))
+            entry.setdefault('playlist_index', index)
+        return entries
+    return [info]
+
+
+def _output_path(template: str, info: Dict, ext: str) -> Path:
+    values = {'title': info.get('title', 'video'), 'id': info.get('id', 'video'), 'ext': ext}
+    path = re.sub(r'%\((\w+)\)s', lambda m: str(values.get(m.group(1), m.group(1))), template)
+    return Path(path)
+
+
+def _download(info: Dict, options: Dict[str, str], flags: set):
+    """Lädt die HLS-Segmente eines Videos und schreibt die Zieldatei"""
+    if '-x' in flags or '--extract-audio' in flags:
+        ext = options.get('--audio-format', 'mp3')
+    else:
+        ext = options.get('--recode-video') or options.get('--merge-output-format') or info.get('ext', 'mp4')
+    target = _output_path(options.get('-o') or options.get('--output') or '%(title)s.%(ext)s', info, ext)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    with urlopen(info['hls_url'], timeout=30) as response:
+        playlist = response.read().decode('utf-8')
+    base = info['hls_url'].rsplit('/', 1)[0]
+    segments = [line for line in playlist.splitlines() if line and not line.startswith('#')]
+
+    quiet = '--quiet' in flags or '-q' in flags
+    if not quiet:
+        print(f"[download] Destination: {target}", flush=True)
+    started = time.monotonic()
+    written = 0
+    with open(target, 'wb') as f:
+        for n, segment in enumerate(segments, 1):
+            with urlopen(f"{base}/{segment}", timeout=30) as response:
+                data = response.read()
+            f.write(data)
+            written += len(data)
+            if not quiet:
+                percent = n * 100.0 / len(segments)
+                speed = written / max(time.monotonic() - started, 1e-6) / 1024 / 1024
+                print(f"[download] {percent:5.1f}% of ~{written / 1024 / 1024:.2f}MiB at {speed:.2f}MiB/s ETA 00:00",
+                      flush=True)
+    if not quiet and ext == options.get('--audio-format'):
+        print(f"[ExtractAudio] Destination: {target}", flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if '--version' in argv:
+        print(__version__)
+        return 0
+
+    options, flags, targets = _parse_args(argv)
+    entries: List[Dict] = []
+    if options.get('--load-info-json'):
+        with open(options['--load-info-json'], 'r', encoding='utf-8') as f:
+            entries = [json.load(f)]
+    for target in targets:
+        entries.extend(_resolve(target, flags, options))
+
+    if not entries:
+        print("ERROR: No video results", file=sys.stderr)
+        return 1
+
+    if '--dump-json' in flags or '-j' in flags or '--simulate' in flags:
+        for entry in entries:
+            print(json.dumps(entry, ensure_ascii=False))
+        return 0
+
+    # Suchanfragen und --no-playlist laden nur das erste Ergebnis
+    if '--no-playlist' in flags or any(_SEARCH_PATTERN.match(t) for t in targets):
+        entries = entries[:1]
+    for entry in entries:
+        _download(entry, options, flags)
+    return 0
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""Einstiegspunkt für 'python -m yt_dlp' (Benchmark-Stub)"""
+
+import sys
+
+from yt_dlp import main
+
+sys.exit(main())
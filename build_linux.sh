@@ -73,6 +73,23 @@ cp install_ffmpeg.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
 cp requirements.txt "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
 cp updater.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
 cp version.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp download_scheduler.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp download_service.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp download_daemon.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp batch_download.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp metrics.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp log_writer.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp log_pump.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp ui_event_bus.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp virtual_list.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp lazy_import.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp instance_ipc.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp history_store.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp query_cache.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp match_ranking.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp token_broker.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp identity_store.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
+cp discography.py "$BUILD_DIR/usr/share/$APP_NAME/" || exit 1
 
 # Kopiere Icon falls vorhanden
 if [ -f "icon.png" ]; then
@@ -133,6 +133,22 @@ def build_exe():
             "--hidden-import=audible_integration",
             "--hidden-import=updater",
             "--hidden-import=version",
+            "--hidden-import=download_scheduler",
+            "--hidden-import=download_service",
+            "--hidden-import=download_daemon",
+            "--hidden-import=metrics",
+            "--hidden-import=log_writer",
+            "--hidden-import=log_pump",
+            "--hidden-import=ui_event_bus",
+            "--hidden-import=virtual_list",
+            "--hidden-import=lazy_import",
+            "--hidden-import=instance_ipc",
+            "--hidden-import=history_store",
+            "--hidden-import=query_cache",
+            "--hidden-import=match_ranking",
+            "--hidden-import=token_broker",
+            "--hidden-import=identity_store",
+            "--hidden-import=discography",
             "--collect-all=yt_dlp",
             "--collect-all=PIL",
             "--collect-all=mutagen",
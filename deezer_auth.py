@@ -12,6 +12,8 @@ from typing import Optional, Dict, List
 from getpass import getpass
 import re
 
+import token_broker
+
 
 class DeezerAuth:
     """Klasse für Deezer-Authentifizierung und Profil-Verwaltung"""
@@ -76,8 +78,8 @@ class DeezerAuth:
                 'subscription_type': self.subscription_type,
                 'quality': self.quality
             }
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            # Enthält den ARL-Token - nur für den Benutzer lesbar speichern
+            token_broker.write_private_json(self.config_path, config)
         except Exception as e:
             print(f"Fehler beim Speichern der Konfiguration: {e}")
     
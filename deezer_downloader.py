@@ -11,13 +11,21 @@ import re
 import json
 import requests
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Deque
+from collections import deque
 from mutagen.id3 import ID3, TIT2, TPE1, TALB, TDRC, APIC
 from mutagen.mp3 import MP3
 from PIL import Image
 import io
 from datetime import datetime
 
+import discography
+import identity_store
+import match_ranking
+import metrics
+import query_cache
+from log_writer import LOG_HISTORY_LIMIT, RESULT_HISTORY_LIMIT
+
 # Import Authentifizierung
 try:
     from deezer_auth import DeezerAuth
@@ -28,13 +36,15 @@ except ImportError:
 class DownloadResult:
     """Klasse zur Speicherung von Download-Ergebnissen"""
     def __init__(self, track_id: str, track_name: str, success: bool, 
-                 source: str, file_path: Optional[Path] = None, error: Optional[str] = None):
+                 source: str, file_path: Optional[Path] = None, error: Optional[str] = None,
+                 match_confidence: Optional[float] = None):
         self.track_id = track_id
         self.track_name = track_name
         self.success = success
-        self.source = source  # "Deezer", "YouTube", "Fehlgeschlagen"
+        self.source = source  # "Deezer", "YouTube", "Bibliothek" (schon vorhanden), "Fehlgeschlagen"
         self.file_path = file_path
         self.error = error
+        self.match_confidence = match_confidence  # Nur bei YouTube: Konfidenz des gewählten Treffers (0..1)
         self.timestamp = datetime.now()
 
 
@@ -74,9 +84,9 @@ class DeezerDownloader:
         if self.arl_token:
             self.session.cookies.set('arl', self.arl_token, domain='.deezer.com')
         
-        # Download-Statistiken
-        self.download_results: List[DownloadResult] = []
-        self.download_log: List[str] = []
+        # Download-Statistiken (begrenzt, damit lange Sitzungen nicht unbegrenzt Speicher belegen)
+        self.download_results: Deque[DownloadResult] = deque(maxlen=RESULT_HISTORY_LIMIT)
+        self.download_log: Deque[str] = deque(maxlen=LOG_HISTORY_LIMIT)
     
     def log(self, message: str, level: str = "INFO"):
         """Fügt eine Nachricht zum Log hinzu"""
@@ -117,6 +127,7 @@ class DeezerDownloader:
                 return match.group(1) if len(match.groups()) == 1 else match.group(2)
         return None
     
+    @metrics.instrument('deezer_api', 'deezer', success=lambda result: result is not None)
     def get_track_info(self, track_id: str) -> Optional[Dict]:
         """
         Ruft Track-Informationen von der Deezer API ab
@@ -136,6 +147,7 @@ class DeezerDownloader:
             self.log(f"Fehler beim Abrufen der Track-Info: {e}", "ERROR")
             return None
     
+    @metrics.instrument('deezer_api', 'deezer', success=lambda result: result is not None)
     def get_album_info(self, album_id: str) -> Optional[Dict]:
         """
         Ruft Album-Informationen von der Deezer API ab
@@ -174,6 +186,7 @@ class DeezerDownloader:
             self.log(f"Fehler beim Abrufen der Album-Info: {e}", "ERROR")
             return None
     
+    @metrics.instrument('deezer_api', 'deezer')
     def get_playlist_tracks(self, playlist_id: str) -> List[Dict]:
         """
         Ruft alle Tracks einer Playlist ab
@@ -206,6 +219,7 @@ class DeezerDownloader:
         
         return tracks
     
+    @metrics.instrument('cover', 'deezer', success=lambda result: result is not None, size=len)
     def download_cover_art(self, cover_url: str) -> Optional[bytes]:
         """
         Lädt das Cover-Art herunter
@@ -248,6 +262,7 @@ class DeezerDownloader:
         
         return filename
     
+    @metrics.instrument('tagging', 'deezer')
     def add_metadata_to_mp3(self, file_path: Path, track_info: Dict, cover_art: Optional[bytes] = None):
         """
         Fügt Metadaten zu einer MP3-Datei hinzu
@@ -295,6 +310,7 @@ class DeezerDownloader:
             
             audio.save()
         except Exception as e:
+            metrics.count_error('tagging', 'deezer')
             self.log(f"Fehler beim Hinzufügen der Metadaten: {e}", "WARNING")
     
     def get_audio_format_from_quality(self) -> Tuple[str, str]:
@@ -313,6 +329,7 @@ class DeezerDownloader:
         
         return quality_map.get(self.quality, ("mp3", "320"))
     
+    @metrics.instrument('download', 'deezer', success=lambda result: result[0])
     def download_track_deezer_direct(self, track_id: str, output_path: Path, track_info: Dict) -> Tuple[bool, str]:
         """
         Versucht direkten Deezer-Download (mit ARL-Token wenn verfügbar)
@@ -375,6 +392,7 @@ class DeezerDownloader:
                     pass
             
             if result.returncode == 0 and output_path.exists() and output_path.stat().st_size > 0:
+                metrics.add_bytes('download', 'deezer', output_path.stat().st_size)
                 return True, "Deezer"
             else:
                 # Kombiniere stderr und stdout für vollständige Fehlermeldung
@@ -416,6 +434,12 @@ class DeezerDownloader:
             search_query = f"{artist_name} {cleaned_title}"
             search_url = f"ytsearch1:{search_query}"
             
+            # Ergebnis früherer Prüfungen (auch "nicht verfügbar") wiederverwenden
+            cache = query_cache.get_cache()
+            cached = cache.get('youtube_available', (artist_name, cleaned_title))
+            if cached is not query_cache.MISS:
+                return bool(cached)
+            
             # Erstelle temporäre Datei
             with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_file:
                 tmp_path = Path(tmp_file.name)
@@ -435,12 +459,11 @@ class DeezerDownloader:
                 
                 result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
                 
-                if result.returncode == 0 and tmp_path.exists() and tmp_path.stat().st_size > 100 * 1024:
-                    tmp_path.unlink(missing_ok=True)
-                    return True
-                else:
-                    tmp_path.unlink(missing_ok=True)
-                    return False
+                available = result.returncode == 0 and tmp_path.exists() and tmp_path.stat().st_size > 100 * 1024
+                tmp_path.unlink(missing_ok=True)
+                if result.returncode == 0 or "No video results" in (result.stderr or ''):
+                    cache.put('youtube_available', (artist_name, cleaned_title), available)
+                return available
                     
             except Exception:
                 tmp_path.unlink(missing_ok=True)
@@ -449,10 +472,19 @@ class DeezerDownloader:
         except Exception:
             return False
     
-    def download_track_youtube(self, track_info: Dict, output_path: Path) -> Tuple[bool, str]:
+    @metrics.instrument('youtube_download', 'deezer', success=lambda result: result[0])
+    def download_track_youtube(self, track_info: Dict, output_path: Path,
+                               match_info: Optional[Dict] = None) -> Tuple[bool, str]:
         """
         Lädt Track von YouTube herunter
         
+        Es wird nur der am besten bewertete Treffer geladen (siehe match_ranking).
+        
+        Args:
+            track_info: Deezer-Track
+            output_path: Zieldatei
+            match_info: Optional: erhält unter 'match' den geladenen Kandidaten (mit Konfidenz)
+        
         Returns:
             (success, source) - source ist "YouTube" oder Fehlermeldung
         """
@@ -495,111 +527,67 @@ class DeezerDownloader:
                 ]
             
             best_result = None
-            best_duration = 0
+            best_confidence = 0.0
+            
+            # Schon einmal (auch über Spotify) gewählter Treffer für diese Aufnahme: ohne Suche zuerst versuchen
+            known_match = None
+            if not is_audiobook_chapter:
+                known = identity_store.get_store().lookup(isrc=track_info.get('isrc'), deezer_id=track_info.get('id'))
+                if known and known.get('youtube_id'):
+                    known_match = {
+                        'video_id': known['youtube_id'],
+                        'url': f"https://www.youtube.com/watch?v={known['youtube_id']}",
+                        'confidence': known.get('youtube_confidence')
+                    }
             
             for search_query in search_queries:
                 try:
                     if is_audiobook_chapter:
-                        # Für Hörbuch-Kapitel: Suche mehrere Ergebnisse und wähle das längste
-                        search_url = f"ytsearch5:{search_query}"
-                        
-                        # Zuerst: Hole Metadaten aller Ergebnisse
-                        # WICHTIG: --flat-playlist funktioniert nicht mit --dump-json für Suchanfragen
-                        # Wir müssen jedes Ergebnis einzeln abrufen
-                        cmd_metadata = [
-                            sys.executable, "-m", "yt_dlp",
-                            "--dump-json",
-                            "--no-warnings",
-                            "--quiet",
-                            search_url
-                        ]
+                        # Für Hörbuch-Kapitel: Suche mehrere Ergebnisse und wähle das am besten bewertete
+                        # vollständige Hörbuch (lang, passender Titel, kein Trailer/Kapitel)
+                        candidate = self._find_full_audiobook_on_youtube(search_query, base_title, artist_name)
+                        if candidate and candidate['confidence'] > best_confidence:
+                            best_confidence = candidate['confidence']
+                            best_result = candidate
                         
-                        result_metadata = subprocess.run(cmd_metadata, capture_output=True, text=True, timeout=30)
-                        
-                        if result_metadata.returncode == 0 and result_metadata.stdout:
-                            import json
-                            lines = [l for l in result_metadata.stdout.strip().split('\n') if l.strip()]
+                        # Wenn wir ein gutes Ergebnis gefunden haben, lade es herunter
+                        if best_result:
+                            video_url = best_result['url']
                             
-                            for line in lines:
-                                if not line.strip():
-                                    continue
-                                
-                                try:
-                                    video_info = json.loads(line)
-                                    duration = video_info.get('duration', 0) or video_info.get('duration_string', '0:00')
-                                    # Konvertiere duration_string zu Sekunden falls nötig
-                                    if isinstance(duration, str):
-                                        parts = duration.split(':')
-                                        if len(parts) == 2:
-                                            duration = int(parts[0]) * 60 + int(parts[1])
-                                        elif len(parts) == 3:
-                                            duration = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                                        else:
-                                            duration = 0
-                                    
-                                    video_id = video_info.get('id', '')
-                                    title = video_info.get('title', '')
-                                    title_lower = title.lower()
-                                    
-                                    # Prüfe ob es ein vollständiges Hörbuch ist
-                                    # Mindestdauer: 30 Minuten (vermeidet Demo-Tracks)
-                                    if duration < 1800:
-                                        continue
-                                    
-                                    # Vermeide Demo/Trailer/Preview
-                                    if any(word in title_lower for word in ['demo', 'trailer', 'preview', 'vorschau', 'sample']):
-                                        continue
-                                    
-                                    # Vermeide einzelne Kapitel (wenn "Kapitel XX" im Titel)
-                                    if re.search(r'\bkapitel\s*\d+', title_lower):
-                                        continue
-                                    
-                                    # Wenn länger als bisher gefundenes Video, speichere es
-                                    if duration > best_duration:
-                                        best_duration = duration
-                                        best_result = {
-                                            'video_id': video_id,
-                                            'duration': duration,
-                                            'title': title
-                                        }
-                                
-                                except json.JSONDecodeError:
-                                    continue
-                                except Exception:
-                                    continue
+                            cmd = [
+                                sys.executable, "-m", "yt_dlp",
+                                "-x",
+                                "--audio-format", "mp3",
+                                "--audio-quality", "0",
+                                "--no-warnings",
+                                "--quiet",
+                                "-f", "bestaudio/best",
+                                "-o", str(output_path),
+                                video_url
+                            ]
                             
-                            # Wenn wir ein gutes Ergebnis gefunden haben, lade es herunter
-                            if best_result and best_duration >= 1800:  # Mindestens 30 Minuten
-                                video_url = f"https://www.youtube.com/watch?v={best_result['video_id']}"
-                                
-                                cmd = [
-                                    sys.executable, "-m", "yt_dlp",
-                                    "-x",
-                                    "--audio-format", "mp3",
-                                    "--audio-quality", "0",
-                                    "--no-warnings",
-                                    "--quiet",
-                                    "-f", "bestaudio/best",
-                                    "-o", str(output_path),
-                                    video_url
-                                ]
-                                
-                                result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                            
+                            if result.returncode == 0 and output_path.exists():
+                                file_size = output_path.stat().st_size
                                 
-                                if result.returncode == 0 and output_path.exists():
-                                    file_size = output_path.stat().st_size
-                                    
-                                    if file_size > 100 * 1024:
-                                        self.log(f"  ✓ YouTube-Download erfolgreich (vollständiges Hörbuch, {best_result['duration'] // 60} min)", "INFO")
-                                        return True, "YouTube"
-                                    else:
-                                        output_path.unlink(missing_ok=True)
-                        
+                                if file_size > 100 * 1024:
+                                    metrics.add_bytes('youtube_download', 'deezer', file_size)
+                                    self.log(f"  ✓ YouTube-Download erfolgreich (vollständiges Hörbuch, {best_result['duration'] // 60} min)", "INFO")
+                                    if match_info is not None:
+                                        match_info['match'] = best_result
+                                    return True, "YouTube"
+                                else:
+                                    output_path.unlink(missing_ok=True)
+                    
                         # Wenn keine vollständiges Hörbuch gefunden, versuche nächste Suchanfrage
                         continue
                     
-                    # Normale Suche für einzelne Tracks
-                    search_url = f"ytsearch1:{search_query}"  # Nur erstes Ergebnis
+                    # Normale Suche für einzelne Tracks: Kandidaten bewerten, nur den besten laden
+                    match = known_match or self._find_youtube_match(search_query, cleaned_title, artist_name, track_info.get('duration'))
+                    known_match = None
+                    if match is None:
+                        continue  # Kein ausreichend passender Treffer, versuche nächste Suchanfrage
                     
                     cmd = [
                         sys.executable, "-m", "yt_dlp",
@@ -610,7 +598,7 @@ class DeezerDownloader:
                         "--quiet",
                         "-f", "bestaudio/best",
                         "-o", str(output_path),
-                        search_url
+                        match['url']
                     ]
                     
                     result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
@@ -619,6 +607,9 @@ class DeezerDownloader:
                         file_size = output_path.stat().st_size
                         # Prüfe ob Datei groß genug ist (mindestens 100KB für ein Hörbuch-Kapitel)
                         if file_size > 100 * 1024:
+                            metrics.add_bytes('youtube_download', 'deezer', file_size)
+                            if match_info is not None:
+                                match_info['match'] = match
                             return True, "YouTube"
                         else:
                             # Datei zu klein, versuche nächste Suchanfrage
@@ -629,8 +620,8 @@ class DeezerDownloader:
                     error_output = result.stderr or result.stdout
                     if error_output:
                         # Prüfe auf spezifische Fehler
-                        if "No video results" in error_output or "Did not get any data blocks" in error_output:
-                            # Keine Ergebnisse, versuche nächste Suchanfrage
+                        if "Did not get any data blocks" in error_output:
+                            # Video nicht abrufbar, versuche nächste Suchanfrage
                             continue
                         elif "ERROR" in error_output:
                             error_msg = error_output.split("ERROR")[-1][:200]
@@ -653,6 +644,55 @@ class DeezerDownloader:
         except Exception as e:
             return False, f"Fehler: {str(e)[:200]}"
     
+    def _find_youtube_match(self, search_query: str, title: str, artist: str,
+                            duration: Optional[float] = None, audiobook: bool = False) -> Optional[Dict]:
+        """
+        Sucht auf YouTube, bewertet die ersten Treffer und liefert den besten
+        
+        Bewertungen (auch "kein passender Treffer") werden zwischengespeichert,
+        Fehler von yt-dlp nicht. Die Entscheidung wird mit Konfidenz protokolliert.
+        
+        Args:
+            search_query: Suchanfrage für YouTube
+            title: Gesuchter Titel (für die Bewertung)
+            artist: Gesuchter Künstler/Autor
+            duration: Erwartete Dauer in Sekunden
+            audiobook: Vollständiges Hörbuch suchen (Mindestdauer, länger ist besser)
+        
+        Returns:
+            Kandidat {'url', 'title', 'duration', 'confidence', 'reasons', ...} oder None
+        """
+        cache = query_cache.get_cache()
+        namespace = 'youtube_audiobook_match' if audiobook else 'youtube_match'
+        cache_key = (search_query, title, artist, duration or 0)
+        cached = cache.get(namespace, cache_key)
+        if cached is not query_cache.MISS:
+            return cached
+        
+        with metrics.timed('youtube_search', 'deezer') as search_timing:
+            match, ranked = match_ranking.find_best_match(search_query, title, artist, duration, audiobook=audiobook)
+            if ranked is None:
+                search_timing.fail()
+        
+        if ranked is None:
+            return None  # Fehler nicht zwischenspeichern
+        if match:
+            self.log(f"  → YouTube-Treffer: {match_ranking.describe(match)}", "INFO")
+        elif ranked:
+            self.log(f"  ⚠ Kein ausreichend passender YouTube-Treffer (bester: {match_ranking.describe(ranked[0])})", "WARNING")
+        cache.put(namespace, cache_key, match)
+        return match
+    
+    def _find_full_audiobook_on_youtube(self, search_query: str, title: str, artist: str) -> Optional[Dict]:
+        """
+        Sucht unter den ersten YouTube-Ergebnissen das am besten passende vollständige Hörbuch
+        
+        Returns:
+            Kandidat (siehe _find_youtube_match) oder None
+        """
+        return self._find_youtube_match(search_query, title, artist, audiobook=True)
+    
+    @metrics.instrument('track', 'deezer', success=lambda result: result.success)
     def download_track(self, track_id: str, output_dir: Optional[Path] = None, 
                        use_youtube_fallback: bool = True, prefer_youtube: bool = False) -> DownloadResult:
         """
@@ -669,6 +709,13 @@ class DeezerDownloader:
         if output_dir is None:
             output_dir = self.download_path
         
+        # Schon geladen (auch über einen anderen Dienst)? Dann nicht einmal die Track-Info abrufen
+        known = identity_store.get_store().lookup(deezer_id=track_id)
+        if known and known.get('file_path'):
+            result = self._library_result(track_id, f"{known.get('artist')} - {known.get('title')}", {'deezer_id': track_id})
+            if result:
+                return result
+        
         # Track-Info abrufen
         track_info = self.get_track_info(track_id)
         if not track_info or 'error' in track_info:
@@ -677,6 +724,19 @@ class DeezerDownloader:
             return DownloadResult(track_id, "Unbekannt", False, "Fehlgeschlagen", error=error_msg)
         
         track_name = f"{track_info['artist']['name']} - {track_info['title']}"
+        
+        # Abgleich über ISRC bzw. Künstler/Titel/Dauer (z.B. bereits über Spotify geladen)
+        identity_keys = {
+            'isrc': track_info.get('isrc'),
+            'deezer_id': track_id,
+            'artist': track_info['artist']['name'],
+            'title': track_info['title'],
+            'duration': track_info.get('duration') or None
+        }
+        result = self._library_result(track_id, track_name, identity_keys)
+        if result:
+            return result
+        
         self.log(f"Starte Download: {track_name}")
         
         # Zeige Qualität an
@@ -695,7 +755,8 @@ class DeezerDownloader:
             youtube_output_dir = self._add_platform_folder(output_dir, "youtube")
             youtube_output_path = youtube_output_dir / f"{filename}.mp3"
             
-            success, youtube_error = self.download_track_youtube(track_info, youtube_output_path)
+            youtube_match = {}
+            success, youtube_error = self.download_track_youtube(track_info, youtube_output_path, youtube_match)
             
             if success:
                 # Cover-Art herunterladen
@@ -706,8 +767,10 @@ class DeezerDownloader:
                 # Metadaten hinzufügen
                 self.add_metadata_to_mp3(youtube_output_path, track_info, cover_art)
                 
+                self._remember_download(identity_keys, youtube_output_path, youtube_match.get('match'))
                 self.log(f"  ✓ Erfolgreich von YouTube heruntergeladen: {youtube_output_path}", "SUCCESS")
-                result = DownloadResult(track_id, track_name, True, "YouTube", youtube_output_path)
+                result = DownloadResult(track_id, track_name, True, "YouTube", youtube_output_path,
+                                        match_confidence=youtube_match.get('match', {}).get('confidence'))
                 self.download_results.append(result)
                 return result
             else:
@@ -733,6 +796,7 @@ class DeezerDownloader:
             # Metadaten hinzufügen
             self.add_metadata_to_mp3(output_path, track_info, cover_art)
             
+            self._remember_download(identity_keys, output_path)
             self.log(f"  ✓ Erfolgreich von Deezer heruntergeladen: {output_path}", "SUCCESS")
             result = DownloadResult(track_id, track_name, True, "Deezer", output_path)
             self.download_results.append(result)
@@ -778,7 +842,8 @@ class DeezerDownloader:
             platform_output_dir = self._add_platform_folder(output_dir, "youtube")
             output_path = platform_output_dir / f"{filename}.mp3"
             
-            success, youtube_error = self.download_track_youtube(track_info, output_path)
+            youtube_match = {}
+            success, youtube_error = self.download_track_youtube(track_info, output_path, youtube_match)
             
             if success:
                 # Cover-Art herunterladen
@@ -789,8 +854,10 @@ class DeezerDownloader:
                 # Metadaten hinzufügen
                 self.add_metadata_to_mp3(output_path, track_info, cover_art)
                 
+                self._remember_download(identity_keys, output_path, youtube_match.get('match'))
                 self.log(f"  ✓ Erfolgreich von YouTube heruntergeladen: {output_path}", "SUCCESS")
-                result = DownloadResult(track_id, track_name, True, "YouTube", output_path)
+                result = DownloadResult(track_id, track_name, True, "YouTube", output_path,
+                                        match_confidence=youtube_match.get('match', {}).get('confidence'))
                 self.download_results.append(result)
                 return result
             else:
@@ -806,6 +873,33 @@ class DeezerDownloader:
             self.download_results.append(result)
             return result
     
+    def _library_result(self, track_id: str, track_name: str, identity_keys: Dict) -> Optional[DownloadResult]:
+        """
+        Ergebnis für eine Aufnahme, die schon in der Bibliothek liegt
+        
+        Returns:
+            DownloadResult mit Quelle "Bibliothek" oder None, wenn die Datei fehlt
+        """
+        identity = identity_store.get_store()
+        existing_file = identity.library_file(identity.lookup(**identity_keys))
+        if not existing_file:
+            return None
+        identity.remember(**identity_keys)
+        self.log(f"  ✓ Bereits in der Bibliothek: {track_name} → {existing_file}", "SUCCESS")
+        result = DownloadResult(track_id, track_name, True, "Bibliothek", existing_file)
+        self.download_results.append(result)
+        return result
+    
+    def _remember_download(self, identity_keys: Dict, file_path: Path, youtube_match: Optional[Dict] = None):
+        """Merkt sich Datei und ggf. YouTube-Treffer für spätere Jobs und andere Dienste"""
+        youtube_match = youtube_match or {}
+        identity_store.get_store().remember(
+            file_path=file_path,
+            youtube_id=youtube_match.get('video_id'),
+            youtube_confidence=youtube_match.get('confidence'),
+            **identity_keys
+        )
+    
     def _add_platform_folder(self, output_dir: Path, platform: str) -> Path:
         """
         Fügt Plattform-Ordner zur Ordnerstruktur hinzu
@@ -899,6 +993,7 @@ class DeezerDownloader:
         
         deezer_count = sum(1 for r in self.download_results if r.source == "Deezer")
         youtube_count = sum(1 for r in self.download_results if r.source == "YouTube")
+        library_count = sum(1 for r in self.download_results if r.source == "Bibliothek")
         
         print("\n" + "=" * 70)
         print("DOWNLOAD-ZUSAMMENFASSUNG")
@@ -910,6 +1005,8 @@ class DeezerDownloader:
         print("Download-Quellen:")
         print(f"  • Deezer: {deezer_count} Track(s)")
         print(f"  • YouTube (Fallback): {youtube_count} Track(s)")
+        if library_count:
+            print(f"  • Bereits vorhanden: {library_count} Track(s)")
         print()
         
         if expected_count > 0:
@@ -1084,16 +1181,75 @@ class DeezerDownloader:
         Returns:
             Liste von Album-Dictionaries
         """
-        try:
-            albums_url = f"{self.api_base}/artist/{artist_id}/albums?limit={limit}"
-            response = self.session.get(albums_url, timeout=10)
-            response.raise_for_status()
-            albums_data = response.json()
-            albums = albums_data.get('data', [])
-            return albums
-        except Exception as e:
-            self.log(f"Fehler beim Abrufen der Alben: {e}", "ERROR")
-            return []
+        # Alle Seiten (nicht nur die erste) bis limit
+        return self._discography_planner().fetch_releases(artist_id, limit)
+    
+    def _discography_planner(self) -> discography.DiscographyPlanner:
+        return discography.DiscographyPlanner(self.session, self.api_base, log=self.log)
+    
+    def download_discography(self, artist_id: str, output_dir: Optional[Path] = None,
+                             record_types=discography.RECORD_TYPES) -> int:
+        """
+        Lädt die komplette Diskografie eines Artists - jede Aufnahme nur einmal
+        
+        Alle Veröffentlichungen werden geladen und nach Typ gruppiert; Tracks,
+        die in mehreren Editionen (Deluxe, Remaster, Single + Album,
+        Compilations) vorkommen, landen nur im Ordner der bevorzugten Veröffentlichung.
+        
+        Args:
+            artist_id: Deezer Artist-ID
+            output_dir: Basis-Ordner (Standard: download_path/<Artist>)
+            record_types: Zu ladende Typen ('album', 'ep', 'single', 'compile')
+            
+        Returns:
+            Anzahl erfolgreich heruntergeladener Tracks
+        """
+        artist_info = self.get_artist_info(artist_id)
+        if not artist_info or 'error' in artist_info:
+            self.log(f"Konnte Artist-Informationen nicht abrufen", "ERROR")
+            return 0
+        
+        artist_name = artist_info.get('name', f'Artist_{artist_id}')
+        if output_dir is None:
+            output_dir = self.download_path / self.sanitize_filename(artist_name)
+        
+        self.log(f"\n{'='*70}", "INFO")
+        self.log(f"Diskografie: {artist_name}", "INFO")
+        self.log(f"{'='*70}\n", "INFO")
+        
+        plan = self._discography_planner().plan(artist_id, record_types)
+        if not plan.tracks:
+            self.log(f"Keine Tracks für {artist_name} gefunden", "WARNING")
+            return 0
+        
+        downloaded = 0
+        position = 0
+        for record_type, releases in plan.releases.items():
+            for release in releases:
+                tracks = release['planned_tracks']
+                if not tracks:
+                    continue  # Nur Duplikate (z.B. Single-Auskopplung eines Albums)
+                
+                year = (release.get('release_date') or '')[:4]
+                release_name = f"{year} - {release.get('title', release['id'])}" if year else release.get('title', str(release['id']))
+                release_dir = output_dir / self.sanitize_filename(release_name)
+                release_dir.mkdir(parents=True, exist_ok=True)
+                self.log(f"{discography.RECORD_TYPE_LABELS.get(record_type, record_type)}: {release_name} "
+                         f"({len(tracks)} Track(s), {release['duplicate_count']} Duplikat(e) übersprungen)", "INFO")
+                
+                for track in tracks:
+                    position += 1
+                    self.log(f"[{position}/{len(plan.tracks)}] Lade herunter: {track.get('title', 'Unbekannt')}", "INFO")
+                    # Priorisiere YouTube wenn verfügbar (schneller, keine DRM-Probleme)
+                    result = self.download_track(str(track['id']), output_dir=release_dir,
+                                                 use_youtube_fallback=True, prefer_youtube=True)
+                    if result.success:
+                        downloaded += 1
+        
+        self.log(f"Diskografie-Download abgeschlossen: {downloaded}/{len(plan.tracks)} Tracks erfolgreich "
+                 f"({plan.duplicate_count} Duplikate nicht erneut geladen)", "INFO")
+        self.print_summary(len(plan.tracks))
+        return downloaded
     
     def check_album_youtube_availability(self, album: Dict) -> bool:
         """
@@ -1255,12 +1411,13 @@ class DeezerDownloader:
         self.log(f"Artist-Download abgeschlossen: {downloaded}/{len(tracks)} Tracks erfolgreich", "INFO")
         return downloaded
     
-    def download_from_url(self, url: str) -> int:
+    def download_from_url(self, url: str, full_discography: bool = False) -> int:
         """
         Lädt basierend auf einer Deezer-URL herunter
         
         Args:
             url: Deezer-URL (Track, Album, Playlist, Artist)
+            full_discography: Bei Artist-URLs die komplette Diskografie statt der Top-Tracks laden
             
         Returns:
             Anzahl erfolgreich heruntergeladener Tracks
@@ -1292,6 +1449,8 @@ class DeezerDownloader:
             artist_id = self.extract_id_from_url(url)
             self.log(f"[DEBUG] Artist-ID extrahiert: {artist_id}", "INFO")
             if artist_id:
+                if full_discography:
+                    return self.download_discography(artist_id)
                 return self.download_artist(artist_id)
         elif '/playlist/' in url:
             playlist_id = self.extract_id_from_url(url)
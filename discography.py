@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Diskografie-Planer für Deezer-Artists
+Bisher lud download_artist nur Top-Tracks bzw. die erste Seite der Alben;
+Deluxe-Editionen, Remaster und Compilations enthalten dieselben Aufnahmen
+aber mehrfach. DiscographyPlanner lädt alle Veröffentlichungen seitenweise
+(parallel), gruppiert sie nach Typ und erstellt einen Download-Plan, in dem
+jede Aufnahme genau einmal vorkommt - erkannt über ISRC bzw. bereinigten
+Titel und Dauer (wenn eine Seite keine ISRC hat oder einer der Titel einen
+Editions-Zusatz trägt - Remaster bekommen meist eine neue ISRC).
+
+Vorrang bei Duplikaten: Album vor EP vor Single vor Compilation, innerhalb
+eines Typs die frühere Veröffentlichung (Original vor Remaster/Deluxe).
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from query_cache import normalize_query
+
+# Veröffentlichungs-Typen von Deezer (record_type) in Vorrangreihenfolge
+RECORD_TYPES = ('album', 'ep', 'single', 'compile')
+RECORD_TYPE_LABELS = {'album': 'Alben', 'ep': 'EPs', 'single': 'Singles', 'compile': 'Compilations'}
+
+PAGE_SIZE = 100
+WORKERS = 4
+
+# Abweichung der Dauer (Sekunden), bis zu der gleiche Titel als dieselbe Aufnahme gelten
+DURATION_TOLERANCE = 2
+
+# Editions-Zusätze, die dieselbe Aufnahme bezeichnen ("Song (Remastered 2011)", "Song - Deluxe Edition")
+_EDITION_PATTERN = re.compile(
+    r'\s*(?:[\(\[][^\)\]]*\b(?:remaster(?:ed)?|deluxe|edition|bonus(?: track)?|album version|expanded)\b[^\)\]]*[\)\]]'
+    r'|\s-\s[^-]*\b(?:remaster(?:ed)?|deluxe|edition|bonus(?: track)?|album version)\b.*$)',
+    re.IGNORECASE
+)
+
+
+def recording_title(title: str) -> str:
+    """Titel ohne Editions-Zusätze, normalisiert (Live-/Remix-Angaben bleiben - andere Aufnahme)"""
+    return normalize_query(_EDITION_PATTERN.sub('', title or ''))
+
+
+def is_edition(title: str) -> bool:
+    """Titel trägt einen Editions-Zusatz (Remaster, Deluxe, ...)"""
+    return bool(_EDITION_PATTERN.search(title or ''))
+
+
+class DiscographyPlan:
+    """
+    Ergebnis der Planung
+
+    Attribute:
+        releases: Veröffentlichungen je Typ (in Vorrangreihenfolge), jeweils mit
+                  'planned_tracks' (zu ladende Tracks) und 'duplicate_count'
+        tracks: Alle zu ladenden Tracks; jeder enthält '_release' (das Album-Dict)
+        total_tracks: Tracks über alle Veröffentlichungen (mit Duplikaten)
+    """
+
+    def __init__(self, artist_id: str):
+        self.artist_id = artist_id
+        self.releases: Dict[str, List[Dict]] = {record_type: [] for record_type in RECORD_TYPES}
+        self.tracks: List[Dict] = []
+        self.total_tracks = 0
+
+    @property
+    def duplicate_count(self) -> int:
+        return self.total_tracks - len(self.tracks)
+
+    def summary(self) -> str:
+        """Kurzfassung für das Log"""
+        groups = ', '.join(
+            f"{len(releases)} {RECORD_TYPE_LABELS.get(record_type, record_type)}"
+            for record_type, releases in self.releases.items() if releases
+        )
+        return (f"{groups or 'keine Veröffentlichungen'}: {self.total_tracks} Tracks, "
+                f"davon {self.duplicate_count} Duplikate → {len(self.tracks)} Downloads")
+
+
+class DiscographyPlanner:
+    """
+    Erstellt Download-Pläne für komplette Diskografien über die Deezer API
+
+    Nutzt Session und Log des DeezerDownloader, damit Cookies/Proxy gleich sind.
+    """
+
+    def __init__(self, session, api_base: str = "https://api.deezer.com",
+                 log: Optional[Callable[[str, str], None]] = None, workers: int = WORKERS):
+        """
+        Args:
+            session: requests.Session
+            api_base: Basis-URL der Deezer API
+            log: Optionale Funktion(message, level)
+            workers: Gleichzeitige API-Anfragen
+        """
+        self.session = session
+        self.api_base = api_base
+        self.log = log or (lambda message, level="INFO": None)
+        self.workers = workers
+
+    def _get(self, path: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        try:
+            response = self.session.get(f"{self.api_base}/{path}", params=params, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            self.log(f"Deezer API-Fehler ({path}): {e}", "WARNING")
+            return None
+        if isinstance(data, dict) and 'error' in data:
+            self.log(f"Deezer API-Fehler ({path}): {data['error']}", "WARNING")
+            return None
+        return data
+
+    def _get_all(self, path: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Lädt alle Einträge eines Listen-Endpunkts (data/total, Parameter index/limit)
+
+        Die erste Seite liefert 'total', die übrigen Seiten werden parallel geladen.
+        """
+        page_size = min(PAGE_SIZE, limit) if limit else PAGE_SIZE
+        first = self._get(path, {'index': 0, 'limit': page_size})
+        if first is None:
+            return []
+        items = list(first.get('data', []))
+        total = first.get('total') or len(items)
+        if limit:
+            total = min(total, limit)
+        offsets = range(len(items), total, page_size)
+        if items and len(offsets):
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(offsets))) as executor:
+                pages = list(executor.map(lambda offset: self._get(path, {'index': offset, 'limit': page_size}), offsets))
+            for page in pages:
+                items.extend((page or {}).get('data', []))
+        return items[:limit] if limit else items
+
+    def fetch_releases(self, artist_id: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Alle Veröffentlichungen eines Artists (nicht nur die erste Seite)
+
+        Args:
+            artist_id: Deezer Artist-ID
+            limit: Optionale Obergrenze
+
+        Returns:
+            Album-Dictionaries der Deezer API (mit 'record_type')
+        """
+        return self._get_all(f"artist/{artist_id}/albums", limit)
+
+    def plan(self, artist_id: str, record_types: Sequence[str] = RECORD_TYPES) -> DiscographyPlan:
+        """
+        Erstellt den Download-Plan für eine Diskografie
+
+        Args:
+            artist_id: Deezer Artist-ID
+            record_types: Zu berücksichtigende Typen (z.B. nur ('album', 'ep'))
+
+        Returns:
+            DiscographyPlan
+        """
+        plan = DiscographyPlan(str(artist_id))
+        releases = [release for release in self.fetch_releases(artist_id)
+                    if (release.get('record_type') or 'album') in record_types]
+        self.log(f"{len(releases)} Veröffentlichung(en) gefunden, lade Tracklisten...", "INFO")
+
+        # Vorrang: Typ, dann Erscheinungsdatum (Original vor späteren Editionen)
+        releases.sort(key=lambda release: (
+            RECORD_TYPES.index(release.get('record_type') or 'album')
+            if (release.get('record_type') or 'album') in RECORD_TYPES else len(RECORD_TYPES),
+            release.get('release_date') or '9999',
+            release.get('id') or 0
+        ))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            tracklists = list(executor.map(lambda release: self._get_all(f"album/{release['id']}/tracks"), releases))
+
+        seen_isrcs = set()
+        seen_titles: Dict[str, List[Tuple[int, str, bool]]] = {}  # Bereinigter Titel → (Dauer, ISRC, Edition)
+        for release, tracks in zip(releases, tracklists):
+            planned = []
+            for track in tracks:
+                plan.total_tracks += 1
+                if self._is_duplicate(track, seen_isrcs, seen_titles):
+                    continue
+                planned.append(dict(track, _release=release))
+
+            release = dict(release, planned_tracks=planned, duplicate_count=len(tracks) - len(planned))
+            for track in planned:
+                track['_release'] = release
+            plan.releases.setdefault(release.get('record_type') or 'album', []).append(release)
+            plan.tracks.extend(planned)
+
+        self.log(f"Diskografie: {plan.summary()}", "INFO")
+        return plan
+
+    @staticmethod
+    def _is_duplicate(track: Dict, seen_isrcs: set, seen_titles: Dict[str, List[Tuple[int, str, bool]]]) -> bool:
+        """
+        Prüft und merkt sich eine Aufnahme
+
+        Gleiche ISRC = Duplikat. Titel + Dauer (beide Dauern bekannt) nur, wenn
+        einer der beiden Tracks keine ISRC hat oder einer der Titel einen
+        Editions-Zusatz trägt - ein Remaster bekommt meist eine neue ISRC,
+        gleichnamige Tracks ohne Zusatz mit verschiedenen ISRCs sind dagegen
+        verschiedene Aufnahmen (z.B. "Intro" auf zwei Alben).
+        """
+        isrc = (track.get('isrc') or '').upper()
+        raw_title = track.get('title', '')
+        title = recording_title(raw_title)
+        edition = is_edition(raw_title)
+        duration = int(track.get('duration') or 0)
+
+        if isrc and isrc in seen_isrcs:
+            return True
+        if title and duration and any(
+                seen_duration and abs(seen_duration - duration) <= DURATION_TOLERANCE
+                and (edition or seen_edition or not (isrc and seen_isrc))
+                for seen_duration, seen_isrc, seen_edition in seen_titles.get(title, [])):
+            return True
+
+        if isrc:
+            seen_isrcs.add(isrc)
+        if title:
+            seen_titles.setdefault(title, []).append((duration, isrc, edition))
+        return False
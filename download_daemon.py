@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Headless-Modus: Download-Daemon mit lokaler JSON-RPC/HTTP-API
+Stellt die Download-Engine (download_service.py) ohne GUI bereit, z.B. für
+Server oder NAS ohne Display.
+
+Endpunkte:
+    POST /rpc      JSON-RPC 2.0 (submit, search_audiobook, status, list, cancel, events, ping)
+    GET  /events   Fortschritt als Server-Sent Events (Parameter: since)
+    GET  /health   Einfache Statusabfrage
+    GET  /metrics  Laufzeit-Metriken je Stufe im Prometheus-Textformat (JSON: /metrics.json)
+
+Jede Anfrage braucht den Bearer-Token; ohne --token wird einer erzeugt und in
+.daemon_token im Anwendungsordner gespeichert (nur für den Benutzer lesbar).
+Anfragen aus dem Browser (Origin-Header, fremder Host-Header) werden immer
+abgelehnt, POST nur mit Content-Type application/json.
+
+Beispiel:
+    python download_daemon.py --port 8765
+    curl -s localhost:8765/rpc -H "Authorization: Bearer $(cat .daemon_token)" -H 'Content-Type: application/json' \
+        -d '{"jsonrpc":"2.0","id":1,"method":"submit","params":{"url":"https://www.deezer.com/album/302127"}}'
+"""
+
+import argparse
+import hmac
+import json
+import os
+import secrets
+import signal
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+import metrics
+from download_service import DownloadService, FINAL_STATUSES, get_default_download_path
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+LOOPBACK_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+TOKEN_FILE = ".daemon_token"
+
+# JSON-RPC Fehlercodes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+JOB_NOT_FOUND = -32001
+
+
+class RpcError(Exception):
+    """Fehler, der als JSON-RPC Fehlerobjekt zurückgegeben wird"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def load_or_create_token(path: Optional[Path] = None) -> str:
+    """
+    Liest den gespeicherten Daemon-Token oder erzeugt einen neuen
+
+    Eine Datei, die einem anderen Benutzer gehört oder für andere lesbar ist,
+    wird nicht übernommen, sondern ersetzt.
+
+    Args:
+        path: Token-Datei (Standard: .daemon_token im Anwendungsordner)
+
+    Returns:
+        Token
+    """
+    if path is None:
+        path = get_default_download_path() / TOKEN_FILE
+    try:
+        info = path.stat()
+        trusted = not hasattr(os, 'getuid') or (info.st_uid == os.getuid() and not info.st_mode & 0o077)
+        token = path.read_text(encoding='utf-8').strip() if trusted else ''
+        if token:
+            return token
+    except OSError:
+        pass
+
+    token = secrets.token_urlsafe(32)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        path.unlink()
+    except OSError:
+        pass
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(token)
+    return token
+
+
+class DownloadRpcApi:
+    """JSON-RPC Methoden des Daemons"""
+
+    def __init__(self, service: DownloadService):
+        self.service = service
+        # Downloads nur unterhalb dieses Ordners (options.download_path)
+        self.base_path = Path(service.download_path or get_default_download_path()).resolve()
+        self.methods = {
+            'ping': self.ping,
+            'submit': self.submit,
+            'search_audiobook': self.search_audiobook,
+            'status': self.status,
+            'list': self.list_jobs,
+            'cancel': self.cancel,
+            'events': self.events,
+        }
+
+    def dispatch(self, request: Dict) -> Optional[Dict]:
+        """
+        Bearbeitet eine einzelne JSON-RPC Anfrage
+
+        Returns:
+            Antwort-Dict oder None bei Notifications (ohne id)
+        """
+        request_id = request.get('id') if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+                raise RpcError(INVALID_REQUEST, "Ungültige Anfrage")
+            method = self.methods.get(request['method'])
+            if not method:
+                raise RpcError(METHOD_NOT_FOUND, f"Unbekannte Methode: {request['method']}")
+            params = request.get('params') or {}
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params muss ein Objekt sein")
+            try:
+                result = method(**params)
+            except TypeError as e:
+                raise RpcError(INVALID_PARAMS, str(e))
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        except RpcError as e:
+            response = {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': e.code, 'message': e.message}}
+        except Exception as e:
+            response = {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': INTERNAL_ERROR, 'message': str(e)}}
+
+        if isinstance(request, dict) and 'id' not in request:
+            return None
+        return response
+
+    def _get_job(self, job_id: str):
+        job = self.service.get_job(job_id)
+        if not job:
+            raise RpcError(JOB_NOT_FOUND, f"Job nicht gefunden: {job_id}")
+        return job
+
+    def ping(self) -> str:
+        return "pong"
+
+    def submit(self, url: str, options: Optional[Dict] = None) -> Dict:
+        if not url:
+            raise RpcError(INVALID_PARAMS, "url fehlt")
+        if options is not None and not isinstance(options, dict):
+            raise RpcError(INVALID_PARAMS, "options muss ein Objekt sein")
+        options = dict(options or {})
+        if options.get('download_path'):
+            options['download_path'] = str(self._confine_path(options['download_path']))
+        return self.service.submit(url, options).to_dict()
+
+    def _confine_path(self, download_path: str) -> Path:
+        """Relativ zum Basis-Ordner auflösen; Pfade außerhalb werden abgelehnt"""
+        path = Path(str(download_path)).expanduser()
+        if not path.is_absolute():
+            path = self.base_path / path
+        path = path.resolve()
+        if path != self.base_path and self.base_path not in path.parents:
+            raise RpcError(INVALID_PARAMS, f"download_path muss innerhalb von {self.base_path} liegen")
+        return path
+
+    def search_audiobook(self, title: str, artist: Optional[str] = None) -> Dict:
+        if not title:
+            raise RpcError(INVALID_PARAMS, "title fehlt")
+        return self.service.submit_audiobook_search(title, artist).to_dict()
+
+    def status(self, job_id: str) -> Dict:
+        return self._get_job(job_id).to_dict()
+
+    def list_jobs(self, status: Optional[str] = None, active_only: bool = False) -> list:
+        jobs = self.service.list_jobs(status)
+        if active_only:
+            jobs = [job for job in jobs if job.status not in FINAL_STATUSES]
+        return [job.to_dict() for job in jobs]
+
+    def cancel(self, job_id: str) -> bool:
+        self._get_job(job_id)
+        return self.service.cancel(job_id)
+
+    def events(self, since: int = 0, timeout: float = 25.0) -> list:
+        return self.service.wait_events(since=int(since), timeout=min(float(timeout), 60.0))
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """HTTP-Handler für JSON-RPC und Event-Stream"""
+
+    server_version = "UniversalDownloaderDaemon"
+    api: DownloadRpcApi = None
+    token: Optional[str] = None
+    # Erlaubte Host-Header (None = jeder, z.B. bei --host 0.0.0.0 mit Token)
+    allowed_hosts: Optional[set] = None
+
+    def log_message(self, format, *args):
+        # Kein Log pro Request auf stderr
+        pass
+
+    def _authorized(self) -> bool:
+        # Browser senden bei Cross-Site-Anfragen Origin; DNS-Rebinding fällt am Host-Header auf
+        if self.headers.get('Origin'):
+            return False
+        if self.allowed_hosts is not None and self.headers.get('Host', '').lower() not in self.allowed_hosts:
+            return False
+        if not self.token:
+            return True
+        header = self.headers.get('Authorization', '')
+        return hmac.compare_digest(header, f"Bearer {self.token}")
+
+    def _send_json(self, status: int, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if not self._authorized():
+            self._send_json(401, {'error': 'Nicht autorisiert'})
+            return
+        parsed = urlparse(self.path)
+        if parsed.path == '/health':
+            jobs = self.api.service.list_jobs()
+            self._send_json(200, {
+                'status': 'ok',
+                'jobs': len(jobs),
+                'active': sum(1 for job in jobs if job.status not in FINAL_STATUSES),
+            })
+        elif parsed.path == '/events':
+            self._stream_events(parse_qs(parsed.query))
+        elif metrics.handle_metrics_request(self):
+            return
+        else:
+            self._send_json(404, {'error': 'Nicht gefunden'})
+
+    def do_POST(self):
+        if not self._authorized():
+            self._send_json(401, {'error': 'Nicht autorisiert'})
+            return
+        if urlparse(self.path).path != '/rpc':
+            self._send_json(404, {'error': 'Nicht gefunden'})
+            return
+        if self.headers.get_content_type() != 'application/json':
+            # Formulare und einfache CORS-Anfragen können diesen Typ nicht setzen
+            self._send_json(415, {'error': 'Content-Type muss application/json sein'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length).decode('utf-8'))
+        except (ValueError, UnicodeDecodeError):
+            self._send_json(200, {'jsonrpc': '2.0', 'id': None,
+                                  'error': {'code': PARSE_ERROR, 'message': "Ungültiges JSON"}})
+            return
+
+        if isinstance(payload, list):
+            # Batch-Anfrage
+            responses = [r for r in (self.api.dispatch(item) for item in payload) if r is not None]
+            if responses:
+                self._send_json(200, responses)
+            else:
+                self.send_response(204)
+                self.end_headers()
+            return
+
+        response = self.api.dispatch(payload)
+        if response is None:
+            self.send_response(204)
+            self.end_headers()
+        else:
+            self._send_json(200, response)
+
+    def _stream_events(self, query: Dict):
+        """Sendet Events als Server-Sent Events, bis der Client trennt"""
+        try:
+            since = int(query.get('since', ['0'])[0])
+        except ValueError:
+            since = 0
+        job_filter = query.get('job_id', [None])[0]
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        try:
+            while not getattr(self.server, 'shutting_down', False):
+                events = self.api.service.wait_events(since=since, timeout=15.0)
+                if not events:
+                    # Keep-Alive Kommentar
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+                    continue
+                for event in events:
+                    since = event['seq']
+                    if job_filter and event['job_id'] != job_filter:
+                        continue
+                    data = json.dumps(event, ensure_ascii=False)
+                    self.wfile.write(f"id: {event['seq']}\nevent: {event['type']}\ndata: {data}\n\n".encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def create_server(service: DownloadService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                  token: Optional[str] = None) -> ThreadingHTTPServer:
+    """
+    Erstellt den HTTP-Server für den Daemon
+
+    Args:
+        service: Download-Service
+        host: Bind-Adresse (Standard: nur localhost)
+        port: Port
+        token: Bearer-Token für alle Anfragen (None = keine Token-Prüfung)
+
+    Returns:
+        Server-Instanz (noch nicht gestartet)
+    """
+    handler = type('BoundDaemonRequestHandler', (DaemonRequestHandler,), {
+        'api': DownloadRpcApi(service),
+        'token': token,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    if host in LOOPBACK_HOSTS:
+        bound_port = server.server_address[1]
+        handler.allowed_hosts = {f"{name}:{bound_port}" for name in ('127.0.0.1', 'localhost', '[::1]')}
+    server.daemon_threads = True
+    server.shutting_down = False
+    return server
+
+
+def main(argv=None):
+    """Startet den Daemon"""
+    parser = argparse.ArgumentParser(description="Universal Downloader - Headless-Daemon mit JSON-RPC API")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"Bind-Adresse (Standard: {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Port (Standard: {DEFAULT_PORT})")
+    parser.add_argument('--workers', type=int, default=2, help="Gleichzeitige Downloads (Standard: 2)")
+    parser.add_argument('--download-path', help="Basis-Ordner für Downloads")
+    parser.add_argument('--token', help=f"Bearer-Token, das jeder Client mitsenden muss (Standard: aus {TOKEN_FILE})")
+    parser.add_argument('--no-token', action='store_true',
+                        help="Keine Token-Prüfung (nur mit --host 127.0.0.1; Browser-Anfragen bleiben gesperrt)")
+    args = parser.parse_args(argv)
+
+    token = args.token
+    if args.no_token:
+        if args.host not in LOOPBACK_HOSTS:
+            print("[ERROR] --no-token ist nur mit einer lokalen Bind-Adresse erlaubt")
+            return 2
+        token = None
+    elif not token:
+        token_path = Path(args.download_path or get_default_download_path()) / TOKEN_FILE
+        token = load_or_create_token(token_path)
+        print(f"[INFO] Token für Clients: {token_path}")
+
+    service = DownloadService(max_workers=max(1, args.workers), download_path=args.download_path)
+    server = create_server(service, args.host, args.port, token)
+
+    def stop(*_):
+        server.shutting_down = True
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGINT, stop)
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, stop)
+
+    print(f"[INFO] Download-Daemon läuft auf http://{args.host}:{args.port} (Worker: {args.workers})")
+    try:
+        server.serve_forever()
+    finally:
+        service.shutdown()
+        server.server_close()
+        print("[INFO] Download-Daemon beendet")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
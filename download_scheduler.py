@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistenter Scheduler für geplante Downloads
+Hält die Jobs in einem Min-Heap (nach Fälligkeit sortiert) und schläft
+bis zum nächsten fälligen Job statt in festen Intervallen zu pollen.
+Unterstützt wiederkehrende Jobs und holt verpasste Jobs nach dem Start nach.
+"""
+
+import heapq
+import json
+import os
+import threading
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Unterstützte Wiederholungsregeln (None = einmalig)
+RECURRENCE_INTERVALS = {
+    'hourly': timedelta(hours=1),
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+}
+
+# Anzeigenamen für die GUI
+RECURRENCE_LABELS = {
+    None: "Einmalig",
+    'hourly': "Stündlich",
+    'daily': "Täglich",
+    'weekly': "Wöchentlich",
+}
+
+# Unterstützte Aktionen
+ACTION_DOWNLOAD = 'download'        # Lädt die URL des Jobs herunter
+ACTION_START_QUEUE = 'start_queue'  # Startet die Download-Queue (z.B. nächtliches Zeitfenster)
+
+# Maximale Schlafdauer am Stück. Schützt vor Uhrumstellungen und Standby,
+# bei denen der monotone Timer nicht mit der Wanduhr mitläuft.
+MAX_SLEEP_SECONDS = 900
+
+
+class DownloadScheduler:
+    """
+    Plant Downloads zu festen Zeitpunkten
+
+    Die Jobs werden in einer eigenen JSON-Datei gespeichert, damit sie
+    einen Neustart überleben. Fällige Jobs werden über den Callback
+    `on_due` gemeldet (aus dem Scheduler-Thread heraus).
+    """
+
+    def __init__(self, data_file: Path, on_due: Callable[[Dict], None],
+                 catch_up: bool = True, log_callback: Optional[Callable[[str], None]] = None):
+        """
+        Initialisiert den Scheduler
+
+        Args:
+            data_file: JSON-Datei, in der die Jobs gespeichert werden
+            on_due: Callback, der mit dem fälligen Job aufgerufen wird
+            catch_up: Ob verpasste Jobs (z.B. während die App geschlossen war) nachgeholt werden
+            log_callback: Optionale Log-Funktion
+        """
+        self.data_file = Path(data_file)
+        self.on_due = on_due
+        self.catch_up = catch_up
+        self.log_callback = log_callback
+
+        self._jobs: Dict[str, Dict] = {}
+        self._heap: List[Tuple[float, int, str]] = []  # (Zeitstempel, Sequenz, Job-ID)
+        self._sequence = 0
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._load()
+
+    def log(self, message: str):
+        """Loggt eine Nachricht"""
+        if self.log_callback:
+            try:
+                self.log_callback(message)
+                return
+            except Exception:
+                pass
+        print(message)
+
+    # ------------------------------------------------------------------
+    # Öffentliche API
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Startet den Scheduler-Thread"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="DownloadScheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stoppt den Scheduler-Thread"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def add_job(self, scheduled_time: datetime, url: Optional[str] = None,
+                settings: Optional[Dict] = None, recurrence: Optional[str] = None,
+                action: str = ACTION_DOWNLOAD) -> Dict:
+        """
+        Fügt einen geplanten Job hinzu
+
+        Args:
+            scheduled_time: Zeitpunkt der ersten Ausführung
+            url: URL für den Download (nicht nötig bei ACTION_START_QUEUE)
+            settings: Download-Einstellungen (Qualität, Format, ...)
+            recurrence: None, 'hourly', 'daily' oder 'weekly'
+            action: ACTION_DOWNLOAD oder ACTION_START_QUEUE
+
+        Returns:
+            Der angelegte Job
+        """
+        if recurrence not in RECURRENCE_LABELS:
+            raise ValueError(f"Unbekannte Wiederholungsregel: {recurrence}")
+        if action == ACTION_DOWNLOAD and not url:
+            raise ValueError("Für einen Download-Job wird eine URL benötigt")
+
+        job = {
+            'id': uuid.uuid4().hex,
+            'url': url or '',
+            'scheduled_time': scheduled_time,
+            'settings': settings or {},
+            'recurrence': recurrence,
+            'action': action,
+            'last_run': None,
+        }
+        with self._condition:
+            self._jobs[job['id']] = job
+            self._push(job)
+            self._save()
+            self._condition.notify_all()
+        return dict(job)
+
+    def remove_job(self, job_id: str) -> bool:
+        """
+        Entfernt einen Job
+
+        Der Heap-Eintrag bleibt liegen und wird beim Abarbeiten verworfen.
+
+        Returns:
+            True wenn der Job existierte
+        """
+        with self._condition:
+            removed = self._jobs.pop(job_id, None) is not None
+            if removed:
+                self._save()
+                self._condition.notify_all()
+        return removed
+
+    def clear(self):
+        """Entfernt alle Jobs"""
+        with self._condition:
+            self._jobs.clear()
+            self._heap.clear()
+            self._save()
+            self._condition.notify_all()
+
+    def list_jobs(self) -> List[Dict]:
+        """Gibt alle Jobs sortiert nach Fälligkeit zurück (Kopien)"""
+        with self._condition:
+            jobs = [dict(job) for job in self._jobs.values()]
+        return sorted(jobs, key=lambda j: j['scheduled_time'])
+
+    def next_due(self) -> Optional[datetime]:
+        """Gibt den Zeitpunkt des nächsten fälligen Jobs zurück"""
+        with self._condition:
+            self._discard_stale()
+            if not self._heap:
+                return None
+            return datetime.fromtimestamp(self._heap[0][0])
+
+    def import_jobs(self, items: List[Dict]) -> int:
+        """
+        Übernimmt Jobs aus dem alten Format (video_data.json)
+
+        Args:
+            items: Liste von Dicts mit 'url', 'scheduled_time' (datetime oder ISO-String), 'settings'
+
+        Returns:
+            Anzahl übernommener Jobs
+        """
+        imported = 0
+        with self._condition:
+            for item in items:
+                try:
+                    job = self._job_from_dict(item)
+                except (KeyError, ValueError, TypeError):
+                    continue
+                self._jobs[job['id']] = job
+                self._push(job)
+                imported += 1
+            if imported:
+                self._save()
+                self._condition.notify_all()
+        return imported
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._jobs)
+
+    # ------------------------------------------------------------------
+    # Interne Logik
+    # ------------------------------------------------------------------
+
+    def _push(self, job: Dict):
+        """Legt einen Heap-Eintrag für den Job an (Lock muss gehalten werden)"""
+        self._sequence += 1
+        heapq.heappush(self._heap, (job['scheduled_time'].timestamp(), self._sequence, job['id']))
+
+    def _is_current(self, entry: Tuple[float, int, str]) -> bool:
+        """Prüft ob ein Heap-Eintrag noch zum aktuellen Stand des Jobs passt"""
+        job = self._jobs.get(entry[2])
+        return job is not None and job['scheduled_time'].timestamp() == entry[0]
+
+    def _discard_stale(self):
+        """Verwirft veraltete Heap-Einträge (entfernte oder verschobene Jobs)"""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _next_occurrence(self, job: Dict, now: datetime) -> Optional[datetime]:
+        """
+        Berechnet die nächste Ausführung eines wiederkehrenden Jobs
+
+        Verpasste Termine werden übersprungen, damit ein Job nach längerer
+        Abwesenheit nur einmal nachgeholt wird und nicht für jeden Termin.
+        """
+        interval = RECURRENCE_INTERVALS.get(job.get('recurrence'))
+        if not interval:
+            return None
+        next_time = job['scheduled_time'] + interval
+        if next_time <= now:
+            missed = (now - next_time) // interval + 1
+            next_time += interval * missed
+        return next_time
+
+    def _collect_due(self, now: datetime) -> List[Dict]:
+        """Nimmt alle fälligen Jobs vom Heap und plant Wiederholungen neu (Lock muss gehalten werden)"""
+        due = []
+        now_ts = now.timestamp()
+        while self._heap and self._heap[0][0] <= now_ts:
+            entry = heapq.heappop(self._heap)
+            if not self._is_current(entry):
+                continue
+            job = self._jobs[entry[2]]
+            due.append(dict(job))
+
+            next_time = self._next_occurrence(job, now)
+            if next_time is None:
+                del self._jobs[job['id']]
+            else:
+                job['scheduled_time'] = next_time
+                job['last_run'] = now.isoformat()
+                self._push(job)
+        if due:
+            self._save()
+        return due
+
+    def _run(self):
+        """Scheduler-Schleife: wartet exakt bis zum nächsten fälligen Job"""
+        first_pass = True
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                self._discard_stale()
+                now = datetime.now()
+                if self._heap and self._heap[0][0] > now.timestamp():
+                    wait = min(self._heap[0][0] - now.timestamp(), MAX_SLEEP_SECONDS)
+                    first_pass = False
+                    self._condition.wait(timeout=wait)
+                    continue
+                if not self._heap:
+                    first_pass = False
+                    self._condition.wait()
+                    continue
+                due = self._collect_due(now)
+
+            for job in due:
+                if first_pass and not self.catch_up and job['scheduled_time'] < now:
+                    self.log(f"⏭ Verpasster geplanter Job übersprungen: {job.get('url') or job.get('action')}")
+                    continue
+                try:
+                    self.on_due(job)
+                except Exception as e:
+                    self.log(f"⚠ Fehler im Scheduler: {e}")
+            first_pass = False
+
+    def _job_from_dict(self, item: Dict) -> Dict:
+        """Baut einen Job aus einem gespeicherten Dict"""
+        scheduled_time = item['scheduled_time']
+        if isinstance(scheduled_time, str):
+            scheduled_time = datetime.fromisoformat(scheduled_time)
+        if not isinstance(scheduled_time, datetime):
+            raise TypeError("scheduled_time muss ein datetime sein")
+        recurrence = item.get('recurrence')
+        if recurrence not in RECURRENCE_LABELS:
+            recurrence = None
+        return {
+            'id': item.get('id') or uuid.uuid4().hex,
+            'url': item.get('url', ''),
+            'scheduled_time': scheduled_time,
+            'settings': item.get('settings', {}),
+            'recurrence': recurrence,
+            'action': item.get('action', ACTION_DOWNLOAD),
+            'last_run': item.get('last_run'),
+        }
+
+    def _load(self):
+        """Lädt die gespeicherten Jobs"""
+        if not self.data_file.exists():
+            return
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            self.log(f"⚠ Fehler beim Laden der geplanten Downloads: {e}")
+            return
+        for item in data.get('jobs', []):
+            try:
+                job = self._job_from_dict(item)
+            except (KeyError, ValueError, TypeError):
+                continue
+            self._jobs[job['id']] = job
+            self._push(job)
+
+    def _save(self):
+        """Speichert die Jobs atomar (Lock muss gehalten werden)"""
+        try:
+            data = {
+                'jobs': [
+                    {**job, 'scheduled_time': job['scheduled_time'].isoformat()}
+                    for job in self._jobs.values()
+                ]
+            }
+            self.data_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.data_file.with_suffix(self.data_file.suffix + '.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.data_file)
+        except Exception as e:
+            self.log(f"⚠ Fehler beim Speichern der geplanten Downloads: {e}")
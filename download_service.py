@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Download-Engine ohne GUI
+Verwaltet Download-Jobs (Deezer, Spotify, Video, Hörbuch-Suche) in einem
+begrenzten Thread-Pool, meldet Fortschritt als Events und unterstützt Abbruch.
+Wird vom Headless-Daemon (download_daemon.py) verwendet.
+"""
+
+import re
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    from path_helper import get_app_base_path
+except ImportError:
+    get_app_base_path = None
+
+
+# Job-Zustände
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+STATUS_CANCELLED = 'cancelled'
+FINAL_STATUSES = (STATUS_COMPLETED, STATUS_FAILED, STATUS_CANCELLED)
+
+# Job-Arten
+KIND_DEEZER = 'deezer'
+KIND_SPOTIFY = 'spotify'
+KIND_VIDEO = 'video'
+KIND_AUDIOBOOK_SEARCH = 'audiobook_search'
+
+# Kurzschreibweisen wie "deezer:album:302127" oder "spotify:track:4uLU6hMCjMI75M1A2tKUQC"
+_TARGET_ID_PATTERN = re.compile(r'^(deezer|spotify):(track|album|playlist|artist):([A-Za-z0-9]+)$', re.IGNORECASE)
+_PERCENT_PATTERN = re.compile(r'(\d+(?:\.\d+)?)%')
+
+
+class JobCancelled(Exception):
+    """Wird ausgelöst, wenn ein laufender Job abgebrochen wurde"""
+
+
+def get_default_download_path() -> Path:
+    """Gibt den Standard-Download-Ordner zurück (wie in der GUI)"""
+    if get_app_base_path:
+        try:
+            return get_app_base_path()
+        except Exception:
+            pass
+    return Path.home() / "Downloads" / "Universal Downloader"
+
+
+def normalize_target(target: str) -> str:
+    """
+    Wandelt eine Kurzschreibweise (z.B. "deezer:album:123") in eine URL um
+
+    Args:
+        target: URL oder Kurzschreibweise
+
+    Returns:
+        URL
+    """
+    target = target.strip()
+    match = _TARGET_ID_PATTERN.match(target)
+    if match:
+        service, item_type, item_id = match.groups()
+        if service.lower() == 'deezer':
+            return f"https://www.deezer.com/{item_type.lower()}/{item_id}"
+        return f"https://open.spotify.com/{item_type.lower()}/{item_id}"
+    return target
+
+
+def detect_kind(url: str) -> str:
+    """
+    Bestimmt den zuständigen Downloader für eine URL
+
+    Args:
+        url: URL (oder Kurzschreibweise)
+
+    Returns:
+        KIND_DEEZER, KIND_SPOTIFY oder KIND_VIDEO
+    """
+    url_lower = normalize_target(url).lower()
+    if 'deezer.com' in url_lower or 'deezer.page.link' in url_lower:
+        return KIND_DEEZER
+    if 'spotify.com' in url_lower:
+        return KIND_SPOTIFY
+    return KIND_VIDEO
+
+
+class DownloadJob:
+    """
+    Ein Download-Job
+
+    Stellt die Attribute `video_download_cancelled` und `video_download_process`
+    bereit, damit er direkt als `gui_instance` an VideoDownloader.download_video
+    übergeben werden kann (Abbruch beendet dann den yt-dlp Prozess).
+    """
+
+    def __init__(self, kind: str, url: str = '', options: Optional[Dict] = None):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.url = url
+        self.options = options or {}
+        self.status = STATUS_QUEUED
+        self.progress: Optional[float] = None
+        self.message = ''
+        self.result: Optional[Dict] = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.cancel_event = threading.Event()
+        self.video_download_process = None
+
+    @property
+    def video_download_cancelled(self) -> bool:
+        """Abbruch-Flag im Format, das VideoDownloader erwartet"""
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self):
+        """Löst JobCancelled aus, wenn der Job abgebrochen wurde"""
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    def to_dict(self) -> Dict:
+        """Gibt den Job als JSON-serialisierbares Dict zurück"""
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'url': self.url,
+            'options': self.options,
+            'status': self.status,
+            'progress': self.progress,
+            'message': self.message,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+def _guard_track_downloads(downloader, job: DownloadJob, on_track: Callable[[int], None]):
+    """
+    Ersetzt download_track einer Downloader-Instanz durch eine Variante,
+    die vor jedem Track auf Abbruch prüft und den Fortschritt meldet.
+    """
+    original = downloader.download_track
+    counter = {'tracks': 0}
+    counter_lock = threading.Lock()  # Spotify lädt Tracks parallel
+
+    def guarded_download_track(*args, **kwargs):
+        job.check_cancelled()
+        result = original(*args, **kwargs)
+        with counter_lock:
+            counter['tracks'] += 1
+            count = counter['tracks']
+        on_track(count)
+        return result
+
+    downloader.download_track = guarded_download_track
+
+
+def execute_download(url: str, options: Optional[Dict] = None, job: Optional[DownloadJob] = None,
+                     log_callback: Optional[Callable[[str, str], None]] = None,
+                     progress_callback: Optional[Callable[[Optional[float], str], None]] = None) -> Dict:
+    """
+    Lädt eine URL mit dem passenden Downloader herunter
+
+    Args:
+        url: Deezer-, Spotify- oder Video-URL (oder Kurzschreibweise)
+        options: Optionen (download_path, quality, format, subtitles, ...)
+        job: Optionaler Job (für Abbruch)
+        log_callback: Optionale Funktion(message, level) für Log-Ausgaben der Downloader
+        progress_callback: Optionale Funktion(percent, message)
+
+    Returns:
+        Dict mit 'success', 'kind', 'url', 'count', 'file_path', 'error'
+    """
+    options = options or {}
+    url = normalize_target(url)
+    kind = detect_kind(url)
+    base_path = Path(options.get('download_path') or get_default_download_path())
+
+    def report(percent: Optional[float], message: str):
+        if progress_callback:
+            progress_callback(percent, message)
+
+    def attach_log(downloader):
+        if not log_callback:
+            return
+        original_log = downloader.log
+
+        def forwarding_log(message, level="INFO"):
+            original_log(message, level)
+            log_callback(message, level)
+
+        downloader.log = forwarding_log
+
+    result = {'success': False, 'kind': kind, 'url': url, 'count': 0, 'file_path': None, 'error': None}
+
+    if kind == KIND_DEEZER:
+        from deezer_downloader import DeezerDownloader
+        auth = None
+        try:
+            from deezer_auth import DeezerAuth
+            auth = DeezerAuth()
+            if not auth.is_logged_in():
+                auth = None
+        except Exception:
+            auth = None
+        downloader = DeezerDownloader(download_path=str(base_path / "Musik"), auth=auth)
+        if options.get('quality'):
+            downloader.quality = options['quality']
+        attach_log(downloader)
+        if job:
+            _guard_track_downloads(downloader, job, lambda n: report(None, f"{n} Track(s) verarbeitet"))
+        count = downloader.download_from_url(url, full_discography=bool(options.get('discography')))
+        result.update(success=count > 0, count=count)
+        if count == 0:
+            result['error'] = "Keine Tracks heruntergeladen"
+
+    elif kind == KIND_SPOTIFY:
+        from spotify_downloader import SpotifyDownloader
+        downloader = SpotifyDownloader(download_path=str(base_path / "Musik"))
+        attach_log(downloader)
+        if job:
+            _guard_track_downloads(downloader, job, lambda n: report(None, f"{n} Track(s) verarbeitet"))
+        # Abbruch des Jobs stoppt auch die parallelen Track-Downloads
+        count = downloader.download_from_url(url, cancel_event=job.cancel_event if job else None)
+        if job:
+            job.check_cancelled()
+        result.update(success=count > 0, count=count)
+        if count == 0:
+            result['error'] = "Keine Tracks heruntergeladen"
+
+    else:
+        from video_downloader import VideoDownloader
+        output_dir = Path(options.get('download_path') or base_path / "Video")
+        downloader = VideoDownloader(
+            download_path=str(output_dir),
+            quality=options.get('quality', 'best'),
+            output_format=options.get('format', 'mp4')
+        )
+        attach_log(downloader)
+
+        def on_progress(percent, line=""):
+            report(percent, line.strip() if isinstance(line, str) else "")
+
+        success, file_path, error = downloader.download_video(
+            url,
+            output_dir=output_dir,
+            quality=options.get('quality'),
+            output_format=options.get('format'),
+            progress_callback=on_progress,
+            download_subtitles=options.get('subtitles', False),
+            subtitle_language=options.get('subtitle_language', 'de'),
+            download_description=options.get('description', False),
+            download_thumbnail=options.get('thumbnail', False),
+            speed_limit=options.get('speed_limit'),
+            embed_metadata=options.get('metadata', True),
+            gui_instance=job
+        )
+        result.update(success=success, count=1 if success else 0,
+                      file_path=str(file_path) if file_path else None, error=error or None)
+        if job and job.cancel_event.is_set():
+            raise JobCancelled()
+
+    return result
+
+
+def execute_audiobook_search(title: str, artist: Optional[str] = None) -> Dict:
+    """
+    Sucht ein Hörbuch bei allen Anbietern
+
+    Returns:
+        Ergebnis von AudiobookSearch.search_all_providers
+    """
+    from audiobook_search import AudiobookSearch
+    return AudiobookSearch().search_all_providers(title, artist)
+
+
+class DownloadService:
+    """
+    Verwaltet Download-Jobs ohne GUI
+
+    Jobs laufen in einem begrenzten Thread-Pool. Statusänderungen,
+    Fortschritt und Log-Zeilen werden als Events mit fortlaufender
+    Sequenznummer gesammelt und können per wait_events abgeholt werden.
+    """
+
+    def __init__(self, max_workers: int = 2, download_path: Optional[str] = None,
+                 max_events: int = 5000, max_finished_jobs: int = 1000):
+        """
+        Initialisiert den Service
+
+        Args:
+            max_workers: Anzahl gleichzeitiger Downloads
+            download_path: Basis-Ordner für Downloads (Standard wie in der GUI)
+            max_events: Anzahl Events, die für wait_events vorgehalten werden
+            max_finished_jobs: Anzahl abgeschlossener Jobs, die behalten werden
+        """
+        self.download_path = download_path
+        self.max_finished_jobs = max_finished_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="DownloadJob")
+        self._jobs: Dict[str, DownloadJob] = {}
+        self._lock = threading.Lock()
+        self._events = deque(maxlen=max_events)
+        self._event_seq = 0
+        self._event_condition = threading.Condition()
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def submit(self, url: str, options: Optional[Dict] = None) -> DownloadJob:
+        """
+        Reiht einen Download ein
+
+        Args:
+            url: URL oder Kurzschreibweise
+            options: Download-Optionen
+
+        Returns:
+            Der angelegte Job
+        """
+        options = dict(options or {})
+        if self.download_path and not options.get('download_path'):
+            options['download_path'] = self.download_path
+        url = normalize_target(url)
+        job = DownloadJob(detect_kind(url), url, options)
+        self._register(job)
+        self._executor.submit(self._run_job, job, lambda: execute_download(
+            job.url, job.options, job=job,
+            log_callback=lambda msg, level="INFO": self._emit(job, 'log', {'message': msg, 'level': level}),
+            progress_callback=lambda percent, msg: self._set_progress(job, percent, msg)
+        ))
+        return job
+
+    def submit_audiobook_search(self, title: str, artist: Optional[str] = None) -> DownloadJob:
+        """Startet eine Hörbuch-Suche über alle Anbieter als Job"""
+        job = DownloadJob(KIND_AUDIOBOOK_SEARCH, options={'title': title, 'artist': artist})
+        self._register(job)
+        self._executor.submit(self._run_job, job, lambda: execute_audiobook_search(title, artist))
+        return job
+
+    def get_job(self, job_id: str) -> Optional[DownloadJob]:
+        """Gibt einen Job zurück"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, status: Optional[str] = None) -> List[DownloadJob]:
+        """Gibt alle Jobs zurück (optional gefiltert nach Status)"""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        if status:
+            jobs = [job for job in jobs if job.status == status]
+        return jobs
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Bricht einen Job ab
+
+        Wartende Jobs starten nicht mehr. Laufende Video-Downloads beenden den
+        yt-dlp Prozess, Musik-Downloads stoppen vor dem nächsten Track.
+
+        Returns:
+            True wenn der Job existierte und noch nicht abgeschlossen war
+        """
+        # Unter dem Lock, damit _run_job einen gerade abgebrochenen Job nicht doch noch startet
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job.status in FINAL_STATUSES:
+                return False
+            job.cancel_event.set()
+            was_queued = job.status == STATUS_QUEUED
+        if was_queued:
+            self._finish(job, STATUS_CANCELLED)
+        return True
+
+    def shutdown(self, cancel_running: bool = True):
+        """Beendet den Service"""
+        if cancel_running:
+            for job in self.list_jobs():
+                if job.status not in FINAL_STATUSES:
+                    self.cancel(job.id)
+        self._executor.shutdown(wait=False)
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def wait_events(self, since: int = 0, timeout: float = 30.0) -> List[Dict]:
+        """
+        Gibt alle Events mit Sequenznummer > since zurück
+
+        Wartet bis zu `timeout` Sekunden, falls noch keine neuen Events vorliegen
+        (Long-Polling).
+        """
+        with self._event_condition:
+            if self._event_seq <= since:
+                self._event_condition.wait(timeout=timeout)
+            return [event for event in self._events if event['seq'] > since]
+
+    def _emit(self, job: DownloadJob, event_type: str, data: Optional[Dict] = None):
+        """Erzeugt ein Event"""
+        with self._event_condition:
+            self._event_seq += 1
+            self._events.append({
+                'seq': self._event_seq,
+                'time': datetime.now().isoformat(),
+                'job_id': job.id,
+                'type': event_type,
+                'data': data or {},
+            })
+            self._event_condition.notify_all()
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+
+    def _register(self, job: DownloadJob):
+        """Speichert einen neuen Job und räumt alte abgeschlossene Jobs auf"""
+        with self._lock:
+            self._jobs[job.id] = job
+            finished = [j for j in self._jobs.values() if j.status in FINAL_STATUSES]
+            excess = len(finished) - self.max_finished_jobs
+            if excess > 0:
+                for old in sorted(finished, key=lambda j: j.finished_at or j.created_at)[:excess]:
+                    del self._jobs[old.id]
+        self._emit(job, 'status', {'status': job.status, 'kind': job.kind, 'url': job.url})
+
+    def _set_progress(self, job: DownloadJob, percent: Optional[float], message: str):
+        """Aktualisiert den Fortschritt eines Jobs"""
+        if percent is None and message:
+            match = _PERCENT_PATTERN.search(message)
+            if match:
+                percent = float(match.group(1))
+        if percent is not None:
+            job.progress = max(0.0, min(100.0, float(percent)))
+        job.message = message
+        self._emit(job, 'progress', {'progress': job.progress, 'message': message})
+
+    def _finish(self, job: DownloadJob, status: str, result: Optional[Dict] = None, error: Optional[str] = None):
+        """Schließt einen Job ab (nur einmal - ein abgeschlossener Job bleibt es)"""
+        with self._lock:
+            if job.status in FINAL_STATUSES:
+                return
+            job.status = status
+            job.result = result
+            job.error = error
+            job.finished_at = datetime.now()
+            if status == STATUS_COMPLETED:
+                job.progress = 100.0
+        self._emit(job, 'status', {'status': status, 'error': error})
+
+    def _run_job(self, job: DownloadJob, work: Callable[[], Dict]):
+        """Führt einen Job im Worker-Thread aus"""
+        with self._lock:
+            if job.status != STATUS_QUEUED or job.cancel_event.is_set():
+                return  # Bereits abgebrochen (cancel() setzt den Endstatus)
+            job.status = STATUS_RUNNING
+            job.started_at = datetime.now()
+        self._emit(job, 'status', {'status': STATUS_RUNNING})
+        try:
+            result = work()
+            if job.cancel_event.is_set():
+                self._finish(job, STATUS_CANCELLED, result)
+            elif job.kind == KIND_AUDIOBOOK_SEARCH or result.get('success'):
+                self._finish(job, STATUS_COMPLETED, result)
+            else:
+                self._finish(job, STATUS_FAILED, result, result.get('error'))
+        except JobCancelled:
+            self._finish(job, STATUS_CANCELLED)
+        except Exception as e:
+            self._finish(job, STATUS_FAILED, error=str(e))
@@ -12,7 +12,7 @@ import queue
 import time
 import re
 from typing import Optional, Dict, List
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import sys
 import json
@@ -22,46 +22,58 @@ import platform
 import shutil
 import subprocess
 import tempfile
-from deezer_downloader import DeezerDownloader
+from download_scheduler import DownloadScheduler, RECURRENCE_LABELS, ACTION_DOWNLOAD, ACTION_START_QUEUE
+import metrics
+from log_writer import AsyncLogWriter
+from log_pump import LogPump
+from ui_event_bus import UIEventBus
+from virtual_list import VirtualList, ThumbnailLoader, SELECTED_BACKGROUND
+from lazy_import import LazyImport, module_available
+from history_store import HistoryStore
+from instance_ipc import InstanceServer, COMMAND_ENQUEUE, COMMAND_START_QUEUE, COMMAND_SHOW
+
+# Downloader und Authentifizierung werden erst bei der ersten Verwendung importiert
+# (ziehen requests, mutagen, PIL, Selenium usw. nach - das soll den Fensteraufbau nicht bremsen)
+DeezerDownloader = LazyImport('deezer_downloader', 'DeezerDownloader')
 
 # Import Authentifizierung
-try:
-    from deezer_auth import DeezerAuth, interactive_login
-except ImportError:
-    DeezerAuth = None
-    interactive_login = None
+DeezerAuth = LazyImport('deezer_auth', 'DeezerAuth')
+interactive_login = LazyImport('deezer_auth', 'interactive_login')
 
 # Import Audible
-try:
-    from audible_integration import AudibleAuth, AudibleLibrary, interactive_audible_login
-except ImportError:
-    AudibleAuth = None
-    AudibleLibrary = None
-    interactive_audible_login = None
+AudibleAuth = LazyImport('audible_integration', 'AudibleAuth')
+AudibleLibrary = LazyImport('audible_integration', 'AudibleLibrary')
+interactive_audible_login = LazyImport('audible_integration', 'interactive_audible_login')
 
 # Import Video Downloader
-try:
-    from video_downloader import VideoDownloader, SUPPORTED_SENDERS
-except ImportError:
-    VideoDownloader = None
-    SUPPORTED_SENDERS = {}
+VideoDownloader = LazyImport('video_downloader', 'VideoDownloader')
+SUPPORTED_SENDERS = LazyImport('video_downloader', 'SUPPORTED_SENDERS', default={})
 
 # Import Spotify Downloader
-try:
-    from spotify_downloader import SpotifyDownloader
-except ImportError:
-    SpotifyDownloader = None
+SpotifyDownloader = LazyImport('spotify_downloader', 'SpotifyDownloader')
 
 # Import Updater
+UpdateChecker = LazyImport('updater', 'UpdateChecker')
+check_updates_simple = LazyImport('updater', 'check_updates_simple')
 try:
-    from updater import UpdateChecker, check_updates_simple
     from version import get_version_string, get_version
 except ImportError:
-    UpdateChecker = None
-    check_updates_simple = None
     get_version_string = lambda: "Universal Downloader"
     get_version = lambda: "unknown"
 
+# Zielzeit vom Prozessstart bis zum bedienbaren Hauptfenster
+STARTUP_BUDGET_SECONDS = 1.0
+
+# Spalten der Audible-Bibliothek: (Überschrift, relative Breite)
+AUDIBLE_LIBRARY_COLUMNS = (('Titel', 4), ('Autor', 3), ('Dauer', 1), ('Gekauft', 1))
+
+# Zeilenhöhe der Suchergebnisse (Vorschaubild 120x68 + Texte)
+SEARCH_RESULT_ROW_HEIGHT = 96
+
+# Einträge pro Seite in Historie und Favoriten; Suche startet nach kurzer Tipp-Pause
+HISTORY_PAGE_SIZE = 200
+HISTORY_SEARCH_DELAY_MS = 250
+
 
 class DeezerDownloaderGUI:
     """GUI-Klasse für den Deezer Downloader"""
@@ -174,6 +186,21 @@ class DeezerDownloaderGUI:
         
         # Spotify Downloader (für API-Funktionen)
         self.spotify_downloader = None
+        self.music_cancel_event = None  # Abbruch des laufenden Spotify-Downloads
+        self.music_download_queue = []  # Wartende Musik-URLs (Queue-Button, externe Aufrufe)
+        self.music_downloads_running = 0  # Laufende Musik-Download-Threads
+        
+        # Log-Ausgabe: Worker-Threads reihen nur ein, der Mainloop fügt gebündelt ein
+        self.log_pump = LogPump(self.root)
+        self.log_pump.register('music', lambda: getattr(self, 'music_log_text', None))
+        self.log_pump.register('deezer', lambda: getattr(self, 'log_text', None) or getattr(self, 'music_log_text', None))
+        self.log_pump.register('spotify', lambda: getattr(self, 'spotify_log_text', None))
+        self.log_pump.register('video', lambda: getattr(self, 'video_log_text', None))
+        self.log_pump.start()
+        
+        # Fortschritt/Status aus Worker-Threads: neuester Stand je Schlüssel, höchstens alle 50 ms
+        self.ui_bus = UIEventBus(self.root)
+        self.ui_bus.start()
         
         # UI erstellen
         self.create_widgets()
@@ -190,6 +217,11 @@ class DeezerDownloaderGUI:
         # Initialisiere letzte Geometrie nach dem Setzen
         self._last_geometry = self.root.geometry()
         
+        # Gespeicherte Anmeldungen erst prüfen, wenn das Fenster steht (importiert deezer_auth/audible_integration)
+        self.root.after(100, self._restore_saved_logins)
+    
+    def _restore_saved_logins(self):
+        """Übernimmt gespeicherte Deezer-/Audible-Anmeldungen"""
         # Prüfe ob bereits angemeldet (Deezer)
         if DeezerAuth:
             try:
@@ -201,19 +233,24 @@ class DeezerDownloaderGUI:
                 pass
         
         # Prüfe ob bereits angemeldet (Audible)
-        if AudibleAuth:
+        if module_available('audible_integration') and AudibleAuth:
             try:
                 temp_audible_auth = AudibleAuth()
                 if temp_audible_auth.is_logged_in():
                     self.audible_auth = temp_audible_auth
                     self.audible_library = AudibleLibrary(temp_audible_auth)
-                    # Aktualisiere Status
-                    email = temp_audible_auth.email if temp_audible_auth.email else "Gespeicherte Anmeldung"
-                    self.audible_status_var.set(f"✓ Angemeldet ({email})")
-                    self.audible_load_button.config(state=tk.NORMAL)
+                    self._show_audible_login_state()
             except Exception as e:
                 print(f"Fehler beim Laden der gespeicherten Audible-Anmeldung: {e}")
     
+    def _show_audible_login_state(self):
+        """Zeigt eine gespeicherte Audible-Anmeldung im Tab an (sofern der Tab schon aufgebaut ist)"""
+        if not self.audible_auth or not hasattr(self, 'audible_status_var'):
+            return
+        email = self.audible_auth.email if self.audible_auth.email else "Gespeicherte Anmeldung"
+        self.audible_status_var.set(f"✓ Angemeldet ({email})")
+        self.audible_load_button.config(state=tk.NORMAL)
+    
     def _set_application_icon(self):
         """Setzt das Programm-Icon für das Hauptfenster und den Prozess"""
         try:
@@ -454,23 +491,68 @@ class DeezerDownloaderGUI:
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
-        # Musik Tab (Deezer & Spotify kombiniert)
+        # Tabs werden erst aufgebaut, wenn sie zum ersten Mal angezeigt werden
+        # (Tab-Frame → Aufbau-Funktion; bereits aufgebaute Tabs werden entfernt)
+        self._pending_tabs = {}
+        self.notebook.bind('<<NotebookTabChanged>>', lambda e: self._ensure_tab_built(self.notebook.select()))
+        
+        # Musik Tab (Deezer & Spotify kombiniert) - ist beim Start sichtbar, wird sofort aufgebaut
         self.music_frame = ttk.Frame(self.notebook, padding="10")
         self.notebook.add(self.music_frame, text="🎵 Musik")
         # Verwende die umbenannte create_deezer_tab als Basis für create_music_tab
         self.create_music_tab()
         
         # Audible Tab
-        if AudibleAuth:
+        if module_available('audible_integration'):
             self.audible_frame = ttk.Frame(self.notebook, padding="10")
             self.notebook.add(self.audible_frame, text="📚 Audible")
-            self.create_audible_tab()
+            self._pending_tabs[str(self.audible_frame)] = self.create_audible_tab
         
         # Video Downloader Tab
-        if VideoDownloader:
+        if module_available('video_downloader'):
             self.video_frame = ttk.Frame(self.notebook, padding="10")
             self.notebook.add(self.video_frame, text="🎬 Video Downloader")
-            self.create_video_tab()
+            self._pending_tabs[str(self.video_frame)] = self.create_video_tab
+            self._init_video_state()
+    
+    def _ensure_tab_built(self, tab) -> bool:
+        """
+        Baut einen Tab auf, falls das noch nicht passiert ist
+        
+        Args:
+            tab: Tab-Frame oder dessen Tk-Pfadname (wie von notebook.select() geliefert)
+        
+        Returns:
+            True wenn der Tab (jetzt) aufgebaut ist
+        """
+        builder = self._pending_tabs.pop(str(tab), None)
+        if builder is None:
+            return True
+        started = time.perf_counter()
+        try:
+            builder()
+        except Exception as e:
+            self.log(f"Fehler beim Aufbau des Tabs: {e}", "ERROR")
+            import traceback
+            self.log(traceback.format_exc(), "ERROR")
+            return False
+        seconds = time.perf_counter() - started
+        metrics.observe('tab_build', builder.__name__.replace('create_', '').replace('_tab', ''), seconds)
+        self.log(f"[STARTUP] {builder.__name__} in {seconds * 1000:.0f} ms aufgebaut", "DEBUG")
+        return True
+    
+    def _select_tab(self, frame):
+        """Wechselt zu einem Tab und baut ihn vorher auf (Aufrufer können danach direkt auf die Widgets zugreifen)"""
+        self._ensure_tab_built(frame)
+        self.notebook.select(self.notebook.index(frame))
+    
+    def _build_pending_tabs(self):
+        """Baut nach dem Start die übrigen Tabs im Leerlauf auf - einen pro Durchlauf, damit das Fenster bedienbar bleibt"""
+        if not self._pending_tabs:
+            return
+        self._ensure_tab_built(next(iter(self._pending_tabs)))
+        if self._pending_tabs:
+            self.root.after(50, lambda: self.root.after_idle(self._build_pending_tabs))
     
     def create_music_tab(self):
         """Erstellt den kombinierten Musik-Tab (Deezer & Spotify)"""
@@ -524,7 +606,7 @@ class DeezerDownloaderGUI:
         self.logout_button.pack(side=tk.RIGHT, padx=5)
         
         # Spotify API Button
-        if SpotifyDownloader:
+        if module_available('spotify_downloader'):
             ttk.Button(
                 auth_frame,
                 text="⚙️ Spotify API",
@@ -584,6 +666,15 @@ class DeezerDownloaderGUI:
         )
         self.music_download_button.pack(side=tk.LEFT, padx=(0, 5))
         
+        # Abbrechen (Spotify: noch nicht begonnene Tracks entfallen)
+        self.music_cancel_button = ttk.Button(
+            button_frame,
+            text="⏹ Abbrechen",
+            command=self.cancel_music_download,
+            state=tk.DISABLED
+        )
+        self.music_cancel_button.pack(side=tk.LEFT, padx=(0, 5))
+        
         ttk.Button(
             button_frame,
             text="➕ Zur Queue",
@@ -683,19 +774,24 @@ class DeezerDownloaderGUI:
         library_frame.columnconfigure(0, weight=1)
         library_frame.rowconfigure(0, weight=1)
         
-        # Treeview für Hörbücher
-        columns = ('Titel', 'Autor', 'Dauer', 'Gekauft')
-        self.audible_tree = ttk.Treeview(library_frame, columns=columns, show='headings', height=15)
-        
-        for col in columns:
-            self.audible_tree.heading(col, text=col)
-            self.audible_tree.column(col, width=200)
-        
-        scrollbar = ttk.Scrollbar(library_frame, orient=tk.VERTICAL, command=self.audible_tree.yview)
-        self.audible_tree.configure(yscrollcommand=scrollbar.set)
-        
-        self.audible_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        # Virtualisierte Liste für Hörbücher (nur sichtbare Zeilen werden als Widgets erzeugt)
+        header = ttk.Frame(library_frame)
+        header.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E))
+        for col, (heading, weight) in enumerate(AUDIBLE_LIBRARY_COLUMNS):
+            header.columnconfigure(col, weight=weight, uniform='audible')
+            ttk.Label(header, text=heading, font=("Arial", 9, "bold")).grid(row=0, column=col, sticky=tk.W, padx=4)
+        
+        self.audible_list = VirtualList(
+            library_frame,
+            row_height=22,
+            create_row=self._create_audible_row,
+            bind_row=self._bind_audible_row,
+            select_mode='extended',
+            height=330
+        )
+        library_frame.rowconfigure(0, weight=0)
+        library_frame.rowconfigure(1, weight=1)
+        self.audible_list.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Download-Button
         button_frame = ttk.Frame(main_frame)
@@ -706,6 +802,9 @@ class DeezerDownloaderGUI:
             text="Ausgewählte Hörbücher herunterladen",
             command=self.download_selected_audible_books
         ).pack(side=tk.LEFT, padx=5)
+        
+        # Anmeldung kann vor dem Aufbau des Tabs wiederhergestellt worden sein
+        self._show_audible_login_state()
     
     def create_video_tab(self):
         """Erstellt den Video-Downloader-Tab"""
@@ -862,26 +961,6 @@ class DeezerDownloaderGUI:
         self._update_subtitle_language_state()
         self._update_video_tab_visibility()
         
-        # Initialisiere Datenstrukturen
-        self.video_scheduled_downloads = []  # Liste von geplanten Downloads
-        self.video_download_history = []  # Liste von Download-Historien
-        self.video_favorites = []  # Liste von Favoriten
-        self.video_statistics = {
-            'total_downloads': 0,
-            'total_size': 0,
-            'successful_downloads': 0,
-            'failed_downloads': 0,
-            'last_download': None
-        }
-        
-        # Lade gespeicherte Daten
-        self._load_video_data()
-        
-        # Starte Scheduler-Thread für geplante Downloads
-        self.scheduler_running = True
-        scheduler_thread = threading.Thread(target=self._scheduler_loop, daemon=True)
-        scheduler_thread.start()
-        
         # ===== RECHTE SEITE: LOG UND STATUS =====
         log_container = ttk.Frame(paned)
         paned.add(log_container, weight=1)
@@ -907,13 +986,35 @@ class DeezerDownloaderGUI:
         video_status_label = ttk.Label(status_frame, textvariable=self.video_status_var, relief=tk.SUNKEN, anchor=tk.W, font=("Arial", 9))
         video_status_label.pack(fill=tk.X)
         
-        # Download-Queue initialisieren (erweiterte Struktur für Download-Optionen)
-        self.video_download_queue = []
-        self.video_download_queue_processing = False  # Flag ob Queue gerade abgearbeitet wird
+        # Queue-Anzeige nachziehen (Einträge können vor dem Aufbau des Tabs hinzugekommen sein)
+        self._update_queue_status()
         
         # Initialisiere Download-Pfad
         self.video_path_var.set(str(self.video_download_path))
     
+    def _init_video_state(self):
+        """Initialisiert Queue, Historie, Favoriten und Scheduler des Video-Downloaders (unabhängig vom Tab-Aufbau)"""
+        self.download_scheduler = DownloadScheduler(
+            self.base_download_path / "scheduled_downloads.json",
+            on_due=lambda job: self.root.after(0, lambda j=job: self._start_scheduled_download(j)),
+            log_callback=lambda msg: self.root.after(0, lambda m=msg: self.video_log(m))
+        )
+        # Historie, Favoriten und Statistiken (SQLite, inkrementelle Schreibzugriffe)
+        self.history_store = HistoryStore(self.base_download_path / "video_data.db")
+        
+        # Übernimm Daten aus der alten video_data.json
+        self._load_video_data()
+        
+        # Starte Scheduler für geplante Downloads (schläft bis zum nächsten fälligen Job)
+        self.download_scheduler.start()
+        
+        # Optionaler Metrik-Endpunkt (nur wenn UD_METRICS_PORT gesetzt ist)
+        self.metrics_server = metrics.start_from_environment()
+        
+        # Download-Queue initialisieren (erweiterte Struktur für Download-Optionen)
+        self.video_download_queue = []
+        self.video_download_queue_processing = False  # Flag ob Queue gerade abgearbeitet wird
+    
     def create_spotify_tab(self):
         """Erstellt den Spotify-Tab"""
         main_frame = self.spotify_frame
@@ -1037,10 +1138,7 @@ class DeezerDownloaderGUI:
     
     def spotify_log(self, message: str):
         """Fügt eine Nachricht zum Spotify-Log hinzu"""
-        self.spotify_log_text.config(state=tk.NORMAL)
-        self.spotify_log_text.insert(tk.END, message + "\n")
-        self.spotify_log_text.see(tk.END)
-        self.spotify_log_text.config(state=tk.DISABLED)
+        self.log_pump.post('spotify', message)
     
     def start_spotify_download(self):
         """Startet den Spotify-Download"""
@@ -1086,7 +1184,7 @@ class DeezerDownloaderGUI:
             original_log = self.spotify_downloader.log
             def logged_log(message, level="INFO"):
                 original_log(message, level)
-                self.root.after(0, lambda: log_func(f"[{level}] {message}"))
+                log_func(f"[{level}] {message}")
             self.spotify_downloader.log = logged_log
             
             # Starte Download
@@ -1299,12 +1397,9 @@ class DeezerDownloaderGUI:
         if log_level_setting == 'normal' and level == 'DEBUG':
             show_in_gui = False
         
-        if show_in_gui and hasattr(self, 'music_log_text'):
-            self.music_log_text.config(state=tk.NORMAL)
+        if show_in_gui:
             level_prefix = f"[{level}] " if level != "INFO" else ""
-            self.music_log_text.insert(tk.END, f"{level_prefix}{message}\n")
-            self.music_log_text.see(tk.END)
-            self.music_log_text.config(state=tk.DISABLED)
+            self.log_pump.post('music', f"{level_prefix}{message}")
         # Auch in Log-Datei schreiben (immer, aber mit Level-Filterung)
         self._write_to_log_file(f"[MUSIK] {message}", level)
     
@@ -1418,9 +1513,8 @@ class DeezerDownloaderGUI:
             def update_progress(elapsed: float):
                 minutes = int(elapsed // 60)
                 seconds = int(elapsed % 60)
-                self.root.after(0, lambda: self.music_status_var.set(
-                    f"🎙️ Aufnahme läuft... ({minutes:02d}:{seconds:02d})"
-                ))
+                self.ui_bus.publish('music.status', self.music_status_var.set,
+                                    f"🎙️ Aufnahme läuft... ({minutes:02d}:{seconds:02d})")
             
             # Lade ARL-Token für automatische Anmeldung
             arl_token = None
@@ -1453,11 +1547,11 @@ class DeezerDownloaderGUI:
             automation.progress_callback = update_progress
             
             if automation.record_with_automation(url, provider, track_info=track_info):
-                self.root.after(0, lambda: self.music_status_var.set(f"✓ Audio-Aufnahme abgeschlossen: {filename}"))
+                self.ui_bus.publish('music.status', self.music_status_var.set, f"✓ Audio-Aufnahme abgeschlossen: {filename}")
                 self.root.after(0, lambda: self.music_log(f"\n✓ Audio-Aufnahme erfolgreich: {output_path}"))
                 self.root.after(0, lambda: messagebox.showinfo("Erfolg", f"Audio-Aufnahme abgeschlossen!\n\nDatei: {filename}"))
             else:
-                self.root.after(0, lambda: self.music_status_var.set("✗ Audio-Aufnahme fehlgeschlagen"))
+                self.ui_bus.publish('music.status', self.music_status_var.set, "✗ Audio-Aufnahme fehlgeschlagen")
                 self.root.after(0, lambda: messagebox.showerror("Fehler", "Audio-Aufnahme fehlgeschlagen"))
                 
         except ImportError as e:
@@ -1625,13 +1719,39 @@ class DeezerDownloaderGUI:
             messagebox.showwarning("Ungültige URL", "Bitte geben Sie eine gültige Deezer- oder Spotify-URL ein.")
             return
         
-        # Starte Download in separatem Thread
+        self._start_music_download_thread(url)
+    
+    def _start_music_download_thread(self, url: str):
+        """Startet music_download_thread (nur aus dem Tk-Thread aufrufen)"""
+        self.music_downloads_running += 1
         threading.Thread(
             target=self.music_download_thread,
             args=(url,),
             daemon=True
         ).start()
     
+    def _music_download_finished(self):
+        """Ein Musik-Download ist fertig - nächsten Queue-Eintrag starten"""
+        self.music_downloads_running = max(0, self.music_downloads_running - 1)
+        self._process_music_queue()
+    
+    def _process_music_queue(self):
+        """Startet den nächsten Eintrag der Musik-Queue, sobald kein Musik-Download mehr läuft"""
+        if self.music_downloads_running or not self.music_download_queue:
+            return
+        url = self.music_download_queue.pop(0)
+        remaining = len(self.music_download_queue)
+        self.music_log(f"Starte Queue-Eintrag: {url} (noch {remaining} wartend)")
+        self._start_music_download_thread(url)
+    
+    def cancel_music_download(self):
+        """Bricht den laufenden Spotify-Download ab (laufende Tracks werden noch beendet)"""
+        if self.music_cancel_event is not None:
+            self.music_cancel_event.set()
+            self.music_status_var.set("Wird abgebrochen...")
+            self.music_log("Abbruch angefordert - laufende Tracks werden noch beendet")
+        self.music_cancel_button.config(state=tk.DISABLED)
+    
     def add_music_to_queue(self):
         """Fügt einen Musik-Download zur Queue hinzu"""
         url = self.music_url_var.get().strip()
@@ -1654,14 +1774,12 @@ class DeezerDownloaderGUI:
             messagebox.showwarning("Ungültige URL", "Bitte geben Sie eine gültige Deezer- oder Spotify-URL ein.")
             return
         
-        # Füge zur Queue hinzu
-        if not hasattr(self, 'music_download_queue'):
-            self.music_download_queue = []
-        
+        # Füge zur Queue hinzu (startet sofort, wenn kein Musik-Download läuft)
         self.music_download_queue.append(url)
         self.music_log(f"Zur Queue hinzugefügt: {url}")
         self.music_status_var.set(f"Zur Queue hinzugefügt ({len(self.music_download_queue)} Einträge)")
         messagebox.showinfo("Queue", f"URL zur Queue hinzugefügt.\nAktuelle Queue-Größe: {len(self.music_download_queue)}")
+        self._process_music_queue()
     
     def music_download_thread(self, url: str):
         """Download-Thread für Musik (Deezer oder Spotify)"""
@@ -1687,13 +1805,18 @@ class DeezerDownloaderGUI:
                 original_log = self.spotify_downloader.log
                 def logged_log(message, level="INFO"):
                     original_log(message, level)
-                    self.root.after(0, lambda: self.music_log(f"[{level}] {message}"))
+                    self.music_log(f"[{level}] {message}")
                 self.spotify_downloader.log = logged_log
                 
-                # Starte Download
-                count = self.spotify_downloader.download_from_url(url, str(self.music_download_path))
+                # Starte Download (abbrechbar)
+                cancel_event = self.music_cancel_event = threading.Event()
+                self.root.after(0, lambda: self.music_cancel_button.config(state=tk.NORMAL))
+                count = self.spotify_downloader.download_from_url(url, str(self.music_download_path), cancel_event=cancel_event)
                 
-                if count > 0:
+                if cancel_event.is_set():
+                    self.root.after(0, lambda: self.music_status_var.set(f"⏹ Download abgebrochen: {count} Track(s) heruntergeladen"))
+                    self.root.after(0, lambda: self.music_log(f"\n⏹ Download abgebrochen: {count} Track(s) heruntergeladen"))
+                elif count > 0:
                     self.root.after(0, lambda: self.music_status_var.set(f"✓ Download abgeschlossen: {count} Track(s)"))
                     self.root.after(0, lambda: self.music_log(f"\n✓ Download erfolgreich abgeschlossen: {count} Track(s)"))
                     self.root.after(0, lambda: messagebox.showinfo("Erfolg", f"Download abgeschlossen!\n{count} Track(s) heruntergeladen."))
@@ -1713,7 +1836,7 @@ class DeezerDownloaderGUI:
                 original_log = self.downloader.log
                 def logged_log(message, level="INFO"):
                     original_log(message, level)
-                    self.root.after(0, lambda: self.music_log(f"[{level}] {message}"))
+                    self.music_log(f"[{level}] {message}")
                 self.downloader.log = logged_log
                 
                 # Prüfe ob es Artist oder Playlist ist - zeige Auswahl-Dialog
@@ -1943,6 +2066,8 @@ class DeezerDownloaderGUI:
         finally:
             self.root.after(0, lambda: self.music_progress_bar.stop())
             self.root.after(0, lambda: self.music_download_button.config(state=tk.NORMAL))
+            self.root.after(0, lambda: self.music_cancel_button.config(state=tk.DISABLED))
+            self.root.after(0, self._music_download_finished)
     
     def browse_download_path(self):
         """Öffnet einen Dialog zur Auswahl des Download-Pfads (Legacy für Deezer)"""
@@ -2059,6 +2184,7 @@ class DeezerDownloaderGUI:
         if not AudibleAuth:
             messagebox.showinfo("Info", "Audible-Integration nicht verfügbar.")
             return
+        self._ensure_tab_built(self.audible_frame)
         
         login_window = tk.Toplevel(self.root)
         login_window.title("Audible Anmeldung")
@@ -2443,6 +2569,31 @@ class DeezerDownloaderGUI:
         ttk.Button(button_frame, text="Anmelden", command=do_cookie_login).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Abbrechen", command=cookie_window.destroy).pack(side=tk.LEFT, padx=5)
     
+    def _create_audible_row(self, parent) -> tk.Frame:
+        """Erzeugt eine (wiederverwendbare) Zeile der Audible-Bibliothek"""
+        row = tk.Frame(parent)
+        row.cells = []
+        for col, (_, weight) in enumerate(AUDIBLE_LIBRARY_COLUMNS):
+            row.columnconfigure(col, weight=weight, uniform='audible')
+            cell = tk.Label(row, anchor=tk.W, padx=4)
+            cell.grid(row=0, column=col, sticky=(tk.W, tk.E))
+            row.cells.append(cell)
+        return row
+    
+    def _bind_audible_row(self, row: tk.Frame, book: Dict, index: int, selected: bool):
+        """Befüllt eine Zeile der Audible-Bibliothek mit einem Hörbuch"""
+        purchase_date = book.get('purchase_date')
+        values = (
+            book.get('title', 'Unbekannt'),
+            book.get('author', 'Unbekannt'),
+            book.get('duration', 'Unbekannt'),
+            purchase_date[:10] if purchase_date else 'Unbekannt'
+        )
+        background = SELECTED_BACKGROUND if selected else row.master.cget('background')
+        row.configure(background=background)
+        for cell, value in zip(row.cells, values):
+            cell.configure(text=value, background=background)
+    
     def load_audible_library(self):
         """Lädt die Audible-Bibliothek"""
         if not self.audible_auth or not self.audible_auth.is_logged_in():
@@ -2456,23 +2607,8 @@ class DeezerDownloaderGUI:
                 self.log("Lade Audible-Bibliothek...")
                 books = self.audible_library.fetch_library()
                 
-                # Lösche alte Einträge
-                for item in self.audible_tree.get_children():
-                    self.audible_tree.delete(item)
-                
-                # Füge Hörbücher hinzu (sortiert nach zuletzt gekauft)
-                for book in books:
-                    self.audible_tree.insert(
-                        '',
-                        tk.END,
-                        values=(
-                            book.get('title', 'Unbekannt'),
-                            book.get('author', 'Unbekannt'),
-                            book.get('duration', 'Unbekannt'),
-                            book.get('purchase_date', 'Unbekannt')[:10] if book.get('purchase_date') else 'Unbekannt'
-                        ),
-                        tags=(book.get('asin', ''),)
-                    )
+                # Liste ersetzen (sortiert nach zuletzt gekauft) - im Mainloop, Zeilen entstehen erst beim Anzeigen
+                self.ui_bus.publish('audible.library', self.audible_list.set_items, books)
                 
                 self.log(f"✓ Bibliothek geladen: {len(books)} Hörbücher")
                 # Wechsle zurück zum Audible-Tab
@@ -2794,7 +2930,7 @@ class DeezerDownloaderGUI:
     
     def download_selected_audible_books(self):
         """Lädt ausgewählte Hörbücher herunter"""
-        selected = self.audible_tree.selection()
+        selected = self.audible_list.selected_items()
         if not selected:
             messagebox.showwarning("Warnung", "Bitte wählen Sie mindestens ein Hörbuch aus.")
             return
@@ -2823,10 +2959,9 @@ class DeezerDownloaderGUI:
                 
                 success_count = 0
                 
-                for item in selected:
-                    values = self.audible_tree.item(item, 'values')
-                    asin = self.audible_tree.item(item, 'tags')[0] if self.audible_tree.item(item, 'tags') else None
-                    title = values[0] if values else "Unbekannt"
+                for book in selected:
+                    asin = book.get('asin') or None
+                    title = book.get('title') or "Unbekannt"
                     
                     if not asin:
                         self.log(f"✗ Keine ASIN für {title} gefunden")
@@ -3086,7 +3221,7 @@ class DeezerDownloaderGUI:
         """Video-Download-Thread"""
         try:
             # Wechsle zum Video-Tab für Logs
-            self.notebook.select(self.notebook.index(self.video_frame))
+            self._select_tab(self.video_frame)
             
             # Prüfe ob es eine YouTube-URL ist
             is_youtube = 'youtube.com' in url.lower() or 'youtu.be' in url.lower()
@@ -3139,7 +3274,7 @@ class DeezerDownloaderGUI:
             def progress_callback(percent, status_line):
                 """Callback für Fortschritts-Updates"""
                 try:
-                    self.video_progress_var.set(percent)
+                    self.ui_bus.publish('video.progress', self.video_progress_var.set, percent)
                     
                     # Extrahiere Geschwindigkeit und ETA aus Status-Line
                     speed_str = ""
@@ -3160,8 +3295,7 @@ class DeezerDownloaderGUI:
                     
                     # Status-Text zusammenstellen
                     status_text = f"Download läuft... {percent:.1f}%{speed_str}{eta_str}"
-                    self.video_status_var.set(status_text)
-                    self.root.update_idletasks()
+                    self.ui_bus.publish('video.status', self.video_status_var.set, status_text)
                 except:
                     pass
             
@@ -3212,7 +3346,7 @@ class DeezerDownloaderGUI:
                     self.video_log(f"\n✓ Download erfolgreich!")
                     self.video_log(f"  Datei: {file_path.name}")
                     self.video_log(f"  Pfad: {file_path}")
-                    self.video_status_var.set(f"✓ Download erfolgreich: {file_path.name}")
+                    self._publish_video_status(f"✓ Download erfolgreich: {file_path.name}")
                     
                     # Aktualisiere Statistiken
                     self._update_statistics(success=True, file_path=file_path, url=url)
@@ -3226,7 +3360,7 @@ class DeezerDownloaderGUI:
                     )
                 else:
                     self.video_log(f"\n⚠ Download scheint erfolgreich, aber Datei nicht gefunden")
-                    self.video_status_var.set("⚠ Download abgeschlossen (Datei nicht gefunden)")
+                    self._publish_video_status("⚠ Download abgeschlossen (Datei nicht gefunden)")
                     
                     # Aktualisiere Statistiken
                     self._update_statistics(success=True, file_path=None, url=url)
@@ -3240,7 +3374,7 @@ class DeezerDownloaderGUI:
                     )
             else:
                 self.video_log(f"\n✗ Download fehlgeschlagen: {error}")
-                self.video_status_var.set(f"✗ Download fehlgeschlagen")
+                self._publish_video_status(f"✗ Download fehlgeschlagen")
                 
                 # Aktualisiere Statistiken
                 self._update_statistics(success=False, file_path=None, url=url)
@@ -3254,25 +3388,34 @@ class DeezerDownloaderGUI:
             self.video_log(f"\n✗ Fehler: {e}")
             import traceback
             self.video_log(traceback.format_exc())
-            self.video_status_var.set(f"✗ Fehler: {e}")
+            self._publish_video_status(f"✗ Fehler: {e}")
             messagebox.showerror("Fehler", f"Fehler beim Download: {e}")
         finally:
-            # UI wieder aktivieren
-            self.video_download_button.config(state=tk.NORMAL)
-            if hasattr(self, 'video_cancel_button'):
-                self.video_cancel_button.config(state=tk.DISABLED)
             self.video_download_process = None
             
-            if self.video_download_cancelled:
-                self.video_status_var.set("Download abgebrochen")
-                self.video_progress_var.set(0)
-            else:
-                self.video_progress_var.set(100)
-                if self.video_status_var.get().startswith("Download läuft"):
-                    self.video_status_var.set("Bereit")
-            
-            # Prüfe ob Queue-Downloads vorhanden sind und starte automatisch
-            self._process_download_queue()
+            # UI wieder aktivieren und Queue fortsetzen - im Mainloop nach dem letzten Status-Update
+            self.ui_bus.publish('video.finished', self._finish_video_download, self.video_download_cancelled)
+    
+    def _publish_video_status(self, text: str):
+        """Setzt den Video-Status aus einem Worker-Thread (über den UI-Event-Bus)"""
+        self.ui_bus.publish('video.status', self.video_status_var.set, text)
+    
+    def _finish_video_download(self, cancelled: bool):
+        """Stellt die UI nach einem Video-Download wieder her (läuft im Mainloop)"""
+        self.video_download_button.config(state=tk.NORMAL)
+        if hasattr(self, 'video_cancel_button'):
+            self.video_cancel_button.config(state=tk.DISABLED)
+        
+        if cancelled:
+            self.video_status_var.set("Download abgebrochen")
+            self.video_progress_var.set(0)
+        else:
+            self.video_progress_var.set(100)
+            if self.video_status_var.get().startswith("Download läuft"):
+                self.video_status_var.set("Bereit")
+        
+        # Prüfe ob Queue-Downloads vorhanden sind und starte automatisch
+        self._process_download_queue()
     
     def cancel_video_download(self):
         """Bricht den laufenden Download ab"""
@@ -4132,8 +4275,13 @@ class DeezerDownloaderGUI:
                 cleaned_title = re.sub(r'^.*? - ', '', album_title, count=1)  # Entferne alles vor " - "
                 cleaned_title = re.sub(r'\(.*?\)', '', cleaned_title).strip()  # Entferne Klammern
                 
-                # Suche auf allen Plattformen
-                results = searcher.search_all_providers(cleaned_title, artist_name)
+                # Suche auf allen Plattformen gleichzeitig - Treffer sofort anzeigen
+                results = {}
+                for provider, result in searcher.iter_provider_results(cleaned_title, artist_name):
+                    results[provider] = result
+                    if result.get('available', False) and result.get('downloadable', False):
+                        drm_text = "🔓 DRM (Umgehung möglich)" if result.get('drm', False) else "✅ Kein DRM"
+                        self.music_log(f"  → Gefunden auf {provider} ({drm_text})")
                 
                 # Zeige Ergebnisse - nur herunterladbare Anbieter
                 downloadable_providers = [p for p, d in results.items() 
@@ -4142,21 +4290,9 @@ class DeezerDownloaderGUI:
                 drm_providers = [p for p in downloadable_providers if results[p].get('drm', False)]
                 
                 if downloadable_providers:
-                    # Zeige detaillierte Informationen
-                    provider_info = []
-                    for provider in downloadable_providers:
-                        info = results[provider]
-                        method = info.get('method', 'unknown')
-                        has_drm = info.get('drm', False)
-                        status = "✅ Kein DRM" if not has_drm else "🔓 DRM (Umgehung möglich)"
-                        provider_info.append(f"{provider} ({status})")
-                    
-                    self.music_log(f"  ✅ Verfügbar und herunterladbar auf:")
-                    for info in provider_info:
-                        self.music_log(f"     • {info}")
-                    
-                    if no_drm_providers:
-                        self.music_log(f"  📥 Empfohlen (kein DRM): {', '.join(no_drm_providers)}")
+                    # Die einzelnen Anbieter wurden bereits beim Eintreffen geloggt - hier nur die Anzahl
+                    self.music_log(f"  ✅ Herunterladbar auf {len(downloadable_providers)} Anbieter(n), "
+                                   f"davon {len(no_drm_providers)} ohne DRM")
                     
                     # Frage ob von alternativem Anbieter heruntergeladen werden soll
                     self.root.after(0, lambda p=downloadable_providers, t=cleaned_title, a=artist_name, s=searcher, r=results: 
@@ -4329,7 +4465,7 @@ class DeezerDownloaderGUI:
             self.video_log(f"[DEBUG] Thread gestartet: episodes_total={episodes_count}")
             
             # Wechsle zum Video-Tab für Logs
-            self.notebook.select(self.notebook.index(self.video_frame))
+            self._select_tab(self.video_frame)
             
             self.video_log("=" * 60)
             self.video_log(f"Starte Download von {len(episodes)} Folgen")
@@ -4389,7 +4525,7 @@ class DeezerDownloaderGUI:
                         # Gesamtfortschritt = (abgeschlossene Episoden + aktuelle Episode Fortschritt) / Gesamtanzahl
                         episode_progress = percent / len(episodes)
                         total_progress = ((i - 1) / len(episodes)) * 100 + episode_progress
-                        self.video_progress_var.set(total_progress)
+                        self.ui_bus.publish('video.progress', self.video_progress_var.set, total_progress)
                         
                         # Extrahiere Geschwindigkeit und ETA
                         speed_str = ""
@@ -4410,8 +4546,7 @@ class DeezerDownloaderGUI:
                         
                         # Status-Text mit Geschwindigkeit
                         status_text = f"Download läuft... {total_progress:.1f}% ({i}/{len(episodes)}){speed_str}{eta_str}"
-                        self.video_status_var.set(status_text)
-                        self.root.update_idletasks()
+                        self.ui_bus.publish('video.status', self.video_status_var.set, status_text)
                     except:
                         pass
                 
@@ -4544,7 +4679,7 @@ class DeezerDownloaderGUI:
                 self.video_log(f"Heruntergeladen: {success_count}/{len(episodes)} Folgen")
                 self.video_log("=" * 60)
                 
-                self.video_status_var.set("⚠ Download abgebrochen")
+                self._publish_video_status("⚠ Download abgebrochen")
                 
                 # Zeige Popup-Fenster für Abbruch
                 messagebox.showwarning(
@@ -4558,7 +4693,7 @@ class DeezerDownloaderGUI:
                     self.video_log(f"Fehlgeschlagen: {failed_count} Folgen")
                 self.video_log("=" * 60)
                 
-                self.video_status_var.set(f"✓ Download abgeschlossen: {success_count}/{len(episodes)} Folgen")
+                self._publish_video_status(f"✓ Download abgeschlossen: {success_count}/{len(episodes)} Folgen")
                 
                 messagebox.showinfo(
                     "Erfolg",
@@ -4571,7 +4706,7 @@ class DeezerDownloaderGUI:
             self.video_log(f"\n✗ Fehler: {e}")
             import traceback
             self.video_log(traceback.format_exc())
-            self.video_status_var.set(f"✗ Fehler: {e}")
+            self._publish_video_status(f"✗ Fehler: {e}")
             messagebox.showerror("Fehler", f"Fehler beim Download: {e}")
         finally:
             # Reset Variablen NUR wenn Download komplett beendet ist
@@ -4579,26 +4714,15 @@ class DeezerDownloaderGUI:
             # self.video_download_episodes_total = 0  # Wird später zurückgesetzt
             # self.video_download_cancel_current_only = False  # Wird später zurückgesetzt
             
-            # UI wieder aktivieren
-            self.video_download_button.config(state=tk.NORMAL)
-            if hasattr(self, 'video_cancel_button'):
-                self.video_cancel_button.config(state=tk.DISABLED)
             self.video_download_process = None
-            
-            if self.video_download_cancelled:
-                self.video_status_var.set("Download abgebrochen")
-                self.video_progress_var.set(0)
-            else:
-                self.video_progress_var.set(100)
-                if self.video_status_var.get().startswith("Download läuft"):
-                    self.video_status_var.set("Bereit")
+            cancelled = self.video_download_cancelled
             
             # Reset Variablen ZUERST, damit _process_download_queue erkennt, dass Download beendet ist
             self.video_download_episodes_total = 0
             self.video_download_cancel_current_only = False
             
-            # Prüfe ob Queue-Downloads vorhanden sind und starte automatisch
-            self._process_download_queue()
+            # UI wieder aktivieren und Queue fortsetzen - im Mainloop nach dem letzten Status-Update
+            self.ui_bus.publish('video.finished', self._finish_video_download, cancelled)
     
     def _setup_logging(self):
         """Richtet File-Logging ein"""
@@ -4624,7 +4748,7 @@ class DeezerDownloaderGUI:
             # Erstelle Log-Datei mit Timestamp
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             log_filename = logs_dir / f"universal_downloader_{timestamp}.log"
-            self.log_file = open(log_filename, 'w', encoding='utf-8')
+            self.log_file = AsyncLogWriter(log_filename, fmt=self.settings.get('log_format', 'text'), source='gui')
             self._write_to_log_file(f"=== Universal Downloader gestartet ===", "INFO")
             self._write_to_log_file(f"Log-Datei: {log_filename}", "INFO")
             self._write_to_log_file(f"Download-Pfad: {self.base_download_path}", "INFO")
@@ -4651,10 +4775,8 @@ class DeezerDownloaderGUI:
                 if log_level_setting == 'normal' and level == 'DEBUG':
                     return
                 
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                log_entry = f"[{timestamp}] [{level}] {message}\n"
-                self.log_file.write(log_entry)
-                self.log_file.flush()  # Sofort schreiben
+                # Nur einreihen - geschrieben wird gebündelt im Hintergrund-Thread
+                self.log_file.write(message, level)
             except:
                 pass
     
@@ -4906,6 +5028,47 @@ class DeezerDownloaderGUI:
             else:
                 self.video_queue_status_label.config(text="📋 Queue: 0 Downloads")
     
+    def handle_instance_message(self, message: Dict):
+        """
+        Verarbeitet eine Nachricht einer weiteren Programm-Instanz (oder der Startargumente)
+        
+        Args:
+            message: {'command': 'enqueue', 'urls': [...]}, {'command': 'start_queue'} oder {'command': 'show'}
+        """
+        command = message.get('command')
+        if command == COMMAND_SHOW:
+            self.root.deiconify()
+            self.root.lift()
+            self.root.focus_force()
+        elif command == COMMAND_ENQUEUE:
+            added_video = 0
+            added_music = 0
+            for url in message.get('urls', []):
+                url = self._clean_url(url.strip())
+                if not url:
+                    continue
+                lower_url = url.lower()
+                if 'spotify.com' in lower_url or 'deezer.com' in lower_url or 'deezer.page.link' in lower_url:
+                    self.music_download_queue.append(url)
+                    self.music_log(f"Zur Queue hinzugefügt (externer Aufruf): {url}")
+                    self.music_status_var.set(f"Zur Queue hinzugefügt ({len(self.music_download_queue)} Einträge)")
+                    added_music += 1
+                elif hasattr(self, 'video_frame'):
+                    # Queue-Einträge übernehmen die Optionen des Video-Tabs
+                    self._ensure_tab_built(self.video_frame)
+                    self._add_to_download_queue(url, show_dialog=False)
+                    added_video += 1
+                else:
+                    self.log(f"Video-Downloader nicht verfügbar - URL ignoriert: {url}", "WARNING")
+            if added_video:
+                self._publish_video_status(f"{added_video} URL(s) von außen zur Queue hinzugefügt")
+            if added_music:
+                self._process_music_queue()
+        elif command == COMMAND_START_QUEUE:
+            self._process_music_queue()
+            if hasattr(self, 'video_download_queue') and self.video_download_queue and not self.video_download_queue_processing:
+                self.start_queue_download()
+    
     def _process_download_queue(self):
         """Startet automatisch den nächsten Download aus der Queue"""
         # Prüfe ob bereits ein Download läuft (aber ignoriere video_download_queue_processing, 
@@ -4961,6 +5124,7 @@ class DeezerDownloaderGUI:
     
     def show_download_queue(self):
         """Zeigt die Download-Queue an"""
+        self._ensure_tab_built(self.video_frame)
         queue_window = tk.Toplevel(self.root)
         queue_window.title("Download-Queue")
         queue_window.geometry("700x450")
@@ -5153,6 +5317,7 @@ class DeezerDownloaderGUI:
     
     def show_scheduled_downloads(self):
         """Zeigt Dialog für geplante Downloads"""
+        self._ensure_tab_built(self.video_frame)
         schedule_window = tk.Toplevel(self.root)
         schedule_window.title("Geplante Downloads")
         schedule_window.geometry("700x500")
@@ -5169,14 +5334,16 @@ class DeezerDownloaderGUI:
         list_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
         # Treeview für geplante Downloads
-        columns = ("URL", "Zeitpunkt", "Status")
+        columns = ("URL", "Zeitpunkt", "Wiederholung", "Status")
         tree = ttk.Treeview(list_frame, columns=columns, show="headings", height=12)
         tree.heading("URL", text="URL")
         tree.heading("Zeitpunkt", text="Geplant für")
+        tree.heading("Wiederholung", text="Wiederholung")
         tree.heading("Status", text="Status")
-        tree.column("URL", width=400)
-        tree.column("Zeitpunkt", width=150)
-        tree.column("Status", width=100)
+        tree.column("URL", width=330)
+        tree.column("Zeitpunkt", width=130)
+        tree.column("Wiederholung", width=100)
+        tree.column("Status", width=80)
         
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=tree.yview)
         tree.configure(yscrollcommand=scrollbar.set)
@@ -5187,13 +5354,18 @@ class DeezerDownloaderGUI:
         # Aktualisiere Liste
         def refresh_list():
             tree.delete(*tree.get_children())
-            for item in self.video_scheduled_downloads:
+            for item in self.download_scheduler.list_jobs():
                 status = "Wartend" if item['scheduled_time'] > datetime.now() else "Bereit"
+                if item.get('action') == ACTION_START_QUEUE:
+                    target = "📋 Download-Queue starten"
+                else:
+                    target = item['url'][:60] + "..." if len(item['url']) > 60 else item['url']
                 tree.insert("", tk.END, values=(
-                    item['url'][:60] + "..." if len(item['url']) > 60 else item['url'],
+                    target,
                     item['scheduled_time'].strftime("%Y-%m-%d %H:%M"),
+                    RECURRENCE_LABELS.get(item.get('recurrence'), "Einmalig"),
                     status
-                ), tags=(item['url'],))
+                ), tags=(item['id'],))
         
         refresh_list()
         
@@ -5204,12 +5376,18 @@ class DeezerDownloaderGUI:
         def add_scheduled():
             add_window = tk.Toplevel(schedule_window)
             add_window.title("Download vormerken")
-            add_window.geometry("500x300")
+            add_window.geometry("500x400")
             add_window.transient(schedule_window)
             
             add_frame = ttk.Frame(add_window, padding="20")
             add_frame.pack(fill=tk.BOTH, expand=True)
             
+            ttk.Label(add_frame, text="Aktion:").pack(anchor=tk.W, pady=(0, 5))
+            action_labels = {"URL herunterladen": ACTION_DOWNLOAD, "Download-Queue starten": ACTION_START_QUEUE}
+            action_var = tk.StringVar(value="URL herunterladen")
+            ttk.Combobox(add_frame, textvariable=action_var, values=list(action_labels.keys()),
+                         state="readonly", width=30).pack(anchor=tk.W, pady=(0, 15))
+            
             ttk.Label(add_frame, text="URL:").pack(anchor=tk.W, pady=(0, 5))
             url_entry = ttk.Entry(add_frame, width=60)
             url_entry.pack(fill=tk.X, pady=(0, 15))
@@ -5220,14 +5398,22 @@ class DeezerDownloaderGUI:
             # Vorschlag: Heute 20:15
             default_time = datetime.now().replace(hour=20, minute=15, second=0, microsecond=0)
             if default_time < datetime.now():
-                default_time = default_time.replace(day=default_time.day + 1)
+                default_time += timedelta(days=1)
             time_entry.insert(0, default_time.strftime("%Y-%m-%d %H:%M"))
             
+            ttk.Label(add_frame, text="Wiederholung:").pack(anchor=tk.W, pady=(0, 5))
+            recurrence_by_label = {label: rule for rule, label in RECURRENCE_LABELS.items()}
+            recurrence_var = tk.StringVar(value=RECURRENCE_LABELS[None])
+            ttk.Combobox(add_frame, textvariable=recurrence_var, values=list(recurrence_by_label.keys()),
+                         state="readonly", width=20).pack(anchor=tk.W, pady=(0, 15))
+            
             def save_scheduled():
                 url = url_entry.get().strip()
                 time_str = time_entry.get().strip()
+                action = action_labels.get(action_var.get(), ACTION_DOWNLOAD)
+                recurrence = recurrence_by_label.get(recurrence_var.get())
                 
-                if not url:
+                if action == ACTION_DOWNLOAD and not url:
                     messagebox.showerror("Fehler", "Bitte URL eingeben!")
                     return
                 
@@ -5237,10 +5423,12 @@ class DeezerDownloaderGUI:
                         messagebox.showerror("Fehler", "Zeitpunkt muss in der Zukunft liegen!")
                         return
                     
-                    self.video_scheduled_downloads.append({
-                        'url': url,
-                        'scheduled_time': scheduled_time,
-                        'settings': {
+                    self.download_scheduler.add_job(
+                        scheduled_time=scheduled_time,
+                        url=url if action == ACTION_DOWNLOAD else None,
+                        recurrence=recurrence,
+                        action=action,
+                        settings={
                             'quality': self.video_quality_var.get(),
                             'format': self.video_format_var.get(),
                             'subtitle': self.video_subtitle_var.get(),
@@ -5251,9 +5439,8 @@ class DeezerDownloaderGUI:
                             'metadata': True,  # Immer aktiviert
                             'speed_limit': self.settings.get('speed_limit_value', '5') if self.settings.get('speed_limit_enabled', False) else None
                         }
-                    })
+                    )
                     
-                    self._save_video_data()
                     refresh_list()
                     add_window.destroy()
                     messagebox.showinfo("Erfolg", f"Download für {scheduled_time.strftime('%Y-%m-%d %H:%M')} vorgemerkt!")
@@ -5267,48 +5454,39 @@ class DeezerDownloaderGUI:
             selection = tree.selection()
             if selection:
                 item = tree.item(selection[0])
-                url = item['tags'][0] if item['tags'] else None
-                if url:
-                    self.video_scheduled_downloads = [s for s in self.video_scheduled_downloads if s['url'] != url]
-                    self._save_video_data()
+                job_id = item['tags'][0] if item['tags'] else None
+                if job_id:
+                    self.download_scheduler.remove_job(job_id)
                     refresh_list()
         
         def clear_all():
             if messagebox.askyesno("Bestätigen", "Alle geplanten Downloads löschen?"):
-                self.video_scheduled_downloads.clear()
-                self._save_video_data()
+                self.download_scheduler.clear()
                 refresh_list()
         
         ttk.Button(button_frame, text="➕ Download vormerken", command=add_scheduled).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="🗑️ Ausgewähltes entfernen", command=remove_selected).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="🗑️ Alle löschen", command=clear_all).pack(side=tk.LEFT, padx=5)
     
-    def _scheduler_loop(self):
-        """Prüft regelmäßig auf geplante Downloads"""
-        while self.scheduler_running:
-            try:
-                now = datetime.now()
-                ready_downloads = []
-                
-                for scheduled in self.video_scheduled_downloads[:]:
-                    if scheduled['scheduled_time'] <= now:
-                        ready_downloads.append(scheduled)
-                        self.video_scheduled_downloads.remove(scheduled)
-                
-                if ready_downloads:
-                    self._save_video_data()
-                    for scheduled in ready_downloads:
-                        # Starte Download im Hintergrund
-                        self.root.after(0, lambda s=scheduled: self._start_scheduled_download(s))
-                
-                time.sleep(30)  # Prüfe alle 30 Sekunden
-            except Exception as e:
-                self.video_log(f"⚠ Fehler im Scheduler: {e}")
-                time.sleep(60)
-    
     def _start_scheduled_download(self, scheduled):
         """Startet einen geplanten Download"""
+        self._ensure_tab_built(self.video_frame)
         try:
+            if scheduled.get('action') == ACTION_START_QUEUE:
+                # Zeitfenster für die Queue (z.B. nachts)
+                if not self.video_download_queue:
+                    self.video_log("⏰ Geplanter Queue-Start: Queue ist leer, nichts zu tun")
+                    return
+                if self.video_download_queue_processing:
+                    self.video_log("⏰ Geplanter Queue-Start: Queue wird bereits abgearbeitet")
+                    return
+                self.video_log(f"\n{'='*60}")
+                self.video_log(f"⏰ Starte geplanten Queue-Download: {len(self.video_download_queue)} Downloads")
+                self.video_log(f"{'='*60}\n")
+                self.video_download_queue_processing = True
+                self._process_download_queue()
+                return
+            
             self.video_log(f"\n{'='*60}")
             self.video_log(f"⏰ Starte geplanten Download: {scheduled['url']}")
             self.video_log(f"{'='*60}")
@@ -5359,10 +5537,10 @@ class DeezerDownloaderGUI:
         self.video_resume_var.set(resume)
     
     def show_download_history(self):
-        """Zeigt Download-Historie"""
+        """Zeigt Download-Historie (durchsuchbar, seitenweise)"""
         history_window = tk.Toplevel(self.root)
         history_window.title("Download-Historie")
-        history_window.geometry("800x500")
+        history_window.geometry("800x550")
         history_window.transient(self.root)
         
         frame = ttk.Frame(history_window, padding="10")
@@ -5372,7 +5550,8 @@ class DeezerDownloaderGUI:
         
         # Treeview
         columns = ("Zeitpunkt", "URL", "Status", "Datei")
-        tree = ttk.Treeview(frame, columns=columns, show="headings", height=20)
+        tree_frame = ttk.Frame(frame)
+        tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=20)
         tree.heading("Zeitpunkt", text="Zeitpunkt")
         tree.heading("URL", text="URL")
         tree.heading("Status", text="Status")
@@ -5382,37 +5561,44 @@ class DeezerDownloaderGUI:
         tree.column("Status", width=100)
         tree.column("Datei", width=200)
         
-        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
         tree.configure(yscrollcommand=scrollbar.set)
         
         tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Lade Historie
-        for entry in sorted(self.video_download_history, key=lambda x: x.get('timestamp', ''), reverse=True):
-            tree.insert("", tk.END, values=(
-                entry.get('timestamp', 'Unbekannt'),
-                entry.get('url', '')[:50] + "..." if len(entry.get('url', '')) > 50 else entry.get('url', ''),
-                entry.get('status', 'Unbekannt'),
-                entry.get('filename', 'N/A')
-            ))
+        def render_page(entries):
+            # Nur die aktuelle Seite steht im Treeview (neueste zuerst)
+            tree.delete(*tree.get_children())
+            for entry in entries:
+                url = entry.get('url') or ''
+                tree.insert("", tk.END, values=(
+                    entry.get('timestamp') or 'Unbekannt',
+                    url[:50] + "..." if len(url) > 50 else url,
+                    entry.get('status') or 'Unbekannt',
+                    entry.get('filename') or 'N/A'
+                ))
+        
+        nav_frame, reload_page = self._create_paged_search(frame, self.history_store.search_history, render_page)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        nav_frame.pack(fill=tk.X, pady=(5, 0))
         
         button_frame = ttk.Frame(frame)
         button_frame.pack(fill=tk.X, pady=(10, 0))
         
         def clear_history():
             if messagebox.askyesno("Bestätigen", "Historie wirklich löschen?"):
-                self.video_download_history.clear()
-                self._save_video_data()
-                tree.delete(*tree.get_children())
+                self.history_store.clear_history()
+                reload_page()
         
         ttk.Button(button_frame, text="Historie löschen", command=clear_history).pack(side=tk.LEFT, padx=5)
     
     def show_favorites(self):
-        """Zeigt Favoriten-Verwaltung"""
+        """Zeigt Favoriten-Verwaltung (durchsuchbar, seitenweise)"""
+        self._ensure_tab_built(self.video_frame)
         fav_window = tk.Toplevel(self.root)
         fav_window.title("Favoriten")
-        fav_window.geometry("600x400")
+        fav_window.geometry("600x450")
         fav_window.transient(self.root)
         
         frame = ttk.Frame(fav_window, padding="10")
@@ -5421,10 +5607,19 @@ class DeezerDownloaderGUI:
         ttk.Label(frame, text="Favoriten", font=("Arial", 12, "bold")).pack(anchor=tk.W, pady=(0, 10))
         
         listbox = tk.Listbox(frame, height=15)
-        listbox.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        for fav in self.video_favorites:
-            listbox.insert(tk.END, fav.get('name', fav.get('url', 'Unbekannt')))
+        # Listbox-Index → Favorit (mit Datenbank-ID) der aktuellen Seite
+        favorites = []
+        
+        def render_page(entries):
+            favorites[:] = entries
+            listbox.delete(0, tk.END)
+            for fav in entries:
+                listbox.insert(tk.END, fav.get('name') or fav.get('url') or 'Unbekannt')
+        
+        nav_frame, reload_page = self._create_paged_search(frame, self.history_store.search_favorites, render_page)
+        listbox.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
+        nav_frame.pack(fill=tk.X, pady=(0, 10))
         
         button_frame = ttk.Frame(frame)
         button_frame.pack(fill=tk.X)
@@ -5432,7 +5627,7 @@ class DeezerDownloaderGUI:
         def add_favorite():
             add_window = tk.Toplevel(fav_window)
             add_window.title("Favorit hinzufügen")
-            add_window.geometry("400x200")
+            add_window.geometry("400x260")
             add_window.transient(fav_window)
             
             add_frame = ttk.Frame(add_window, padding="20")
@@ -5446,13 +5641,16 @@ class DeezerDownloaderGUI:
             url_entry = ttk.Entry(add_frame, width=40)
             url_entry.pack(fill=tk.X, pady=(0, 15))
             
+            ttk.Label(add_frame, text="Tags (optional, z.B. krimi serie):").pack(anchor=tk.W, pady=(0, 5))
+            tags_entry = ttk.Entry(add_frame, width=40)
+            tags_entry.pack(fill=tk.X, pady=(0, 15))
+            
             def save_favorite():
                 name = name_entry.get().strip()
                 url = url_entry.get().strip()
                 if name and url:
-                    self.video_favorites.append({'name': name, 'url': url})
-                    self._save_video_data()
-                    listbox.insert(tk.END, name)
+                    self.history_store.add_favorite(name, url, tags_entry.get().strip())
+                    reload_page(keep_page=True)
                     add_window.destroy()
                 else:
                     messagebox.showerror("Fehler", "Bitte Name und URL eingeben!")
@@ -5462,23 +5660,122 @@ class DeezerDownloaderGUI:
         def remove_favorite():
             selection = listbox.curselection()
             if selection:
-                index = selection[0]
-                self.video_favorites.pop(index)
-                self._save_video_data()
-                listbox.delete(index)
+                self.history_store.remove_favorite(favorites[selection[0]]['id'])
+                reload_page(keep_page=True)
         
         def load_favorite():
             selection = listbox.curselection()
             if selection:
-                fav = self.video_favorites[selection[0]]
+                fav = favorites[selection[0]]
+                self._ensure_tab_built(self.video_frame)
                 self.video_url_var.set(fav['url'])
                 fav_window.destroy()
-                self.notebook.select(self.notebook.index(self.video_frame))
+                self._select_tab(self.video_frame)
         
         ttk.Button(button_frame, text="➕ Hinzufügen", command=add_favorite).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="🗑️ Entfernen", command=remove_favorite).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="📥 Laden", command=load_favorite).pack(side=tk.RIGHT, padx=5)
     
+    def _create_paged_search(self, parent, fetch_page, render_page, page_size: int = HISTORY_PAGE_SIZE):
+        """
+        Suchfeld und Blätter-Leiste für Historie/Favoriten
+        
+        Das Suchfeld wird sofort in parent gepackt, die Blätter-Leiste gibt die
+        Methode zurück (der Aufrufer packt sie unter die Liste). Gesucht wird in
+        der Datenbank (Volltextindex) in einem Hintergrund-Thread - die
+        Tippfehler-Suche kann bei großer Historie dauern -, angezeigt wird immer
+        nur eine Seite und nur das Ergebnis der letzten Anfrage.
+        
+        Args:
+            parent: Eltern-Widget
+            fetch_page: (query, limit, offset) → (Einträge, Anzahl, Anzahl vollständig?)
+            render_page: Zeigt die Einträge einer Seite an
+            page_size: Einträge pro Seite
+        
+        Returns:
+            (Blätter-Leiste, reload(keep_page=False))
+        """
+        search_frame = ttk.Frame(parent)
+        search_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(search_frame, text="Suche:").pack(side=tk.LEFT, padx=(0, 5))
+        query_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=query_var)
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Label(search_frame, text="Titel, Sender, URL, Tags, Datum", foreground='gray').pack(side=tk.LEFT, padx=(5, 0))
+        
+        nav_frame = ttk.Frame(parent)
+        prev_button = ttk.Button(nav_frame, text="◀", width=3)
+        prev_button.pack(side=tk.LEFT)
+        page_label = ttk.Label(nav_frame, text="")
+        page_label.pack(side=tk.LEFT, padx=10)
+        next_button = ttk.Button(nav_frame, text="▶", width=3)
+        next_button.pack(side=tk.LEFT)
+        
+        state = {'offset': 0, 'after_id': None, 'request': 0}
+        
+        def load(offset):
+            state['request'] += 1
+            request = state['request']
+            query = query_var.get()
+            
+            def search_thread():
+                try:
+                    result = fetch_page(query, page_size, offset)
+                except Exception as e:
+                    result = e
+                self.root.after(0, lambda: show(request, query, offset, result))
+            
+            threading.Thread(target=search_thread, daemon=True).start()
+        
+        def show(request, query, offset, result):
+            # Veraltete Antwort (inzwischen weitergetippt) oder Fenster geschlossen
+            try:
+                if request != state['request'] or not parent.winfo_exists():
+                    return
+            except tk.TclError:
+                return
+            if isinstance(result, Exception):
+                page_label.config(text=f"Fehler bei der Suche: {result}")
+                return
+            entries, total, complete = result
+            if not entries and offset > 0:
+                # Seite ist leer geworden (z.B. nach Entfernen) → eine Seite zurück
+                load(max(0, offset - page_size))
+                return
+            state['offset'] = offset
+            render_page(entries)
+            if not entries:
+                page_label.config(text="Keine Einträge gefunden" if query.strip() else "Keine Einträge")
+            else:
+                total_text = f"{total}" if complete else f"mehr als {max(total, offset + len(entries)) - 1}"
+                page_label.config(text=f"Einträge {offset + 1}–{offset + len(entries)} von {total_text}")
+            prev_button.config(state=tk.NORMAL if offset > 0 else tk.DISABLED)
+            has_next = offset + len(entries) < total or not complete
+            next_button.config(state=tk.NORMAL if has_next else tk.DISABLED)
+        
+        def reload(keep_page: bool = False):
+            load(state['offset'] if keep_page else 0)
+        
+        def on_query_changed(*args):
+            # Erst nach einer kurzen Tipp-Pause suchen
+            if state['after_id'] is not None:
+                parent.after_cancel(state['after_id'])
+            state['after_id'] = parent.after(HISTORY_SEARCH_DELAY_MS, on_search)
+        
+        def on_search(event=None):
+            if state['after_id'] is not None:
+                parent.after_cancel(state['after_id'])
+            state['after_id'] = None
+            reload()
+        
+        prev_button.config(command=lambda: load(max(0, state['offset'] - page_size)))
+        next_button.config(command=lambda: load(state['offset'] + page_size))
+        query_var.trace_add('write', on_query_changed)
+        search_entry.bind('<Return>', on_search)
+        search_entry.focus()
+        reload()
+        return nav_frame, reload
+
     def show_search_dialog(self):
         """Zeigt Such-Dialog für Filme und Serien"""
         search_window = tk.Toplevel(self.root)
@@ -5498,34 +5795,26 @@ class DeezerDownloaderGUI:
         search_entry = ttk.Entry(search_frame, textvariable=search_var, width=50, font=("Arial", 10))
         search_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         
-        search_button = ttk.Button(search_frame, text="🔍 Suchen", command=lambda: self._perform_search(search_var.get(), results_frame, status_label))
+        search_button = ttk.Button(search_frame, text="🔍 Suchen", command=lambda: self._perform_search(search_var.get(), results_list, status_label))
         search_button.pack(side=tk.LEFT, padx=5)
         
         # Enter-Taste für Suche
-        search_entry.bind('<Return>', lambda e: self._perform_search(search_var.get(), results_frame, status_label))
+        search_entry.bind('<Return>', lambda e: self._perform_search(search_var.get(), results_list, status_label))
         
         # Status-Label
         status_label = ttk.Label(main_frame, text="Geben Sie einen Suchbegriff ein und klicken Sie auf 'Suchen'", foreground='gray')
         status_label.pack(pady=5)
         
-        # Ergebnisse-Frame mit Scrollbar
-        results_container = ttk.Frame(main_frame)
-        results_container.pack(fill=tk.BOTH, expand=True)
-        
-        canvas = tk.Canvas(results_container)
-        scrollbar = ttk.Scrollbar(results_container, orient="vertical", command=canvas.yview)
-        results_frame = ttk.Frame(canvas)
-        
-        results_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        # Ergebnisliste (virtualisiert: nur sichtbare Ergebnisse werden als Widgets erzeugt)
+        thumbnails = ThumbnailLoader(self.root)
+        results_list = VirtualList(
+            main_frame,
+            row_height=SEARCH_RESULT_ROW_HEIGHT,
+            create_row=self._create_search_result_row,
+            bind_row=lambda row, result, index, selected: self._bind_search_result_row(row, result, thumbnails)
         )
-        
-        canvas.create_window((0, 0), window=results_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        results_list.pack(fill=tk.BOTH, expand=True)
+        search_window.bind('<Destroy>', lambda e: thumbnails.shutdown() if e.widget is search_window else None)
         
         # Fokus auf Suchfeld
         search_entry.focus()
@@ -5563,18 +5852,16 @@ class DeezerDownloaderGUI:
                     return sender
         return 'unknown'
     
-    def _perform_search(self, query: str, results_frame: ttk.Frame, status_label: ttk.Label):
+    def _perform_search(self, query: str, results_list: VirtualList, status_label: ttk.Label):
         """Führt die Suche aus - durchsucht alle Standard-Mediatheken"""
         if not query.strip():
             messagebox.showwarning("Warnung", "Bitte geben Sie einen Suchbegriff ein.")
             return
         
         # Lösche alte Ergebnisse
-        for widget in results_frame.winfo_children():
-            widget.destroy()
+        results_list.set_items([])
         
         status_label.config(text=f"Suche nach: {query}... (durchsuche alle Mediatheken)", foreground='blue')
-        results_frame.update()
         
         # Suche in separatem Thread
         def search_thread():
@@ -5583,8 +5870,7 @@ class DeezerDownloaderGUI:
                 all_results = []
                 
                 # 1. YouTube-Suche
-                status_label.config(text=f"Suche auf YouTube...", foreground='blue')
-                self.root.update()
+                self.ui_bus.publish('search.status', lambda: status_label.config(text=f"Suche auf YouTube...", foreground='blue'))
                 
                 search_url = f"ytsearch20:{query}"  # Erste 20 Ergebnisse
                 from yt_dlp_helper import get_ytdlp_command
@@ -5623,7 +5909,8 @@ class DeezerDownloaderGUI:
                                     'view_count': info.get('view_count', 0),
                                     'is_playlist': info.get('_type') == 'playlist' or 'playlist' in str(info.get('_type', '')),
                                     'sender': sender,
-                                    'sender_name': sender_name
+                                    'sender_name': sender_name,
+                                    'thumbnail': self._pick_thumbnail(info)
                                 })
                             except json.JSONDecodeError as e:
                                 continue
@@ -5640,128 +5927,117 @@ class DeezerDownloaderGUI:
                 print(f"[DEBUG] {len(all_results)} Ergebnisse gefunden - zeige alle einzeln")
                 
                 # Zeige Ergebnisse im UI-Thread
-                self.root.after(0, lambda results=all_results, rf=results_frame, sl=status_label, q=query: self._display_search_results_list(results, rf, sl, q))
+                self.ui_bus.publish('search.status', self._display_search_results_list, all_results, results_list, status_label, query)
                 
             except Exception as e:
                 import traceback
                 error_msg = f"Fehler: {str(e)}\n{traceback.format_exc()}"
-                self.root.after(0, lambda: status_label.config(text=error_msg[:200], foreground='red'))
+                self.ui_bus.publish('search.status', lambda: status_label.config(text=error_msg[:200], foreground='red'))
         
         thread = threading.Thread(target=search_thread, daemon=True)
         thread.start()
     
-    def _display_search_results_list(self, results: List[Dict], results_frame: ttk.Frame, status_label: ttk.Label, query: str):
+    def _display_search_results_list(self, results: List[Dict], results_list: VirtualList, status_label: ttk.Label, query: str):
         """Zeigt Suchergebnisse als einfache Liste an - jedes Ergebnis einzeln"""
-        # Lösche alte Ergebnisse
-        for widget in results_frame.winfo_children():
-            widget.destroy()
+        if not status_label.winfo_exists():
+            return  # Such-Dialog wurde inzwischen geschlossen
+        
+        results_list.set_items(results)
         
         if not results:
             status_label.config(text=f"Keine Ergebnisse für '{query}' gefunden", foreground='orange')
             return
         
         status_label.config(text=f"{len(results)} Ergebnis(se) gefunden für '{query}'", foreground='green')
-        
-        # Debug: Zeige Anzahl der Ergebnisse
-        print(f"[DEBUG] Zeige {len(results)} Ergebnisse als Liste")
-        
-        # Zeige jedes Ergebnis einzeln
-        for idx, result in enumerate(results):
-            # Ergebnis-Frame (ein Frame pro Ergebnis)
-            result_frame = ttk.LabelFrame(results_frame, padding="10")
-            result_frame.pack(fill=tk.X, pady=5, padx=5)
-            
-            # Titel
-            title = result.get('title', 'Unbekannter Titel')
-            title_label = ttk.Label(
-                result_frame,
-                text=title,
-                font=("Arial", 11, "bold"),
-                wraplength=800
-            )
-            title_label.pack(anchor=tk.W, pady=(0, 5))
-            
-            # Info-Zeile
-            info_parts = []
-            if result.get('uploader'):
-                info_parts.append(f"Kanal: {result['uploader']}")
-            if result.get('duration'):
-                minutes = result['duration'] // 60
-                seconds = result['duration'] % 60
-                info_parts.append(f"Dauer: {minutes}:{seconds:02d}")
-            if result.get('view_count'):
-                views = result['view_count']
-                if views > 1000000:
-                    info_parts.append(f"Aufrufe: {views/1000000:.1f}M")
-                elif views > 1000:
-                    info_parts.append(f"Aufrufe: {views/1000:.1f}K")
-                else:
-                    info_parts.append(f"Aufrufe: {views}")
-            
-            if info_parts:
-                info_label = ttk.Label(result_frame, text=" | ".join(info_parts), foreground='gray')
-                info_label.pack(anchor=tk.W, pady=(0, 5))
-            
-            # Sender-Info
-            sender = result.get('sender', 'unknown')
-            sender_logo = self._get_sender_logo(sender)
-            sender_name = result.get('sender_name', sender.upper())
-            
-            sender_label = ttk.Label(
-                result_frame,
-                text=f"{sender_logo} {sender_name}",
-                font=("Arial", 9),
-                foreground='blue'
-            )
-            sender_label.pack(anchor=tk.W, pady=(0, 10))
-            
-            # Button-Frame
-            button_frame = ttk.Frame(result_frame)
-            button_frame.pack(fill=tk.X, pady=(0, 5))
-            
-            # WICHTIG: Closure-Variablen korrekt binden
-            result_url = result['url']
-            result_title = title
-            
-            # Download-Button
-            download_btn = ttk.Button(
-                button_frame,
-                text="⬇️ Sofort herunterladen",
-                command=lambda u=result_url, t=result_title: self._download_from_search(u, t, direct=True)
-            )
-            download_btn.pack(side=tk.LEFT, padx=5, pady=2)
-            
-            # Queue-Button
-            queue_btn = ttk.Button(
-                button_frame,
-                text="➕ Zur Warteschlange",
-                command=lambda u=result_url, t=result_title: self._download_from_search(u, t, direct=False)
-            )
-            queue_btn.pack(side=tk.LEFT, padx=5, pady=2)
-            
-            # Staffelauswahl-Button (wenn Playlist)
-            if result.get('is_playlist'):
-                season_btn = ttk.Button(
-                    button_frame,
-                    text="📺 Staffeln auswählen",
-                    command=lambda u=result_url, t=result_title: self._select_seasons_from_search(u, t)
-                )
-                season_btn.pack(side=tk.LEFT, padx=5, pady=2)
-            
-            # Separator (außer beim letzten Element)
-            if idx < len(results) - 1:
-                separator = ttk.Separator(result_frame, orient='horizontal')
-                separator.pack(fill=tk.X, pady=5)
-        
-        # Aktualisiere Scroll-Region nach dem Hinzufügen aller Ergebnisse
-        results_frame.update_idletasks()
-        # Finde das Canvas-Element (parent von results_frame)
-        canvas = results_frame.master
-        if isinstance(canvas, tk.Canvas):
-            canvas.configure(scrollregion=canvas.bbox("all"))
+    
+    @staticmethod
+    def _pick_thumbnail(info: Dict) -> Optional[str]:
+        """Wählt das kleinste Vorschaubild, das mindestens 120 Pixel breit ist"""
+        thumbnails = [t for t in info.get('thumbnails') or [] if t.get('url')]
+        if not thumbnails:
+            return info.get('thumbnail')
+        large_enough = [t for t in thumbnails if (t.get('width') or 0) >= 120]
+        if large_enough:
+            return min(large_enough, key=lambda t: t.get('width') or 0)['url']
+        return thumbnails[-1]['url']
+    
+    def _create_search_result_row(self, parent) -> ttk.Frame:
+        """Erzeugt eine (wiederverwendbare) Zeile für ein Suchergebnis"""
+        row = ttk.Frame(parent, padding=(5, 4))
+        row.columnconfigure(1, weight=1)
+        
+        row.thumbnail_label = ttk.Label(row, width=17)
+        row.thumbnail_label.grid(row=0, column=0, rowspan=4, sticky=tk.NW, padx=(0, 10))
+        
+        row.title_label = ttk.Label(row, font=("Arial", 11, "bold"))
+        row.title_label.grid(row=0, column=1, sticky=tk.W)
+        row.info_label = ttk.Label(row, foreground='gray')
+        row.info_label.grid(row=1, column=1, sticky=tk.W)
+        row.sender_label = ttk.Label(row, font=("Arial", 9), foreground='blue')
+        row.sender_label.grid(row=2, column=1, sticky=tk.W)
+        
+        # Button-Frame
+        button_frame = ttk.Frame(row)
+        button_frame.grid(row=3, column=1, sticky=tk.W, pady=(2, 0))
+        row.download_button = ttk.Button(button_frame, text="⬇️ Sofort herunterladen")
+        row.download_button.pack(side=tk.LEFT, padx=(0, 5))
+        row.queue_button = ttk.Button(button_frame, text="➕ Zur Warteschlange")
+        row.queue_button.pack(side=tk.LEFT, padx=5)
+        row.season_button = ttk.Button(button_frame, text="📺 Staffeln auswählen")
+        
+        ttk.Separator(row, orient='horizontal').grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(4, 0))
+        return row
+    
+    def _bind_search_result_row(self, row: ttk.Frame, result: Dict, thumbnails: ThumbnailLoader):
+        """Befüllt eine Suchergebnis-Zeile (Zeilen werden beim Scrollen wiederverwendet)"""
+        title = result.get('title', 'Unbekannter Titel')
+        row.title_label.config(text=title if len(title) <= 110 else title[:107] + "...")
+        
+        # Info-Zeile
+        info_parts = []
+        if result.get('uploader'):
+            info_parts.append(f"Kanal: {result['uploader']}")
+        if result.get('duration'):
+            minutes = int(result['duration']) // 60
+            seconds = int(result['duration']) % 60
+            info_parts.append(f"Dauer: {minutes}:{seconds:02d}")
+        if result.get('view_count'):
+            views = result['view_count']
+            if views > 1000000:
+                info_parts.append(f"Aufrufe: {views/1000000:.1f}M")
+            elif views > 1000:
+                info_parts.append(f"Aufrufe: {views/1000:.1f}K")
+            else:
+                info_parts.append(f"Aufrufe: {views}")
+        row.info_label.config(text=" | ".join(info_parts))
+        
+        # Sender-Info
+        sender = result.get('sender', 'unknown')
+        row.sender_label.config(text=f"{self._get_sender_logo(sender)} {result.get('sender_name', sender.upper())}")
+        
+        # WICHTIG: Closure-Variablen korrekt binden
+        result_url = result['url']
+        row.download_button.config(command=lambda u=result_url, t=title: self._download_from_search(u, t, direct=True))
+        row.queue_button.config(command=lambda u=result_url, t=title: self._download_from_search(u, t, direct=False))
+        if result.get('is_playlist'):
+            row.season_button.config(command=lambda u=result_url, t=title: self._select_seasons_from_search(u, t))
+            row.season_button.pack(side=tk.LEFT, padx=5)
+        else:
+            row.season_button.pack_forget()
+        
+        # Vorschaubild erst laden, wenn die Zeile sichtbar ist
+        row.thumbnail_url = result.get('thumbnail')
+        row.thumbnail_label.config(image='', text="🎬")
+        if row.thumbnail_url:
+            def show_thumbnail(photo, url=row.thumbnail_url):
+                if row.thumbnail_url == url:  # Zeile inzwischen neu belegt?
+                    row.thumbnail_label.config(image=photo, text='')
+                    row.thumbnail_label.image = photo
+            thumbnails.request(row.thumbnail_url, show_thumbnail)
     
     def _download_from_search(self, url: str, title: str, direct: bool = True):
         """Startet Download von Suchergebnis"""
+        self._ensure_tab_built(self.video_frame)
         if direct:
             # Setze URL und starte Download
             self.video_url_var.set(url)
@@ -5774,6 +6050,7 @@ class DeezerDownloaderGUI:
     
     def _select_seasons_from_search(self, url: str, title: str):
         """Zeigt Staffelauswahl für Serie aus Suchergebnissen"""
+        self._ensure_tab_built(self.video_frame)
         # Initialisiere Downloader falls noch nicht geschehen
         if not hasattr(self, 'video_downloader') or self.video_downloader is None:
             self.video_download_path = Path(self.video_path_var.get())
@@ -5806,18 +6083,19 @@ class DeezerDownloaderGUI:
         
         ttk.Label(frame, text="Download-Statistiken", font=("Arial", 14, "bold")).pack(pady=(0, 20))
         
+        statistics = self.history_store.statistics()
         stats_text = f"""
-Gesamt-Downloads: {self.video_statistics.get('total_downloads', 0)}
-Erfolgreich: {self.video_statistics.get('successful_downloads', 0)}
-Fehlgeschlagen: {self.video_statistics.get('failed_downloads', 0)}
+Gesamt-Downloads: {statistics.get('total_downloads', 0)}
+Erfolgreich: {statistics.get('successful_downloads', 0)}
+Fehlgeschlagen: {statistics.get('failed_downloads', 0)}
 
-Gesamt-Größe: {self._format_size(self.video_statistics.get('total_size', 0))}
+Gesamt-Größe: {self._format_size(statistics.get('total_size', 0))}
 
-Letzter Download: {self.video_statistics.get('last_download', 'Nie')}
+Letzter Download: {statistics.get('last_download') or 'Nie'}
 
-Geplante Downloads: {len(self.video_scheduled_downloads)}
-Favoriten: {len(self.video_favorites)}
-Historie-Einträge: {len(self.video_download_history)}
+Geplante Downloads: {len(self.download_scheduler)}
+Favoriten: {self.history_store.favorites_count()}
+Historie-Einträge: {self.history_store.history_count()}
         """
         
         ttk.Label(frame, text=stats_text.strip(), font=("Arial", 10), justify=tk.LEFT).pack(anchor=tk.W)
@@ -5827,14 +6105,7 @@ Historie-Einträge: {len(self.video_download_history)}
         
         def reset_stats():
             if messagebox.askyesno("Bestätigen", "Statistiken wirklich zurücksetzen?"):
-                self.video_statistics = {
-                    'total_downloads': 0,
-                    'total_size': 0,
-                    'successful_downloads': 0,
-                    'failed_downloads': 0,
-                    'last_download': None
-                }
-                self._save_video_data()
+                self.history_store.reset_statistics()
                 stats_window.destroy()
                 self.show_statistics()
         
@@ -5857,6 +6128,13 @@ Historie-Einträge: {len(self.video_download_history)}
                 if started_by_launcher:
                     self._write_to_log_file("[DEBUG] Gestartet über Launcher - Abhängigkeiten sollten bereits installiert sein", "DEBUG")
                 
+                # Umgebung unverändert seit der letzten erfolgreichen Prüfung → nichts zu tun
+                from auto_install_dependencies import load_cached_dependency_status
+                cached = load_cached_dependency_status()
+                if cached:
+                    self._write_to_log_file(f"[DEBUG] Abhängigkeiten unverändert seit {cached.get('checked_at')} - überspringe Prüfung", "DEBUG")
+                    return
+                
                 from auto_install_dependencies import check_ffmpeg
                 
                 # Schnelle Prüfung ob Installation nötig ist (nur ffmpeg, yt-dlp wird automatisch installiert)
@@ -6108,7 +6386,8 @@ Historie-Einträge: {len(self.video_download_history)}
         
         def check_thread():
             try:
-                checker = UpdateChecker()
+                # Innerhalb der TTL kein Netzwerkzugriff, danach bedingte Anfrage (ETag)
+                checker = UpdateChecker(cache_file=self.base_download_path / ".update_check.json")
                 available, info = checker.check_for_updates()
                 if available and info:
                     # Zeige Benachrichtigung im Hauptthread
@@ -6152,8 +6431,8 @@ Historie-Einträge: {len(self.video_download_history)}
         
         def check_thread():
             try:
-                checker = UpdateChecker()
-                available, info = checker.check_for_updates()
+                checker = UpdateChecker(cache_file=self.base_download_path / ".update_check.json")
+                available, info = checker.check_for_updates(force=True)
                 
                 def update_ui():
                     progress.stop()
@@ -6536,32 +6815,24 @@ Copyright (c) 2025 Universal Downloader Contributors
     
     def _update_statistics(self, success, file_path, url):
         """Aktualisiert Download-Statistiken"""
-        self.video_statistics['total_downloads'] += 1
-        if success:
-            self.video_statistics['successful_downloads'] += 1
-            if file_path and file_path.exists():
-                try:
-                    size = file_path.stat().st_size
-                    self.video_statistics['total_size'] += size
-                except:
-                    pass
-        else:
-            self.video_statistics['failed_downloads'] += 1
-        self.video_statistics['last_download'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self._save_video_data()
+        size = 0
+        if success and file_path and file_path.exists():
+            try:
+                size = file_path.stat().st_size
+            except:
+                pass
+        try:
+            self.history_store.record_download(success, size)
+        except Exception as e:
+            self.video_log(f"⚠ Fehler beim Speichern der Statistik: {e}")
     
     def _add_to_history(self, url, filename, status):
         """Fügt Eintrag zur Download-Historie hinzu"""
-        self.video_download_history.append({
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'url': url,
-            'filename': filename,
-            'status': status
-        })
-        # Behalte nur die letzten 1000 Einträge
-        if len(self.video_download_history) > 1000:
-            self.video_download_history = self.video_download_history[-1000:]
-        self._save_video_data()
+        try:
+            sender = self._detect_sender_from_url(url)
+            self.history_store.add_history(url, filename, status, sender=None if sender == 'unknown' else sender)
+        except Exception as e:
+            self.video_log(f"⚠ Fehler beim Speichern der Historie: {e}")
     
     def _load_settings(self):
         """Lädt gespeicherte Einstellungen"""
@@ -6582,6 +6853,7 @@ Copyright (c) 2025 Universal Downloader Contributors
             'log_cleanup_on_exit': False,
             'auto_check_updates': True,  # Automatische Update-Prüfung beim Start
             'log_level': 'debug',  # Log-Level: 'normal' oder 'debug'
+            'log_format': 'text',  # Log-Datei: 'text' oder 'json' (JSON-Zeilen)
             'video_accounts': []  # Liste von Account-Dictionaries
         }
         
@@ -6800,6 +7072,14 @@ Copyright (c) 2025 Universal Downloader Contributors
         log_cleanup_on_exit_var = tk.BooleanVar(value=self.settings.get('log_cleanup_on_exit', False))
         ttk.Checkbutton(log_frame, text="Logs beim Beenden der Anwendung löschen", variable=log_cleanup_on_exit_var).pack(anchor=tk.W, pady=5)
         
+        # Format der Log-Datei
+        log_format_frame = ttk.Frame(log_frame)
+        log_format_frame.pack(anchor=tk.W, pady=5)
+        ttk.Label(log_format_frame, text="Log-Format:").pack(side=tk.LEFT, padx=(0, 5))
+        log_format_var = tk.StringVar(value=self.settings.get('log_format', 'text'))
+        ttk.Combobox(log_format_frame, textvariable=log_format_var, values=['text', 'json'], state='readonly', width=10).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Label(log_format_frame, text="json = eine JSON-Zeile pro Eintrag (ab nächstem Start)", foreground="gray", font=("Arial", 8)).pack(side=tk.LEFT)
+        
         # Buttons
         button_frame = ttk.Frame(scrollable_frame)
         button_frame.pack(fill=tk.X, pady=20, padx=5)
@@ -6823,6 +7103,7 @@ Copyright (c) 2025 Universal Downloader Contributors
             self.settings['log_cleanup_on_exit'] = log_cleanup_on_exit_var.get()
             self.settings['auto_check_updates'] = auto_check_updates_var.get()
             self.settings['log_level'] = log_level_var.get()
+            self.settings['log_format'] = log_format_var.get()
             
             self._save_settings()
             
@@ -6929,42 +7210,24 @@ Copyright (c) 2025 Universal Downloader Contributors
                 self._geometry_save_timer = self.root.after(1000, self._save_window_geometry)
     
     def _load_video_data(self):
-        """Lädt gespeicherte Video-Daten"""
+        """Übernimmt die alte video_data.json (einmalig) in Scheduler und Datenbank"""
         try:
             data_file = self.base_download_path / "video_data.json"
             if data_file.exists():
                 import json
                 with open(data_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    self.video_scheduled_downloads = [
-                        {**item, 'scheduled_time': datetime.fromisoformat(item['scheduled_time'])}
-                        for item in data.get('scheduled_downloads', [])
-                    ]
-                    self.video_download_history = data.get('download_history', [])
-                    self.video_favorites = data.get('favorites', [])
-                    self.video_statistics = data.get('statistics', self.video_statistics)
+                # Übernehme geplante Downloads aus dem alten Format in den Scheduler
+                legacy_scheduled = data.get('scheduled_downloads', [])
+                if legacy_scheduled:
+                    self.download_scheduler.import_jobs(legacy_scheduled)
+                if self.history_store.import_legacy_json(data):
+                    self.video_log(f"Video-Daten aus {data_file.name} in {self.history_store.db_path.name} übernommen")
+                # Alte Datei erst nach erfolgreichem Import beiseitelegen
+                data_file.replace(data_file.with_name(data_file.name + ".migrated"))
         except Exception as e:
             self.video_log(f"⚠ Fehler beim Laden der Video-Daten: {e}")
     
-    def _save_video_data(self):
-        """Speichert Video-Daten"""
-        try:
-            data_file = self.base_download_path / "video_data.json"
-            import json
-            data = {
-                'scheduled_downloads': [
-                    {**item, 'scheduled_time': item['scheduled_time'].isoformat()}
-                    for item in self.video_scheduled_downloads
-                ],
-                'download_history': self.video_download_history,
-                'favorites': self.video_favorites,
-                'statistics': self.video_statistics
-            }
-            with open(data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            self.video_log(f"⚠ Fehler beim Speichern der Video-Daten: {e}")
-    
     def video_log(self, message: str, level: str = "INFO"):
         """Fügt eine Nachricht zum Video-Log hinzu"""
         # Bestimme Level basierend auf Nachricht
@@ -6986,14 +7249,10 @@ Copyright (c) 2025 Universal Downloader Contributors
         # Schreibe in Log-Datei (immer, aber mit Level-Filterung)
         self._write_to_log_file(f"[VIDEO] {message}", level)
         
-        # Zeige in GUI (wenn nicht übersprungen)
-        if show_in_gui and hasattr(self, 'video_log_text'):
-            self.video_log_text.config(state=tk.NORMAL)
+        # Zeige in GUI (wenn nicht übersprungen) - gebündelt über die Log-Pumpe
+        if show_in_gui:
             level_prefix = f"[{level}] " if level != "INFO" else ""
-            self.video_log_text.insert(tk.END, f"{level_prefix}{message}\n")
-            self.video_log_text.see(tk.END)
-            self.video_log_text.config(state=tk.DISABLED)
-            self.root.update_idletasks()
+            self.log_pump.post('video', f"{level_prefix}{message}")
     
     def log(self, message: str, level: str = "INFO"):
         """Fügt eine Nachricht zum Log hinzu"""
@@ -7016,14 +7275,10 @@ Copyright (c) 2025 Universal Downloader Contributors
         # Schreibe in Log-Datei (immer, aber mit Level-Filterung)
         self._write_to_log_file(f"[DEEZER] {message}", level)
         
-        # Zeige in GUI (wenn nicht übersprungen)
-        if show_in_gui and hasattr(self, 'log_text'):
-            self.log_text.config(state=tk.NORMAL)
+        # Zeige in GUI (wenn nicht übersprungen) - gebündelt über die Log-Pumpe
+        if show_in_gui:
             level_prefix = f"[{level}] " if level != "INFO" else ""
-            self.log_text.insert(tk.END, f"{level_prefix}{message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
-        self.root.update_idletasks()
+            self.log_pump.post('deezer', f"{level_prefix}{message}")
     
     def show_quality_dialog(self, default_quality: str = "MP3_320") -> Optional[str]:
         """
@@ -7127,7 +7382,7 @@ Copyright (c) 2025 Universal Downloader Contributors
             count = self.downloader.download_from_url(url)
             
             # Zeige alle Log-Einträge an
-            for log_entry in self.downloader.download_log:
+            for log_entry in list(self.downloader.download_log):
                 self.log(log_entry)
             
             # Zeige Zusammenfassung
@@ -7174,8 +7429,16 @@ Copyright (c) 2025 Universal Downloader Contributors
             self.status_var.set("Bereit")
 
 
-def main():
-    """Hauptfunktion"""
+def main(started_at: Optional[float] = None, startup_messages: Optional[List[Dict]] = None):
+    """
+    Hauptfunktion
+    
+    Args:
+        started_at: time.perf_counter() beim Prozessstart (für die Messung der Startzeit)
+        startup_messages: Nachrichten aus den Startargumenten (siehe instance_ipc.parse_arguments)
+    """
+    if started_at is None:
+        started_at = time.perf_counter()
     # Setze RESOURCE_NAME Umgebungsvariable für Linux (MUSS vor tk.Tk() gesetzt werden)
     if sys.platform.startswith("linux"):
         os.environ['RESOURCE_NAME'] = 'UniversalDownloader'
@@ -7248,13 +7511,35 @@ def main():
         # Für Linux: Setze Icon sofort
         root.after(100, app._set_application_icon)
     
+    # Weitere Aufrufe von start.py übergeben ihre URLs an diese Instanz
+    instance_server = InstanceServer(lambda message: root.after(0, app.handle_instance_message, message))
+    instance_server.start()
+    
     # Cleanup beim Schließen
     def on_closing():
+        instance_server.stop()
         app._save_window_geometry()  # Speichere Fenstergröße
+        app.log_pump.stop()
+        app.ui_bus.stop()
+        if hasattr(app, 'history_store'):
+            app.history_store.close()
         app._close_log_file()
         root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
+    
+    # Startzeit messen, sobald das Fenster gezeichnet ist; danach restliche Tabs im Leerlauf aufbauen
+    def on_window_ready():
+        seconds = time.perf_counter() - started_at
+        metrics.observe('startup', 'gui', seconds)
+        level = "WARNING" if seconds > STARTUP_BUDGET_SECONDS else "INFO"
+        app.log(f"[STARTUP] Fenster bedienbar nach {seconds * 1000:.0f} ms (Budget: {STARTUP_BUDGET_SECONDS * 1000:.0f} ms)", level)
+        root.after(200, app._build_pending_tabs)
+        for message in startup_messages or []:
+            if message.get('command') != COMMAND_SHOW:
+                app.handle_instance_message(message)
+    
+    root.after_idle(on_window_ready)
     root.mainloop()
 
 
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistente Download-Historie, Favoriten und Statistiken (SQLite, WAL-Modus)
+Ersetzt das Neuschreiben der kompletten video_data.json bei jedem Download:
+ein abgeschlossener Download ist ein einzelnes INSERT plus ein UPDATE der
+Statistik-Zeile, unabhängig davon, wie lang die Historie ist. Jede Änderung
+läuft in einer eigenen Transaktion (atomar, auch bei Absturz).
+
+Für die Suche werden Historie und Favoriten in FTS5-Tabellen indiziert
+(Trigramm-Tokenizer: Teilwort-/Präfixsuche und unscharfe Treffer bei
+Tippfehlern). Ohne FTS5 fällt die Suche auf LIKE zurück.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+SCHEMA_VERSION = 2
+
+# Obergrenze beim Zählen von Suchtreffern (Anzeige "1000+"), damit breite Suchen schnell bleiben
+SEARCH_COUNT_LIMIT = 1000
+
+# Ergebnis einer Suche: Seite, Trefferzahl und ob die Zahl vollständig ist
+# (sonst Untergrenze - gezählt wird nur über den Index, nicht bei LIKE-/Tippfehler-Suchen)
+SearchResult = Tuple[List[Dict], int, bool]
+
+# Tippfehler-Suche nur für Begriffe ab dieser Länge und höchstens so lange (Sekunden) -
+# sie läuft nach jeder Suche ohne Treffer, also bei fast jedem Tastendruck
+FUZZY_MIN_LENGTH = 4
+FUZZY_TIME_LIMIT = 0.05
+
+# Indizierte Spalten je Tabelle (Reihenfolge = Spalten der FTS-Tabelle)
+SEARCH_COLUMNS = {
+    'history': ('filename', 'url', 'sender', 'status', 'tags', 'timestamp'),
+    'favorites': ('name', 'url', 'sender', 'tags', 'added'),
+}
+
+STATISTICS_FIELDS = ('total_downloads', 'successful_downloads', 'failed_downloads', 'total_size', 'last_download')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    url TEXT NOT NULL,
+    filename TEXT,
+    status TEXT,
+    sender TEXT,
+    tags TEXT
+);
+CREATE INDEX IF NOT EXISTS history_timestamp ON history (timestamp);
+CREATE INDEX IF NOT EXISTS history_url ON history (url);
+CREATE TABLE IF NOT EXISTS favorites (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    added TEXT,
+    sender TEXT,
+    tags TEXT
+);
+CREATE INDEX IF NOT EXISTS favorites_url ON favorites (url);
+CREATE TABLE IF NOT EXISTS statistics (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_downloads INTEGER NOT NULL DEFAULT 0,
+    successful_downloads INTEGER NOT NULL DEFAULT 0,
+    failed_downloads INTEGER NOT NULL DEFAULT 0,
+    total_size INTEGER NOT NULL DEFAULT 0,
+    last_download TEXT
+);
+INSERT OR IGNORE INTO statistics (id) VALUES (1);
+"""
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def sender_from_url(url: str) -> str:
+    """Kurzname der Website aus der URL (z.B. 'ardmediathek' für www.ardmediathek.de)"""
+    try:
+        host = (urlparse(url).hostname or '').lower()
+    except ValueError:
+        return ''
+    if host.startswith('www.'):
+        host = host[4:]
+    parts = host.split('.')
+    return parts[-2] if len(parts) >= 2 else host
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _typo_variants(term: str) -> set:
+    """
+    LIKE-Muster für alle Schreibweisen mit Editierdistanz 1 (inkl. Vertauschung)
+
+    Nur Muster, deren feste Teile zusammen mindestens zwei Trigramme enthalten:
+    Der Index liefert alle Zeilen mit diesen Trigrammen, die dann einzeln
+    geprüft werden - bei nur einem (häufigen) Trigramm wären das große Teile
+    der Tabelle.
+    """
+    escaped = term.replace('%', '').replace('_', '')
+    variants = set()
+    for i in range(len(escaped) + 1):
+        variants.add(escaped[:i] + '_' + escaped[i:])             # Zeichen fehlt
+        if i < len(escaped):
+            variants.add(escaped[:i] + escaped[i + 1:])           # Zeichen zu viel
+            variants.add(escaped[:i] + '_' + escaped[i + 1:])     # Zeichen falsch
+        if i < len(escaped) - 1:
+            variants.add(escaped[:i] + escaped[i + 1] + escaped[i] + escaped[i + 2:])  # vertauscht
+    return {variant for variant in variants
+            if sum(max(0, len(part) - 2) for part in variant.split('_')) >= 2}
+
+
+class HistoryStore:
+    """
+    Historie, Favoriten und Statistiken des Video-Downloaders
+
+    Thread-sicher: Downloads melden ihr Ergebnis aus Worker-Threads, die GUI
+    liest im Mainloop. Alle Zugriffe teilen sich eine Verbindung hinter einem Lock.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Öffnet (bzw. erstellt) die Datenbank
+
+        Args:
+            db_path: Pfad der SQLite-Datei (z.B. video_data.db)
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.create_function('sender_from_url', 1, sender_from_url)
+        with self._transaction():
+            self._create_schema()
+            self.search_mode = self._setup_search()
+
+    def _create_schema(self):
+        for statement in _SCHEMA.split(';'):
+            if statement.strip():
+                self._conn.execute(statement)
+        # Version 1 → 2: Spalten sender/tags nachrüsten
+        for table in ('history', 'favorites'):
+            columns = {row['name'] for row in self._conn.execute(f"PRAGMA table_info({table})")}
+            for column in ('sender', 'tags'):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} TEXT")
+            self._conn.execute(f"UPDATE {table} SET sender = sender_from_url(url) WHERE sender IS NULL")
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+
+    def _setup_search(self) -> str:
+        """
+        Legt die Suchindizes an (einmalig, danach per Trigger aktuell gehalten)
+
+        Returns:
+            'trigram' (Teilwort + unscharf), 'unicode61' (Präfix) oder 'like' (ohne FTS5)
+        """
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'search_mode'").fetchone()
+        if row:
+            return row['value']
+
+        mode = 'like'
+        for tokenizer in ('trigram', 'unicode61'):
+            try:
+                for table, columns in SEARCH_COLUMNS.items():
+                    self._create_search_index(table, columns, tokenizer)
+                mode = tokenizer
+                break
+            except sqlite3.OperationalError:
+                # Tokenizer (trigram erst ab SQLite 3.34) oder FTS5 nicht vorhanden
+                for table in SEARCH_COLUMNS:
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}_search")
+        self._conn.execute("INSERT INTO meta (key, value) VALUES ('search_mode', ?)", (mode,))
+        return mode
+
+    def _create_search_index(self, table: str, columns: Tuple[str, ...], tokenizer: str):
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f"new.{column}" for column in columns)
+        old_values = ', '.join(f"old.{column}" for column in columns)
+        prefix = " prefix='2 3'" if tokenizer == 'unicode61' else ''
+        self._conn.execute(
+            f"CREATE VIRTUAL TABLE {table}_search USING fts5({column_list}, content='{table}', "
+            f"content_rowid='id', tokenize='{tokenizer}'{prefix})"
+        )
+        # Externer Inhalt: Index wird über Trigger mit der Tabelle synchron gehalten
+        self._conn.execute(
+            f"CREATE TRIGGER {table}_search_insert AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {table}_search (rowid, {column_list}) VALUES (new.id, {new_values}); END"
+        )
+        self._conn.execute(
+            f"CREATE TRIGGER {table}_search_delete AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {table}_search ({table}_search, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); END"
+        )
+        self._conn.execute(
+            f"CREATE TRIGGER {table}_search_update AFTER UPDATE ON {table} BEGIN "
+            f"INSERT INTO {table}_search ({table}_search, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO {table}_search (rowid, {column_list}) VALUES (new.id, {new_values}); END"
+        )
+        self._conn.execute(f"INSERT INTO {table}_search ({table}_search) VALUES ('rebuild')")
+
+    @contextmanager
+    def _transaction(self):
+        """BEGIN IMMEDIATE … COMMIT bzw. ROLLBACK bei Fehlern, unter dem Lock"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ----- Historie -----
+
+    def add_history(self, url: str, filename: str, status: str, timestamp: Optional[str] = None,
+                    sender: Optional[str] = None, tags: str = '') -> int:
+        """Fügt einen Historien-Eintrag hinzu (ein INSERT); gibt die ID zurück"""
+        with self._transaction():
+            cursor = self._conn.execute(
+                "INSERT INTO history (timestamp, url, filename, status, sender, tags) VALUES (?, ?, ?, ?, ?, ?)",
+                (timestamp or _now(), url, filename, status, sender or sender_from_url(url), tags)
+            )
+            return cursor.lastrowid
+
+    def history(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Historien-Einträge, neueste zuerst"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, timestamp, url, filename, status, sender, tags FROM history "
+                "ORDER BY id DESC LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def search_history(self, query: str, limit: int = 100, offset: int = 0) -> SearchResult:
+        """
+        Durchsucht die Historie (Dateiname/Titel, URL, Sender, Status, Tags, Datum)
+
+        Args:
+            query: Suchbegriffe (alle müssen vorkommen); leer = alle Einträge
+            limit: Seitengröße
+            offset: Anzahl zu überspringender Treffer
+
+        Returns:
+            (Treffer neueste zuerst, Trefferzahl, Trefferzahl vollständig?)
+        """
+        if not query.strip():
+            return self.history(limit, offset), self.history_count(), True
+        return self._search('history', query, limit, offset)
+
+    def history_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def clear_history(self):
+        with self._transaction():
+            self._conn.execute("DELETE FROM history")
+
+    # ----- Favoriten -----
+
+    def favorites(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """Favoriten in der Reihenfolge, in der sie angelegt wurden"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, name, url, added, sender, tags FROM favorites ORDER BY id LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def search_favorites(self, query: str, limit: int = 100, offset: int = 0) -> SearchResult:
+        """Durchsucht die Favoriten (Name, URL, Sender, Tags, Datum) - wie search_history()"""
+        if not query.strip():
+            return self.favorites(limit, offset), self.favorites_count(), True
+        return self._search('favorites', query, limit, offset)
+
+    def favorites_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM favorites").fetchone()[0]
+
+    def add_favorite(self, name: str, url: str, tags: str = '') -> int:
+        with self._transaction():
+            cursor = self._conn.execute(
+                "INSERT INTO favorites (name, url, added, sender, tags) VALUES (?, ?, ?, ?, ?)",
+                (name, url, _now(), sender_from_url(url), tags)
+            )
+            return cursor.lastrowid
+
+    def remove_favorite(self, favorite_id: int):
+        with self._transaction():
+            self._conn.execute("DELETE FROM favorites WHERE id = ?", (favorite_id,))
+
+    # ----- Suche -----
+
+    def _search(self, table: str, query: str, limit: int, offset: int) -> SearchResult:
+        terms = query.lower().split()
+        if self.search_mode == 'like':
+            return self._search_page(table, table, *self._like_clause(SEARCH_COLUMNS[table], terms),
+                                     limit, offset, count=False)
+
+        source = f"{table}_search"
+        # Kurze Begriffe (< 3 Zeichen) kann der Trigramm-Index nicht auflösen → LIKE auf den Treffern
+        if self.search_mode == 'trigram':
+            indexed = [term for term in terms if len(term) >= 3]
+            match = ' AND '.join(_fts_phrase(term) for term in indexed)
+        else:
+            indexed = terms
+            match = ' AND '.join(_fts_phrase(term) + '*' for term in indexed)
+        short_sql, short_params = self._like_clause(SEARCH_COLUMNS[table], [t for t in terms if t not in indexed])
+        if not match:
+            # Nur kurze Begriffe: Tabelle direkt durchsuchen (der Index hilft hier nicht)
+            return self._search_page(table, table, short_sql, short_params, limit, offset, count=False)
+
+        result = self._search_page(table, source, f"{source} MATCH ?" + (f" AND {short_sql}" if short_sql else ''),
+                                   [match] + short_params, limit, offset)
+        if result[1] or self.search_mode != 'trigram':
+            return result
+
+        if any(len(term) < FUZZY_MIN_LENGTH for term in indexed):
+            return result
+        return self._fuzzy_search(table, indexed, short_sql, short_params, limit, offset)
+
+    def _fuzzy_search(self, table: str, terms: List[str], short_sql: str, short_params: list,
+                      limit: int, offset: int) -> SearchResult:
+        """
+        Titel mit höchstens einem Tippfehler pro Begriff (fehlendes, überzähliges,
+        falsches oder vertauschtes Zeichen)
+
+        Eine einzige Index-Abfrage liefert Kandidaten (die festen Teile einer der
+        Schreibweisen kommen im Titel vor) neueste zuerst; geprüft wird jeder
+        Kandidat gegen die Schreibweisen, bis eine Seite voll ist. OR-verknüpfte
+        LIKEs würden dagegen die ganze Tabelle lesen. Nach FUZZY_TIME_LIMIT wird
+        abgebrochen (Ergebnis: keine Treffer).
+        """
+        source = f"{table}_search"
+        title = SEARCH_COLUMNS[table][0]
+        match_groups = []
+        patterns = []
+        for term in terms:
+            variants = sorted(_typo_variants(term))
+            if not variants:
+                return [], offset, True
+            match_groups.append('(' + ' OR '.join(
+                '(' + ' AND '.join(_fts_phrase(part) for part in variant.split('_') if len(part) >= 3) + ')'
+                for variant in variants
+            ) + ')')
+            patterns.append(re.compile('|'.join(
+                '.'.join(re.escape(part) for part in variant.split('_')) for variant in variants
+            ), re.IGNORECASE))
+        match = f"{title} : (" + ' AND '.join(match_groups) + ')'
+
+        order = "DESC" if table == 'history' else "ASC"
+        wanted = offset + limit + 1
+        ids = []
+        with self._lock:
+            deadline = time.monotonic() + FUZZY_TIME_LIMIT
+            self._conn.set_progress_handler(lambda: time.monotonic() > deadline, 1000)
+            try:
+                candidates = self._conn.execute(
+                    f"SELECT rowid, {title} FROM {source} WHERE {source} MATCH ? ORDER BY rowid {order}", (match,)
+                )
+                for rowid, text in candidates:
+                    if not text or not all(pattern.search(text) for pattern in patterns):
+                        continue
+                    if short_sql and not self._conn.execute(
+                            f"SELECT 1 FROM {table} WHERE id = ? AND {short_sql}", [rowid] + short_params).fetchone():
+                        continue
+                    ids.append(rowid)
+                    if len(ids) >= wanted:
+                        break
+                page = ids[offset:offset + limit]
+                columns = ', '.join(('id',) + SEARCH_COLUMNS[table])
+                rows = self._conn.execute(
+                    f"SELECT {columns} FROM {table} WHERE id IN ({', '.join('?' for _ in page)}) ORDER BY id {order}",
+                    page
+                ).fetchall() if page else []
+            except sqlite3.OperationalError:
+                return [], offset, True  # Zeitlimit überschritten
+            finally:
+                self._conn.set_progress_handler(None, 0)
+        more = len(ids) >= wanted
+        return [dict(row) for row in rows], offset + len(rows) + (1 if more else 0), not more
+
+    def _search_page(self, table: str, source: str, where: str, params: list,
+                     limit: int, offset: int, count: bool = True) -> SearchResult:
+        """
+        Eine Seite Treffer; sortiert wird über die rowid (= id) der Quelle
+
+        Mit count=False wird statt zu zählen ein Eintrag mehr geholt - das
+        reicht für "weitere Seite vorhanden" und vermeidet einen vollen Scan.
+        """
+        columns = ', '.join(('id',) + SEARCH_COLUMNS[table])
+        # Historie neueste zuerst, Favoriten in Anlage-Reihenfolge (IDs steigen mit der Zeit)
+        order = "DESC" if table == 'history' else "ASC"
+        where = where or '1'
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {columns} FROM {table} WHERE id IN "
+                f"(SELECT rowid FROM {source} WHERE {where} ORDER BY rowid {order} LIMIT ? OFFSET ?) "
+                f"ORDER BY id {order}",
+                params + [limit if count else limit + 1, offset]
+            ).fetchall()
+            if count:
+                total = self._conn.execute(
+                    f"SELECT COUNT(*) FROM (SELECT 1 FROM {source} WHERE {where} LIMIT ?)",
+                    params + [SEARCH_COUNT_LIMIT + 1]
+                ).fetchone()[0]
+                return [dict(row) for row in rows], total, total <= SEARCH_COUNT_LIMIT
+        more = len(rows) > limit
+        return [dict(row) for row in rows[:limit]], offset + len(rows), not more
+
+    @staticmethod
+    def _like_clause(columns: Tuple[str, ...], terms: List[str]) -> Tuple[str, list]:
+        """Jeder Begriff muss in mindestens einer Spalte vorkommen"""
+        clauses = []
+        params = []
+        for term in terms:
+            pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            clauses.append('(' + ' OR '.join(f"lower({column}) LIKE ? ESCAPE '\\'" for column in columns) + ')')
+            params.extend([pattern] * len(columns))
+        return ' AND '.join(clauses), params
+
+    # ----- Statistiken -----
+
+    def statistics(self) -> Dict:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(STATISTICS_FIELDS)} FROM statistics WHERE id = 1"
+            ).fetchone()
+        return dict(row)
+
+    def record_download(self, success: bool, size: int = 0):
+        """Zählt einen abgeschlossenen Download (ein UPDATE)"""
+        with self._transaction():
+            self._conn.execute(
+                "UPDATE statistics SET total_downloads = total_downloads + 1, "
+                "successful_downloads = successful_downloads + ?, failed_downloads = failed_downloads + ?, "
+                "total_size = total_size + ?, last_download = ? WHERE id = 1",
+                (1 if success else 0, 0 if success else 1, size if success else 0, _now())
+            )
+
+    def reset_statistics(self):
+        with self._transaction():
+            self._conn.execute(
+                "UPDATE statistics SET total_downloads = 0, successful_downloads = 0, failed_downloads = 0, "
+                "total_size = 0, last_download = NULL WHERE id = 1"
+            )
+
+    # ----- Übernahme aus video_data.json -----
+
+    def import_legacy_json(self, data: Dict) -> bool:
+        """
+        Übernimmt Historie, Favoriten und Statistiken aus dem alten video_data.json-Format
+
+        Läuft in einer Transaktion und nur einmal (markiert in der meta-Tabelle).
+
+        Args:
+            data: Inhalt der alten video_data.json
+
+        Returns:
+            True wenn importiert wurde
+        """
+        with self._transaction():
+            if self._conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_json_imported'").fetchone():
+                return False
+            # Historie chronologisch einfügen, damit die IDs der zeitlichen Reihenfolge folgen
+            history = sorted(data.get('download_history', []), key=lambda entry: entry.get('timestamp') or '')
+            self._conn.executemany(
+                "INSERT INTO history (timestamp, url, filename, status, sender) VALUES (?, ?, ?, ?, ?)",
+                [(entry.get('timestamp') or _now(), entry.get('url', ''), entry.get('filename'), entry.get('status'),
+                  sender_from_url(entry.get('url', ''))) for entry in history]
+            )
+            self._conn.executemany(
+                "INSERT INTO favorites (name, url, added, sender) VALUES (?, ?, ?, ?)",
+                [(fav.get('name') or fav.get('url', ''), fav.get('url', ''), fav.get('added'),
+                  sender_from_url(fav.get('url', ''))) for fav in data.get('favorites', [])]
+            )
+            stats = data.get('statistics') or {}
+            self._conn.execute(
+                "UPDATE statistics SET total_downloads = total_downloads + ?, "
+                "successful_downloads = successful_downloads + ?, failed_downloads = failed_downloads + ?, "
+                "total_size = total_size + ?, last_download = COALESCE(?, last_download) WHERE id = 1",
+                (int(stats.get('total_downloads') or 0), int(stats.get('successful_downloads') or 0),
+                 int(stats.get('failed_downloads') or 0), int(stats.get('total_size') or 0),
+                 stats.get('last_download'))
+            )
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('legacy_json_imported', ?)", (json.dumps(_now()),)
+            )
+        return True
+
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Plattformübergreifende Identität von Aufnahmen
+Deezer, Spotify und der YouTube-Fallback lösen dieselbe Aufnahme bisher
+jeweils selbst auf - über Jobs und Quellen hinweg wurde nichts gemerkt.
+IdentityStore ordnet ISRC bzw. normalisiertem Künstler/Titel/Dauer die
+Deezer-ID, die Spotify-ID, den gewählten YouTube-Treffer und die Datei in der
+Bibliothek zu. Downloader fragen hier zuerst nach: Ein Song, der schon über
+einen Dienst geladen wurde, wird über einen anderen weder gesucht noch erneut
+heruntergeladen.
+
+Verwendung:
+    store = identity_store.get_store()
+    record = store.lookup(isrc=isrc, spotify_id=track_id, artist=artist, title=title, duration=duration)
+    existing = store.library_file(record)
+    ...
+    store.remember(isrc=isrc, spotify_id=track_id, youtube_id=video_id, file_path=path, ...)
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from query_cache import normalize_query
+
+IDENTITY_FILE = ".identity.db"
+
+# Abweichung der Dauer (Sekunden), bis zu der Künstler/Titel als dieselbe Aufnahme gilt
+DURATION_TOLERANCE = 3
+
+# Felder, die remember() übernimmt
+FIELDS = ('isrc', 'deezer_id', 'spotify_id', 'youtube_id', 'youtube_confidence',
+          'file_path', 'artist', 'title', 'duration')
+
+_FEATURING_PATTERN = re.compile(r'\s*[\(\[](?:feat|ft|with)\.?\s[^\)\]]*[\)\]]', re.IGNORECASE)
+_ARTIST_SEPARATOR = re.compile(r',|&|\s(?:feat|ft)\.?\s', re.IGNORECASE)
+
+
+def match_key(artist: Optional[str], title: Optional[str]) -> Optional[str]:
+    """
+    Normalisierter Schlüssel aus Hauptkünstler und Titel
+
+    Spotify liefert "A, B", Deezer nur "A"; Featuring-Angaben im Titel fehlen
+    je nach Dienst. Beides bleibt deshalb unberücksichtigt.
+    """
+    if not artist or not title:
+        return None
+    main_artist = normalize_query(_ARTIST_SEPARATOR.split(artist)[0])
+    clean_title = normalize_query(_FEATURING_PATTERN.sub('', title))
+    if not main_artist or not clean_title:
+        return None
+    return f"{main_artist}|{clean_title}"
+
+
+class IdentityStore:
+    """
+    SQLite-Tabelle recordings: eine Zeile pro Aufnahme mit allen bekannten IDs
+
+    Suche nach ISRC, dann Deezer-/Spotify-ID, zuletzt Künstler/Titel mit
+    passender Dauer. Thread-sicher.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            db_path: SQLite-Datei (None = nur im Speicher)
+        """
+        self.db_path = Path(db_path) if db_path else None
+        self._lock = threading.RLock()
+        if self.db_path:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path) if self.db_path else ':memory:',
+                                     check_same_thread=False, isolation_level=None, timeout=5)
+        self._conn.row_factory = sqlite3.Row
+        if self.db_path:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS recordings (
+                id INTEGER PRIMARY KEY,
+                isrc TEXT,
+                deezer_id TEXT,
+                spotify_id TEXT,
+                youtube_id TEXT,
+                youtube_confidence REAL,
+                file_path TEXT,
+                artist TEXT,
+                title TEXT,
+                duration INTEGER,
+                match_key TEXT,
+                updated REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS recordings_isrc ON recordings (isrc);
+            CREATE INDEX IF NOT EXISTS recordings_deezer ON recordings (deezer_id);
+            CREATE INDEX IF NOT EXISTS recordings_spotify ON recordings (spotify_id);
+            CREATE INDEX IF NOT EXISTS recordings_match_key ON recordings (match_key);
+        """)
+
+    def lookup(self, isrc: Optional[str] = None, deezer_id: Optional[str] = None,
+               spotify_id: Optional[str] = None, artist: Optional[str] = None,
+               title: Optional[str] = None, duration: Optional[float] = None) -> Optional[Dict]:
+        """
+        Sucht eine bekannte Aufnahme
+
+        Args:
+            isrc: International Standard Recording Code
+            deezer_id: Deezer Track-ID
+            spotify_id: Spotify Track-ID
+            artist: Künstler (für den Abgleich ohne IDs)
+            title: Titel
+            duration: Dauer in Sekunden (Abweichung bis DURATION_TOLERANCE)
+
+        Returns:
+            Datensatz als Dictionary oder None
+        """
+        isrc = _normalize_isrc(isrc)
+        with self._lock:
+            for column, value in (('isrc', isrc), ('deezer_id', deezer_id),
+                                  ('spotify_id', spotify_id)):
+                if value:
+                    row = self._conn.execute(
+                        f"SELECT * FROM recordings WHERE {column} = ? ORDER BY updated DESC LIMIT 1",
+                        (str(value),)
+                    ).fetchone()
+                    if row is not None:
+                        return dict(row)
+
+            key = match_key(artist, title)
+            if key is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT * FROM recordings WHERE match_key = ? ORDER BY updated DESC", (key,)
+            ).fetchall()
+        for row in rows:
+            if isrc and row['isrc'] and row['isrc'] != isrc:
+                continue  # Andere Aufnahme (z.B. Remaster) mit gleichem Titel
+            if not duration or not row['duration'] or abs(row['duration'] - duration) <= DURATION_TOLERANCE:
+                return dict(row)
+        return None
+
+    def remember(self, **fields) -> Dict:
+        """
+        Ergänzt die Aufnahme um neue IDs bzw. den Dateipfad (legt sie bei Bedarf an)
+
+        Args:
+            **fields: Beliebige aus FIELDS; None-Werte überschreiben nichts
+
+        Returns:
+            Aktueller Datensatz
+        """
+        unknown = set(fields) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unbekannte Felder: {', '.join(sorted(unknown))}")
+        values = {key: value for key, value in fields.items() if value not in (None, '')}
+        if 'isrc' in values:
+            values['isrc'] = _normalize_isrc(values['isrc'])
+        for key in ('deezer_id', 'spotify_id', 'file_path'):
+            if key in values:
+                values[key] = str(values[key])
+        if 'duration' in values:
+            values['duration'] = int(values['duration'])
+
+        with self._lock:
+            record = self.lookup(
+                isrc=values.get('isrc'), deezer_id=values.get('deezer_id'), spotify_id=values.get('spotify_id'),
+                artist=values.get('artist'), title=values.get('title'), duration=values.get('duration')
+            ) or {}
+            record.update(values)
+            record['match_key'] = match_key(record.get('artist'), record.get('title'))
+            record['updated'] = time.time()
+            columns = [column for column in FIELDS + ('match_key', 'updated') if column in record]
+            if 'id' in record:
+                self._conn.execute(
+                    f"UPDATE recordings SET {', '.join(f'{column} = ?' for column in columns)} WHERE id = ?",
+                    [record[column] for column in columns] + [record['id']]
+                )
+            else:
+                cursor = self._conn.execute(
+                    f"INSERT INTO recordings ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                    [record[column] for column in columns]
+                )
+                record['id'] = cursor.lastrowid
+            return record
+
+    def library_file(self, record: Optional[Dict]) -> Optional[Path]:
+        """
+        Datei der Aufnahme in der Bibliothek, falls sie noch existiert
+
+        Gelöschte/verschobene Dateien werden aus dem Datensatz entfernt.
+        """
+        if not record or not record.get('file_path'):
+            return None
+        path = Path(record['file_path'])
+        try:
+            if path.is_file() and path.stat().st_size > 0:
+                return path
+        except OSError:
+            pass
+        with self._lock:
+            self._conn.execute("UPDATE recordings SET file_path = NULL WHERE id = ?", (record['id'],))
+        record['file_path'] = None
+        return None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _normalize_isrc(isrc: Optional[str]) -> Optional[str]:
+    if not isrc:
+        return None
+    return re.sub(r'[^A-Z0-9]', '', str(isrc).upper()) or None
+
+
+_default_store: Optional[IdentityStore] = None
+_default_lock = threading.Lock()
+
+
+def get_store() -> IdentityStore:
+    """
+    Prozessweiter Store im Anwendungsordner (wird beim ersten Aufruf geöffnet)
+
+    Der Ordner folgt get_app_base_path() und lässt sich über UD_APP_DIR umlenken.
+    """
+    global _default_store
+    if _default_store is None:
+        with _default_lock:
+            if _default_store is None:
+                try:
+                    from path_helper import get_app_base_path
+                    db_path = get_app_base_path() / IDENTITY_FILE
+                except Exception:
+                    db_path = Path.home() / ".universal-downloader" / IDENTITY_FILE
+                try:
+                    _default_store = IdentityStore(db_path)
+                except sqlite3.Error as e:
+                    print(f"[WARNING] Identitäts-Speicher nicht verfügbar, nur im Speicher: {e}")
+                    _default_store = IdentityStore()
+    return _default_store
+
+
+def reset_store():
+    """Schließt den prozessweiten Store; get_store() öffnet danach neu (z.B. nach Änderung von UD_APP_DIR)"""
+    global _default_store
+    with _default_lock:
+        if _default_store is not None:
+            _default_store.close()
+            _default_store = None
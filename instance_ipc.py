@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kommunikation zwischen Programm-Instanzen
+Die erste Instanz lauscht auf einem lokalen Unix-Socket (Windows: Named Pipe).
+Weitere Aufrufe (z.B. aus dem Browser oder einer Shell-Schleife) übergeben
+ihre URLs bzw. Befehle dorthin und beenden sich sofort wieder - statt wie
+bisher wegen der Lock-Datei ohne Wirkung abzubrechen.
+
+Nachrichten sind Dicts:
+    {'command': 'enqueue', 'urls': [...]}   URLs in die Download-Queue
+    {'command': 'start_queue'}              Queue-Verarbeitung starten
+    {'command': 'show'}                     Fenster in den Vordergrund holen
+
+Socket und Schlüssel liegen in einem privaten Verzeichnis (0700) unter
+$XDG_RUNTIME_DIR bzw. im Anwendungsordner - nicht im gemeinsamen Temp-Ordner,
+wo ein anderer Benutzer sie vorab anlegen könnte.
+
+Beispiel:
+    for url in $(cat urls.txt); do python start.py "$url"; done
+"""
+
+import getpass
+import os
+import secrets
+import stat
+import sys
+import tempfile
+import threading
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+COMMAND_ENQUEUE = 'enqueue'
+COMMAND_START_QUEUE = 'start_queue'
+COMMAND_SHOW = 'show'
+COMMANDS = (COMMAND_ENQUEUE, COMMAND_START_QUEUE, COMMAND_SHOW)
+
+# Kommandozeilen-Schalter → Befehl
+CLI_FLAGS = {'--start-queue': COMMAND_START_QUEUE, '--show': COMMAND_SHOW}
+
+CONNECT_TIMEOUT = 2.0
+
+RUNTIME_DIR_NAME = "universal_downloader"
+
+
+def _user_tag() -> str:
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = str(os.getpid())
+    return ''.join(c for c in user if c.isalnum()) or 'user'
+
+
+def _is_private(info: os.stat_result) -> bool:
+    """Gehört dem aktuellen Benutzer und ist für niemanden sonst zugänglich (ohne getuid: Windows)"""
+    if not hasattr(os, 'getuid'):
+        return True
+    return info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+
+def runtime_dir() -> Path:
+    """
+    Privates Verzeichnis für Socket und Schlüssel
+
+    Raises:
+        OSError: Verzeichnis gehört einem anderen Benutzer oder ist kein Verzeichnis
+    """
+    if os.getenv('XDG_RUNTIME_DIR'):
+        path = Path(os.environ['XDG_RUNTIME_DIR']) / RUNTIME_DIR_NAME
+    elif sys.platform == "win32":
+        # Temp-Ordner liegt unter Windows im Benutzerprofil
+        path = Path(tempfile.gettempdir()) / RUNTIME_DIR_NAME
+    else:
+        try:
+            from path_helper import get_app_base_path
+            path = get_app_base_path() / ".runtime"
+        except Exception:
+            path = Path.home() / ".universal-downloader" / ".runtime"
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode):
+        raise OSError(f"{path} ist kein Verzeichnis")
+    if hasattr(os, 'getuid'):
+        if info.st_uid != os.getuid():
+            raise OSError(f"{path} gehört einem anderen Benutzer")
+        if info.st_mode & 0o077:
+            os.chmod(path, 0o700)
+    return path
+
+
+def ipc_address() -> str:
+    """Adresse des Listeners (pro Benutzer)"""
+    if sys.platform == "win32":
+        return rf"\\.\pipe\universal_downloader_{_user_tag()}"
+    return str(runtime_dir() / "instance.sock")
+
+
+def _family() -> str:
+    return 'AF_PIPE' if sys.platform == "win32" else 'AF_UNIX'
+
+
+def _authkey_path() -> Path:
+    return runtime_dir() / "instance.key"
+
+
+def _read_authkey() -> Optional[bytes]:
+    """Schlüssel der laufenden Instanz - nur aus einer eigenen, privaten Datei"""
+    try:
+        fd = os.open(str(_authkey_path()), os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0))
+    except OSError:
+        return None
+    with os.fdopen(fd, 'rb') as f:
+        info = os.fstat(f.fileno())
+        if not stat.S_ISREG(info.st_mode) or not _is_private(info):
+            print("[WARNING] IPC-Schlüssel ignoriert: gehört nicht dem Benutzer oder ist für andere lesbar")
+            return None
+        return f.read() or None
+
+
+def _create_authkey() -> bytes:
+    """Erzeugt einen neuen Schlüssel (nur für den aktuellen Benutzer lesbar)"""
+    key = secrets.token_bytes(32)
+    path = _authkey_path()
+    try:
+        path.unlink()
+    except OSError:
+        pass
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(key)
+    return key
+
+
+def parse_arguments(args: List[str]) -> List[Dict]:
+    """
+    Übersetzt Kommandozeilen-Argumente in Nachrichten
+
+    Args:
+        args: sys.argv[1:] (URLs und Schalter wie --start-queue)
+
+    Returns:
+        Liste von Nachrichten; ohne Argumente nur {'command': 'show'}
+    """
+    urls = [arg for arg in args if arg.startswith(('http://', 'https://'))]
+    messages = []
+    if urls:
+        messages.append({'command': COMMAND_ENQUEUE, 'urls': urls})
+    for arg in args:
+        if arg in CLI_FLAGS:
+            messages.append({'command': CLI_FLAGS[arg]})
+    return messages or [{'command': COMMAND_SHOW}]
+
+
+def send_to_running_instance(messages: List[Dict], timeout: float = CONNECT_TIMEOUT) -> bool:
+    """
+    Übergibt Nachrichten an eine laufende Instanz
+
+    Returns:
+        True wenn eine Instanz erreicht wurde und alle Nachrichten angenommen hat
+    """
+    authkey = _read_authkey()
+    if authkey is None:
+        return False
+    result = [False]
+
+    def connect():
+        try:
+            with Client(ipc_address(), family=_family(), authkey=authkey) as conn:
+                for message in messages:
+                    conn.send(message)
+                    reply = conn.recv()
+                    if not reply.get('ok'):
+                        print(f"[WARNING] Laufende Instanz hat abgelehnt: {reply.get('error')}")
+                        return
+                result[0] = True
+        except (OSError, EOFError, ValueError) as e:
+            print(f"[INFO] Keine laufende Instanz erreichbar: {e}")
+        except Exception as e:
+            # z.B. AuthenticationError bei veraltetem Schlüssel
+            print(f"[WARNING] Übergabe an laufende Instanz fehlgeschlagen: {e}")
+
+    # Client() kennt keinen Timeout - hängt die andere Instanz, nicht mit ihr hängen
+    thread = threading.Thread(target=connect, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return result[0]
+
+
+class InstanceServer:
+    """
+    Nimmt Nachrichten weiterer Instanzen entgegen
+
+    on_message wird im Listener-Thread aufgerufen; GUI-Code muss selbst in den
+    Tk-Mainloop wechseln (root.after).
+    """
+
+    def __init__(self, on_message: Callable[[Dict], None]):
+        self.on_message = on_message
+        self.address: Optional[str] = None
+        self._listener: Optional[Listener] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def start(self) -> bool:
+        """Startet den Listener; False wenn das nicht möglich ist (die Anwendung läuft trotzdem)"""
+        try:
+            self.address = ipc_address()
+            authkey = _create_authkey()
+            if _family() == 'AF_UNIX' and os.path.exists(self.address):
+                # Übrig gebliebener Socket einer abgestürzten Instanz (die Lock-Datei schützt vor einer laufenden)
+                os.unlink(self.address)
+            self._listener = Listener(self.address, family=_family(), authkey=authkey)
+        except Exception as e:
+            print(f"[WARNING] Instanz-Listener konnte nicht gestartet werden: {e}")
+            return False
+        self._running = True
+        self._thread = threading.Thread(target=self._serve, name="instance-ipc", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        self._running = False
+        if self._listener is not None:
+            try:
+                self._listener.close()
+            except Exception:
+                pass
+            self._listener = None
+        try:
+            _authkey_path().unlink()
+        except OSError:
+            pass
+
+    def _serve(self):
+        while self._running:
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                # Authentifizierung fehlgeschlagen oder Listener geschlossen
+                if not self._running:
+                    return
+                continue
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        with conn:
+            while True:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    return
+                if not isinstance(message, dict) or message.get('command') not in COMMANDS:
+                    conn.send({'ok': False, 'error': 'Unbekannter Befehl'})
+                    continue
+                try:
+                    self.on_message(message)
+                    conn.send({'ok': True})
+                except Exception as e:
+                    conn.send({'ok': False, 'error': str(e)})
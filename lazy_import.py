@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Verzögerte Imports für schnellen Programmstart
+Die Downloader-Module ziehen beim Import requests, mutagen, PIL, Selenium
+usw. nach. LazyImport steht stellvertretend für eine Klasse/ein Objekt aus
+einem solchen Modul und importiert es erst bei der ersten Verwendung.
+
+Verwendung:
+    VideoDownloader = LazyImport('video_downloader', 'VideoDownloader')
+    ...
+    if module_available('video_downloader'):   # importiert nichts
+        ...
+    downloader = VideoDownloader(...)          # erst hier wird importiert
+"""
+
+import importlib
+import importlib.util
+import threading
+from typing import Any, Dict, Optional
+
+_available_cache: Dict[str, bool] = {}
+
+
+def module_available(module_name: str) -> bool:
+    """
+    Prüft, ob ein Modul importierbar wäre, ohne es zu importieren
+
+    Args:
+        module_name: Modulname (z.B. 'audible_integration')
+
+    Returns:
+        True wenn das Modul gefunden wurde
+    """
+    if module_name not in _available_cache:
+        try:
+            _available_cache[module_name] = importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
+            _available_cache[module_name] = False
+    return _available_cache[module_name]
+
+
+class LazyImport:
+    """
+    Platzhalter für ein Attribut eines Moduls, das erst bei Bedarf importiert wird
+
+    Aufrufe, Attributzugriffe und Wahrheitswert-Prüfungen lösen den Import aus.
+    Schlägt der Import fehl, verhält sich der Platzhalter wie `default`
+    (wie die bisherigen try/except-ImportError-Blöcke).
+    """
+
+    def __init__(self, module_name: str, attribute: Optional[str] = None, default: Any = None):
+        """
+        Args:
+            module_name: Zu importierendes Modul
+            attribute: Attribut des Moduls (None = das Modul selbst)
+            default: Ersatzwert, falls der Import fehlschlägt
+        """
+        self._module_name = module_name
+        self._attribute = attribute
+        self._default = default
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._value = None
+
+    def resolve(self) -> Any:
+        """Importiert das Modul (einmalig) und liefert das Attribut bzw. den Ersatzwert"""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    try:
+                        module = importlib.import_module(self._module_name)
+                        self._value = getattr(module, self._attribute) if self._attribute else module
+                    except ImportError as e:
+                        print(f"[INFO] {self._module_name} nicht verfügbar: {e}")
+                        self._value = self._default
+                    self._loaded = True
+        return self._value
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def __call__(self, *args, **kwargs):
+        value = self.resolve()
+        if value is None:
+            raise ImportError(f"{self._module_name} ist nicht verfügbar")
+        return value(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        # Nur für Attribute, die LazyImport selbst nicht hat
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __bool__(self) -> bool:
+        return bool(self.resolve())
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __repr__(self) -> str:
+        target = f"{self._module_name}.{self._attribute}" if self._attribute else self._module_name
+        state = "geladen" if self._loaded else "nicht geladen"
+        return f"<LazyImport {target} ({state})>"
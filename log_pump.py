@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gebündelte Log-Ausgabe für Tk-Textfelder
+Worker-Threads legen Log-Zeilen nur in eine thread-sichere Queue. Der
+Tk-Mainloop leert sie in festem Takt und fügt pro Textfeld alle neuen Zeilen
+mit einem einzigen insert() ein. Jedes Textfeld behält nur ein begrenztes
+Scrollback-Fenster; die vollständige Historie steht in der Log-Datei.
+"""
+
+import queue
+import tkinter as tk
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_INTERVAL_MS = 100
+DEFAULT_SCROLLBACK_LINES = 5000
+
+
+class LogPump:
+    """
+    Überträgt Log-Zeilen aus beliebigen Threads gebündelt in Tk-Textfelder
+
+    Textfelder werden unter einem Namen registriert (z.B. 'video'); post()
+    darf aus jedem Thread aufgerufen werden und berührt Tk nie direkt.
+    """
+
+    def __init__(self, root: tk.Misc, interval_ms: int = DEFAULT_INTERVAL_MS,
+                 scrollback_lines: int = DEFAULT_SCROLLBACK_LINES):
+        """
+        Args:
+            root: Tk-Wurzelfenster (für after())
+            interval_ms: Takt, in dem die Queue geleert wird
+            scrollback_lines: Maximale Zeilenzahl je Textfeld
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self.scrollback_lines = scrollback_lines
+        self._queue = queue.SimpleQueue()
+        self._targets: Dict[str, Callable[[], Optional[tk.Text]]] = {}
+        self._after_id = None
+        self._running = False
+
+    def register(self, name: str, widget_getter: Callable[[], Optional[tk.Text]]):
+        """
+        Registriert ein Ziel-Textfeld
+
+        Args:
+            name: Kanalname für post()
+            widget_getter: Liefert das Textfeld (oder None, solange es noch nicht existiert)
+        """
+        self._targets[name] = widget_getter
+
+    def post(self, name: str, line: str):
+        """Reiht eine Zeile für das Textfeld `name` ein (thread-sicher, kehrt sofort zurück)"""
+        self._queue.put((name, line))
+
+    def start(self):
+        if not self._running:
+            self._running = True
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self):
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def flush(self):
+        """Leert die Queue sofort (nur aus dem Tk-Mainloop aufrufen)"""
+        pending: Dict[str, List[str]] = {}
+        while True:
+            try:
+                name, line = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            pending.setdefault(name, []).append(line)
+
+        for name, lines in pending.items():
+            getter = self._targets.get(name)
+            widget = getter() if getter else None
+            if widget is None:
+                continue
+            # Was ohnehin sofort wieder aus dem Scrollback fallen würde, gar nicht erst einfügen
+            if len(lines) > self.scrollback_lines:
+                lines = lines[-self.scrollback_lines:]
+            try:
+                self._append(widget, lines)
+            except tk.TclError:
+                # Textfeld wurde zerstört (z.B. Fenster geschlossen)
+                pass
+
+    def _drain(self):
+        self._after_id = None
+        try:
+            self.flush()
+        finally:
+            if self._running:
+                self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def _append(self, widget: tk.Text, lines: List[str]):
+        # Nur mitscrollen, wenn der Nutzer nicht gerade weiter oben liest
+        follow = widget.yview()[1] >= 0.999
+        widget.config(state=tk.NORMAL)
+        widget.insert(tk.END, "\n".join(lines) + "\n")
+        line_count = int(widget.index('end-1c').split('.')[0])
+        if line_count > self.scrollback_lines + 1:
+            widget.delete('1.0', f'{line_count - self.scrollback_lines}.0')
+        widget.config(state=tk.DISABLED)
+        if follow:
+            widget.see(tk.END)
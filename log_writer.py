@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Asynchrones Datei-Logging für Universal Downloader
+Log-Einträge werden nur in eine Queue gelegt; ein Hintergrund-Thread schreibt
+sie gebündelt in die Datei (ein flush pro Bündel statt pro Zeile). Die Datei
+wird ab einer Maximalgröße rotiert und kann als Text oder als JSON-Zeilen
+geschrieben werden.
+
+Verwendung:
+    writer = AsyncLogWriter(logs_dir / "video_download.log", source='video')
+    writer.write("Download gestartet", "INFO", url=url)
+    ...
+    writer.close()
+"""
+
+import atexit
+import json
+import queue
+import threading
+import time
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# Obergrenzen für die In-Memory-Historie der Downloader (collections.deque(maxlen=...))
+LOG_HISTORY_LIMIT = 2000
+RESULT_HISTORY_LIMIT = 5000
+
+FORMAT_TEXT = 'text'
+FORMAT_JSON = 'json'
+
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+DEFAULT_FLUSH_INTERVAL = 0.5  # Sekunden, die ein Bündel höchstens gesammelt wird
+MAX_BATCH_SIZE = 500
+
+_STOP = object()
+
+# Offene Writer - werden beim Beenden des Interpreters geleert und geschlossen
+_open_writers = weakref.WeakSet()
+
+
+def format_record(record: dict, fmt: str = FORMAT_TEXT) -> str:
+    """
+    Formatiert einen Log-Eintrag als Zeile (ohne Zeilenumbruch)
+
+    Args:
+        record: Eintrag mit 'ts', 'level', 'message' und optionalen Zusatzfeldern
+        fmt: FORMAT_TEXT ("[Zeit] [LEVEL] Nachricht") oder FORMAT_JSON
+    """
+    timestamp = datetime.fromtimestamp(record['ts'])
+    if fmt == FORMAT_JSON:
+        entry = dict(record)
+        entry['ts'] = timestamp.isoformat(timespec='milliseconds')
+        return json.dumps(entry, ensure_ascii=False, default=str)
+    return f"[{timestamp.strftime('%Y-%m-%d %H:%M:%S')}] [{record['level']}] {record['message']}"
+
+
+def rotated_path(path: Path, index: int) -> Path:
+    """Pfad der index-ten Sicherung (z.B. app.log → app.1.log), damit *.log-Globs sie finden"""
+    return path.with_name(f"{path.stem}.{index}{path.suffix}")
+
+
+class AsyncLogWriter:
+    """
+    Schreibt Log-Einträge aus einem Hintergrund-Thread in eine Datei
+
+    write() blockiert nie auf Datei-I/O. Der Thread sammelt Einträge bis zu
+    flush_interval Sekunden (oder MAX_BATCH_SIZE Einträge), schreibt sie am
+    Stück und ruft danach einmal flush() auf.
+    """
+
+    def __init__(self, path: Path, fmt: str = FORMAT_TEXT, source: str = '',
+                 max_bytes: int = DEFAULT_MAX_BYTES, backup_count: int = DEFAULT_BACKUP_COUNT,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        """
+        Öffnet die Log-Datei und startet den Schreib-Thread
+
+        Args:
+            path: Ziel-Datei (wird neu angelegt)
+            fmt: FORMAT_TEXT oder FORMAT_JSON
+            source: Wird bei JSON-Zeilen als Feld 'source' mitgeschrieben (z.B. 'gui', 'video')
+            max_bytes: Ab dieser Größe wird rotiert (0 = nie)
+            backup_count: Anzahl aufbewahrter Sicherungen
+            flush_interval: Maximale Verzögerung, bis ein Eintrag auf der Platte ist
+        """
+        self.path = Path(path)
+        self.fmt = fmt if fmt in (FORMAT_TEXT, FORMAT_JSON) else FORMAT_TEXT
+        self.source = source
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.dropped = 0  # Einträge, die wegen Schreibfehlern verloren gingen
+
+        # Fehler beim Öffnen sollen beim Aufrufer ankommen (wie bisher bei open())
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"log-writer-{self.path.name}", daemon=True)
+        self._thread.start()
+        _open_writers.add(self)
+
+    @property
+    def name(self) -> str:
+        return str(self.path)
+
+    def write(self, message: str, level: str = "INFO", **fields):
+        """Reiht einen Eintrag ein (kehrt sofort zurück)"""
+        if self._closed:
+            return
+        record = {'ts': time.time(), 'level': level, 'message': message}
+        if self.fmt == FORMAT_JSON:
+            if self.source:
+                record['source'] = self.source
+            record.update(fields)
+        self._queue.put(record)
+
+    def flush(self, timeout: Optional[float] = 2.0) -> bool:
+        """Wartet, bis alle bisher eingereihten Einträge geschrieben sind"""
+        if self._closed or not self._thread.is_alive():
+            return False
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 2.0):
+        """Schreibt ausstehende Einträge und schließt die Datei"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        _open_writers.discard(self)
+
+    def _collect_batch(self) -> list:
+        """Blockiert bis zum ersten Eintrag und sammelt danach bis zum Ende des Intervalls"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < MAX_BATCH_SIZE and isinstance(batch[-1], dict):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        stop = False
+        while not stop:
+            batch = self._collect_batch()
+            lines = []
+            waiters = []
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    lines.append(format_record(item, self.fmt))
+
+            if lines:
+                try:
+                    self._file.write("\n".join(lines) + "\n")
+                    self._file.flush()
+                    if self.max_bytes and self._file.tell() >= self.max_bytes:
+                        self._rotate()
+                except Exception:
+                    self.dropped += len(lines)
+
+            for waiter in waiters:
+                waiter.set()
+
+        try:
+            self._file.close()
+        except Exception:
+            pass
+
+    def _rotate(self):
+        """Verschiebt app.log → app.1.log → app.2.log ... und beginnt eine neue Datei"""
+        self._file.close()
+        try:
+            if self.backup_count > 0:
+                oldest = rotated_path(self.path, self.backup_count)
+                if oldest.exists():
+                    oldest.unlink()
+                for index in range(self.backup_count - 1, 0, -1):
+                    source = rotated_path(self.path, index)
+                    if source.exists():
+                        source.replace(rotated_path(self.path, index + 1))
+                self.path.replace(rotated_path(self.path, 1))
+        finally:
+            self._file = open(self.path, 'w', encoding='utf-8')
+
+
+@atexit.register
+def _close_open_writers():
+    for writer in list(_open_writers):
+        try:
+            writer.close(timeout=1.0)
+        except Exception:
+            pass
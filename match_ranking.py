@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bewertung von YouTube-Treffern für den Fallback-Download
+Statt blind das erste Suchergebnis (ytsearch1) herunterzuladen, werden mit
+einem einzigen yt-dlp-Aufruf N Kandidaten geholt und nach mehreren Signalen
+bewertet:
+    - Abweichung der Dauer von der Deezer-/Spotify-Dauer
+    - Titel-Ähnlichkeit (Token-Mengen, unabhängig von der Wortreihenfolge;
+      Upload-Zusätze wie "(Official Video)" oder "[HD]" zählen nicht mit)
+    - Kanal-Heuristiken ("Künstler - Topic", Kanal des Künstlers, VEVO)
+    - Abzüge für Live-, Cover-, Remix- usw. Versionen, die nicht gesucht waren
+
+Heruntergeladen wird nur der beste Kandidat, und nur wenn seine Konfidenz
+(0..1) mindestens MIN_CONFIDENCE beträgt. Score und Begründung werden am
+Kandidaten mitgeliefert, damit der Aufrufer sie protokollieren kann.
+"""
+
+import json
+import math
+import re
+import subprocess
+import sys
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from query_cache import normalize_query
+
+# Kandidaten pro Suche (ein yt-dlp-Aufruf)
+DEFAULT_CANDIDATES = 5
+
+# Unterhalb dieser Konfidenz wird nichts heruntergeladen
+MIN_CONFIDENCE = 0.55
+
+# Gewichte der Signale (Summe 1.0)
+TITLE_WEIGHT = 0.5
+DURATION_WEIGHT = 0.35
+CHANNEL_WEIGHT = 0.15
+
+# Passende Dauer/Kanal gleichen einen falschen Titel nicht aus: Score höchstens Titel-Ähnlichkeit + Marge
+TITLE_CAP_MARGIN = 0.15
+
+# Abweichung der Dauer: bis DURATION_TOLERANCE Sekunden volle Punkte, ab
+# DURATION_MAX_DELTA (bzw. 25% der Länge) keine Punkte mehr
+DURATION_TOLERANCE = 3
+DURATION_MAX_DELTA = 30
+
+# Versionen, die nur passen, wenn sie im gesuchten Titel auch vorkommen
+VERSION_PENALTIES = {
+    'live': 0.3,
+    'cover': 0.35,
+    'remix': 0.3,
+    'karaoke': 0.5,
+    'instrumental': 0.35,
+    'nightcore': 0.5,
+    'sped up': 0.4,
+    'slowed': 0.4,
+    'reverb': 0.2,
+    '8d': 0.3,
+    'reaction': 0.5,
+    'tutorial': 0.5,
+    'lyrics': 0.05,
+    'acoustic': 0.2,
+    'edit': 0.1,
+    'mashup': 0.4,
+}
+
+# Hörbücher: kürzer als das ist kein vollständiges Hörbuch
+AUDIOBOOK_MIN_DURATION = 1800
+AUDIOBOOK_PENALTIES = {
+    'demo': 0.5,
+    'trailer': 0.6,
+    'preview': 0.5,
+    'vorschau': 0.5,
+    'sample': 0.4,
+    'leseprobe': 0.5,
+}
+_CHAPTER_PATTERN = re.compile(r'\bkapitel\s*\d+')
+
+# Upload-Zusätze ohne Bedeutung für die Aufnahme: "(Official Video)", "[HD]", "| Lyrics"
+# (Live, Remix usw. bleiben stehen - das sind andere Versionen)
+_UPLOAD_TAG_WORD = (r'(?:official|offizielle[sr]?|officiel(?:le)?|music|musik|video|videoclip|clip|audio'
+                    r'|lyrics?|visuali[sz]er|hd|hq|4k|\d{3,4}p)')
+_UPLOAD_TAGS = _UPLOAD_TAG_WORD + r'(?:[\s/&-]+' + _UPLOAD_TAG_WORD + r')*'
+_UPLOAD_TAG_PATTERN = re.compile(
+    r'\s*(?:[\(\[]\s*' + _UPLOAD_TAGS + r'\s*[\)\]]|\|\s*' + _UPLOAD_TAGS + r'\s*$)',
+    re.IGNORECASE
+)
+
+
+def tokens(text: str) -> List[str]:
+    """Normalisierte Wörter (klein, ohne Satzzeichen)"""
+    return normalize_query(text).split()
+
+
+def strip_upload_tags(title: str) -> str:
+    """Videotitel ohne Upload-Zusätze ("Song (Official Video) [HD]" → "Song")"""
+    return _UPLOAD_TAG_PATTERN.sub('', title or '').strip()
+
+
+def token_set_similarity(a: str, b: str) -> float:
+    """
+    Ähnlichkeit zweier Titel (0..1), unabhängig von Wortreihenfolge und Zusatzwörtern
+
+    Wie token_set_ratio aus fuzzywuzzy: verglichen werden die gemeinsamen Wörter
+    mit jeweils gemeinsamen + eigenen Wörtern; der beste Vergleich zählt.
+    "Artist - Song (Official Video)" und "Song Artist" liegen damit nah beieinander.
+    """
+    set_a, set_b = set(tokens(a)), set(tokens(b))
+    if not set_a or not set_b:
+        return 0.0
+    common = ' '.join(sorted(set_a & set_b))
+    with_a = ' '.join(filter(None, [common, ' '.join(sorted(set_a - set_b))]))
+    with_b = ' '.join(filter(None, [common, ' '.join(sorted(set_b - set_a))]))
+    ratios = [SequenceMatcher(None, with_a, with_b).ratio()]
+    if common:
+        ratios.append(SequenceMatcher(None, common, with_a).ratio())
+        ratios.append(SequenceMatcher(None, common, with_b).ratio())
+    return max(ratios)
+
+
+def _contains_phrase(text_tokens: Sequence[str], phrase: str) -> bool:
+    words = phrase.split()
+    return any(list(text_tokens[i:i + len(words)]) == words for i in range(len(text_tokens) - len(words) + 1))
+
+
+def _duration_score(expected: float, actual: float) -> Tuple[float, str]:
+    delta = abs(actual - expected)
+    max_delta = max(DURATION_MAX_DELTA, expected * 0.25)
+    if delta <= DURATION_TOLERANCE:
+        return 1.0, f"Dauer ±{delta:.0f}s"
+    if delta >= max_delta:
+        return 0.0, f"Dauer weicht {delta:.0f}s ab"
+    return 1.0 - (delta - DURATION_TOLERANCE) / (max_delta - DURATION_TOLERANCE), f"Dauer ±{delta:.0f}s"
+
+
+def _channel_score(channel: str, artist: str) -> Tuple[float, List[str]]:
+    score = 0.0
+    reasons = []
+    channel_lower = channel.lower()
+    if channel_lower.endswith(' - topic'):
+        # Automatisch erzeugte Kanäle mit Studio-Versionen
+        score += 0.6
+        reasons.append("Topic-Kanal")
+        channel_lower = channel_lower[:-len(' - topic')]
+    if artist and token_set_similarity(channel_lower, artist) >= 0.85:
+        score += 0.4
+        reasons.append("Kanal des Künstlers")
+    elif 'vevo' in channel_lower:
+        score += 0.3
+        reasons.append("VEVO")
+    return min(score, 1.0), reasons
+
+
+def score_candidate(candidate: Dict, title: str, artist: str = '', duration: Optional[float] = None,
+                    audiobook: bool = False) -> Tuple[float, List[str]]:
+    """
+    Bewertet einen Kandidaten
+
+    Args:
+        candidate: {'title', 'channel', 'duration', ...} (siehe fetch_candidates)
+        title: Gesuchter Titel
+        artist: Gesuchter Künstler/Autor
+        duration: Erwartete Dauer in Sekunden (None/0 = unbekannt)
+        audiobook: Vollständiges Hörbuch gesucht (Mindestdauer, länger ist besser)
+
+    Returns:
+        (Score 0..1, Begründungen)
+    """
+    candidate_title = candidate.get('title') or ''
+    channel = candidate.get('channel') or ''
+    actual_duration = candidate.get('duration') or 0
+    reasons = []
+
+    # Titel: Künstler + Titel gegen Videotitel (+ Kanal, der oft den Künstler enthält)
+    wanted = f"{artist} {title}"
+    compared_title = strip_upload_tags(candidate_title)
+    title_similarity = max(token_set_similarity(wanted, compared_title),
+                           token_set_similarity(wanted, f"{channel} {compared_title}"))
+    reasons.append(f"Titel {title_similarity:.2f}")
+
+    if audiobook:
+        if actual_duration < AUDIOBOOK_MIN_DURATION:
+            return 0.0, reasons + [f"zu kurz für ein Hörbuch ({actual_duration // 60} min)"]
+        # Länger ist besser, ab ~8 Stunden kaum noch Unterschied
+        length_score = min(1.0, math.log(actual_duration / AUDIOBOOK_MIN_DURATION + 1, 2) / 4)
+        reasons.append(f"{actual_duration // 60} min")
+        score = 0.6 * title_similarity + 0.4 * length_score
+        penalties = AUDIOBOOK_PENALTIES
+    else:
+        if duration:
+            duration_score, duration_reason = _duration_score(duration, actual_duration) if actual_duration \
+                else (0.5, "Dauer unbekannt")
+            reasons.append(duration_reason)
+            title_weight, duration_weight = TITLE_WEIGHT, DURATION_WEIGHT
+        else:
+            # Ohne Vergleichsdauer zählt der Titel stärker
+            duration_score, title_weight, duration_weight = 0.0, TITLE_WEIGHT + DURATION_WEIGHT, 0.0
+        channel_score, channel_reasons = _channel_score(channel, artist)
+        reasons.extend(channel_reasons)
+        score = title_weight * title_similarity + duration_weight * duration_score + CHANNEL_WEIGHT * channel_score
+        penalties = VERSION_PENALTIES
+    score = min(score, title_similarity + TITLE_CAP_MARGIN)
+
+    # Abzüge für Versionen, die nicht gesucht waren
+    wanted_tokens = tokens(wanted)
+    candidate_tokens = tokens(candidate_title)
+    for phrase, penalty in penalties.items():
+        if _contains_phrase(candidate_tokens, phrase) and not _contains_phrase(wanted_tokens, phrase):
+            score -= penalty
+            reasons.append(f"'{phrase}' -{penalty:.2f}")
+    if audiobook and _CHAPTER_PATTERN.search(normalize_query(candidate_title)):
+        score -= 0.5
+        reasons.append("einzelnes Kapitel")
+
+    return max(0.0, min(1.0, score)), reasons
+
+
+def rank_candidates(candidates: List[Dict], title: str, artist: str = '', duration: Optional[float] = None,
+                    audiobook: bool = False) -> List[Dict]:
+    """
+    Bewertet alle Kandidaten und sortiert sie (bester zuerst)
+
+    Returns:
+        Kopien der Kandidaten mit 'confidence' und 'reasons'
+    """
+    ranked = []
+    for candidate in candidates:
+        confidence, reasons = score_candidate(candidate, title, artist, duration, audiobook)
+        ranked.append(dict(candidate, confidence=round(confidence, 3), reasons=reasons))
+    ranked.sort(key=lambda candidate: candidate['confidence'], reverse=True)
+    return ranked
+
+
+def _parse_duration(value) -> int:
+    if isinstance(value, (int, float)):
+        return int(value)
+    parts = str(value or '').split(':')
+    try:
+        seconds = 0
+        for part in parts:
+            seconds = seconds * 60 + int(part)
+        return seconds
+    except ValueError:
+        return 0
+
+
+def fetch_candidates(query: str, limit: int = DEFAULT_CANDIDATES, timeout: float = 30,
+                     command: Optional[List[str]] = None, keep_info: bool = False) -> Optional[List[Dict]]:
+    """
+    Holt die ersten `limit` YouTube-Ergebnisse mit einem yt-dlp-Aufruf (ohne Download)
+
+    Args:
+        query: Suchanfrage
+        limit: Anzahl Kandidaten
+        timeout: Zeitlimit in Sekunden
+        command: yt-dlp-Aufruf (Standard: python -m yt_dlp)
+        keep_info: Vollständiges Info-Dict unter 'info' behalten (für --load-info-json,
+                   damit der Download die Seite nicht erneut extrahieren muss)
+
+    Returns:
+        Kandidaten {'video_id', 'url', 'title', 'channel', 'duration'}; None bei
+        Fehler von yt-dlp (zur Unterscheidung von "keine Treffer" = leere Liste)
+    """
+    cmd = (command or [sys.executable, "-m", "yt_dlp"]) + [
+        "--dump-json",
+        "--no-warnings",
+        "--quiet",
+        f"ytsearch{limit}:{query}"
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    if result.returncode != 0:
+        return None
+
+    candidates = []
+    for line in result.stdout.splitlines():
+        if not line.strip():
+            continue
+        try:
+            info = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        video_id = info.get('id', '')
+        candidate = {
+            'video_id': video_id,
+            'url': info.get('webpage_url') or f"https://www.youtube.com/watch?v={video_id}",
+            'title': info.get('title', ''),
+            'channel': info.get('channel') or info.get('uploader', ''),
+            'duration': _parse_duration(info.get('duration') or info.get('duration_string')),
+        }
+        if keep_info:
+            candidate['info'] = info
+        candidates.append(candidate)
+    return candidates
+
+
+def without_info(candidate: Optional[Dict]) -> Optional[Dict]:
+    """Kandidat ohne Info-Dict (zum Zwischenspeichern - Format-URLs laufen nach Stunden ab)"""
+    if candidate is None:
+        return None
+    return {key: value for key, value in candidate.items() if key != 'info'}
+
+
+def find_best_match(query: str, title: str, artist: str = '', duration: Optional[float] = None,
+                    audiobook: bool = False, limit: int = DEFAULT_CANDIDATES,
+                    min_confidence: float = MIN_CONFIDENCE, timeout: float = 30,
+                    command: Optional[List[str]] = None,
+                    keep_info: bool = False) -> Tuple[Optional[Dict], Optional[List[Dict]]]:
+    """
+    Sucht, bewertet und wählt den besten Kandidaten
+
+    Returns:
+        (bester Kandidat mit Konfidenz ≥ min_confidence oder None,
+         alle bewerteten Kandidaten - None bei Fehler von yt-dlp)
+    """
+    candidates = fetch_candidates(query, limit, timeout, command, keep_info)
+    if candidates is None:
+        return None, None
+    ranked = rank_candidates(candidates, title, artist, duration, audiobook)
+    if ranked and ranked[0]['confidence'] >= min_confidence:
+        return ranked[0], ranked
+    return None, ranked
+
+
+def describe(candidate: Dict) -> str:
+    """Kurzbeschreibung für das Log: Titel, Konfidenz und Begründung"""
+    return f"{candidate.get('title', '')} [{candidate.get('confidence', 0):.2f}: {', '.join(candidate.get('reasons', []))}]"
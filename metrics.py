@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Laufzeit-Metriken für Universal Downloader
+Misst pro Verarbeitungsstufe (Deezer-API, YouTube-Suche, Download, Konvertierung,
+Tagging, ...) Dauer, Fehler und übertragene Bytes. Die Werte sind prozessweit
+und können als Prometheus-Textformat (/metrics) oder als JSON-Snapshot
+(/metrics.json, write_snapshot) abgerufen werden.
+
+Verwendung:
+    import metrics
+
+    with metrics.timed('deezer_api', 'deezer'):
+        response = session.get(url)
+
+    @metrics.instrument('download', 'deezer', success=lambda result: result[0])
+    def download_track_deezer_direct(...): ...
+
+    metrics.start_metrics_server(9464)   # http://127.0.0.1:9464/metrics
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Bucket-Grenzen in Sekunden - von API-Aufrufen (ms) bis zu Hörbuch-Downloads (Minuten)
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label_value(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Basis für Metriken mit Labels (thread-sicher über das Lock der Registry)"""
+
+    metric_type = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...], lock: threading.Lock):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = lock
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+        return tuple(zip(self.labelnames, key))
+
+
+class Counter(_Metric):
+    """Monoton steigender Zähler"""
+
+    metric_type = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        if amount < 0:
+            raise ValueError("Counter können nur erhöht werden")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}"
+                for key, value in sorted(self._values.items())]
+
+    def samples(self) -> List[Dict]:
+        return [{'labels': dict(self._labels(key)), 'value': value}
+                for key, value in sorted(self._values.items())]
+
+
+class Histogram(_Metric):
+    """Histogramm mit festen Bucket-Grenzen (kumulativ wie bei Prometheus)"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...], lock: threading.Lock,
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames, lock)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {'counts': [0] * len(self.buckets), 'count': 0, 'sum': 0.0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state['counts'][index] += 1
+                    break
+            state['count'] += 1
+            state['sum'] += value
+
+    def _cumulative(self, state: Dict) -> List[Tuple[float, int]]:
+        result = []
+        running = 0
+        for bound, count in zip(self.buckets, state['counts']):
+            running += count
+            result.append((bound, running))
+        result.append((float('inf'), state['count']))
+        return result
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, state in sorted(self._values.items()):
+            labels = self._labels(key)
+            for bound, count in self._cumulative(state):
+                bucket_labels = labels + (('le', _format_value(bound)),)
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(state['sum'])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {state['count']}")
+        return lines
+
+    def samples(self) -> List[Dict]:
+        samples = []
+        for key, state in sorted(self._values.items()):
+            samples.append({
+                'labels': dict(self._labels(key)),
+                'count': state['count'],
+                'sum': round(state['sum'], 6),
+                'buckets': {_format_value(bound): count for bound, count in self._cumulative(state)},
+            })
+        return samples
+
+    def quantile(self, q: float, **labels) -> Optional[float]:
+        """Schätzt ein Quantil aus den Buckets (lineare Interpolation wie histogram_quantile)"""
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            if not state or not state['count']:
+                return None
+            return _estimate_quantile(self._cumulative(state), state['count'], q)
+
+
+def _estimate_quantile(cumulative: List[Tuple[float, int]], total: int, q: float) -> float:
+    rank = q * total
+    lower_bound, lower_count = 0.0, 0
+    for bound, count in cumulative:
+        if count >= rank:
+            if bound == float('inf'):
+                return lower_bound
+            if count == lower_count:
+                return bound
+            return lower_bound + (bound - lower_bound) * (rank - lower_count) / (count - lower_count)
+        lower_bound, lower_count = bound, count
+    return lower_bound
+
+
+class MetricsRegistry:
+    """Sammlung aller Metriken eines Prozesses"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+        self.started_at = time.time()
+
+    def _register(self, metric_class, name: str, documentation: str, labelnames, **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, metric_class) or existing.labelnames != tuple(labelnames):
+                    raise ValueError(f"Metrik {name} ist bereits mit anderem Typ/Labels registriert")
+                return existing
+            metric = metric_class(name, documentation, tuple(labelnames), self._lock, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def reset(self):
+        """Setzt alle Werte zurück (z.B. zwischen Benchmark-Läufen)"""
+        with self._lock:
+            for metric in self._metrics.values():
+                metric._values.clear()
+            self.started_at = time.time()
+
+    def render_prometheus(self) -> str:
+        """Alle Metriken im Prometheus-Textformat 0.0.4"""
+        lines = []
+        with self._lock:
+            for name, metric in sorted(self._metrics.items()):
+                lines.append(f"# HELP {name} {metric.documentation}")
+                lines.append(f"# TYPE {name} {metric.metric_type}")
+                lines.extend(metric.render())
+        lines.append("# HELP ud_process_start_time_seconds Startzeit des Prozesses (Unix-Zeit)")
+        lines.append("# TYPE ud_process_start_time_seconds gauge")
+        lines.append(f"ud_process_start_time_seconds {_format_value(round(self.started_at, 3))}")
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self) -> Dict:
+        """Alle Metriken als JSON-fähiges Dictionary, plus Übersicht pro Stufe"""
+        with self._lock:
+            metrics = {
+                name: {'type': metric.metric_type, 'help': metric.documentation, 'samples': metric.samples()}
+                for name, metric in sorted(self._metrics.items())
+            }
+            stages = self._stage_summary()
+        return {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'stages': stages,
+            'metrics': metrics,
+        }
+
+    def _stage_summary(self) -> Dict[str, Dict]:
+        """Verdichtete Sicht: Anzahl, Fehler, Dauer und Bytes je 'stufe/quelle' (Lock wird gehalten)"""
+        durations = self._metrics.get('ud_stage_duration_seconds')
+        errors = self._metrics.get('ud_stage_errors_total')
+        transferred = self._metrics.get('ud_bytes_transferred_total')
+        if durations is None:
+            return {}
+        summary: Dict[str, Dict] = {}
+        for key, state in sorted(durations._values.items()):
+            stage, source = key
+            cumulative = durations._cumulative(state)
+            summary[f"{stage}/{source}" if source else stage] = {
+                'count': state['count'],
+                'errors': errors._values.get(key, 0) if errors else 0,
+                'bytes': transferred._values.get(key, 0) if transferred else 0,
+                'total_seconds': round(state['sum'], 4),
+                'mean_seconds': round(state['sum'] / state['count'], 4) if state['count'] else None,
+                'p50_seconds': round(_estimate_quantile(cumulative, state['count'], 0.5), 4),
+                'p95_seconds': round(_estimate_quantile(cumulative, state['count'], 0.95), 4),
+            }
+        return summary
+
+
+# Prozessweite Registry und Standard-Metriken
+REGISTRY = MetricsRegistry()
+STAGE_SECONDS = REGISTRY.histogram('ud_stage_duration_seconds', "Dauer einer Verarbeitungsstufe in Sekunden",
+                                   ('stage', 'source'))
+STAGE_ERRORS = REGISTRY.counter('ud_stage_errors_total', "Fehlgeschlagene Durchläufe einer Verarbeitungsstufe",
+                                ('stage', 'source'))
+BYTES_TOTAL = REGISTRY.counter('ud_bytes_transferred_total', "Übertragene Bytes je Verarbeitungsstufe",
+                               ('stage', 'source'))
+
+
+class StageTiming:
+    """Wird von timed() geliefert; erlaubt Fehler und Bytes ohne Exception zu melden"""
+
+    def __init__(self, stage: str, source: str):
+        self.stage = stage
+        self.source = source
+        self.failed = False
+        self.started = time.perf_counter()
+
+    def fail(self):
+        """Markiert den Durchlauf als fehlgeschlagen (z.B. bei Rückgabe False)"""
+        self.failed = True
+
+    def add_bytes(self, amount: int):
+        add_bytes(self.stage, self.source, amount)
+
+
+@contextmanager
+def timed(stage: str, source: str = ''):
+    """
+    Misst die Dauer eines Blocks als Stufe; Exceptions werden als Fehler gezählt
+
+    Args:
+        stage: Name der Stufe (z.B. 'deezer_api', 'youtube_search', 'download', 'tagging')
+        source: Quelle/Plattform (z.B. 'deezer', 'spotify', 'video', 'audible')
+    """
+    timing = StageTiming(stage, source)
+    try:
+        yield timing
+    except BaseException:
+        timing.failed = True
+        raise
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - timing.started, stage=stage, source=source)
+        if timing.failed:
+            STAGE_ERRORS.inc(stage=stage, source=source)
+
+
+def instrument(stage: str, source: str = '', success: Optional[Callable] = None,
+               size: Optional[Callable] = None):
+    """
+    Decorator: misst jeden Aufruf der Funktion als Stufe
+
+    Args:
+        stage: Name der Stufe
+        source: Quelle/Plattform
+        success: Optional, bewertet den Rückgabewert (False → Fehler wird gezählt)
+        size: Optional, liefert aus dem Rückgabewert die übertragenen Bytes
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(stage, source) as timing:
+                result = func(*args, **kwargs)
+                try:
+                    if success is not None and not success(result):
+                        timing.fail()
+                    if size is not None:
+                        timing.add_bytes(size(result) or 0)
+                except Exception:
+                    pass
+                return result
+        return wrapper
+    return decorator
+
+
+def count_error(stage: str, source: str = ''):
+    """Zählt einen Fehler einer Stufe, die ihn selbst abfängt (z.B. Tagging)"""
+    STAGE_ERRORS.inc(stage=stage, source=source)
+
+
+def observe(stage: str, source: str, seconds: float):
+    """Erfasst eine extern gemessene Dauer (z.B. Nachbearbeitung innerhalb von yt-dlp)"""
+    if seconds >= 0:
+        STAGE_SECONDS.observe(seconds, stage=stage, source=source)
+
+
+def add_bytes(stage: str, source: str, amount: int):
+    if amount and amount > 0:
+        BYTES_TOTAL.inc(amount, stage=stage, source=source)
+
+
+def file_size(path) -> int:
+    """Größe einer Datei in Bytes (0 wenn nicht vorhanden)"""
+    try:
+        return Path(path).stat().st_size if path else 0
+    except OSError:
+        return 0
+
+
+def write_snapshot(path, registry: MetricsRegistry = REGISTRY) -> Path:
+    """Schreibt den JSON-Snapshot atomar in eine Datei"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(registry.snapshot(), f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def handle_metrics_request(handler: BaseHTTPRequestHandler, registry: MetricsRegistry = REGISTRY) -> bool:
+    """
+    Beantwortet GET /metrics und /metrics.json auf einem beliebigen BaseHTTPRequestHandler
+
+    Returns:
+        True wenn der Pfad ein Metrik-Endpunkt war
+    """
+    path = urlparse(handler.path).path
+    if path == '/metrics':
+        body = registry.render_prometheus().encode('utf-8')
+        content_type = PROMETHEUS_CONTENT_TYPE
+    elif path == '/metrics.json':
+        body = json.dumps(registry.snapshot(), ensure_ascii=False).encode('utf-8')
+        content_type = 'application/json; charset=utf-8'
+    else:
+        return False
+    handler.send_response(200)
+    handler.send_header('Content-Type', content_type)
+    handler.send_header('Content-Length', str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+    return True
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    """Eigenständiger Endpunkt für /metrics und /metrics.json"""
+
+    registry: MetricsRegistry = REGISTRY
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if not handle_metrics_request(self, self.registry):
+            self.send_error(404)
+
+
+def start_metrics_server(port: int, host: str = '127.0.0.1',
+                         registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """
+    Startet einen lokalen Metrik-Endpunkt in einem Hintergrund-Thread
+
+    Args:
+        port: TCP-Port (0 = beliebiger freier Port, siehe server.server_address)
+        host: Bind-Adresse (Standard nur lokal)
+    """
+    handler = type('BoundMetricsRequestHandler', (MetricsRequestHandler,), {'registry': registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
+
+
+def start_from_environment() -> Optional[ThreadingHTTPServer]:
+    """Startet den Endpunkt, wenn UD_METRICS_PORT gesetzt ist (GUI/CLI)"""
+    port = os.environ.get('UD_METRICS_PORT')
+    if not port:
+        return None
+    try:
+        return start_metrics_server(int(port), os.environ.get('UD_METRICS_HOST', '127.0.0.1'))
+    except (ValueError, OSError) as e:
+        print(f"⚠ Metrik-Endpunkt konnte nicht gestartet werden: {e}")
+        return None
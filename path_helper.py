@@ -9,6 +9,9 @@ import os
 import sys
 from pathlib import Path
 
+# Umgebungsvariable, die den Anwendungsordner ersetzt (z.B. Benchmarks, die das echte Profil nicht anfassen dürfen)
+APP_DIR_ENV = "UD_APP_DIR"
+
 
 def get_downloads_folder():
     """
@@ -172,8 +175,14 @@ def get_app_base_path():
     Gibt den Basis-Pfad für die Anwendung zurück (Downloads/Universal Downloader)
     
     Returns:
-        Path: Pfad zum Basis-Verzeichnis der Anwendung
+        Path: Pfad zum Basis-Verzeichnis der Anwendung (UD_APP_DIR hat Vorrang)
     """
+    override = os.getenv(APP_DIR_ENV)
+    if override:
+        app_path = Path(override).expanduser()
+        app_path.mkdir(parents=True, exist_ok=True)
+        return app_path
+    
     downloads_folder = get_downloads_folder()
     app_path = downloads_folder / "Universal Downloader"
     
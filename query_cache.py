@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zwischenspeicher für Suchanfragen bei Anbietern
+Dieselben (Titel, Künstler)-Anfragen laufen bei Hörbuch-Suche, Spotify→YouTube
+und dem YouTube-Fallback von Deezer immer wieder gegen yt-dlp bzw. die
+Anbieter-APIs. QueryCache merkt sich Antworten prozessübergreifend in einer
+SQLite-Datei - auch "nicht gefunden", aber kürzer (negative TTL).
+
+Fehler (Timeouts, Netzwerkprobleme) werden nicht gespeichert; das entscheidet
+der Aufrufer, indem er put() nur für echte Antworten aufruft.
+
+Verwendung:
+    cache = query_cache.get_cache()
+    url = cache.get('youtube_track', (artist, title))
+    if url is query_cache.MISS:
+        url = search(...)
+        cache.put('youtube_track', (artist, title), url)   # None = nicht gefunden
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+# Gültigkeit gefundener bzw. nicht gefundener Ergebnisse (Sekunden)
+POSITIVE_TTL = 7 * 24 * 3600
+NEGATIVE_TTL = 6 * 3600
+
+# Einträge, die zusätzlich im Speicher gehalten werden
+MEMORY_ENTRIES = 5000
+
+CACHE_FILE = ".query_cache.db"
+
+# Rückgabe von get(), wenn nichts (Gültiges) gespeichert ist - None ist ein gültiger Wert ("nicht gefunden")
+MISS = object()
+
+_SEPARATOR = '\x1f'
+
+
+def normalize_query(text: Any) -> str:
+    """
+    Normalisiert einen Suchbegriff für den Cache-Schlüssel
+
+    Groß-/Kleinschreibung, Unicode-Varianten, Satzzeichen und Leerraum
+    spielen keine Rolle ("Die Ärzte - Schrei nach Liebe" == "die ärzte schrei nach liebe").
+    """
+    text = unicodedata.normalize('NFKC', str(text or '')).casefold()
+    return ' '.join(re.sub(r'[^\w]+', ' ', text).split())
+
+
+def _is_negative(value: Any) -> bool:
+    if isinstance(value, dict) and 'available' in value:
+        return not value['available']
+    return not value
+
+
+class QueryCache:
+    """
+    Zwischenspeicher mit getrennter TTL für Treffer und Nicht-Treffer
+
+    Werte müssen JSON-serialisierbar sein. Lesen trifft zuerst ein Dict im
+    Speicher, erst danach die Datenbank. Thread-sicher.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None, positive_ttl: float = POSITIVE_TTL,
+                 negative_ttl: float = NEGATIVE_TTL, memory_entries: int = MEMORY_ENTRIES):
+        """
+        Args:
+            db_path: SQLite-Datei (None = nur im Speicher)
+            positive_ttl: Gültigkeit gefundener Ergebnisse in Sekunden
+            negative_ttl: Gültigkeit von "nicht gefunden" in Sekunden
+            memory_entries: Maximale Anzahl Einträge im Speicher
+        """
+        self.db_path = Path(db_path) if db_path else None
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.memory_entries = memory_entries
+        self._memory: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+
+        if self.db_path:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                             isolation_level=None, timeout=5)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS query_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+                )
+                self._conn.execute("DELETE FROM query_cache WHERE expires < ?", (time.time(),))
+            except sqlite3.Error as e:
+                print(f"[WARNING] Such-Cache nicht verfügbar, nur im Speicher: {e}")
+                self._conn = None
+
+    @staticmethod
+    def make_key(namespace: str, key: Union[str, Sequence]) -> str:
+        parts = [key] if isinstance(key, str) else list(key)
+        return _SEPARATOR.join([namespace] + [normalize_query(part) for part in parts])
+
+    def get(self, namespace: str, key: Union[str, Sequence]) -> Any:
+        """
+        Liefert den gespeicherten Wert oder MISS
+
+        Args:
+            namespace: Art der Anfrage (z.B. 'youtube_track', 'audiobook.spotify')
+            key: Suchbegriff(e), werden normalisiert
+        """
+        cache_key = self.make_key(namespace, key)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is None and self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value, expires FROM query_cache WHERE key = ?", (cache_key,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row is not None:
+                    entry = (row[1], json.loads(row[0]))
+                    self._remember(cache_key, entry)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    self._memory.pop(cache_key, None)
+                self.misses += 1
+                return MISS
+            self.hits += 1
+            return entry[1]
+
+    def put(self, namespace: str, key: Union[str, Sequence], value: Any, negative: Optional[bool] = None):
+        """
+        Speichert eine Antwort
+
+        Args:
+            namespace: Art der Anfrage
+            key: Suchbegriff(e)
+            value: JSON-serialisierbarer Wert; None/False/leer bzw. {'available': False} gilt als "nicht gefunden"
+            negative: Überschreibt die automatische Erkennung von "nicht gefunden"
+        """
+        if negative is None:
+            negative = _is_negative(value)
+        cache_key = self.make_key(namespace, key)
+        expires = time.time() + (self.negative_ttl if negative else self.positive_ttl)
+        with self._lock:
+            self._remember(cache_key, (expires, value))
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO query_cache (key, value, expires) VALUES (?, ?, ?)",
+                        (cache_key, json.dumps(value, ensure_ascii=False), expires)
+                    )
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    print(f"[WARNING] Such-Cache: Eintrag nicht gespeichert: {e}")
+
+    def cached(self, namespace: str, key: Union[str, Sequence], compute: Callable[[], Any]) -> Any:
+        """Liefert den gespeicherten Wert oder berechnet und speichert ihn (Ausnahmen werden nicht gespeichert)"""
+        value = self.get(namespace, key)
+        if value is MISS:
+            value = compute()
+            self.put(namespace, key, value)
+        return value
+
+    def invalidate(self, namespace: str, key: Union[str, Sequence]):
+        cache_key = self.make_key(namespace, key)
+        with self._lock:
+            self._memory.pop(cache_key, None)
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM query_cache WHERE key = ?", (cache_key,))
+                except sqlite3.Error:
+                    pass
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM query_cache")
+                except sqlite3.Error:
+                    pass
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, cache_key: str, entry: Tuple[float, Any]):
+        self._memory.pop(cache_key, None)
+        self._memory[cache_key] = entry
+        while len(self._memory) > self.memory_entries:
+            # Ältesten Eintrag verwerfen (Dicts behalten die Einfügereihenfolge)
+            del self._memory[next(iter(self._memory))]
+
+
+_default_cache: Optional[QueryCache] = None
+_default_lock = threading.Lock()
+
+
+def get_cache() -> QueryCache:
+    """
+    Prozessweiter Cache im Anwendungsordner (wird beim ersten Aufruf geöffnet)
+
+    Der Ordner folgt get_app_base_path() und lässt sich über UD_APP_DIR umlenken.
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                try:
+                    from path_helper import get_app_base_path
+                    db_path = get_app_base_path() / CACHE_FILE
+                except Exception:
+                    db_path = Path.home() / ".universal-downloader" / CACHE_FILE
+                _default_cache = QueryCache(db_path)
+    return _default_cache
+
+
+def reset_cache():
+    """Schließt den prozessweiten Cache; get_cache() öffnet danach neu (z.B. nach Änderung von UD_APP_DIR)"""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is not None:
+            _default_cache.close()
+            _default_cache = None
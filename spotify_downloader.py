@@ -5,13 +5,26 @@ Spotify Downloader für privaten Gebrauch
 Lädt Musik von Spotify herunter (über YouTube/Deezer-Fallback)
 """
 
+import os
 import re
 import json
+import time
 import requests
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Callable, Optional, Dict, List, Tuple, Deque
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import subprocess
+import tempfile
+import threading
+
+import match_ranking
+import identity_store
+import metrics
+import query_cache
+import token_broker
+from log_writer import LOG_HISTORY_LIMIT, RESULT_HISTORY_LIMIT
 
 # Import Deezer Downloader für Fallback
 try:
@@ -25,6 +38,23 @@ try:
 except ImportError:
     VideoDownloader = None
 
+# Versuche mutagen zu importieren (ID3-Tags aus den Spotify-Metadaten)
+try:
+    from mutagen.id3 import ID3, ID3NoHeaderError, TIT2, TPE1, TALB
+except ImportError:
+    ID3 = None
+
+# Spotify Web API: Obergrenzen der Mehrfach-Endpunkte und Seitengrößen
+SPOTIFY_API_URL = "https://api.spotify.com/v1"
+TRACKS_PER_REQUEST = 50
+ALBUMS_PER_REQUEST = 20
+PLAYLIST_PAGE_SIZE = 100
+ALBUM_PAGE_SIZE = 50
+API_WORKERS = 4  # Gleichzeitige Anfragen für weitere Seiten/Batches
+
+# Gleichzeitige Track-Downloads bei Playlists, Alben und Artists
+TRACK_WORKERS = 3
+
 
 class SpotifyDownloader:
     """Hauptklasse für Spotify-Downloads (über Fallback zu YouTube/Deezer)"""
@@ -62,17 +92,27 @@ class SpotifyDownloader:
         # Spotify Web API (für öffentliche Daten, kein Login nötig)
         # Client-ID und Secret können über https://developer.spotify.com/dashboard erstellt werden
         # Für öffentliche Daten ist ein einfacher Client ausreichend
+        # Access-Tokens verwaltet der gemeinsame TokenBroker (über Instanzen und Prozesse hinweg)
         self.spotify_client_id = None
         self.spotify_client_secret = None
-        self.spotify_access_token = None
-        self.spotify_token_expires_at = None
         
         # Lade gespeicherte Credentials
         self._load_spotify_credentials()
         
-        # Download-Statistiken
-        self.download_results: List[Dict] = []
-        self.download_log: List[str] = []
+        # Download-Statistiken (begrenzt, damit lange Sitzungen nicht unbegrenzt Speicher belegen)
+        self.download_results: Deque[Dict] = deque(maxlen=RESULT_HISTORY_LIMIT)
+        self.download_log: Deque[str] = deque(maxlen=LOG_HISTORY_LIMIT)
+        
+        # Parallele Track-Downloads (abbrechbar über cancel(); download_from_url setzt ein neues Event)
+        self.max_workers = TRACK_WORKERS
+        self.cancel_event = threading.Event()
+        # Zieldateien laufender Downloads (gleicher Künstler + Titel, z.B. Single und Album-Version)
+        self._active_paths = set()
+        self._active_paths_lock = threading.Lock()
+    
+    def cancel(self):
+        """Bricht laufende Playlist-/Album-Downloads ab (noch nicht begonnene Tracks entfallen)"""
+        self.cancel_event.set()
     
     def log(self, message: str, level: str = "INFO"):
         """Fügt eine Nachricht zum Log hinzu"""
@@ -101,8 +141,7 @@ class SpotifyDownloader:
                 'client_id': self.spotify_client_id,
                 'client_secret': self.spotify_client_secret
             }
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            token_broker.write_private_json(config_file, config)
         except Exception as e:
             self.log(f"Fehler beim Speichern der Spotify-Credentials: {e}", "WARNING")
     
@@ -114,18 +153,23 @@ class SpotifyDownloader:
             client_id: Spotify Client ID
             client_secret: Spotify Client Secret
         """
+        self.invalidate_spotify_token()  # Token der alten Credentials verwerfen
         self.spotify_client_id = client_id
         self.spotify_client_secret = client_secret
-        self.spotify_access_token = None  # Token zurücksetzen
-        self.spotify_token_expires_at = None
         self._save_spotify_credentials()
         self.log("Spotify API Credentials gespeichert", "INFO")
     
+    def _spotify_token_key(self) -> str:
+        return f"spotify:{self.spotify_client_id}"
+    
     def get_spotify_access_token(self) -> Optional[str]:
         """
         Ruft ein Access-Token für die Spotify Web API ab
         Verwendet Client Credentials Flow (für öffentliche Daten)
         
+        Das Token wird über token_broker mit allen Instanzen geteilt und
+        kurz vor Ablauf erneuert.
+        
         Returns:
             Access-Token oder None
         """
@@ -133,13 +177,25 @@ class SpotifyDownloader:
         if not self.spotify_client_id or not self.spotify_client_secret:
             return None
         
-        # Wenn bereits ein gültiges Token vorhanden ist, verwende es
-        if self.spotify_access_token and self.spotify_token_expires_at:
-            from datetime import datetime, timedelta
-            if datetime.now() < self.spotify_token_expires_at:
-                return self.spotify_access_token
+        return token_broker.get_broker().get_token(self._spotify_token_key(), self._request_spotify_token)
+    
+    def invalidate_spotify_token(self, access_token: Optional[str] = None):
+        """
+        Verwirft das gemeinsame Token (z.B. nach 401)
+        
+        Args:
+            access_token: Abgelehntes Token; ein inzwischen erneuertes bleibt erhalten
+        """
+        if self.spotify_client_id:
+            token_broker.get_broker().invalidate(self._spotify_token_key(), access_token)
+    
+    def _request_spotify_token(self) -> Optional[Tuple[str, float]]:
+        """
+        Fordert ein neues Token beim Token-Endpunkt an
         
-        # Hole neues Token
+        Returns:
+            (Token, Gültigkeit in Sekunden) oder None
+        """
         try:
             import base64
             
@@ -163,14 +219,11 @@ class SpotifyDownloader:
             
             if response.status_code == 200:
                 token_data = response.json()
-                self.spotify_access_token = token_data.get('access_token')
+                access_token = token_data.get('access_token')
                 expires_in = token_data.get('expires_in', 3600)  # Standard: 1 Stunde
                 
-                from datetime import datetime, timedelta
-                self.spotify_token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)  # 1 Minute Puffer
-                
                 self.log("Spotify Access-Token erfolgreich abgerufen", "INFO")
-                return self.spotify_access_token
+                return (access_token, expires_in) if access_token else None
             else:
                 self.log(f"Fehler beim Abrufen des Access-Tokens: {response.status_code}", "ERROR")
                 if response.status_code == 401:
@@ -181,6 +234,203 @@ class SpotifyDownloader:
             self.log(f"Fehler beim Abrufen des Access-Tokens: {e}", "ERROR")
             return None
     
+    def _api_get(self, path: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        GET-Anfrage an die Spotify Web API
+        
+        Bei 401 wird das Token einmal erneuert, bei 429 einmal gemäß Retry-After gewartet.
+        
+        Args:
+            path: Pfad relativ zu /v1 (z.B. 'tracks')
+            params: Query-Parameter
+            
+        Returns:
+            JSON-Antwort oder None
+        """
+        for attempt in range(2):
+            access_token = self.get_spotify_access_token()
+            if not access_token:
+                return None
+            
+            try:
+                response = self.session.get(
+                    f"{SPOTIFY_API_URL}/{path}",
+                    headers={'Authorization': f'Bearer {access_token}'},
+                    params=params,
+                    timeout=10
+                )
+            except requests.RequestException as e:
+                self.log(f"Fehler bei Spotify API-Aufruf: {e}", "ERROR")
+                return None
+            
+            if response.status_code == 200:
+                return response.json()
+            if response.status_code == 401 and attempt == 0:
+                # Token abgelaufen oder ungültig
+                self.invalidate_spotify_token(access_token)
+                continue
+            if response.status_code == 429 and attempt == 0:
+                try:
+                    retry_after = float(response.headers.get('Retry-After', 1))
+                except ValueError:
+                    retry_after = 1
+                time.sleep(min(max(retry_after, 0), 10))
+                continue
+            
+            self.log(f"Spotify API Fehler: {response.status_code} - {response.text[:200]}", "ERROR")
+            return None
+        return None
+    
+    def _api_get_all(self, requests_list: List[Tuple[str, Dict]]) -> List[Optional[Dict]]:
+        """
+        Führt mehrere API-Anfragen aus, ab der zweiten parallel
+        
+        Die erste Anfrage läuft allein, damit ein fehlendes Token nur einmal geholt wird.
+        
+        Returns:
+            Antworten in der Reihenfolge der Anfragen (None bei Fehler)
+        """
+        if not requests_list:
+            return []
+        
+        first_path, first_params = requests_list[0]
+        responses = [self._api_get(first_path, first_params)]
+        rest = requests_list[1:]
+        if rest:
+            with ThreadPoolExecutor(max_workers=min(API_WORKERS, len(rest))) as executor:
+                responses.extend(executor.map(lambda request: self._api_get(*request), rest))
+        return responses
+    
+    def _api_get_pages(self, path: str, page_size: int, params: Optional[Dict] = None,
+                       first_page: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """
+        Lädt alle Einträge eines seitenweisen Endpunkts (Paging-Objekt mit items/total)
+        
+        Die erste Seite liefert 'total', alle weiteren Seiten werden parallel angefragt.
+        
+        Args:
+            path: Pfad relativ zu /v1
+            page_size: Einträge pro Seite (Obergrenze des Endpunkts)
+            params: Zusätzliche Query-Parameter
+            first_page: Bereits vorhandene erste Seite (z.B. in einem Album eingebettet)
+            
+        Returns:
+            Einträge in Originalreihenfolge oder None, wenn die erste Seite fehlschlägt
+        """
+        params = dict(params or {})
+        if first_page is None:
+            first_page = self._api_get(path, {**params, 'limit': page_size, 'offset': 0})
+            if first_page is None:
+                return None
+        
+        items = list(first_page.get('items', []))
+        offsets = range(len(items), first_page.get('total') or 0, page_size)
+        if len(offsets) == 0 or not items:
+            return items
+        
+        pages = self._api_get_all([(path, {**params, 'limit': page_size, 'offset': offset}) for offset in offsets])
+        for offset, page in zip(offsets, pages):
+            if page is None:
+                self.log(f"Spotify API: Einträge ab Position {offset} konnten nicht geladen werden", "WARNING")
+                continue
+            items.extend(page.get('items', []))
+        return items
+    
+    @staticmethod
+    def _track_from_api(track: Dict, album_name: Optional[str] = None) -> Dict:
+        """Wandelt ein Track-Objekt der Web API in ein Track-Dictionary um"""
+        return {
+            'id': track['id'],
+            'title': track['name'],
+            'artist': ', '.join([artist['name'] for artist in track.get('artists', [])]),
+            'album': album_name if album_name is not None else (track.get('album') or {}).get('name', ''),
+            'duration': track.get('duration_ms', 0) // 1000,
+            'url': (track.get('external_urls') or {}).get('spotify') or f"https://open.spotify.com/track/{track['id']}",
+            'isrc': (track.get('external_ids') or {}).get('isrc')  # Fehlt bei Album-Tracks (vereinfachte Objekte)
+        }
+    
+    @metrics.instrument('spotify_api', 'spotify')
+    def get_tracks_batch(self, track_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Ruft mehrere Tracks über /v1/tracks?ids= ab (bis zu 50 pro Anfrage)
+        
+        Args:
+            track_ids: Spotify Track-IDs (Duplikate werden ignoriert)
+            
+        Returns:
+            Track-ID → Track-Dictionary (nicht gefundene IDs fehlen)
+        """
+        ids = list(dict.fromkeys(track_ids))
+        batches = [ids[i:i + TRACKS_PER_REQUEST] for i in range(0, len(ids), TRACKS_PER_REQUEST)]
+        responses = self._api_get_all([('tracks', {'ids': ','.join(batch)}) for batch in batches])
+        
+        tracks = {}
+        for batch, response in zip(batches, responses):
+            # Antwort enthält die Tracks in Anfragereihenfolge, null für unbekannte IDs
+            for track_id, track in zip(batch, (response or {}).get('tracks', [])):
+                if track and track.get('id'):
+                    tracks[track_id] = self._track_from_api(track)
+        return tracks
+    
+    @metrics.instrument('spotify_api', 'spotify')
+    def get_albums_batch(self, album_ids: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Ruft die Tracks mehrerer Alben über /v1/albums?ids= ab (bis zu 20 pro Anfrage)
+        
+        Alben enthalten die ersten 50 Tracks; längere Alben werden seitenweise nachgeladen.
+        
+        Args:
+            album_ids: Spotify Album-IDs
+            
+        Returns:
+            Album-ID → Liste von Track-Dictionaries (mit Albumname)
+        """
+        ids = list(dict.fromkeys(album_ids))
+        batches = [ids[i:i + ALBUMS_PER_REQUEST] for i in range(0, len(ids), ALBUMS_PER_REQUEST)]
+        responses = self._api_get_all([('albums', {'ids': ','.join(batch)}) for batch in batches])
+        
+        albums = {}
+        for batch, response in zip(batches, responses):
+            for album_id, album in zip(batch, (response or {}).get('albums', [])):
+                if not album:
+                    continue
+                items = self._api_get_pages(f"albums/{album_id}/tracks", ALBUM_PAGE_SIZE,
+                                            first_page=album.get('tracks') or {})
+                albums[album_id] = [
+                    self._track_from_api(item, album.get('name', ''))
+                    for item in items or [] if item and item.get('id')
+                ]
+        return albums
+    
+    def hydrate_tracks(self, track_ids: List[str]) -> List[Dict]:
+        """
+        Ergänzt Track-IDs (z.B. aus yt-dlp oder dem HTML) zu Track-Dictionaries
+        
+        Nutzt den Mehrfach-Endpunkt der Web API. Nur ohne API-Zugang wird jeder
+        Track einzeln über get_track_info (yt-dlp/Web-Scraping) abgefragt.
+        
+        Args:
+            track_ids: Spotify Track-IDs in gewünschter Reihenfolge
+            
+        Returns:
+            Liste von Track-Dictionaries (Reihenfolge bleibt erhalten)
+        """
+        ids = list(dict.fromkeys(track_ids))
+        if not ids:
+            return []
+        
+        if self.get_spotify_access_token():
+            tracks = self.get_tracks_batch(ids)
+            return [tracks[track_id] for track_id in ids if track_id in tracks]
+        
+        tracks = []
+        for track_id in ids:
+            track_info = self.get_track_info(track_id)
+            if track_info:
+                tracks.append(track_info)
+        return tracks
+    
+    @metrics.instrument('spotify_api', 'spotify')
     def get_artist_tracks_via_api(self, artist_id: str, limit: int = 50) -> List[Dict]:
         """
         Ruft Artist-Tracks über die Spotify Web API ab
@@ -230,8 +480,7 @@ class SpotifyDownloader:
                 return tracks
             elif response.status_code == 401:
                 # Token abgelaufen oder ungültig
-                self.spotify_access_token = None
-                self.spotify_token_expires_at = None
+                self.invalidate_spotify_token(access_token)
                 # Versuche erneut mit neuem Token
                 access_token = self.get_spotify_access_token()
                 if access_token:
@@ -254,135 +503,38 @@ class SpotifyDownloader:
         Returns:
             Liste von Track-Dictionaries
         """
-        tracks = []
-        
-        # Hole Access-Token
-        access_token = self.get_spotify_access_token()
-        if not access_token:
+        if not self.get_spotify_access_token():
             return []
         
-        try:
-            # API-Endpoint für Album Tracks
-            api_url = f"https://api.spotify.com/v1/albums/{album_id}/tracks"
-            
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            # Spotify API limitiert auf 50 Tracks pro Request
-            offset = 0
-            limit = 50
-            
-            while True:
-                response = self.session.get(
-                    api_url,
-                    headers=headers,
-                    params={'limit': limit, 'offset': offset},
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get('items', [])
-                    
-                    if not items:
-                        break
-                    
-                    for item in items:
-                        tracks.append({
-                            'id': item['id'],
-                            'title': item['name'],
-                            'artist': ', '.join([artist['name'] for artist in item.get('artists', [])]),
-                            'album': '',  # Wird später gefüllt
-                            'duration': item.get('duration_ms', 0) // 1000,
-                            'url': f"https://open.spotify.com/track/{item['id']}"
-                        })
-                    
-                    # Prüfe ob weitere Tracks vorhanden sind
-                    if not data.get('next'):
-                        break
-                    
-                    offset += limit
-                else:
-                    break
-            
-            if tracks:
-                self.log(f"✓ {len(tracks)} Tracks über Spotify API gefunden", "SUCCESS")
-            
-        except Exception as e:
-            self.log(f"Fehler bei Spotify API-Aufruf: {e}", "ERROR")
-        
+        tracks = self.get_albums_batch([album_id]).get(album_id, [])
+        if tracks:
+            self.log(f"✓ {len(tracks)} Tracks über Spotify API gefunden", "SUCCESS")
         return tracks
     
+    @metrics.instrument('spotify_api', 'spotify')
     def get_playlist_tracks_via_api(self, playlist_id: str) -> List[Dict]:
         """
         Ruft Playlist-Tracks über die Spotify Web API ab
         
+        Seiten à 100 Einträge; nach der ersten Seite werden die übrigen parallel geladen.
+        
         Args:
             playlist_id: Spotify Playlist-ID
             
         Returns:
             Liste von Track-Dictionaries
         """
-        tracks = []
-        
-        # Hole Access-Token
-        access_token = self.get_spotify_access_token()
-        if not access_token:
+        if not self.get_spotify_access_token():
             return []
         
-        try:
-            # API-Endpoint für Playlist Tracks
-            api_url = f"https://api.spotify.com/v1/playlists/{playlist_id}/tracks"
-            
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            offset = 0
-            limit = 50
-            
-            while True:
-                response = self.session.get(
-                    api_url,
-                    headers=headers,
-                    params={'limit': limit, 'offset': offset, 'market': 'DE'},
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get('items', [])
-                    
-                    if not items:
-                        break
-                    
-                    for item in items:
-                        track = item.get('track')
-                        if track:
-                            tracks.append({
-                                'id': track['id'],
-                                'title': track['name'],
-                                'artist': ', '.join([artist['name'] for artist in track.get('artists', [])]),
-                                'album': track.get('album', {}).get('name', ''),
-                                'duration': track.get('duration_ms', 0) // 1000,
-                                'url': track['external_urls']['spotify']
-                            })
-                    
-                    if not data.get('next'):
-                        break
-                    
-                    offset += limit
-                else:
-                    break
-            
-            if tracks:
-                self.log(f"✓ {len(tracks)} Tracks über Spotify API gefunden", "SUCCESS")
+        items = self._api_get_pages(f"playlists/{playlist_id}/tracks", PLAYLIST_PAGE_SIZE, {'market': 'DE'})
+        tracks = [
+            self._track_from_api(item['track'])
+            for item in items or [] if item.get('track') and item['track'].get('id')
+        ]
         
-        except Exception as e:
-            self.log(f"Fehler bei Spotify API-Aufruf: {e}", "ERROR")
+        if tracks:
+            self.log(f"✓ {len(tracks)} Tracks über Spotify API gefunden", "SUCCESS")
         
         return tracks
     
@@ -416,9 +568,10 @@ class SpotifyDownloader:
         
         return None
     
+    @metrics.instrument('spotify_api', 'spotify', success=lambda result: result is not None)
     def get_track_info(self, track_id: str) -> Optional[Dict]:
         """
-        Ruft Track-Informationen ab (über yt-dlp oder Web-Scraping)
+        Ruft Track-Informationen ab (über die Web API, sonst yt-dlp oder Web-Scraping)
         
         Args:
             track_id: Spotify Track-ID
@@ -426,6 +579,11 @@ class SpotifyDownloader:
         Returns:
             Dictionary mit Track-Informationen oder None
         """
+        if self.get_spotify_access_token():
+            track_info = self.get_tracks_batch([track_id]).get(track_id)
+            if track_info:
+                return track_info
+        
         try:
             # Versuche Track-Info über yt-dlp zu bekommen
             spotify_url = f"https://open.spotify.com/track/{track_id}"
@@ -492,6 +650,25 @@ class SpotifyDownloader:
         
         return None
     
+    @staticmethod
+    def _track_ids_from_ytdlp(output: str) -> List[str]:
+        """Extrahiert Track-IDs aus der --flat-playlist-Ausgabe von yt-dlp (eine JSON-Zeile pro Eintrag)"""
+        track_ids = []
+        for line in output.strip().split('\n'):
+            if not line:
+                continue
+            try:
+                info = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            track_url = info.get('url') or info.get('webpage_url', '')
+            
+            # Extrahiere Track-ID aus URL
+            track_match = re.search(r'/track/([a-zA-Z0-9]+)', track_url)
+            if track_match:
+                track_ids.append(track_match.group(1))
+        return track_ids
+    
     def get_playlist_tracks(self, playlist_id: str) -> List[Dict]:
         """
         Ruft alle Tracks einer Playlist ab
@@ -529,21 +706,7 @@ class SpotifyDownloader:
             )
             
             if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        try:
-                            info = json.loads(line)
-                            track_url = info.get('url') or info.get('webpage_url', '')
-                            
-                            # Extrahiere Track-ID aus URL
-                            track_match = re.search(r'/track/([a-zA-Z0-9]+)', track_url)
-                            if track_match:
-                                track_id = track_match.group(1)
-                                track_info = self.get_track_info(track_id)
-                                if track_info:
-                                    tracks.append(track_info)
-                        except json.JSONDecodeError:
-                            continue
+                tracks = self.hydrate_tracks(self._track_ids_from_ytdlp(result.stdout))
             
             # Fallback: Versuche Web-Scraping
             if not tracks:
@@ -552,11 +715,7 @@ class SpotifyDownloader:
                     # Suche nach Track-Links im HTML
                     html = response.text
                     track_matches = re.findall(r'spotify\.com/track/([a-zA-Z0-9]+)', html)
-                    
-                    for track_id in set(track_matches):  # Entferne Duplikate
-                        track_info = self.get_track_info(track_id)
-                        if track_info:
-                            tracks.append(track_info)
+                    tracks = self.hydrate_tracks(track_matches)
         
         except Exception as e:
             self.log(f"Fehler beim Abrufen der Playlist: {e}", "ERROR")
@@ -627,20 +786,20 @@ class SpotifyDownloader:
                     
                     self.log(f"Gefunden: {len(set(track_matches))} Track-Links im HTML")
                     
-                    for track_id in set(track_matches)[:limit]:
-                        track_info = self.get_track_info(track_id)
-                        if track_info:
-                            tracks.append(track_info)
+                    tracks.extend(self.hydrate_tracks(list(dict.fromkeys(track_matches))[:limit]))
                 
                 # Methode 4: Suche nach Album-Links und lade deren Tracks
                 if len(tracks) < limit:
                     album_matches = re.findall(r'spotify\.com/album/([a-zA-Z0-9]{22})', html)
                     self.log(f"Gefunden: {len(set(album_matches))} Album-Links")
                     
-                    for album_id in set(album_matches)[:5]:  # Maximal 5 Alben
+                    album_ids = list(dict.fromkeys(album_matches))[:5]  # Maximal 5 Alben
+                    # Mit API-Zugang alle Alben in einer Anfrage, sonst einzeln
+                    albums = self.get_albums_batch(album_ids) if self.get_spotify_access_token() else {}
+                    for album_id in album_ids:
                         if len(tracks) >= limit:
                             break
-                        album_tracks = self.get_album_tracks(album_id)
+                        album_tracks = albums.get(album_id) or self.get_album_tracks(album_id)
                         for track in album_tracks:
                             if len(tracks) >= limit:
                                 break
@@ -683,6 +842,12 @@ class SpotifyDownloader:
         Returns:
             Liste von Track-Dictionaries
         """
+        # Versuche zuerst über API
+        api_tracks = self.get_album_tracks_via_api(album_id)
+        if api_tracks:
+            return api_tracks
+        
+        # Fallback zu yt-dlp/Web-Scraping
         tracks = []
         spotify_url = f"https://open.spotify.com/album/{album_id}"
         
@@ -704,21 +869,7 @@ class SpotifyDownloader:
             )
             
             if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        try:
-                            info = json.loads(line)
-                            track_url = info.get('url') or info.get('webpage_url', '')
-                            
-                            # Extrahiere Track-ID aus URL
-                            track_match = re.search(r'/track/([a-zA-Z0-9]+)', track_url)
-                            if track_match:
-                                track_id = track_match.group(1)
-                                track_info = self.get_track_info(track_id)
-                                if track_info:
-                                    tracks.append(track_info)
-                        except json.JSONDecodeError:
-                            continue
+                tracks = self.hydrate_tracks(self._track_ids_from_ytdlp(result.stdout))
             
             # Fallback: Versuche Web-Scraping
             if not tracks:
@@ -726,55 +877,192 @@ class SpotifyDownloader:
                 if response.status_code == 200:
                     html = response.text
                     track_matches = re.findall(r'spotify\.com/track/([a-zA-Z0-9]+)', html)
-                    
-                    for track_id in set(track_matches):
-                        track_info = self.get_track_info(track_id)
-                        if track_info:
-                            tracks.append(track_info)
+                    tracks = self.hydrate_tracks(track_matches)
         
         except Exception as e:
             self.log(f"Fehler beim Abrufen der Album-Tracks: {e}", "ERROR")
         
         return tracks
     
-    def search_track_on_youtube(self, track_info: Dict) -> Optional[str]:
+    @metrics.instrument('youtube_search', 'spotify', success=lambda result: result is not None)
+    def search_track_on_youtube(self, track_info: Dict) -> Optional[Dict]:
         """
         Sucht einen Track auf YouTube
         
+        Bewertet die ersten Treffer (Titel, Dauer, Kanal) und liefert nur einen
+        ausreichend passenden - lieber kein Treffer als ein Cover oder Live-Mitschnitt.
+        Bei einer frischen Suche enthält der Treffer unter 'info' das Info-Dict von
+        yt-dlp, das _download_youtube_audio ohne erneute Extraktion weiterverwendet.
+        
         Args:
             track_info: Dictionary mit Track-Informationen
             
         Returns:
-            YouTube-URL oder None
+            Treffer {'url', 'title', 'confidence', 'reasons', ...} oder None
         """
+        # Gleiche Suchen (z.B. bei Künstler-Downloads) nicht erneut an yt-dlp schicken
+        cache = query_cache.get_cache()
+        cache_key = (track_info['artist'], track_info['title'], track_info.get('duration') or 0)
+        cached_match = cache.get('youtube_match', cache_key)
+        if cached_match is not query_cache.MISS:
+            return cached_match
+        
         try:
             search_query = f"{track_info['artist']} {track_info['title']}"
             
             from yt_dlp_helper import get_ytdlp_command
-            cmd = get_ytdlp_command() + [
-                '--dump-json',
-                f'ytsearch1:{search_query}'
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
+            match, ranked = match_ranking.find_best_match(
+                search_query, track_info['title'], track_info['artist'],
+                duration=track_info.get('duration') or None,
+                command=get_ytdlp_command(),
+                keep_info=True
             )
             
-            if result.returncode == 0:
-                try:
-                    info = json.loads(result.stdout)
-                    return info.get('webpage_url') or info.get('url')
-                except json.JSONDecodeError:
-                    pass
+            if ranked is not None:
+                if match:
+                    self.log(f"  → YouTube-Treffer: {match_ranking.describe(match)}")
+                elif ranked:
+                    self.log(f"  ⚠ Kein ausreichend passender YouTube-Treffer (bester: {match_ranking.describe(ranked[0])})", "WARNING")
+                cache.put('youtube_match', cache_key, match_ranking.without_info(match))
+                return match
         
         except Exception as e:
             self.log(f"Fehler bei YouTube-Suche: {e}", "ERROR")
         
         return None
     
+    @staticmethod
+    def _safe_filename(name: str) -> str:
+        """Entfernt Zeichen, die in Dateinamen nicht erlaubt sind"""
+        return re.sub(r'[<>:"/\\|?*]', '_', name).strip('. ')[:200]
+    
+    def _reserve_output_path(self, output_dir: Path, track_name: str, track_id: Optional[str]) -> Path:
+        """
+        Zieldatei für einen Track, die kein paralleler Download gerade beschreibt
+        
+        Kollidiert "Künstler - Titel.mp3" mit einem laufenden Download, wird die
+        Track-ID angehängt. Freigeben mit _release_output_path.
+        """
+        base = self._safe_filename(track_name)
+        path = output_dir / f"{base}.mp3"
+        with self._active_paths_lock:
+            if path in self._active_paths and track_id:
+                base = f"{base} [{self._safe_filename(str(track_id))}]"
+                path = output_dir / f"{base}.mp3"
+            counter = 2
+            while path in self._active_paths:
+                path = output_dir / f"{base} ({counter}).mp3"
+                counter += 1
+            self._active_paths.add(path)
+        return path
+    
+    def _release_output_path(self, path: Path):
+        with self._active_paths_lock:
+            self._active_paths.discard(path)
+    
+    @metrics.instrument('youtube_download', 'spotify', success=lambda result: result is not None)
+    def _download_youtube_audio(self, match: Dict, output_path: Path) -> Optional[Path]:
+        """
+        Lädt die Audiospur eines YouTube-Treffers als MP3
+        
+        Enthält der Treffer das Info-Dict der Suche, übernimmt yt-dlp es per
+        --load-info-json und lädt direkt - die Seite wird kein zweites Mal
+        extrahiert. Ohne Info-Dict (Treffer aus dem Cache) extrahiert yt-dlp einmal.
+        Metadaten schreibt der Aufrufer aus den Spotify-Daten.
+        
+        Args:
+            match: Treffer aus search_track_on_youtube
+            output_path: Zieldatei (.mp3)
+            
+        Returns:
+            Pfad der MP3-Datei oder None
+        """
+        from yt_dlp_helper import run_ytdlp
+        
+        info_file = None
+        try:
+            if match.get('info'):
+                with tempfile.NamedTemporaryFile('w', suffix='.info.json', delete=False, encoding='utf-8') as f:
+                    json.dump(match['info'], f)
+                    info_file = f.name
+                source_args = ['--load-info-json', info_file]
+            else:
+                source_args = [match['url']]
+            
+            result = run_ytdlp(source_args + [
+                '-x',
+                '--audio-format', 'mp3',
+                '--audio-quality', '0',
+                '-f', 'bestaudio/best',
+                '--no-playlist',
+                '--no-warnings',
+                '-o', str(output_path.with_suffix('.%(ext)s'))
+            ], capture_output=True, text=True, timeout=300)
+            
+            if result.returncode == 0 and output_path.exists() and output_path.stat().st_size > 0:
+                metrics.add_bytes('youtube_download', 'spotify', output_path.stat().st_size)
+                return output_path
+            
+            error_output = (result.stderr or result.stdout or '').strip().splitlines()
+            self.log(f"  ✗ yt-dlp: {error_output[-1] if error_output else 'keine Datei erzeugt'}", "ERROR")
+        except Exception as e:
+            self.log(f"  ✗ YouTube-Download fehlgeschlagen: {e}", "ERROR")
+        finally:
+            if info_file:
+                try:
+                    os.unlink(info_file)
+                except OSError:
+                    pass
+        return None
+    
+    @metrics.instrument('tagging', 'spotify')
+    def _write_tags(self, file_path: Path, track_info: Dict):
+        """Schreibt Titel, Künstler und Album aus den Spotify-Daten als ID3-Tags"""
+        if ID3 is None:
+            return
+        try:
+            try:
+                tags = ID3(str(file_path))
+            except ID3NoHeaderError:
+                tags = ID3()
+            tags['TIT2'] = TIT2(encoding=3, text=track_info['title'])
+            tags['TPE1'] = TPE1(encoding=3, text=track_info['artist'])
+            if track_info.get('album') and track_info['album'] != 'Unknown':
+                tags['TALB'] = TALB(encoding=3, text=track_info['album'])
+            tags.save(str(file_path))
+        except Exception as e:
+            metrics.count_error('tagging', 'spotify')
+            self.log(f"Fehler beim Hinzufügen der Metadaten: {e}", "WARNING")
+    
+    def _find_deezer_track_id(self, track_info: Dict, known: Optional[Dict] = None) -> Optional[str]:
+        """
+        Ermittelt die Deezer-ID eines Spotify-Tracks
+        
+        Reihenfolge: bekannte Identität, exakte ISRC-Abfrage, Textsuche.
+        
+        Returns:
+            Deezer Track-ID oder None
+        """
+        if known and known.get('deezer_id'):
+            return known['deezer_id']
+        
+        if track_info.get('isrc'):
+            response = self.session.get(f"https://api.deezer.com/track/isrc:{track_info['isrc']}", timeout=10)
+            if response.status_code == 200:
+                data = response.json()
+                if data.get('id') and 'error' not in data:
+                    return str(data['id'])
+        
+        # Suche Track auf Deezer
+        search_query = f"{track_info['artist']} {track_info['title']}"
+        response = self.session.get("https://api.deezer.com/search", params={'q': search_query, 'limit': 1}, timeout=10)
+        if response.status_code == 200:
+            data = response.json()
+            if data.get('data'):
+                return str(data['data'][0]['id'])
+        return None
+    
+    @metrics.instrument('track', 'spotify', success=lambda result: result.get('success'))
     def download_track(self, track_info: Dict, output_dir: Optional[Path] = None) -> Dict:
         """
         Lädt einen Track herunter (über YouTube/Deezer-Fallback)
@@ -795,63 +1083,83 @@ class SpotifyDownloader:
         track_name = f"{track_info['artist']} - {track_info['title']}"
         self.log(f"Lade Track herunter: {track_name}")
         
-        # Methode 1: Versuche YouTube
-        youtube_url = self.search_track_on_youtube(track_info)
-        if youtube_url and self.video_downloader:
+        # Schon über einen anderen Dienst geladen? Dann weder suchen noch erneut herunterladen
+        identity = identity_store.get_store()
+        identity_keys = {
+            'isrc': track_info.get('isrc'),
+            'spotify_id': track_info.get('id'),
+            'artist': track_info['artist'],
+            'title': track_info['title'],
+            'duration': track_info.get('duration') or None
+        }
+        known = identity.lookup(**identity_keys)
+        existing_file = identity.library_file(known)
+        if existing_file:
+            identity.remember(**identity_keys)
+            self.log(f"  ✓ Bereits in der Bibliothek: {existing_file}", "SUCCESS")
+            return {
+                'success': True,
+                'source': 'Bibliothek',
+                'file_path': existing_file,
+                'track_info': track_info
+            }
+        
+        # Methode 1: Versuche YouTube (bekannter Treffer zuerst, sonst Suche)
+        youtube_match = None
+        if known and known.get('youtube_id'):
+            youtube_match = {
+                'video_id': known['youtube_id'],
+                'url': f"https://www.youtube.com/watch?v={known['youtube_id']}",
+                'confidence': known.get('youtube_confidence')
+            }
+        else:
+            youtube_match = self.search_track_on_youtube(track_info)
+        if youtube_match:
             self.log(f"  → Versuche Download über YouTube...")
+            output_path = self._reserve_output_path(output_dir, track_name, track_info.get('id'))
             try:
-                success, file_path, error = self.video_downloader.download_video(
-                    url=youtube_url,
-                    output_dir=output_dir,
-                    quality="best",
-                    output_format="mp3"
-                )
+                new_path = self._download_youtube_audio(youtube_match, output_path)
                 
-                if success and file_path:
-                    # Benenne Datei um (falls nötig)
-                    new_path = output_dir / f"{track_name}.mp3"
-                    if file_path != new_path:
-                        file_path.rename(new_path)
+                if new_path:
+                    self._write_tags(new_path, track_info)
+                    identity.remember(youtube_id=youtube_match.get('video_id'),
+                                      youtube_confidence=youtube_match.get('confidence'),
+                                      file_path=new_path, **identity_keys)
                     
                     self.log(f"  ✓ Erfolgreich von YouTube heruntergeladen: {new_path}", "SUCCESS")
                     return {
                         'success': True,
                         'source': 'YouTube',
                         'file_path': new_path,
-                        'track_info': track_info
+                        'track_info': track_info,
+                        'match_confidence': youtube_match.get('confidence')
                     }
             except Exception as e:
                 self.log(f"  ✗ YouTube-Download fehlgeschlagen: {e}", "ERROR")
+            finally:
+                self._release_output_path(output_path)
         
         # Methode 2: Versuche Deezer (falls verfügbar)
         if self.deezer_downloader:
             self.log(f"  → Versuche Download über Deezer...")
             try:
-                # Suche Track auf Deezer
-                search_query = f"{track_info['artist']} {track_info['title']}"
-                deezer_url = f"https://api.deezer.com/search?q={search_query}&limit=1"
-                
-                response = self.session.get(deezer_url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get('data') and len(data['data']) > 0:
-                        deezer_track = data['data'][0]
-                        deezer_track_id = str(deezer_track['id'])
-                        
-                        result = self.deezer_downloader.download_track(
-                            track_id=deezer_track_id,
-                            output_dir=output_dir,
-                            use_youtube_fallback=True
-                        )
-                        
-                        if result.success:
-                            self.log(f"  ✓ Erfolgreich von Deezer heruntergeladen: {result.file_path}", "SUCCESS")
-                            return {
-                                'success': True,
-                                'source': result.source,
-                                'file_path': result.file_path,
-                                'track_info': track_info
-                            }
+                deezer_track_id = self._find_deezer_track_id(track_info, known)
+                if deezer_track_id:
+                    result = self.deezer_downloader.download_track(
+                        track_id=deezer_track_id,
+                        output_dir=output_dir,
+                        use_youtube_fallback=True
+                    )
+                    
+                    if result.success:
+                        identity.remember(deezer_id=deezer_track_id, file_path=result.file_path, **identity_keys)
+                        self.log(f"  ✓ Erfolgreich von Deezer heruntergeladen: {result.file_path}", "SUCCESS")
+                        return {
+                            'success': True,
+                            'source': result.source,
+                            'file_path': result.file_path,
+                            'track_info': track_info
+                        }
             except Exception as e:
                 self.log(f"  ✗ Deezer-Download fehlgeschlagen: {e}", "ERROR")
         
@@ -879,17 +1187,86 @@ class SpotifyDownloader:
             'error': error_msg
         }
     
-    def download_from_url(self, url: str, output_dir: Optional[Path] = None) -> int:
+    def download_tracks(self, tracks: List[Dict], output_dir: Optional[Path] = None,
+                        max_workers: Optional[int] = None,
+                        on_result: Optional[Callable[[int, Dict], None]] = None) -> List[Dict]:
+        """
+        Lädt mehrere Tracks parallel in einem begrenzten Thread-Pool
+        
+        Vor jedem Track wird cancel_event geprüft; nach cancel() werden
+        laufende Tracks noch beendet, alle übrigen als abgebrochen markiert.
+        
+        Args:
+            tracks: Track-Dictionaries
+            output_dir: Optionales Ausgabe-Verzeichnis
+            max_workers: Gleichzeitige Downloads (Standard: self.max_workers)
+            on_result: Optional: wird je Track mit (Index, Ergebnis) aufgerufen, sobald er fertig ist
+            
+        Returns:
+            Ergebnisse in der Reihenfolge der Tracks; 'status' ist 'completed', 'failed' oder 'cancelled'
+        """
+        total = len(tracks)
+        results: List[Optional[Dict]] = [None] * total
+        
+        def run(index: int, track_info: Dict) -> Dict:
+            result = None
+            if not self.cancel_event.is_set():
+                self.log(f"[{index + 1}/{total}] {track_info['artist']} - {track_info['title']}")
+                try:
+                    result = self.download_track(track_info, output_dir)
+                except Exception as e:
+                    # Nach Abbruch (z.B. JobCancelled aus dem Download-Dienst) kein Fehler
+                    if not self.cancel_event.is_set():
+                        self.log(f"  ✗ Fehler bei {track_info['artist']} - {track_info['title']}: {e}", "ERROR")
+                        result = {'success': False, 'source': 'Fehlgeschlagen', 'track_info': track_info, 'error': str(e)}
+            
+            if result is None:
+                result = {'success': False, 'source': 'Abgebrochen', 'track_info': track_info, 'status': 'cancelled'}
+            else:
+                result['status'] = 'completed' if result.get('success') else 'failed'
+                self.download_results.append(result)
+            results[index] = result
+            if on_result:
+                on_result(index, result)
+            return result
+        
+        workers = max(1, min(max_workers or self.max_workers, total or 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='spotify-track') as executor:
+            futures = [executor.submit(run, index, track_info) for index, track_info in enumerate(tracks)]
+            for future in futures:
+                future.result()
+        
+        return results
+    
+    def _download_batch(self, tracks: List[Dict], output_dir: Path, label: str) -> int:
+        """Lädt Tracks parallel und protokolliert die Zusammenfassung; gibt die Anzahl Erfolge zurück"""
+        self.log(f"Gefunden: {len(tracks)} Track(s)")
+        
+        results = self.download_tracks(tracks, output_dir)
+        successful = sum(1 for result in results if result['status'] == 'completed')
+        cancelled = sum(1 for result in results if result['status'] == 'cancelled')
+        
+        if cancelled:
+            self.log(f"{label}-Download abgebrochen: {successful}/{len(tracks)} erfolgreich, {cancelled} übersprungen", "WARNING")
+        else:
+            self.log(f"{label}-Download abgeschlossen: {successful}/{len(tracks)} erfolgreich")
+        return successful
+    
+    def download_from_url(self, url: str, output_dir: Optional[Path] = None,
+                          cancel_event: Optional[threading.Event] = None) -> int:
         """
         Lädt basierend auf einer Spotify-URL herunter
         
         Args:
             url: Spotify-URL (Track, Album, Playlist)
             output_dir: Optionales Ausgabe-Verzeichnis
+            cancel_event: Abbruch-Signal für diesen Download (Standard: neues Event,
+                          damit ein früherer cancel() die Instanz nicht dauerhaft blockiert)
             
         Returns:
             Anzahl erfolgreich heruntergeladener Tracks
         """
+        self.cancel_event = cancel_event or threading.Event()
         parsed = self.extract_id_from_url(url)
         if not parsed:
             self.log("Ungültige Spotify-URL", "ERROR")
@@ -918,18 +1295,7 @@ class SpotifyDownloader:
                 self.log("Keine Tracks in Playlist gefunden", "ERROR")
                 return 0
             
-            self.log(f"Gefunden: {len(tracks)} Track(s)")
-            
-            successful = 0
-            for i, track_info in enumerate(tracks, 1):
-                self.log(f"[{i}/{len(tracks)}] {track_info['artist']} - {track_info['title']}")
-                result = self.download_track(track_info, output_dir)
-                self.download_results.append(result)
-                if result['success']:
-                    successful += 1
-            
-            self.log(f"Playlist-Download abgeschlossen: {successful}/{len(tracks)} erfolgreich")
-            return successful
+            return self._download_batch(tracks, output_dir, "Playlist")
         
         elif item_type == 'album':
             self.log(f"Lade Album herunter: {item_id}")
@@ -939,18 +1305,7 @@ class SpotifyDownloader:
                 self.log("Keine Tracks im Album gefunden", "ERROR")
                 return 0
             
-            self.log(f"Gefunden: {len(tracks)} Track(s)")
-            
-            successful = 0
-            for i, track_info in enumerate(tracks, 1):
-                self.log(f"[{i}/{len(tracks)}] {track_info['artist']} - {track_info['title']}")
-                result = self.download_track(track_info, output_dir)
-                self.download_results.append(result)
-                if result['success']:
-                    successful += 1
-            
-            self.log(f"Album-Download abgeschlossen: {successful}/{len(tracks)} erfolgreich")
-            return successful
+            return self._download_batch(tracks, output_dir, "Album")
         
         elif item_type == 'artist':
             self.log(f"Lade Artist-Tracks herunter: {item_id}")
@@ -962,18 +1317,7 @@ class SpotifyDownloader:
                 self.log("Keine Tracks für diesen Artist gefunden", "ERROR")
                 return 0
             
-            self.log(f"Gefunden: {len(tracks)} Track(s)")
-            
-            successful = 0
-            for i, track_info in enumerate(tracks, 1):
-                self.log(f"[{i}/{len(tracks)}] {track_info['artist']} - {track_info['title']}")
-                result = self.download_track(track_info, output_dir)
-                self.download_results.append(result)
-                if result['success']:
-                    successful += 1
-            
-            self.log(f"Artist-Download abgeschlossen: {successful}/{len(tracks)} erfolgreich")
-            return successful
+            return self._download_batch(tracks, output_dir, "Artist")
         
         else:
             self.log(f"Nicht unterstützter Spotify-Typ: {item_type}", "ERROR")
@@ -7,8 +7,12 @@ Startet die GUI-Anwendung
 
 import sys
 import os
+import time
 from pathlib import Path
 
+# Referenzzeitpunkt für die Messung der Startzeit (bis das Hauptfenster bedienbar ist)
+_STARTED_AT = time.perf_counter()
+
 # Füge das aktuelle Verzeichnis zum Python-Pfad hinzu
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -131,6 +135,11 @@ if __name__ == "__main__":
     import tempfile
     from datetime import datetime
     
+    # Headless-Modus: Download-Daemon ohne GUI (kein Single-Instance-Lock, keine Tk-Abhängigkeit)
+    if '--headless' in sys.argv:
+        from download_daemon import main as daemon_main
+        sys.exit(daemon_main([arg for arg in sys.argv[1:] if arg != '--headless']))
+    
     # Plattform-spezifische Imports für Lock-Mechanismus
     if sys.platform == "win32":
         try:
@@ -222,8 +231,16 @@ if __name__ == "__main__":
         except Exception:
             pass
     
+    # URLs/Befehle aus der Kommandozeile (werden ggf. an eine laufende Instanz übergeben)
+    from instance_ipc import parse_arguments, send_to_running_instance
+    cli_args = sys.argv[1:]
+    
     # Prüfe ob bereits eine Instanz läuft
     if not acquire_lock():
+        # Laufende Instanz erreichbar → Argumente übergeben und beenden
+        if send_to_running_instance(parse_arguments(cli_args)):
+            print("[INFO] Eine andere Instanz läuft bereits - Aufruf wurde an sie übergeben")
+            sys.exit(0)
         # Prüfe ob die andere Instanz noch läuft
         try:
             if lock_file.exists():
@@ -335,51 +352,61 @@ if __name__ == "__main__":
     else:
         debug_log("Kein Restart-Flag gefunden - normaler Start")
     
-    # Schnelle Prüfung der wichtigsten Abhängigkeiten (nicht blockierend)
-    try:
-        debug_log("Importiere auto_install_dependencies...")
-        from auto_install_dependencies import check_ytdlp, check_ffmpeg, get_app_dir
-        
-        debug_log("Prüfe yt-dlp...")
-        ytdlp_ok, ytdlp_version = check_ytdlp()
-        debug_log(f"yt-dlp Status: {'OK' if ytdlp_ok else 'FEHLT'} (Version: {ytdlp_version or 'N/A'})")
-        
-        debug_log("Prüfe ffmpeg...")
-        ffmpeg_ok, ffmpeg_version = check_ffmpeg()
-        debug_log(f"ffmpeg Status: {'OK' if ffmpeg_ok else 'FEHLT'} (Version: {ffmpeg_version or 'N/A'})")
-        
-        # Füge ffmpeg zum PATH hinzu (falls lokal installiert)
-        if not ffmpeg_ok:
-            app_dir = get_app_dir()
-            ffmpeg_bin = app_dir / "ffmpeg" / "bin"
-            debug_log(f"Prüfe lokales ffmpeg in: {ffmpeg_bin}")
-            if ffmpeg_bin.exists():
-                debug_log(f"Lokales ffmpeg gefunden - füge zum PATH hinzu")
-                os.environ['PATH'] = str(ffmpeg_bin) + os.pathsep + os.environ.get('PATH', '')
-                # Prüfe nochmal
-                ffmpeg_ok, ffmpeg_version = check_ffmpeg()
-                debug_log(f"ffmpeg Status nach PATH-Update: {'OK' if ffmpeg_ok else 'FEHLT'}")
-        
-        # Starte GUI sofort - Abhängigkeiten werden im Hintergrund geprüft/installiert
-        if not ytdlp_ok or not ffmpeg_ok:
-            debug_log("Einige Abhängigkeiten fehlen - werden im Hintergrund installiert", "WARNING")
-        else:
-            debug_log("Alle Abhängigkeiten vorhanden")
-        
-    except ImportError as e:
-        debug_log(f"ImportError bei auto_install_dependencies: {e}", "WARNING")
-        # Fallback: Alte Methode
-        missing = check_dependencies_quick()
-        if missing:
-            debug_log("Warnung: Einige Abhängigkeiten fehlen:", "WARNING")
-            for dep in missing:
-                debug_log(f"  - {dep}", "WARNING")
-            debug_log("Versuche trotzdem zu starten...")
-    except Exception as e:
-        # Fehler bei Abhängigkeitsprüfung sind nicht kritisch - starte trotzdem
-        debug_log(f"Fehler bei Abhängigkeitsprüfung: {e}", "ERROR")
-        import traceback
-        debug_log(f"Traceback: {traceback.format_exc()}", "ERROR")
+    # Schnelle Prüfung der wichtigsten Abhängigkeiten (im Hintergrund, damit das Fenster nicht darauf wartet)
+    def check_dependencies_background():
+        try:
+            debug_log("Importiere auto_install_dependencies...")
+            from auto_install_dependencies import check_ytdlp, check_ffmpeg, get_app_dir, load_cached_dependency_status
+            
+            # Fingerabdruck unverändert → Ergebnis der letzten Prüfung übernehmen (keine Prozessstarts)
+            cached = load_cached_dependency_status()
+            if cached:
+                debug_log(f"Abhängigkeiten unverändert seit {cached.get('checked_at')} (yt-dlp {cached.get('ytdlp_version')}) - Prüfung übersprungen")
+                return
+            
+            debug_log("Prüfe yt-dlp...")
+            ytdlp_ok, ytdlp_version = check_ytdlp()
+            debug_log(f"yt-dlp Status: {'OK' if ytdlp_ok else 'FEHLT'} (Version: {ytdlp_version or 'N/A'})")
+            
+            debug_log("Prüfe ffmpeg...")
+            ffmpeg_ok, ffmpeg_version = check_ffmpeg()
+            debug_log(f"ffmpeg Status: {'OK' if ffmpeg_ok else 'FEHLT'} (Version: {ffmpeg_version or 'N/A'})")
+            
+            # Füge ffmpeg zum PATH hinzu (falls lokal installiert)
+            if not ffmpeg_ok:
+                app_dir = get_app_dir()
+                ffmpeg_bin = app_dir / "ffmpeg" / "bin"
+                debug_log(f"Prüfe lokales ffmpeg in: {ffmpeg_bin}")
+                if ffmpeg_bin.exists():
+                    debug_log(f"Lokales ffmpeg gefunden - füge zum PATH hinzu")
+                    os.environ['PATH'] = str(ffmpeg_bin) + os.pathsep + os.environ.get('PATH', '')
+                    # Prüfe nochmal
+                    ffmpeg_ok, ffmpeg_version = check_ffmpeg()
+                    debug_log(f"ffmpeg Status nach PATH-Update: {'OK' if ffmpeg_ok else 'FEHLT'}")
+            
+            # Starte GUI sofort - Abhängigkeiten werden im Hintergrund geprüft/installiert
+            if not ytdlp_ok or not ffmpeg_ok:
+                debug_log("Einige Abhängigkeiten fehlen - werden im Hintergrund installiert", "WARNING")
+            else:
+                debug_log("Alle Abhängigkeiten vorhanden")
+            
+        except ImportError as e:
+            debug_log(f"ImportError bei auto_install_dependencies: {e}", "WARNING")
+            # Fallback: Alte Methode
+            missing = check_dependencies_quick()
+            if missing:
+                debug_log("Warnung: Einige Abhängigkeiten fehlen:", "WARNING")
+                for dep in missing:
+                    debug_log(f"  - {dep}", "WARNING")
+                debug_log("Versuche trotzdem zu starten...")
+        except Exception as e:
+            # Fehler bei Abhängigkeitsprüfung sind nicht kritisch - starte trotzdem
+            debug_log(f"Fehler bei Abhängigkeitsprüfung: {e}", "ERROR")
+            import traceback
+            debug_log(f"Traceback: {traceback.format_exc()}", "ERROR")
+    
+    import threading
+    threading.Thread(target=check_dependencies_background, name="startup-dependency-check", daemon=True).start()
     
     try:
         debug_log("Importiere gui...")
@@ -401,9 +428,10 @@ if __name__ == "__main__":
                 debug_log(f"Konnte Terminal-Fenster nicht verstecken: {e}", "WARNING")
         
         from gui import main
+        debug_log(f"gui importiert nach {(time.perf_counter() - _STARTED_AT) * 1000:.0f} ms")
         
         debug_log("Starte GUI...")
-        main()
+        main(started_at=_STARTED_AT, startup_messages=parse_arguments(cli_args) if cli_args else None)
     except ImportError as e:
         debug_log(f"Fehler beim Importieren der Module: {e}", "ERROR")
         print(f"✗ Fehler beim Importieren der Module: {e}")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests für den Diskografie-Planer (Duplikat-Erkennung)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from discography import DiscographyPlanner
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Beantwortet Deezer-API-Pfade aus einem Dict (Pfad → Liste)"""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, params=None, timeout=None):
+        path = url.split('/', 3)[3]
+        items = self.pages.get(path, [])
+        index = (params or {}).get('index', 0)
+        limit = (params or {}).get('limit', len(items))
+        return FakeResponse({'data': items[index:index + limit], 'total': len(items)})
+
+
+def _track(track_id, title, isrc, duration):
+    return {'id': track_id, 'title': title, 'isrc': isrc, 'duration': duration}
+
+
+def _plan(albums, tracklists):
+    pages = {'artist/1/albums': albums}
+    for album_id, tracks in tracklists.items():
+        pages[f'album/{album_id}/tracks'] = tracks
+    return DiscographyPlanner(FakeSession(pages), api_base='https://api.test').plan('1')
+
+
+def test_remaster_with_new_isrc_is_duplicate():
+    plan = _plan(
+        [{'id': 10, 'record_type': 'album', 'release_date': '1975-01-01'},
+         {'id': 20, 'record_type': 'album', 'release_date': '2011-01-01'}],
+        {10: [_track(1, 'Song', 'GBAAA7500001', 200)],
+         20: [_track(2, 'Song (Remastered 2011)', 'GBAAA1100001', 201)]}
+    )
+    assert [track['id'] for track in plan.tracks] == [1]
+    assert plan.duplicate_count == 1
+
+
+def test_same_title_with_distinct_isrcs_is_kept():
+    plan = _plan(
+        [{'id': 10, 'record_type': 'album', 'release_date': '2001-01-01'},
+         {'id': 20, 'record_type': 'album', 'release_date': '2005-01-01'}],
+        {10: [_track(1, 'Intro', 'GBAAA0100001', 60)],
+         20: [_track(2, 'Intro', 'GBAAA0500001', 61)]}
+    )
+    assert [track['id'] for track in plan.tracks] == [1, 2]
+
+
+def test_remaster_with_other_duration_is_kept():
+    plan = _plan(
+        [{'id': 10, 'record_type': 'album', 'release_date': '1975-01-01'},
+         {'id': 20, 'record_type': 'album', 'release_date': '2011-01-01'}],
+        {10: [_track(1, 'Song', 'GBAAA7500001', 200)],
+         20: [_track(2, 'Song - Remastered 2011', 'GBAAA1100001', 240)]}
+    )
+    assert [track['id'] for track in plan.tracks] == [1, 2]
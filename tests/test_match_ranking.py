@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests für die Bewertung von YouTube-Kandidaten (Upload-Zusätze)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from match_ranking import score_candidate, strip_upload_tags
+
+
+def test_strip_upload_tags():
+    assert strip_upload_tags("Artist - Song (Official Video)") == "Artist - Song"
+    assert strip_upload_tags("Artist - Song (Official Music Video) [HD]") == "Artist - Song"
+    assert strip_upload_tags("Artist - Song [4K] (Lyrics)") == "Artist - Song"
+    assert strip_upload_tags("Artist - Song | Official Audio") == "Artist - Song"
+
+
+def test_version_tags_are_kept():
+    assert strip_upload_tags("Artist - Song (Live)") == "Artist - Song (Live)"
+    assert strip_upload_tags("Artist - Song (Remix)") == "Artist - Song (Remix)"
+
+
+def test_upload_tags_do_not_lower_score():
+    bare, _ = score_candidate({'title': "Artist - Song", 'channel': 'Uploader', 'duration': 200},
+                              'Song', 'Artist', 200)
+    for title in ("Artist - Song (Official Video)", "Artist - Song [HD]",
+                  "Artist - Song (Official Music Video) [4K]"):
+        score, reasons = score_candidate({'title': title, 'channel': 'Uploader', 'duration': 200},
+                                         'Song', 'Artist', 200)
+        assert score == bare
+        assert "Titel 1.00" in reasons
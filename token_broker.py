@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gemeinsame Zugriffstokens für alle Downloader-Instanzen
+Bisher holte jeder neue SpotifyDownloader (jeder GUI-Download, jede
+Hörbuch-Suche) ein eigenes Client-Credentials-Token. TokenBroker hält Tokens
+mit Ablaufzeit im Speicher und in einer nur für den Benutzer lesbaren Datei,
+erneuert sie kurz vor Ablauf und sorgt dafür, dass bei parallelen Workern nur
+einer das Token neu anfordert - auch über Prozessgrenzen hinweg (Lock-Datei).
+
+Verwendung:
+    broker = token_broker.get_broker()
+    token = broker.get_token(f"spotify:{client_id}", fetch_token)
+    # fetch_token() -> (token, gültig_für_sekunden) oder None
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
+
+# Versuche fcntl zu importieren (Lock über Prozessgrenzen, nicht unter Windows)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+TOKEN_FILE = ".universal_downloader_tokens.json"
+
+# Tokens so viele Sekunden vor Ablauf erneuern
+REFRESH_MARGIN = 300
+
+# Token-Anfrage: (Token, Gültigkeit in Sekunden) oder None bei Fehler
+TokenFetcher = Callable[[], Optional[Tuple[str, float]]]
+
+
+def write_private_json(path: Union[str, Path], data: Dict):
+    """
+    Schreibt JSON atomar mit Rechten 0600 (nur der Benutzer darf lesen)
+
+    Für Dateien mit Zugangsdaten; unter Windows greifen die Rechte nicht,
+    dort liegt die Datei ohnehin im Benutzerprofil.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.chmod(tmp_path, 0o600)  # Falls die Datei schon mit anderen Rechten existierte
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+class TokenBroker:
+    """
+    Token-Cache mit proaktiver Erneuerung
+
+    Lesen ist ohne Lock möglich, solange das Token noch länger als
+    refresh_margin gültig ist. Erneuerungen laufen pro Schlüssel unter einem
+    Lock; wer wartet, liest danach das Token, das der andere geholt hat.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, refresh_margin: float = REFRESH_MARGIN):
+        """
+        Args:
+            path: JSON-Datei für die Tokens (None = nur im Speicher)
+            refresh_margin: Sekunden vor Ablauf, ab denen erneuert wird
+        """
+        self.path = Path(path) if path else None
+        self.refresh_margin = refresh_margin
+        self._tokens: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.refreshes = 0
+
+    def get_token(self, key: str, fetch: TokenFetcher) -> Optional[str]:
+        """
+        Liefert ein gültiges Token, erneuert es bei Bedarf
+
+        Args:
+            key: Eindeutiger Schlüssel, z.B. f"spotify:{client_id}"
+            fetch: Fordert ein neues Token an
+
+        Returns:
+            Token oder None, wenn keines angefordert werden konnte
+        """
+        entry = self._tokens.get(key)
+        if self._is_fresh(entry):
+            return entry['token']
+
+        with self._key_lock(key):
+            with self._file_lock():
+                # Ein anderer Thread/Prozess hat eventuell gerade erneuert
+                entry = self._load().get(key)
+                if self._is_fresh(entry):
+                    self._tokens[key] = entry
+                    return entry['token']
+
+                result = fetch()
+                if not result or not result[0]:
+                    # Erneuerung fehlgeschlagen: noch gültiges Token weiterverwenden
+                    if entry and entry['expires_at'] > time.time():
+                        return entry['token']
+                    return None
+
+                token, expires_in = result
+                entry = {'token': token, 'expires_at': time.time() + float(expires_in)}
+                self._tokens[key] = entry
+                self.refreshes += 1
+                self._store(key, entry)
+                return token
+
+    def invalidate(self, key: str, token: Optional[str] = None):
+        """
+        Verwirft ein Token (z.B. nach 401 oder geänderten Zugangsdaten)
+
+        Args:
+            key: Schlüssel des Tokens
+            token: Nur verwerfen, wenn noch dieses Token gespeichert ist - erhalten
+                   mehrere Worker gleichzeitig 401, wird das neue Token nicht erneut verworfen
+        """
+        with self._key_lock(key):
+            with self._file_lock():
+                entry = self._load().get(key) or self._tokens.get(key)
+                if token is not None and entry and entry['token'] != token:
+                    self._tokens[key] = entry
+                    return
+                self._tokens.pop(key, None)
+                self._store(key, None)
+
+    def _is_fresh(self, entry: Optional[Dict]) -> bool:
+        return bool(entry) and entry['expires_at'] - self.refresh_margin > time.time()
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _file_lock(self):
+        return _FileLock(self.path.with_name(self.path.name + '.lock') if self.path else None)
+
+    def _load(self) -> Dict[str, Dict]:
+        if self.path is None:
+            return dict(self._tokens)
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {key: entry for key, entry in data.items()
+                if isinstance(entry, dict) and entry.get('token') and 'expires_at' in entry}
+
+    def _store(self, key: str, entry: Optional[Dict]):
+        if self.path is None:
+            return
+        data = self._load()
+        now = time.time()
+        data = {k: v for k, v in data.items() if v['expires_at'] > now}  # Abgelaufene aufräumen
+        if entry is None:
+            data.pop(key, None)
+        else:
+            data[key] = entry
+        try:
+            write_private_json(self.path, data)
+        except OSError as e:
+            print(f"[WARNING] Tokens konnten nicht gespeichert werden: {e}")
+
+
+class _FileLock:
+    """Exklusiver Lock über eine Lock-Datei (ohne fcntl bzw. Pfad: nichts tun)"""
+
+    def __init__(self, path: Optional[Path]):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        if self.path is not None and fcntl is not None:
+            try:
+                self._file = open(self.path, 'a')
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            except OSError:
+                self._close()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._close()
+
+    def _close(self):
+        if self._file is not None:
+            try:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            except OSError:
+                pass
+            self._file.close()
+            self._file = None
+
+
+_default_broker: Optional[TokenBroker] = None
+_default_lock = threading.Lock()
+
+
+def get_broker() -> TokenBroker:
+    """Prozessweiter Broker mit Token-Datei im Benutzerverzeichnis"""
+    global _default_broker
+    if _default_broker is None:
+        with _default_lock:
+            if _default_broker is None:
+                _default_broker = TokenBroker(Path.home() / TOKEN_FILE)
+    return _default_broker
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zusammenfassender Event-Bus für UI-Updates
+Worker-Threads veröffentlichen Zustandsänderungen unter einem Schlüssel
+(z.B. 'video.progress' oder f"job.{job_id}"). Der Tk-Mainloop wendet höchstens
+alle interval_ms Millisekunden den jeweils neuesten Stand pro Schlüssel an;
+überholte Zwischenstände werden verworfen. Die UI-Last hängt damit von der
+Bildrate ab, nicht davon, wie oft yt-dlp Fortschritt meldet.
+"""
+
+import threading
+import tkinter as tk
+from typing import Callable, Dict, List, Tuple
+
+DEFAULT_INTERVAL_MS = 50
+
+
+class UIEventBus:
+    """
+    Sammelt UI-Updates aus Worker-Threads und wendet sie gebündelt im Mainloop an
+
+    publish() ersetzt ein noch nicht angewendetes Update mit gleichem Schlüssel.
+    Innerhalb eines Takts werden die Schlüssel in der Reihenfolge ihrer ersten
+    Veröffentlichung angewendet - ein Abschluss-Update unter eigenem Schlüssel
+    läuft also nach dem zuvor veröffentlichten Status.
+    """
+
+    def __init__(self, root: tk.Misc, interval_ms: int = DEFAULT_INTERVAL_MS):
+        """
+        Args:
+            root: Tk-Wurzelfenster (für after())
+            interval_ms: Mindestabstand zwischen zwei Anwendungen
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Tuple[Callable, tuple]] = {}
+        self._after_id = None
+        self._running = False
+        # Zähler für Diagnose (veröffentlicht / angewendet / verworfen)
+        self.published = 0
+        self.applied = 0
+        self.dropped = 0
+
+    def publish(self, key: str, callback: Callable, *args):
+        """
+        Veröffentlicht ein Update (thread-sicher, kehrt sofort zurück)
+
+        Args:
+            key: Schlüssel des Zustands; neuere Updates ersetzen ältere
+            callback: Wird im Mainloop mit *args aufgerufen
+        """
+        with self._lock:
+            self.published += 1
+            if key in self._pending:
+                self.dropped += 1
+            self._pending[key] = (callback, args)
+
+    def start(self):
+        if not self._running:
+            self._running = True
+            self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def flush(self):
+        """Wendet alle ausstehenden Updates sofort an (nur aus dem Mainloop aufrufen)"""
+        with self._lock:
+            if not self._pending:
+                return
+            pending: List[Tuple[Callable, tuple]] = list(self._pending.values())
+            self._pending = {}
+            self.applied += len(pending)
+
+        for callback, args in pending:
+            try:
+                callback(*args)
+            except tk.TclError:
+                # Widget existiert nicht mehr (Fenster geschlossen)
+                pass
+            except Exception as e:
+                print(f"[UIEventBus] Fehler beim Anwenden eines Updates: {e}")
+
+    def _tick(self):
+        self._after_id = None
+        try:
+            self.flush()
+        finally:
+            if self._running:
+                self._after_id = self.root.after(self.interval_ms, self._tick)
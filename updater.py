@@ -9,44 +9,114 @@ import json
 import requests
 import sys
 import platform
+import time
 from pathlib import Path
 from typing import Optional, Dict, Tuple
 from version import get_version, compare_versions
 
+# Wie lange ein Ergebnis der Update-Prüfung ohne neue Anfrage gilt (Sekunden)
+UPDATE_CHECK_TTL = 6 * 60 * 60
+
 class UpdateChecker:
     """Klasse zum Prüfen und Installieren von Updates"""
     
-    def __init__(self, update_url: Optional[str] = None, timeout: int = 10):
+    def __init__(self, update_url: Optional[str] = None, timeout: int = 10,
+                 cache_file: Optional[Path] = None, cache_ttl: int = UPDATE_CHECK_TTL):
         """
         Initialisiert den Update-Checker
         
         Args:
             update_url: URL zur Update-Information (JSON oder GitHub API)
             timeout: Timeout für HTTP-Requests in Sekunden
+            cache_file: JSON-Datei für die letzte Antwort samt ETag (None = kein Cache)
+            cache_ttl: Innerhalb dieser Zeit (Sekunden) wird ohne Netzwerkzugriff aus dem Cache geantwortet
         """
         from version import UPDATE_CHECK_URL
         self.update_url = update_url or UPDATE_CHECK_URL
         self.timeout = timeout
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.cache_ttl = cache_ttl
         self.current_version = get_version()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'UniversalDownloader/Updater'
         })
     
-    def check_for_updates(self) -> Tuple[bool, Optional[Dict]]:
+    def _load_cache(self) -> Dict:
+        if not self.cache_file or not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            # Cache gehört zu einer anderen URL (z.B. geänderter Update-Server)
+            return cache if cache.get('url') == self.update_url else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_cache(self, cache: Dict):
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        except OSError:
+            pass  # Cache ist optional
+    
+    def _fetch_release_data(self, force: bool = False) -> Dict:
+        """
+        Holt die Release-Informationen - aus dem Cache, per bedingter Anfrage oder neu
+        
+        Innerhalb der TTL wird gar nicht angefragt (außer force=True). Danach wird
+        mit If-None-Match/If-Modified-Since angefragt; bei 304 gilt die gespeicherte
+        Antwort weiter (zählt bei GitHub nicht gegen das Rate-Limit).
+        
+        Raises:
+            requests.exceptions.RequestException: Bei Netzwerkfehlern ohne verwertbaren Cache
+        """
+        cache = self._load_cache()
+        cached_data = cache.get('data')
+        if cached_data is not None and not force and time.time() - cache.get('checked_at', 0) < self.cache_ttl:
+            return cached_data
+        
+        headers = {}
+        if cached_data is not None:
+            if cache.get('etag'):
+                headers['If-None-Match'] = cache['etag']
+            if cache.get('last_modified'):
+                headers['If-Modified-Since'] = cache['last_modified']
+        
+        response = self.session.get(self.update_url, timeout=self.timeout, headers=headers)
+        if response.status_code == 304 and cached_data is not None:
+            cache['checked_at'] = time.time()
+            self._save_cache(cache)
+            return cached_data
+        response.raise_for_status()
+        
+        data = response.json()
+        self._save_cache({
+            'url': self.update_url,
+            'checked_at': time.time(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'data': data
+        })
+        return data
+    
+    def check_for_updates(self, force: bool = False) -> Tuple[bool, Optional[Dict]]:
         """
         Prüft auf verfügbare Updates
         
+        Args:
+            force: TTL des Caches ignorieren (die Anfrage bleibt bedingt per ETag)
+        
         Returns:
             Tuple (update_available, update_info)
             update_info enthält: version, download_url, changelog, release_date
         """
         try:
-            response = self.session.get(self.update_url, timeout=self.timeout)
-            response.raise_for_status()
-            
             # Prüfe ob es GitHub API oder eigene JSON ist
-            data = response.json()
+            data = self._fetch_release_data(force=force)
             
             if 'tag_name' in data:
                 # GitHub Releases Format
@@ -10,12 +10,24 @@ import platform
 import json
 import re
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Deque
+from collections import deque
 from datetime import datetime
 import sys
 import logging
 import os
 import signal
+import time
+from html import unescape as html_unescape
+
+import metrics
+from log_writer import AsyncLogWriter, LOG_HISTORY_LIMIT
+
+# Versuche orjson zu importieren (schnellerer JSON-Parser für yt-dlp-Ausgaben)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Unterstützte Sender
 SUPPORTED_SENDERS = {
@@ -39,6 +51,88 @@ SUPPORTED_SENDERS = {
 }
 
 
+# Auflösungsstufen (Mindesthöhe, Bezeichnung) von hoch nach niedrig
+QUALITY_LADDER = (
+    (2160, '2160p'),
+    (1440, '1440p'),
+    (1080, '1080p'),
+    (720, '720p'),
+    (480, '480p'),
+    (360, '360p'),
+    (240, '240p'),
+    (144, '144p'),
+)
+
+# Vorkompilierte Muster für die Parser im Hot-Path
+_FORMAT_NOTE_RESOLUTION = re.compile(r'(\d+)p?')
+# Staffel/Folge im Titel, in absteigender Priorität: "(S03/E07)", "S03/E07", "(S03 E07)"
+_SEASON_EPISODE_PATTERNS = (
+    re.compile(r'\(S(\d+)/E(\d+)\)'),
+    re.compile(r'S(\d+)/E(\d+)'),
+    re.compile(r'\(S(\d+)\s+E(\d+)\)'),
+)
+_SERIES_SLUG_PATTERN = re.compile(r'/serie/([^/]+)/')
+
+# Fundstellen für Beschreibungen auf ARD-Mediathek-Seiten in absteigender Priorität
+_DESCRIPTION_PATTERNS = tuple(re.compile(pattern, re.DOTALL | re.IGNORECASE) for pattern in (
+    # <p> Tags die nach dem Video-Titel kommen
+    r'<h1[^>]*>.*?</h1>.*?<p[^>]*>(.*?)</p>',
+    # Beschreibung in bestimmten Divs
+    r'<div[^>]*class="[^"]*description[^"]*"[^>]*>(.*?)</div>',
+    r'<div[^>]*class="[^"]*synopsis[^"]*"[^>]*>(.*?)</div>',
+    r'<div[^>]*data-description="([^"]*)"',
+    # Meta-Tags
+    r'<meta[^>]*name="description"[^>]*content="([^"]*)"',
+    # Text zwischen bestimmten Tags (nach Video-Info)
+    r'<p[^>]*class="[^"]*text[^"]*"[^>]*>(.*?)</p>',
+    r'<div[^>]*class="[^"]*text[^"]*"[^>]*>(.*?)</div>',
+    # Lange Textblöcke die wie Beschreibungen aussehen (mindestens 100 Zeichen)
+    r'<p[^>]*>(.{100,}?)</p>',
+))
+_JSON_LD_PATTERN = re.compile(r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+# yt-dlp-Ausgaben der Nachbearbeitung (Konvertierung/Zusammenführen nach dem Download)
+_POSTPROCESSOR_PREFIXES = ('[ExtractAudio]', '[Merger]', '[VideoConvertor]', '[VideoRemuxer]',
+                           '[FixupM3u8]', '[EmbedThumbnail]', '[Metadata]')
+_GERMAN_HINT_WORDS = ('heute', 'mit', 'und', 'der', 'die', 'das', 'ein', 'eine', 'sich', 'sind', 'wird')
+
+
+def _height_to_quality(height: int) -> Optional[str]:
+    """Ordnet eine Bildhöhe der passenden Qualitätsstufe zu (None unter 144p)"""
+    for min_height, label in QUALITY_LADDER:
+        if height >= min_height:
+            return label
+    return None
+
+
+def _loads_json_line(line: str):
+    """json.loads mit orjson als schnellem Pfad (Fallback z.B. für NaN oder sehr große Zahlen)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
+
+def _match_season_episode(title: str):
+    """Sucht Staffel/Folge im Titel; liefert den ersten Treffer nach Priorität"""
+    if 'S' not in title:
+        return None
+    for pattern in _SEASON_EPISODE_PATTERNS:
+        match = pattern.search(title)
+        if match:
+            return match
+    return None
+
+
+def _clean_html_text(fragment: str) -> str:
+    """Entfernt Tags und Entities und normalisiert Leerzeichen"""
+    text = _HTML_TAG_PATTERN.sub('', fragment)
+    return _WHITESPACE_PATTERN.sub(' ', html_unescape(text)).strip()
+
+
 class VideoDownloader:
     """Klasse für Video-Downloads von öffentlich-rechtlichen Sendern"""
     
@@ -56,7 +150,7 @@ class VideoDownloader:
         self.download_path.mkdir(parents=True, exist_ok=True)
         self.quality = quality
         self.output_format = output_format.lower()
-        self.download_log: List[str] = []
+        self.download_log: Deque[str] = deque(maxlen=LOG_HISTORY_LIMIT)
         self.gui_instance = gui_instance
         
         # Log-Datei Setup
@@ -80,7 +174,8 @@ class VideoDownloader:
             # Erstelle Log-Datei mit Timestamp
             timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             log_filename = logs_dir / f"video_download_{timestamp}.log"
-            self.log_file = open(log_filename, 'w', encoding='utf-8')
+            settings = getattr(self.gui_instance, 'settings', None) or {}
+            self.log_file = AsyncLogWriter(log_filename, fmt=settings.get('log_format', 'text'), source='video')
             self.log(f"Log-Datei erstellt: {log_filename}")
         except Exception as e:
             print(f"Warnung: Konnte Log-Datei nicht erstellen: {e}")
@@ -145,13 +240,9 @@ class VideoDownloader:
         log_entry = f"[{timestamp}] [{level}] {message}"
         self.download_log.append(log_entry)
         
-        # Schreibe in Log-Datei
+        # Schreibe in Log-Datei (gebündelt im Hintergrund-Thread)
         if self.log_file:
-            try:
-                self.log_file.write(log_entry + "\n")
-                self.log_file.flush()  # Sofort schreiben
-            except:
-                pass
+            self.log_file.write(message, level)
         
         # Nur wichtige Meldungen in Terminal ausgeben (reduziert)
         if level in ["ERROR", "WARNING"]:
@@ -320,6 +411,7 @@ class VideoDownloader:
             self.log(f"Fehler beim Erstellen der Cookies-Datei: {e}", "ERROR")
             return None
     
+    @metrics.instrument('video_info', 'video', success=lambda result: result is not None)
     def get_video_info(self, url: str, check_series: bool = False) -> Optional[Dict]:
         """
         Ruft Informationen über das Video ab
@@ -463,72 +555,33 @@ class VideoDownloader:
         Returns:
             Liste von verfügbaren Qualitäten (z.B. ['best', '1080p', '720p', 'niedrigste'])
         """
-        qualities = set()
-        
         try:
             formats = video_info.get('formats', [])
             if not formats:
                 return ['best', 'niedrigste']
             
+            # Ein Durchlauf: Höhen und (meist wenige verschiedene) format_notes sammeln
+            heights = set()
+            format_notes = set()
             for fmt in formats:
                 # Prüfe Höhe (height) für Video-Formate
                 height = fmt.get('height')
                 if height and isinstance(height, (int, float)):
-                    height_int = int(height)
-                    if height_int >= 2160:
-                        qualities.add('2160p')
-                    elif height_int >= 1440:
-                        qualities.add('1440p')
-                    elif height_int >= 1080:
-                        qualities.add('1080p')
-                    elif height_int >= 720:
-                        qualities.add('720p')
-                    elif height_int >= 480:
-                        qualities.add('480p')
-                    elif height_int >= 360:
-                        qualities.add('360p')
-                    elif height_int >= 240:
-                        qualities.add('240p')
-                    elif height_int >= 144:
-                        qualities.add('144p')
-                
-                # Prüfe auch format_note für zusätzliche Informationen
-                format_note = fmt.get('format_note', '').lower()
+                    heights.add(int(height))
+                # Prüfe auch format_note für zusätzliche Informationen (z.B. "1080p", "720p60")
+                format_note = fmt.get('format_note')
                 if format_note:
-                    # Extrahiere Auflösung aus format_note (z.B. "1080p", "720p")
-                    match = re.search(r'(\d+)p?', format_note)
-                    if match:
-                        res = int(match.group(1))
-                        if res >= 2160:
-                            qualities.add('2160p')
-                        elif res >= 1440:
-                            qualities.add('1440p')
-                        elif res >= 1080:
-                            qualities.add('1080p')
-                        elif res >= 720:
-                            qualities.add('720p')
-                        elif res >= 480:
-                            qualities.add('480p')
-                        elif res >= 360:
-                            qualities.add('360p')
-                        elif res >= 240:
-                            qualities.add('240p')
-                        elif res >= 144:
-                            qualities.add('144p')
-            
-            # Sortiere Qualitäten von hoch nach niedrig
-            quality_order = ['2160p', '1440p', '1080p', '720p', '480p', '360p', '240p', '144p']
-            sorted_qualities = []
-            for q in quality_order:
-                if q in qualities:
-                    sorted_qualities.append(q)
-            
-            # Füge "best" und "niedrigste" immer hinzu
-            result = ['best']
-            result.extend(sorted_qualities)
-            result.append('niedrigste')
+                    format_notes.add(format_note)
             
-            return result
+            for format_note in format_notes:
+                match = _FORMAT_NOTE_RESOLUTION.search(format_note)
+                if match:
+                    heights.add(int(match.group(1)))
+            
+            qualities = set(map(_height_to_quality, heights))
+            
+            # Sortiert von hoch nach niedrig, "best" und "niedrigste" immer dabei
+            return ['best'] + [label for _, label in QUALITY_LADDER if label in qualities] + ['niedrigste']
             
         except Exception as e:
             self.log(f"Fehler beim Extrahieren der Qualitäten: {e}", "WARNING")
@@ -562,24 +615,7 @@ class VideoDownloader:
                 
                 if max_height > 0:
                     # Konvertiere Höhe zu Auflösungs-String
-                    if max_height >= 2160:
-                        return '2160p'
-                    elif max_height >= 1440:
-                        return '1440p'
-                    elif max_height >= 1080:
-                        return '1080p'
-                    elif max_height >= 720:
-                        return '720p'
-                    elif max_height >= 480:
-                        return '480p'
-                    elif max_height >= 360:
-                        return '360p'
-                    elif max_height >= 240:
-                        return '240p'
-                    elif max_height >= 144:
-                        return '144p'
-                    else:
-                        return f'{max_height}p'
+                    return _height_to_quality(max_height) or f'{max_height}p'
                 return None
             elif quality == "niedrigste" or quality == "worst":
                 # Finde die niedrigste verfügbare Auflösung
@@ -597,24 +633,7 @@ class VideoDownloader:
                 
                 if min_height != float('inf'):
                     # Konvertiere Höhe zu Auflösungs-String
-                    if min_height >= 2160:
-                        return '2160p'
-                    elif min_height >= 1440:
-                        return '1440p'
-                    elif min_height >= 1080:
-                        return '1080p'
-                    elif min_height >= 720:
-                        return '720p'
-                    elif min_height >= 480:
-                        return '480p'
-                    elif min_height >= 360:
-                        return '360p'
-                    elif min_height >= 240:
-                        return '240p'
-                    elif min_height >= 144:
-                        return '144p'
-                    else:
-                        return f'{int(min_height)}p'
+                    return _height_to_quality(min_height) or f'{int(min_height)}p'
                 return None
             elif quality.endswith('p'):
                 # Spezifische Auflösung wurde ausgewählt
@@ -821,6 +840,7 @@ class VideoDownloader:
         # Falls keine Staffel-URL, gebe Original zurück
         return url
     
+    @metrics.instrument('series_listing', 'video', success=lambda result: result is not None)
     def get_series_episodes(self, url: str) -> Optional[Dict]:
         """
         Ruft alle Folgen einer Serie/Staffel ab, gruppiert nach Staffeln
@@ -972,13 +992,14 @@ class VideoDownloader:
                         # Versuche die URL als normale Webseite zu behandeln und Video-Links zu extrahieren
                         try:
                             import requests
-                            from bs4 import BeautifulSoup
+                            from bs4 import BeautifulSoup, SoupStrainer
                             
                             response = requests.get(series_url, timeout=30, headers={
                                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                             })
                             if response.status_code == 200:
-                                soup = BeautifulSoup(response.text, 'html.parser')
+                                # Nur Links werden benötigt - den Rest der Seite gar nicht erst aufbauen
+                                soup = BeautifulSoup(response.text, 'html.parser', parse_only=SoupStrainer('a', href=True))
                                 # Suche nach Video-Links auf der Seite
                                 video_links = []
                                 for link in soup.find_all('a', href=True):
@@ -999,179 +1020,7 @@ class VideoDownloader:
                             self.log(f"Fehler beim Parsen der Seite: {e}", "WARNING")
             
             if result.returncode == 0:
-                episodes = []
-                series_name = None
-                
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        try:
-                            info = json.loads(line)
-                            
-                            # URL extrahieren - wichtig für spätere Downloads
-                            # Bei --flat-playlist sind URLs oft nicht vollständig
-                            episode_url = info.get('url') or info.get('webpage_url') or info.get('webpage_url_basename')
-                            
-                            # Falls keine vollständige URL, versuche sie zu konstruieren
-                            if not episode_url or not episode_url.startswith('http'):
-                                # Versuche URL aus ID zu konstruieren
-                                episode_id = info.get('id')
-                                if episode_id:
-                                    # Für YouTube: Konstruiere URL aus Video-ID
-                                    if is_youtube:
-                                        episode_url = f"https://www.youtube.com/watch?v={episode_id}"
-                                    # Für ARD: Konstruiere URL aus Original-URL
-                                    elif 'ardmediathek.de' in series_url:
-                                        # Versuche Episode-URL aus ID zu konstruieren
-                                        # ARD Episode-URLs haben das Format: https://www.ardmediathek.de/video/.../ID
-                                        # Oder verwende die vollständige URL aus webpage_url wenn verfügbar
-                                        if info.get('webpage_url'):
-                                            episode_url = info.get('webpage_url')
-                                        else:
-                                            # Fallback: Verwende Serien-URL, yt-dlp wird die richtige Episode finden
-                                            episode_url = series_url
-                                    else:
-                                        episode_url = series_url  # Fallback: Serien-URL
-                                else:
-                                    episode_url = series_url  # Fallback: Serien-URL
-                            
-                            # Extrahiere Staffel- und Episodennummer aus Titel, falls nicht in Metadaten
-                            title = info.get('title', info.get('id', 'Unbekannt'))
-                            
-                            if is_youtube:
-                                # Für YouTube: Verwende Playlist-Index als Episode-Nummer
-                                season_num = 1  # Immer Staffel 1 für YouTube-Playlists
-                                episode_num = info.get('playlist_index') or info.get('playlist_autonumber') or info.get('episode_number')
-                            else:
-                                # Für andere Sender: Verwende normale Staffel/Episode-Nummern
-                                season_num = info.get('season_number')
-                                episode_num = info.get('episode_number')
-                                
-                                # Versuche Staffel/Episode aus Titel zu extrahieren (z.B. "Folge 7: Klassenfahrt (S03/E07)")
-                                if not season_num or not episode_num:
-                                    import re
-                                    # Suche nach (SXX/EXX) im Titel - verschiedene Formate
-                                    # Pattern 1: (S03/E07)
-                                    season_episode_match = re.search(r'\(S(\d+)/E(\d+)\)', title)
-                                    if not season_episode_match:
-                                        # Pattern 2: S03/E07 (ohne Klammern)
-                                        season_episode_match = re.search(r'S(\d+)/E(\d+)', title)
-                                    if not season_episode_match:
-                                        # Pattern 3: (S03 E07) mit Leerzeichen
-                                        season_episode_match = re.search(r'\(S(\d+)\s+E(\d+)\)', title)
-                                    
-                                    if season_episode_match:
-                                        if not season_num:
-                                            season_num = int(season_episode_match.group(1))
-                                        if not episode_num:
-                                            episode_num = int(season_episode_match.group(2))
-                            
-                            # Setze Serienname/Playlist-Namen aus Metadaten
-                            if is_youtube:
-                                # Für YouTube: Verwende Playlist-Namen
-                                series = info.get('playlist') or info.get('playlist_title') or info.get('series')
-                                if not series_name:
-                                    series_name = series
-                            else:
-                                # Für andere Sender: Verwende Serienname
-                                series = info.get('series')
-                                if not series and series_name:
-                                    series = series_name
-                            
-                            episode_info = {
-                                'title': title,
-                                'url': episode_url,
-                                'episode_number': episode_num,
-                                'season_number': season_num if not is_youtube else 1,  # YouTube: Immer Staffel 1
-                                'series': series,
-                                'duration': info.get('duration', 0),
-                                'duration_string': self._format_duration(info.get('duration') or 0),
-                                'thumbnail': info.get('thumbnail'),
-                                'id': info.get('id'),
-                            }
-                            
-                            # Für YouTube: Füge Playlist-Index hinzu
-                            if is_youtube:
-                                episode_info['playlist_index'] = info.get('playlist_index') or info.get('playlist_autonumber')
-                            
-                            episodes.append(episode_info)
-                            
-                            # Setze Serienname/Playlist-Namen (falls noch nicht gesetzt)
-                            if not series_name:
-                                if is_youtube:
-                                    # Für YouTube: Versuche Playlist-Namen zu extrahieren
-                                    if episode_info.get('series'):
-                                        series_name = episode_info.get('series')
-                                    elif info.get('playlist'):
-                                        series_name = info.get('playlist')
-                                    elif info.get('playlist_title'):
-                                        series_name = info.get('playlist_title')
-                                else:
-                                    # Für andere Sender: Versuche Serienname zu extrahieren
-                                    if episode_info.get('series'):
-                                        series_name = episode_info.get('series')
-                                    else:
-                                        # Versuche Serienname aus URL zu extrahieren (z.B. "almania" aus URL)
-                                        if 'ardmediathek.de/serie/' in series_url:
-                                            import re
-                                            match = re.search(r'/serie/([^/]+)/', series_url)
-                                            if match:
-                                                # Konvertiere "almania" zu "Almania"
-                                                series_name = match.group(1).replace('-', ' ').title()
-                                                episode_info['series'] = series_name
-                        except json.JSONDecodeError as e:
-                            self.log(f"JSON-Fehler beim Parsen einer Episode: {e}", "WARNING")
-                            continue
-                        except Exception as e:
-                            self.log(f"Fehler beim Verarbeiten einer Episode: {e}", "WARNING")
-                            continue
-                
-                if episodes:
-                    # Gruppiere nach Staffeln/Playlisten
-                    seasons = {}
-                    for episode in episodes:
-                        # Für YouTube-Playlists: Alle Videos in "Playlist 1" (keine echten Staffeln)
-                        if is_youtube:
-                            season_num = 1  # Alle Videos in eine Playlist
-                        else:
-                            season_num = episode.get('season_number') or 1
-                        if season_num not in seasons:
-                            seasons[season_num] = []
-                        seasons[season_num].append(episode)
-                    
-                    # Sortiere Episoden/Videos innerhalb jeder Staffel/Playlist
-                    for season_num in seasons:
-                        if is_youtube:
-                            # Bei YouTube: Sortiere nach Index in Playlist (playlist_index)
-                            seasons[season_num].sort(key=lambda x: x.get('playlist_index', x.get('episode_number', 0)) or 0)
-                        else:
-                            seasons[season_num].sort(key=lambda x: x.get('episode_number') or 0)
-                    
-                    # Sortiere Staffeln/Playlisten
-                    sorted_seasons = dict(sorted(seasons.items()))
-                    
-                    # Für YouTube: Setze Playlist-Namen
-                    if is_youtube:
-                        playlist_name = series_name or info.get('playlist', 'Unbekannte Playlist') if episodes else 'Unbekannte Playlist'
-                        if not series_name and episodes:
-                            # Versuche Playlist-Namen aus erstem Video zu extrahieren
-                            first_video = episodes[0]
-                            playlist_name = first_video.get('playlist', first_video.get('series', 'Unbekannte Playlist'))
-                        series_name = playlist_name
-                    
-                    result_dict = {
-                        'series_name': series_name or ('Unbekannte Playlist' if is_youtube else 'Unbekannte Serie'),
-                        'seasons': sorted_seasons,
-                        'total_episodes': len(episodes)
-                    }
-                    
-                    if is_youtube:
-                        self.log(f"✓ {len(episodes)} Videos in {len(sorted_seasons)} Playlist(en) gefunden")
-                    else:
-                        self.log(f"✓ {len(episodes)} Folgen in {len(sorted_seasons)} Staffel(n) gefunden")
-                    return result_dict
-                else:
-                    self.log("⚠ Keine Folgen gefunden", "WARNING")
-                    return None
+                return self._parse_series_listing(result.stdout, series_url, is_youtube)
             else:
                 self.log(f"✗ Fehler beim Abrufen der Serien-Info: {result.stderr}", "ERROR")
                 return None
@@ -1183,6 +1032,171 @@ class VideoDownloader:
             self.log(f"✗ Fehler: {e}", "ERROR")
             return None
     
+    def _parse_series_listing(self, output: str, series_url: str, is_youtube: bool) -> Optional[Dict]:
+        """
+        Parst die JSON-Zeilen von 'yt-dlp --dump-json --flat-playlist' und gruppiert die Folgen
+        
+        Args:
+            output: Standardausgabe von yt-dlp (ein JSON-Objekt pro Zeile)
+            series_url: URL der Serie/Playlist (Fallback für Episoden-URLs)
+            is_youtube: True für YouTube-Playlists (keine echten Staffeln)
+            
+        Returns:
+            Dictionary wie bei get_series_episodes() oder None, wenn keine Folgen gefunden wurden
+        """
+        episodes = []
+        series_name = None
+        last_info = {}
+        is_ard = 'ardmediathek.de' in series_url
+        
+        # Serienname aus der URL (z.B. "almania" → "Almania") - hängt nur von der URL ab,
+        # wird daher einmal statt pro Folge bestimmt
+        url_series_name = None
+        if not is_youtube and 'ardmediathek.de/serie/' in series_url:
+            match = _SERIES_SLUG_PATTERN.search(series_url)
+            if match:
+                url_series_name = match.group(1).replace('-', ' ').title()
+        
+        for line in output.strip().split('\n'):
+            if line:
+                try:
+                    info = _loads_json_line(line)
+                    last_info = info
+                    get = info.get
+                    
+                    # URL extrahieren - wichtig für spätere Downloads
+                    # Bei --flat-playlist sind URLs oft nicht vollständig
+                    episode_url = get('url') or get('webpage_url') or get('webpage_url_basename')
+                    episode_id = get('id')
+                    
+                    # Falls keine vollständige URL, versuche sie zu konstruieren
+                    if not episode_url or not episode_url.startswith('http'):
+                        if episode_id and is_youtube:
+                            # Für YouTube: Konstruiere URL aus Video-ID
+                            episode_url = f"https://www.youtube.com/watch?v={episode_id}"
+                        elif episode_id and is_ard and get('webpage_url'):
+                            # Für ARD: Vollständige URL aus webpage_url
+                            episode_url = get('webpage_url')
+                        else:
+                            # Fallback: Serien-URL, yt-dlp wird die richtige Episode finden
+                            episode_url = series_url
+                    
+                    # Extrahiere Staffel- und Episodennummer aus Titel, falls nicht in Metadaten
+                    title = get('title', get('id', 'Unbekannt'))
+                    duration = get('duration')
+                    
+                    if is_youtube:
+                        # Für YouTube: Playlist-Index als Episode-Nummer, Playlist-Name als Serie
+                        playlist_index = get('playlist_index') or get('playlist_autonumber')
+                        episode_num = playlist_index or get('episode_number')
+                        series = get('playlist') or get('playlist_title') or get('series')
+                        if not series_name:
+                            series_name = series
+                        episode_info = {
+                            'title': title,
+                            'url': episode_url,
+                            'episode_number': episode_num,
+                            'season_number': 1,  # YouTube: Immer Staffel 1
+                            'series': series,
+                            'duration': duration if 'duration' in info else 0,
+                            'duration_string': self._format_duration(duration or 0),
+                            'thumbnail': get('thumbnail'),
+                            'id': episode_id,
+                            'playlist_index': playlist_index,
+                        }
+                    else:
+                        # Für andere Sender: Verwende normale Staffel/Episode-Nummern
+                        season_num = get('season_number')
+                        episode_num = get('episode_number')
+                        
+                        # Versuche Staffel/Episode aus Titel zu extrahieren (z.B. "Folge 7: Klassenfahrt (S03/E07)")
+                        if not season_num or not episode_num:
+                            season_episode_match = _match_season_episode(title)
+                            if season_episode_match:
+                                if not season_num:
+                                    season_num = int(season_episode_match.group(1))
+                                if not episode_num:
+                                    episode_num = int(season_episode_match.group(2))
+                        
+                        series = get('series')
+                        if not series and series_name:
+                            series = series_name
+                        episode_info = {
+                            'title': title,
+                            'url': episode_url,
+                            'episode_number': episode_num,
+                            'season_number': season_num,
+                            'series': series,
+                            'duration': duration if 'duration' in info else 0,
+                            'duration_string': self._format_duration(duration or 0),
+                            'thumbnail': get('thumbnail'),
+                            'id': episode_id,
+                        }
+                        
+                        # Setze Serienname (falls noch nicht gesetzt)
+                        if not series_name:
+                            if series:
+                                series_name = series
+                            elif url_series_name:
+                                series_name = url_series_name
+                                episode_info['series'] = series_name
+                    
+                    episodes.append(episode_info)
+                except json.JSONDecodeError as e:
+                    self.log(f"JSON-Fehler beim Parsen einer Episode: {e}", "WARNING")
+                    continue
+                except Exception as e:
+                    self.log(f"Fehler beim Verarbeiten einer Episode: {e}", "WARNING")
+                    continue
+        
+        if episodes:
+            # Gruppiere nach Staffeln/Playlisten
+            seasons = {}
+            for episode in episodes:
+                # Für YouTube-Playlists: Alle Videos in "Playlist 1" (keine echten Staffeln)
+                if is_youtube:
+                    season_num = 1  # Alle Videos in eine Playlist
+                else:
+                    season_num = episode.get('season_number') or 1
+                if season_num not in seasons:
+                    seasons[season_num] = []
+                seasons[season_num].append(episode)
+            
+            # Sortiere Episoden/Videos innerhalb jeder Staffel/Playlist
+            for season_num in seasons:
+                if is_youtube:
+                    # Bei YouTube: Sortiere nach Index in Playlist (playlist_index)
+                    seasons[season_num].sort(key=lambda x: x.get('playlist_index', x.get('episode_number', 0)) or 0)
+                else:
+                    seasons[season_num].sort(key=lambda x: x.get('episode_number') or 0)
+            
+            # Sortiere Staffeln/Playlisten
+            sorted_seasons = dict(sorted(seasons.items()))
+            
+            # Für YouTube: Setze Playlist-Namen
+            if is_youtube:
+                playlist_name = series_name or last_info.get('playlist', 'Unbekannte Playlist') if episodes else 'Unbekannte Playlist'
+                if not series_name and episodes:
+                    # Versuche Playlist-Namen aus erstem Video zu extrahieren
+                    first_video = episodes[0]
+                    playlist_name = first_video.get('playlist', first_video.get('series', 'Unbekannte Playlist'))
+                series_name = playlist_name
+            
+            result_dict = {
+                'series_name': series_name or ('Unbekannte Playlist' if is_youtube else 'Unbekannte Serie'),
+                'seasons': sorted_seasons,
+                'total_episodes': len(episodes)
+            }
+            
+            if is_youtube:
+                self.log(f"✓ {len(episodes)} Videos in {len(sorted_seasons)} Playlist(en) gefunden")
+            else:
+                self.log(f"✓ {len(episodes)} Folgen in {len(sorted_seasons)} Staffel(n) gefunden")
+            return result_dict
+        else:
+            self.log("⚠ Keine Folgen gefunden", "WARNING")
+            return None
+    
     def _format_duration(self, seconds: int) -> str:
         """Formatiert Dauer in MM:SS oder HH:MM:SS"""
         if not seconds:
@@ -1373,6 +1387,8 @@ class VideoDownloader:
             self.log(f"DEBUG: Standard-Pfad verwendet: {output_dir}")
             return output_dir
     
+    @metrics.instrument('download', 'video', success=lambda result: result[0],
+                        size=lambda result: metrics.file_size(result[1]))
     def download_video(self, url: str, output_dir: Optional[Path] = None, 
                       quality: Optional[str] = None, 
                       output_format: Optional[str] = None,
@@ -1921,6 +1937,7 @@ class VideoDownloader:
             
             # Lese Output in Echtzeit
             output_lines = []
+            postprocess_started = None  # Beginn der Nachbearbeitung (für Metriken)
             try:
                 # Verwende iter() für nicht-blockierendes Lesen mit Timeout
                 import select
@@ -1982,6 +1999,8 @@ class VideoDownloader:
                         line = line.strip()
                         if line:
                             output_lines.append(line)
+                            if postprocess_started is None and line.startswith(_POSTPROCESSOR_PREFIXES):
+                                postprocess_started = time.perf_counter()
                             # Parse Fortschritt
                             progress_percent = None
                             if '%' in line:
@@ -2049,6 +2068,9 @@ class VideoDownloader:
                 return (False, None, "Download abgebrochen")
             
             if process.returncode == 0:
+                if postprocess_started is not None:
+                    metrics.observe('transcode', 'video', time.perf_counter() - postprocess_started)
+                
                 # Suche nach heruntergeladener Datei
                 # yt-dlp gibt normalerweise den Dateinamen aus
                 downloaded_files = []
@@ -2162,6 +2184,7 @@ class VideoDownloader:
                 except Exception as e:
                     self.log(f"⚠ Konnte Cookies-Datei nicht löschen: {e}", "WARNING")
     
+    @metrics.instrument('description', 'video')
     def _extract_description(self, video_info: Dict, url: str) -> str:
         """Extrahiert Beschreibungstext aus Video-Informationen"""
         try:
@@ -2406,70 +2429,7 @@ class VideoDownloader:
             with urllib.request.urlopen(req, timeout=10) as response:
                 html_content = response.read().decode('utf-8')
             
-            # Suche nach der Beschreibung in verschiedenen möglichen Stellen
-            import re
-            
-            # ARD-Mediathek speichert die Beschreibung oft in einem <p> Tag mit bestimmten Klassen
-            # Oder in einem <div> mit data-attribute oder bestimmten Klassen
-            # Basierend auf der tatsächlichen ARD-Struktur
-            patterns = [
-                # Suche nach <p> Tags die nach dem Video-Titel kommen
-                r'<h1[^>]*>.*?</h1>.*?<p[^>]*>(.*?)</p>',
-                # Suche nach Beschreibung in bestimmten Divs
-                r'<div[^>]*class="[^"]*description[^"]*"[^>]*>(.*?)</div>',
-                r'<div[^>]*class="[^"]*synopsis[^"]*"[^>]*>(.*?)</div>',
-                r'<div[^>]*data-description="([^"]*)"',
-                # Meta-Tags
-                r'<meta[^>]*name="description"[^>]*content="([^"]*)"',
-                # Suche nach Text der zwischen bestimmten Tags steht (nach Video-Info)
-                r'<p[^>]*class="[^"]*text[^"]*"[^>]*>(.*?)</p>',
-                r'<div[^>]*class="[^"]*text[^"]*"[^>]*>(.*?)</div>',
-                # Suche nach langen Textblöcken die wie Beschreibungen aussehen
-                r'<p[^>]*>(.{100,}?)</p>',  # Mindestens 100 Zeichen
-            ]
-            
-            description = ''
-            for pattern in patterns:
-                matches = re.findall(pattern, html_content, re.DOTALL | re.IGNORECASE)
-                for match in matches:
-                    # Entferne HTML-Tags
-                    text = re.sub(r'<[^>]+>', '', match)
-                    # Entferne HTML-Entities
-                    text = text.replace('&nbsp;', ' ').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-                    text = text.replace('&quot;', '"').replace('&#39;', "'").replace('&apos;', "'")
-                    # Entferne mehrfache Leerzeichen
-                    text = re.sub(r'\s+', ' ', text).strip()
-                    # Prüfe ob es wie eine Beschreibung aussieht (enthält deutsche Wörter)
-                    if len(text) > 50 and any(word in text.lower() for word in ['heute', 'mit', 'und', 'der', 'die', 'das', 'ein', 'eine', 'sich', 'sind', 'wird']):
-                        description = text
-                        break
-                if description:
-                    break
-            
-            # Falls immer noch nichts gefunden, suche nach JSON-LD strukturierten Daten
-            if not description:
-                json_ld_pattern = r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>'
-                json_ld_matches = re.findall(json_ld_pattern, html_content, re.DOTALL | re.IGNORECASE)
-                for json_ld in json_ld_matches:
-                    try:
-                        data = json.loads(json_ld)
-                        if isinstance(data, dict):
-                            description = (data.get('description') or 
-                                         data.get('about') or 
-                                         data.get('text') or '')
-                        elif isinstance(data, list):
-                            for item in data:
-                                if isinstance(item, dict):
-                                    desc = (item.get('description') or 
-                                           item.get('about') or 
-                                           item.get('text') or '')
-                                    if desc and len(desc) > 50:
-                                        description = desc
-                                        break
-                        if description:
-                            break
-                    except:
-                        pass
+            description = self._parse_description_html(html_content)
             
             # Falls keine Beschreibung gefunden, versuche yt-dlp mit der Webseiten-URL
             if not description:
@@ -2507,6 +2467,60 @@ class VideoDownloader:
             self.log(f"[DEBUG] Fehler beim Extrahieren der Beschreibung von Webseite: {e}", "DEBUG")
             return ''
     
+    def _parse_description_html(self, html_content: str) -> str:
+        """
+        Sucht die Sendungsbeschreibung im HTML einer ARD-Mediathek-Seite
+        
+        Args:
+            html_content: HTML der Webseite
+            
+        Returns:
+            Gefundene Beschreibung oder leerer String
+        """
+        # Suche nach der Beschreibung in verschiedenen möglichen Stellen
+        import re
+        
+        # ARD-Mediathek speichert die Beschreibung oft in einem <p> Tag mit bestimmten Klassen
+        # Oder in einem <div> mit data-attribute oder bestimmten Klassen (siehe _DESCRIPTION_PATTERNS)
+        description = ''
+        for pattern in _DESCRIPTION_PATTERNS:
+            # finditer statt findall: beim ersten passenden Treffer aufhören
+            for match in pattern.finditer(html_content):
+                text = _clean_html_text(match.group(1))
+                # Prüfe ob es wie eine Beschreibung aussieht (enthält deutsche Wörter)
+                if len(text) > 50:
+                    text_lower = text.lower()
+                    if any(word in text_lower for word in _GERMAN_HINT_WORDS):
+                        description = text
+                        break
+            if description:
+                break
+        
+        # Falls immer noch nichts gefunden, suche nach JSON-LD strukturierten Daten
+        if not description:
+            for json_ld in _JSON_LD_PATTERN.findall(html_content):
+                try:
+                    data = json.loads(json_ld)
+                    if isinstance(data, dict):
+                        description = (data.get('description') or 
+                                     data.get('about') or 
+                                     data.get('text') or '')
+                    elif isinstance(data, list):
+                        for item in data:
+                            if isinstance(item, dict):
+                                desc = (item.get('description') or 
+                                       item.get('about') or 
+                                       item.get('text') or '')
+                                if desc and len(desc) > 50:
+                                    description = desc
+                                    break
+                    if description:
+                        break
+                except:
+                    pass
+        
+        return description
+    
     def download_playlist(self, url: str, output_dir: Optional[Path] = None,
                           quality: Optional[str] = None) -> List[Tuple[bool, Optional[Path], str]]:
         """
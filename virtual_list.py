@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Virtualisierte Listen für Tkinter
+Statt für jeden Eintrag eigene Widgets zu bauen, erzeugt VirtualList nur so
+viele Zeilen-Widgets, wie in den sichtbaren Bereich passen, und belegt sie
+beim Scrollen mit anderen Einträgen neu. Speicher und Aufbauzeit hängen damit
+von der Fenstergröße ab, nicht von der Anzahl der Einträge.
+
+ThumbnailLoader lädt Vorschaubilder erst, wenn eine Zeile sichtbar wird, und
+hält nur eine begrenzte Anzahl im Speicher.
+"""
+
+import io
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Versuche PIL zu importieren (Vorschaubilder)
+try:
+    from PIL import Image, ImageTk
+except ImportError:
+    Image = None
+    ImageTk = None
+
+SELECTED_BACKGROUND = '#cde8ff'
+
+# Modifier-Bits in event.state
+_SHIFT_MASK = 0x0001
+_CONTROL_MASK = 0x0004
+
+
+class VirtualList(ttk.Frame):
+    """
+    Scrollbare Liste mit fester Zeilenhöhe, die nur sichtbare Zeilen materialisiert
+
+    create_row(parent) baut ein leeres Zeilen-Widget, bind_row(row, item, index,
+    selected) befüllt es. Zeilen werden beim Scrollen wiederverwendet, bind_row
+    muss deshalb alle Inhalte der Zeile neu setzen. Alle Kind-Widgets einer Zeile
+    sollten in create_row entstehen (nur diese erhalten Klick-/Mausrad-Bindungen).
+    """
+
+    def __init__(self, parent, row_height: int, create_row: Callable[[tk.Misc], tk.Widget],
+                 bind_row: Callable[[tk.Widget, object, int, bool], None],
+                 select_mode: Optional[str] = None, overscan: int = 2, **kwargs):
+        """
+        Args:
+            parent: Eltern-Widget
+            row_height: Höhe einer Zeile in Pixeln
+            create_row: Erzeugt ein Zeilen-Widget (Kind von parent)
+            bind_row: Befüllt ein Zeilen-Widget mit einem Eintrag
+            select_mode: None (keine Auswahl), 'browse' (eine Zeile) oder 'extended' (Strg/Shift)
+            overscan: Zusätzliche Zeilen ober-/unterhalb des sichtbaren Bereichs
+        """
+        super().__init__(parent, **kwargs)
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.select_mode = select_mode
+        self.overscan = overscan
+
+        self.items: List = []
+        self.selection: set = set()
+        self._anchor: Optional[int] = None
+        self._rows: Dict[int, Tuple[tk.Widget, int]] = {}  # Index → (Widget, Canvas-Fenster)
+        self._free: List[Tuple[tk.Widget, int]] = []
+        self._refresh_pending = False
+
+        self.canvas = tk.Canvas(self, highlightthickness=0, yscrollincrement=max(1, row_height // 4))
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.canvas.bind('<Configure>', self._on_configure)
+        self._bind_wheel(self.canvas)
+
+    # ----- Öffentliche API -----
+
+    def set_items(self, items: List):
+        """Ersetzt alle Einträge (springt nach oben, Auswahl wird zurückgesetzt)"""
+        self.items = list(items)
+        self.selection.clear()
+        self._anchor = None
+        for index in list(self._rows):
+            self._release(index)
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), len(self.items) * self.row_height))
+        self.canvas.yview_moveto(0)
+        self._schedule_refresh()
+
+    def selected_items(self) -> List:
+        """Ausgewählte Einträge in Listenreihenfolge"""
+        return [self.items[index] for index in sorted(self.selection) if index < len(self.items)]
+
+    def refresh(self):
+        """Befüllt alle sichtbaren Zeilen neu (z.B. nach Änderung eines Eintrags)"""
+        for index, (row, _) in self._rows.items():
+            self.bind_row(row, self.items[index], index, index in self.selection)
+
+    # ----- Scrollen und Materialisieren -----
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_refresh()
+
+    def _on_configure(self, event):
+        self.canvas.configure(scrollregion=(0, 0, event.width, len(self.items) * self.row_height))
+        for _, window in list(self._rows.values()) + self._free:
+            self.canvas.itemconfigure(window, width=event.width)
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        # Mehrere Scroll-Events pro Frame zu einem Aufbau zusammenfassen
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._materialize)
+
+    def _visible_range(self) -> range:
+        top = int(self.canvas.canvasy(0))
+        height = max(self.canvas.winfo_height(), self.row_height)
+        first = max(0, top // self.row_height - self.overscan)
+        last = min(len(self.items), (top + height) // self.row_height + 1 + self.overscan)
+        return range(first, last)
+
+    def _materialize(self):
+        self._refresh_pending = False
+        if not self.winfo_exists():
+            return
+        visible = self._visible_range()
+
+        # Zeilen außerhalb des sichtbaren Bereichs freigeben
+        for index in [index for index in self._rows if index not in visible]:
+            self._release(index)
+
+        width = self.canvas.winfo_width()
+        for index in visible:
+            if index in self._rows:
+                continue
+            if self._free:
+                row, window = self._free.pop()
+                self.canvas.coords(window, 0, index * self.row_height)
+                self.canvas.itemconfigure(window, state='normal')
+            else:
+                row = self.create_row(self.canvas)
+                window = self.canvas.create_window(0, index * self.row_height, window=row, anchor='nw',
+                                                   width=width, height=self.row_height)
+                self._bind_row_events(row)
+            row._virtual_index = index
+            self._rows[index] = (row, window)
+            self.bind_row(row, self.items[index], index, index in self.selection)
+
+    def _release(self, index: int):
+        row, window = self._rows.pop(index)
+        row._virtual_index = None
+        self.canvas.itemconfigure(window, state='hidden')
+        self._free.append((row, window))
+
+    # ----- Maus -----
+
+    def _bind_row_events(self, widget: tk.Misc):
+        """Bindet Mausrad und Klick an die Zeile und alle Kind-Widgets (außer Buttons)"""
+        self._bind_wheel(widget)
+        if self.select_mode and not isinstance(widget, (ttk.Button, tk.Button)):
+            widget.bind('<Button-1>', self._on_click, add='+')
+        for child in widget.winfo_children():
+            self._bind_row_events(child)
+
+    def _bind_wheel(self, widget: tk.Misc):
+        widget.bind('<MouseWheel>', self._on_wheel, add='+')
+        widget.bind('<Button-4>', lambda e: self.canvas.yview_scroll(-3, 'units'), add='+')
+        widget.bind('<Button-5>', lambda e: self.canvas.yview_scroll(3, 'units'), add='+')
+
+    def _on_wheel(self, event):
+        # Windows liefert Vielfache von 120, macOS kleine Werte
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.canvas.yview_scroll(-delta * 3, 'units')
+
+    def _row_index(self, widget: tk.Misc) -> Optional[int]:
+        while widget is not None and widget is not self.canvas:
+            index = getattr(widget, '_virtual_index', None)
+            if index is not None:
+                return index
+            widget = widget.master
+        return None
+
+    def _on_click(self, event):
+        index = self._row_index(event.widget)
+        if index is None:
+            return
+        if self.select_mode == 'extended' and event.state & _SHIFT_MASK and self._anchor is not None:
+            low, high = sorted((self._anchor, index))
+            self.selection = set(range(low, high + 1))
+        elif self.select_mode == 'extended' and event.state & _CONTROL_MASK:
+            self.selection ^= {index}
+            self._anchor = index
+        else:
+            self.selection = {index}
+            self._anchor = index
+        self.refresh()
+
+
+class ThumbnailLoader:
+    """
+    Lädt Vorschaubilder im Hintergrund und hält die letzten N als PhotoImage vor
+
+    Das Dekodieren/Skalieren passiert im Worker-Thread, nur das Erzeugen des
+    PhotoImage im Tk-Mainloop.
+    """
+
+    def __init__(self, root: tk.Misc, size: Tuple[int, int] = (120, 68), cache_size: int = 100,
+                 workers: int = 3, fetch: Optional[Callable[[str], bytes]] = None):
+        self.root = root
+        self.size = size
+        self.cache_size = cache_size
+        self.fetch = fetch or self._fetch_http
+        self._cache: 'OrderedDict[str, object]' = OrderedDict()
+        self._waiting: Dict[str, List[Callable]] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='thumbnail')
+
+    @property
+    def available(self) -> bool:
+        return Image is not None and ImageTk is not None
+
+    def request(self, url: str, callback: Callable[[object], None]):
+        """
+        Liefert das Bild für url an callback (im Mainloop, ggf. später)
+
+        Args:
+            url: Bild-URL
+            callback: Erhält das PhotoImage; Aufrufer prüfen selbst, ob die Zeile noch aktuell ist
+        """
+        if not url or not self.available:
+            return
+        image = self._cache.get(url)
+        if image is not None:
+            self._cache.move_to_end(url)
+            callback(image)
+            return
+        with self._lock:
+            if url in self._waiting:
+                self._waiting[url].append(callback)
+                return
+            self._waiting[url] = [callback]
+        self._executor.submit(self._load, url)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+    def _fetch_http(self, url: str) -> bytes:
+        # requests erst hier importieren - das Modul wird schon beim Programmstart geladen
+        try:
+            import requests
+        except ImportError:
+            raise RuntimeError("requests nicht verfügbar")
+        response = requests.get(url, timeout=10)
+        response.raise_for_status()
+        return response.content
+
+    def _load(self, url: str):
+        try:
+            image = Image.open(io.BytesIO(self.fetch(url)))
+            image.thumbnail(self.size)
+            image.load()
+        except Exception:
+            image = None
+        try:
+            self.root.after(0, lambda: self._deliver(url, image))
+        except (RuntimeError, tk.TclError):
+            pass  # Fenster bereits geschlossen
+
+    def _deliver(self, url: str, image):
+        with self._lock:
+            callbacks = self._waiting.pop(url, [])
+        if image is None:
+            return
+        photo = ImageTk.PhotoImage(image)
+        self._cache[url] = photo
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        for callback in callbacks:
+            try:
+                callback(photo)
+            except tk.TclError:
+                pass